@@ -24,6 +24,7 @@ The :class:`music21.analysis.discrete.KrumhanslSchmuckler`
 
 import unittest
 
+from music21 import base # for _missingImport testing.
 from music21 import exceptions21
 
 from music21 import pitch
@@ -149,6 +150,30 @@ class DiscreteAnalysis(object):
         '''
         pass
 
+    def getWindowSummaries(self, windowStreams):
+        '''
+        Given the minimum windows (Measures) of a 
+        :class:`~music21.analysis.windowed.WindowedAnalysis`, return a 
+        summary of them from which any run of adjacent windows can be 
+        analyzed by processWindowSummaries() without building a Stream.
+
+        Subclasses that cannot summarize windows return None; each window 
+        is then given to process() as a Stream.
+        '''
+        return None
+
+    def processWindowSummaries(self, summaries, starts, ends):
+        '''
+        Given the summaries returned by getWindowSummaries() and lists of the 
+        start and end index (as in a slice) of the minimum windows of 
+        each window, return a list of the (solution, color) pairs that 
+        process() returns for each window.
+
+        Subclasses that override getWindowSummaries() must override this 
+        method as well.
+        '''
+        raise DiscreteAnalysisException('%s returns window summaries but does not define processWindowSummaries()' % self.__class__.__name__)
+
 
     def getSolution(self, subStream):
         '''For a given Stream, apply the analysis and return the best solution.
@@ -485,7 +510,9 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
     def _likelyKeys(self, sStream):
         pcDistribution = self._getPitchClassDistribution(sStream)
         #environLocal.printDebug(['process(); pcDistribution', pcDistribution])
-    
+        return self._likelyKeysFromDistribution(pcDistribution)
+
+    def _likelyKeysFromDistribution(self, pcDistribution):
         keyResultsMajor = self._convoluteDistribution(pcDistribution, 'major')
         differenceMajor = self._getDifference(keyResultsMajor, 
                           pcDistribution, 'major')
@@ -569,8 +596,15 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         
         # this is the distribution for the melody of "happy birthday"
         #pcDistribution = [9,0,3,0,2,5,0,2,0,2,2,0]
-    
-        likelyKeysMajor, likelyKeysMinor = self._likelyKeys(sStream)
+        pcDistribution = self._getPitchClassDistribution(sStream)
+        return self._processDistribution(pcDistribution, storeAlternatives)
+
+    def _processDistribution(self, pcDistribution, storeAlternatives=False):
+        '''
+        Find the solution and color for a pitch class distribution, as 
+        returned by _getPitchClassDistribution(), for process().
+        '''
+        likelyKeysMajor, likelyKeysMinor = self._likelyKeysFromDistribution(pcDistribution)
 
         #find the largest correlation value to use to select major or minor as the resulting key
         # values are the result of _getLikelyKeys
@@ -601,7 +635,7 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         #environLocal.printDebug(['sortList', sortList])
 
         coefficient, p, mode = sortList[0]
-        p = self._bestKeyEnharmonic(p, mode, sStream)
+        p = self._bestKeyEnharmonic(p, mode)
         solution = (p, mode, coefficient)
 
         color = self.solutionToColor(solution)
@@ -612,12 +646,202 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
             # get all but first
             for coefficient, p, mode in sortList[1:]:
                 # adjust enharmonic spelling
-                p = self._bestKeyEnharmonic(p, mode, sStream)
+                p = self._bestKeyEnharmonic(p, mode)
                 self._alternativeSolutions.append((p, mode, coefficient))
 
         # store solutions for compressed legend generation
         self._solutionsFound.append((solution, color))
         return solution, color        
+
+    def _correlateDistributions(self, pcDistributions):
+        '''
+        Given a sequence of pitch class distributions, return two numpy arrays 
+        with a row of 24 values for each distribution: the results of 
+        _convoluteDistribution() and the correlation coefficients of 
+        _getDifference(), first for the major key weights rotated to each of 
+        the 12 tonics, then for the minor key weights. 
+        
+        All distributions are processed at once, but the sums are taken in the
+        same order as in those methods, so the values are identical.
+
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> dist = [3.0, 0, 0, 0, 0, 0, 2.0, 0, 0, 0, 0, 0]
+        >>> keyResults, correlations = p._correlateDistributions([dist])
+        >>> correlations.shape
+        (1, 24)
+        >>> majorResults = p._convoluteDistribution(dist, 'major')
+        >>> keyResults[0, :12].tolist() == majorResults
+        True
+        >>> correlations[0, :12].tolist() == p._getDifference(majorResults, dist, 'major')
+        True
+        '''
+        import numpy
+        histograms = numpy.array(pcDistributions, dtype=float)
+        numRows = len(histograms)
+        profiles = [] # one row for each of the 24 keys
+        profileAverages = []
+        profileVariances = [] # bottomRight of _getDifference()
+        for weightType in ['major', 'minor']:
+            toneWeights = self._getWeights(weightType)
+            profileAverage = float(sum(toneWeights)) / len(toneWeights)
+            for i in range(12):
+                profiles.append([toneWeights[(j - i) % 12] for j in range(12)])
+                profileAverages.append(profileAverage)
+                variance = 0
+                for j in range(12):
+                    variance = variance + ((toneWeights[(j - i) % 12] - profileAverage) ** 2)
+                profileVariances.append(variance)
+        profiles = numpy.array(profiles, dtype=float)
+        profilesCentered = profiles - numpy.array(profileAverages)[:, numpy.newaxis]
+
+        histogramSums = numpy.zeros(numRows)
+        for j in range(12):
+            histogramSums = histogramSums + histograms[:, j]
+        histogramAverages = histogramSums / 12
+        keyResults = numpy.zeros((numRows, 24))
+        top = numpy.zeros((numRows, 24))
+        histogramVariances = numpy.zeros(numRows) # bottomLeft of _getDifference()
+        for j in range(12):
+            keyResults = keyResults + (profiles[:, j] * histograms[:, j][:, numpy.newaxis])
+            histogramCentered = histograms[:, j] - histogramAverages
+            top = top + (profilesCentered[:, j] * histogramCentered[:, numpy.newaxis])
+            # numpy.power, like the ** of a Python float, calls pow()
+            histogramVariances = histogramVariances + numpy.power(histogramCentered, 2.0)
+
+        bottom = numpy.outer(histogramVariances, profileVariances)
+        correlations = numpy.zeros((numRows, 24))
+        nonZero = bottom != 0
+        correlations[nonZero] = top[nonZero] / numpy.power(bottom[nonZero], 0.5)
+        return keyResults, correlations
+
+    def processDistributions(self, pcDistributions):
+        '''
+        Find the solutions for many pitch class distributions at once, 
+        such as those of all the windows of a 
+        :class:`~music21.analysis.windowed.WindowedAnalysis`. 
+        Each distribution is a list of 12 values, as returned by 
+        _getPitchClassDistribution(). 
+        
+        Returns a list of (solution, color) pairs, the same as process() 
+        returns for a Stream with each distribution. If numpy is installed, 
+        all distributions are correlated with all 24 key weights at once.
+
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> dists = [p._getPitchClassDistribution(s.flat), 
+        ...          p._getPitchClassDistribution(s.parts[3].flat)]
+        >>> results = p.processDistributions(dists)
+        >>> [(sol[0], sol[1], round(sol[2], 6)) for sol, color in results]
+        [(<music21.pitch.Pitch F#>, 'minor', 0.815471), (<music21.pitch.Pitch F#>, 'minor', 0.868629)]
+        >>> results[0] == p.process(s)
+        True
+        
+        A distribution of None, as given for a Stream without notes, raises
+        a DiscreteAnalysisException, as process() does.
+        '''
+        for pcDistribution in pcDistributions:
+            if pcDistribution is None:
+                raise DiscreteAnalysisException('failed to get likely keys for Stream component')
+        if 'numpy' in base._missingImport:
+            return [self._processDistribution(d) for d in pcDistributions]
+        import numpy
+        if len(pcDistributions) == 0:
+            return []
+        keyResults, correlations = self._correlateDistributions(pcDistributions)
+        # _getLikelyKeys() gives keys with equal results the tonic of the 
+        # first of them; the others do not compete
+        keyResults = keyResults.reshape(-1, 2, 12)
+        sameResults = keyResults[:, :, :, numpy.newaxis] == keyResults[:, :, numpy.newaxis, :]
+        competing = (sameResults.argmax(axis=3) == numpy.arange(12)).reshape(-1, 24)
+        # process() sorts solutions by coefficient, then by tonic, 
+        # then with minor before major; rank all 24 keys the same way
+        columns = numpy.arange(24)
+        keyRank = (columns % 12) * 2 + (columns >= 12)
+        candidates = numpy.where(competing, correlations, -numpy.inf)
+        best = candidates.max(axis=1)[:, numpy.newaxis]
+        choices = numpy.where(candidates == best, keyRank, -1).argmax(axis=1)
+
+        post = []
+        for row, column in enumerate(choices):
+            if column < 12:
+                mode = 'major'
+            else:
+                mode = 'minor'
+            p = self._bestKeyEnharmonic(pitch.Pitch(int(column % 12)), mode)
+            if correlations[row, column] == 0:
+                coefficient = 0 # as in _getDifference()
+            else:
+                coefficient = float(correlations[row, column])
+            solution = (p, mode, coefficient)
+            color = self.solutionToColor(solution)
+            self._solutionsFound.append((solution, color))
+            post.append((solution, color))
+        return post
+
+    def getWindowSummaries(self, windowStreams):
+        '''
+        Return, for each window, the number of notes in it and a list of 
+        the (pitch class, quarterLength) pairs that 
+        _getPitchClassDistribution() adds up, in the same order. 
+
+        Adding these up for a run of windows gives exactly the distribution
+        of a Stream of the windows; adding or subtracting whole 
+        distributions would give different rounding with quarterLengths, 
+        such as those of triplets, that are not exact binary fractions.
+
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> measures = s.parts[0].getElementsByClass('Measure')
+        >>> summaries = p.getWindowSummaries(measures[:3])
+        >>> len(summaries)
+        3
+        >>> summaries[1]
+        (4, [(9, 1.0), (11, 1.0), (1, 1.0), (4, 1.0)])
+        '''
+        summaries = []
+        for windowStream in windowStreams:
+            notes = windowStream.flat.notes
+            contributions = []
+            for n in notes:
+                length = n.quarterLength
+                if n.isChord:
+                    for m in n.pitchClasses:
+                        contributions.append((m, length))
+                else:
+                    contributions.append((n.pitchClass, length))
+            summaries.append((len(notes), contributions))
+        return summaries
+
+    def processWindowSummaries(self, summaries, starts, ends):
+        '''
+        Find the keys of many runs of windows at once with 
+        processDistributions(). The results are the same as those of 
+        process() for a Stream of each run of windows.
+
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> measures = s.parts[0].getElementsByClass('Measure')
+        >>> summaries = p.getWindowSummaries(measures)
+        >>> results = p.processWindowSummaries(summaries, [0, 2], [2, 4])
+        >>> results[0] == p.process(measures[0:2])
+        True
+        >>> results[1] == p.process(measures[2:4])
+        True
+        '''
+        pcDistributions = []
+        for start, end in zip(starts, ends):
+            noteCount = 0
+            # as in _getPitchClassDistribution()
+            pcDist = [0] * 12
+            for windowNoteCount, contributions in summaries[start:end]:
+                noteCount += windowNoteCount
+                for m, length in contributions:
+                    pcDist[m] = pcDist[m] + (1 * length)
+            if noteCount == 0:
+                pcDistributions.append(None)
+            else:
+                pcDistributions.append(pcDist)
+        return self.processDistributions(pcDistributions)
     
     def _solutionToObject(self, solution):
         '''Convert a solution into an appropriate object representation, returning a Key object.
@@ -1004,27 +1228,28 @@ class Ambitus(DiscreteAnalysis):
         >>> p.getPitchRanges(s)
         (0, 34)
         '''
-        ssfn = subStream.flat.notes
-        
-        psFound = []
-        for n in ssfn:
-            pitches = []
-            if 'Chord' in n.classes:
-                pitches = n.pitches
-            elif 'Note' in n.classes:
-                pitches = [n.pitch]
-            for p in pitches:
-                psFound.append(p.ps)
+        if 'numpy' not in base._missingImport:
+            # toArrays() is found again if a pitch was changed in place
+            psFound = subStream.toArrays()['ps'].tolist()
+        else:
+            psFound = []
+            for n in subStream.flat.notes:
+                pitches = []
+                if 'Chord' in n.classes:
+                    pitches = n.pitches
+                elif 'Note' in n.classes:
+                    pitches = [n.pitch]
+                for p in pitches:
+                    psFound.append(p.ps)
         psFound.sort()
+        # the smallest difference between any two pitches is between
+        # neighbors in sorted order; the largest is between the extremes
         psRange = []
         for i in range(len(psFound)-1):
-            p1 = psFound[i]
-            for j in range(i+1, len(psFound)):
-                p2 = psFound[j]
-                # p2 should always be equal or greater than p1
-                psRange.append(p2-p1)
-
-        return int(min(psRange)), int(max(psRange))
+            psRange.append(psFound[i+1] - psFound[i])
+        # as before, raises a ValueError if there are fewer than two pitches
+        minRange = int(min(psRange))
+        return minRange, int(psFound[-1] - psFound[0])
 
 
     def solutionLegend(self, compress=False):
@@ -1126,16 +1351,127 @@ class Ambitus(DiscreteAnalysis):
         (<music21.interval.Interval m38>, '#665288')
         '''
         post = self.getPitchSpan(sStream)
+        return self._processPitchSpan(post)
+
+    def _processPitchSpan(self, post):
+        '''
+        Return the solution and color for the pitches returned by 
+        getPitchSpan(), for process().
+        '''
         if post != None:
             solution = interval.Interval(noteStart = post[0], noteEnd = post[1])
+            color = self.solutionToColor(post[1].ps - post[0].ps)
         else:
             solution = None
-        color = self.solutionToColor(post[1].ps - post[0].ps)
+            color = self.solutionToColor(None)
         
         # store solutions for compressed legend generation
         self._solutionsFound.append((solution, color))
         return solution, color
 
+    def getWindowSummaries(self, windowStreams):
+        '''
+        Return the pitch spans of the windows, as given by getPitchSpan(), 
+        and, for both the lowest and the (negated) highest pitch space 
+        values, the values of each window and a table of the window holding 
+        the first extreme value of every run of windows whose length is a 
+        power of two. The span of any run of windows is then found from the 
+        two (overlapping) runs that cover it.
+
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.Ambitus()
+        >>> measures = s.parts[0].getElementsByClass('Measure')
+        >>> summaries = p.getWindowSummaries(measures[:4])
+        >>> pitchSpans, minValues, minTable, maxValues, maxTable = summaries
+        >>> pitchSpans[3]
+        (<music21.pitch.Pitch F#4>, <music21.pitch.Pitch B4>)
+        >>> minValues
+        [71.0, 69.0, 69.0, 66.0]
+        >>> minTable
+        [[0, 1, 2, 3], [1, 1, 3], [3]]
+        '''
+        pitchSpans = []
+        minValues = [] # compared so that the first lowest pitch is found
+        maxValues = []
+        for windowStream in windowStreams:
+            post = self.getPitchSpan(windowStream)
+            pitchSpans.append(post)
+            if post is None:
+                minValues.append(float('inf'))
+                maxValues.append(float('inf'))
+            else:
+                minValues.append(post[0].ps)
+                maxValues.append(-post[1].ps)
+        minTable = self._getLowestIndexTable(minValues)
+        maxTable = self._getLowestIndexTable(maxValues)
+        return pitchSpans, minValues, minTable, maxValues, maxTable
+
+    def _getLowestIndexTable(self, values):
+        '''
+        Return a list whose row k gives, for each run of 2**k values, the 
+        index of the first lowest value in it.
+        
+        >>> p = analysis.discrete.Ambitus()
+        >>> p._getLowestIndexTable([3, 1, 1, 2, 0])
+        [[0, 1, 2, 3, 4], [1, 1, 2, 4], [1, 4]]
+        '''
+        table = [range(len(values))]
+        runLength = 1
+        while runLength * 2 <= len(values):
+            lastRow = table[-1]
+            row = []
+            for i in range(len(lastRow) - runLength):
+                left = lastRow[i]
+                right = lastRow[i + runLength]
+                if values[right] < values[left]:
+                    row.append(right)
+                else:
+                    row.append(left)
+            table.append(row)
+            runLength *= 2
+        return table
+
+    def _getLowestIndex(self, table, values, start, end):
+        '''
+        Return the index of the first lowest value from start to end (as in 
+        a slice) with a table from _getLowestIndexTable().
+        '''
+        level = (end - start).bit_length() - 1
+        left = table[level][start]
+        right = table[level][end - (1 << level)]
+        if values[right] < values[left]:
+            return right
+        return left
+
+    def processWindowSummaries(self, summaries, starts, ends):
+        '''
+        Find the pitch spans of many runs of windows at once.
+
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.Ambitus()
+        >>> measures = s.parts[0].getElementsByClass('Measure')
+        >>> summaries = p.getWindowSummaries(measures)
+        >>> p.processWindowSummaries(summaries, [0, 3], [3, 4])
+        [(<music21.interval.Interval P5>, '#1c1625'), (<music21.interval.Interval P4>, '#1a1422')]
+        >>> p.process(measures[0:3])
+        (<music21.interval.Interval P5>, '#1c1625')
+        '''
+        pitchSpans, minValues, minTable, maxValues, maxTable = summaries
+        post = []
+        for start, end in zip(starts, ends):
+            if end <= start:
+                post.append(self._processPitchSpan(None))
+                continue
+            minIndex = self._getLowestIndex(minTable, minValues, start, end)
+            maxIndex = self._getLowestIndex(maxTable, maxValues, start, end)
+            if pitchSpans[minIndex] is None:
+                # no window has pitches
+                post.append(self._processPitchSpan(None))
+            else:
+                post.append(self._processPitchSpan((pitchSpans[minIndex][0], 
+                                                    pitchSpans[maxIndex][1])))
+        return post
+
 
     def getSolution(self, sStream):
         '''
@@ -1477,6 +1813,41 @@ class Test(unittest.TestCase):
         #s.plot('grid', 'KrumhanslSchmuckler')
         #s.plot('windowed', 'aarden')
 
+    def testKeyAnalysisProcessDistributions(self):
+        from music21 import corpus
+        s = corpus.parse('bach/bwv324')
+        streams = [s.flat] + [p.flat for p in s.parts] + [m.flat for m in 
+                    s.parts[0].getElementsByClass('Measure')]
+        for pClass in [KrumhanslSchmuckler, KrumhanslKessler, AardenEssen, 
+                       SimpleWeights, BellmanBudge, TemperleyKostkaPayne]:
+            p = pClass()
+            dists = [p._getPitchClassDistribution(x.notesAndRests) for x in streams]
+            results = p.processDistributions(dists)
+            self.assertEqual(len(results), len(streams))
+            for x, result in zip(streams, results):
+                self.assertEqual(result, p.process(x))
+        self.assertRaises(DiscreteAnalysisException, p.processDistributions, [None])
+
+    def testAmbitusPitchRangesAfterEdit(self):
+        from music21 import note, stream
+        s = stream.Stream()
+        for pitchName in ['C4', 'D4', 'G4']:
+            s.append(note.Note(pitchName))
+        p = Ambitus()
+        self.assertEqual(p.getPitchRanges(s), (2, 7))
+        # pitches changed in place are found
+        s.notes[2].pitch.midi = 84
+        self.assertEqual(p.getPitchRanges(s), (2, 24))
+        self.assertRaises(ValueError, p.getPitchRanges, stream.Stream())
+
+    def testProcessWindowSummariesUndefined(self):
+        class SummarizingAnalysis(DiscreteAnalysis):
+            def getWindowSummaries(self, windowStreams):
+                return [len(w) for w in windowStreams]
+        p = SummarizingAnalysis()
+        self.assertRaises(DiscreteAnalysisException,
+            p.processWindowSummaries, [1, 2], [0], [2])
+
 
 # define presented order in documentation
 _DOC_ORDER = [analyzeStream, DiscreteAnalysis, Ambitus, MelodicIntervalDiversity, KeyWeightKeyAnalysis, SimpleWeights, AardenEssen, BellmanBudge, KrumhanslSchmuckler, KrumhanslKessler, TemperleyKostkaPayne]
@@ -16,6 +16,7 @@ Modular analysis procedures inherit from :class:`music21.analysis.discrete.Discr
 '''
 
 
+import multiprocessing
 import unittest
 import sys
 
@@ -43,6 +44,8 @@ class WindowedAnalysis(object):
         '''Create a WindowedAnalysis object.
 
         The provided `analysisProcessor` must provide a `process()` method that, when given a windowed Stream (a Measure) returns two element tuple containing (a) a data value (implementation dependent) and (b) a color code. 
+
+        If the processor also provides `getWindowSummaries()` and `processWindowSummaries()` methods, as :class:`~music21.analysis.discrete.DiscreteAnalysis` subclasses may, the minimum windows are summarized once and windows of all sizes are analyzed from those summaries, without building a Stream for each window.
         '''
         self.processor = analysisProcessor
         #environLocal.printDebug(self.processor)
@@ -51,6 +54,8 @@ class WindowedAnalysis(object):
         self._srcStream = streamObj
         # store a windowed Stream, partitioned into bars of 1/4
         self._windowedStream = self._getMinimumWindowStream() 
+        # summaries of the minimum windows, if the processor provides them
+        self._windowSummaries = None
 
     def _getMinimumWindowStream(self, timeSignature='1/4'):
         ''' Take the loaded stream and restructure it into measures of 1 quarter note duration.
@@ -87,6 +92,47 @@ class WindowedAnalysis(object):
         return measured
 
 
+    def _getWindowSummaries(self):
+        '''
+        Return the processor's summaries of the minimum windows, or None if 
+        the processor does not summarize windows.
+        '''
+        if self._windowSummaries is None and hasattr(self.processor, 'getWindowSummaries'):
+            self._windowSummaries = self.processor.getWindowSummaries(self._windowedStream)
+        return self._windowSummaries
+
+    def _getWindowBounds(self, windowSize, windowType='overlap'):
+        '''
+        Return two lists, the start and the end index (as in a slice) of the minimum windows of each window.
+
+        If windowType is "noOverlap", the Stream is divided into windows of the window size; the last window may be shorter.
+
+        If windowType is "adjacentAverage", there is a window for each minimum window, made of the minimum windows of all overlapping windows that include it.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 5)
+        >>> wa = analysis.windowed.WindowedAnalysis(s, analysis.discrete.Ambitus())
+        >>> wa._getWindowBounds(2, 'overlap')
+        ([0, 1, 2, 3], [2, 3, 4, 5])
+        >>> wa._getWindowBounds(2, 'noOverlap')
+        ([0, 2, 4], [2, 4, 5])
+        >>> wa._getWindowBounds(2, 'adjacentAverage')
+        ([0, 0, 1, 2, 3], [2, 3, 4, 5, 5])
+        '''
+        maxWindowCount = len(self._windowedStream)
+        if windowType == 'overlap':
+            starts = range(maxWindowCount - windowSize + 1)
+            ends = [start + windowSize for start in starts]
+        elif windowType == 'noOverlap':
+            starts = range(0, maxWindowCount, windowSize)
+            ends = [min(start + windowSize, maxWindowCount) for start in starts]
+        elif windowType == 'adjacentAverage':
+            starts = [max(0, i - windowSize + 1) for i in range(maxWindowCount)]
+            ends = [min(i + windowSize, maxWindowCount) for i in range(maxWindowCount)]
+        else:
+            raise WindowedAnalysisException('unknown window type: %s' % windowType)
+        return starts, ends
+
     def _analyze(self, windowSize, windowType='overlap'):
         ''' Calls, for a given window size, an analysis method across all windows in the source Stream. 
 
@@ -111,78 +157,30 @@ class WindowedAnalysis(object):
         >>> len(a), len(b)
         (33, 33)
 
+        >>> a, b = wa._analyze(5, 'noOverlap')
+        >>> len(a), len(b)
+        (8, 8)
         '''
-        maxWindowCount = len(self._windowedStream)
-        # assuming that this is sorted
-
-        if windowType == 'overlap':
-            windowCount = maxWindowCount - windowSize + 1
-
-        elif windowType == 'noOverlap':
-            windowCount = (maxWindowCount / windowSize) + 1
-
-        elif windowType == 'adjacentAverage':
-            windowCount = maxWindowCount
-
-        data = [0] * windowCount
-        color = [0] * windowCount
-        # how many windows in this row
-        windowCountIndices = range(windowCount)
-        
-        if windowType == 'overlap':
-            for i in windowCountIndices:
-                current = stream.Stream()
-                for j in range(i, i+windowSize):
-                    #environLocal.printDebug(['self._windowedStream[j]', self._windowedStream[j]])
-                    current.append(self._windowedStream[j])
-                data[i], color[i] = self.processor.process(current)
-
-        elif windowType == 'noOverlap':
-            start = 0
-            end = start+windowSize
-            i = 0
-            while True:
-                if end >= len(self._windowedStream):
-                    end = len(self._windowedStream)
-
+        starts, ends = self._getWindowBounds(windowSize, windowType)
+        summaries = self._getWindowSummaries()
+        if summaries is not None:
+            results = self.processor.processWindowSummaries(summaries, starts, ends)
+        else:
+            results = []
+            for start, end in zip(starts, ends):
                 current = stream.Stream()
                 for j in range(start, end):
+                    #environLocal.printDebug(['self._windowedStream[j]', self._windowedStream[j]])
                     current.append(self._windowedStream[j])
-                data[i], color[i] = self.processor.process(current)
-
-                start = end
-                end = start + windowSize
-                i += 1
-                if i >= windowCount:
-                    break
-       
-        elif windowType == 'adjacentAverage':
-            # first get overlapping windows
-            overlapped = []
-            for i in range(maxWindowCount - windowSize + 1):
-                current = stream.Stream()
-                # store indices of min windows that participate
-                participants = [] 
-                for j in range(i, i+windowSize):
-                    current.append(self._windowedStream[j])
-                    participants.append(j)
-                overlapped.append([current, participants])
-
-            # then distribute to each of maxWindowCount
-            for i in range(maxWindowCount):
-                # get all participants, combine into a single 
-                current = stream.Stream()
-                for dataStream, participants in overlapped:
-                    if i in participants:
-                        for m in dataStream:
-                            current.append(m)
-                data[i], color[i] = self.processor.process(current)
+                results.append(self.processor.process(current))
 
+        data = [solution for solution, unused_color in results]
+        color = [c for unused_solution, c in results]
         return data, color
 
         
     def process(self, minWindow=1, maxWindow=1, windowStepSize=1, 
-                windowType='overlap', includeTotalWindow=True):
+                windowType='overlap', includeTotalWindow=True, processes=1):
 
         ''' Main method for windowed analysis across one or more window size.
 
@@ -195,6 +193,8 @@ class WindowedAnalysis(object):
 
         If `includeTotalWindow` is True, the largest window size will always be added. 
 
+        If `processes` is greater than 1 (or None, for one process per CPU), the window sizes are split among that many worker processes; the results are the same as when running in a single process.
+
         
         >>> s = corpus.parse('bach/bwv324')
         >>> p = analysis.discrete.KrumhanslSchmuckler()
@@ -217,6 +217,10 @@ class WindowedAnalysis(object):
         (<music21.pitch.Pitch B>, 'major', 0.6868258874056411)
         >>> y[0][0].startswith('#') # a color is returned for each matching data position
         True
+
+        >>> x2, y2, z2 = wa.process(1, 2, includeTotalWindow=False, processes=2)
+        >>> x2 == x, y2 == y, z2 == z
+        (True, True, True)
         '''
         if maxWindow == None:
             maxLength = len(self._windowedStream)
@@ -261,11 +265,34 @@ class WindowedAnalysis(object):
             if totalWindow not in windowSizes:
                 windowSizes.append(totalWindow)
 
-        for i in windowSizes:
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        processes = min(processes, len(windowSizes))
+
+        if processes <= 1:
+            results = (self._analyze(i, windowType=windowType) for i in windowSizes)
+        else:
+            # summarize before the workers are started, so that each has the summaries
+            self._getWindowSummaries()
+            pool = multiprocessing.Pool(processes=processes, 
+                                        initializer=_analyzeWorkerInit, 
+                                        initargs=((self, windowType),))
+            try:
+                # map keeps the results in window size order
+                results = pool.map(_analyzeWorker, windowSizes)
+                pool.close()
+            finally:
+                pool.terminate()
+                pool.join()
+            # solutions found by the workers are stored here, as in a single process
+            if hasattr(self.processor, '_solutionsFound'):
+                for soln, colorn in results:
+                    self.processor._solutionsFound.extend(zip(soln, colorn))
+
+        for i, (soln, colorn) in zip(windowSizes, results):
             #environLocal.printDebug(['processing window:', i])
             # each of these results are lists, where len is based on 
-            soln, colorn = self._analyze(i, windowType=windowType) 
-            # store lists of results in a list of lists
+            # the window size; store lists of results in a list of lists
             solutionMatrix.append(soln)
             colorMatrix.append(colorn)
             meta = {'windowSize': i}
@@ -274,6 +301,17 @@ class WindowedAnalysis(object):
         return solutionMatrix, colorMatrix, metaMatrix
 
 
+_analyzeArguments = None
+
+def _analyzeWorkerInit(arguments):
+    global _analyzeArguments # pylint: disable=global-statement
+    _analyzeArguments = arguments
+
+def _analyzeWorker(windowSize):
+    windowedAnalysis, windowType = _analyzeArguments
+    return windowedAnalysis._analyze(windowSize, windowType=windowType)
+
+
 
 
 
@@ -376,6 +414,43 @@ class Test(unittest.TestCase):
 
 
 
+    def testWindowSummaries(self):
+        '''Test that windows analyzed from summaries match windows analyzed as Streams
+        '''
+        from music21 import corpus
+        from music21.analysis import discrete
+        
+        s = corpus.parse('bach/bwv66.6')
+        for pClass in [discrete.KrumhanslSchmuckler, discrete.Ambitus]:
+            wa = WindowedAnalysis(s, pClass())
+            for windowType in ['overlap', 'noOverlap', 'adjacentAverage']:
+                for windowSize in [1, 2, 5, 36]:
+                    data, color = wa._analyze(windowSize, windowType)
+                    starts, ends = wa._getWindowBounds(windowSize, windowType)
+                    self.assertEqual(len(data), len(starts))
+                    for i, (start, end) in enumerate(zip(starts, ends)):
+                        current = stream.Stream()
+                        for j in range(start, end):
+                            current.append(wa._windowedStream[j])
+                        self.assertEqual((data[i], color[i]), wa.processor.process(current))
+
+        # with triplets, the distributions must be added up as in process()
+        from music21 import note
+        s = stream.Stream()
+        for i in range(240):
+            n = note.Note(['C4', 'E-4', 'G4', 'A4', 'F#4', 'B-3', 'D4'][i % 7])
+            n.quarterLength = [1/3., 1/6.][i % 2]
+            s.append(n)
+        wa = WindowedAnalysis(s, discrete.KrumhanslSchmuckler())
+        for windowSize in [2, 5, 9]:
+            data, color = wa._analyze(windowSize, 'overlap')
+            starts, ends = wa._getWindowBounds(windowSize, 'overlap')
+            for i, (start, end) in enumerate(zip(starts, ends)):
+                current = stream.Stream()
+                for j in range(start, end):
+                    current.append(wa._windowedStream[j])
+                self.assertEqual((data[i], color[i]), wa.processor.process(current))
+
     def testVariableWindowing(self):
         from music21.analysis import discrete
         from music21 import corpus, graph
@@ -55,6 +55,7 @@ import doctest
 import sys
 import types
 import unittest
+import weakref
 #import uuid
 
 #-----all exceptions are in the exceptions21 package.
@@ -151,6 +152,10 @@ class Groups(list):
     '''
     # TODO: presently groups can be cased-differentiated; this may 
     # need to be made case independent
+
+    # every Music21Object has a Groups; do not give each one a __dict__
+    __slots__ = ()
+
     def append(self, value):
         if isinstance(value, basestring):
             # do not permit the same entry more than once
@@ -210,23 +215,27 @@ class Sites(object):
     object stores an offset value, used for determining position 
     within a Stream. 
 
-    All defined contexts are stored as dictionaries in a 
-    dictionary. The outermost dictionary stores objects.
+    As every Music21Object has a Sites object, storage is compact:
+    all defined contexts are stored in parallel lists, in the order
+    in which they were added, holding the id() of each object
+    (None for the None site), a weak reference to it, its
+    offset (None if the object is a context and not a location), and
+    its class name.
     '''
+    __slots__ = ('containedById', '_keys', '_objs', '_offsets', '_classes')
+
     def __init__(self, containedById=None):
-        # a dictionary of dictionaries
-        self._definedContexts = {} 
-        # store idKeys in lists for easy access
-        # the same key may be both in locationKeys and contextKeys
-        self._locationKeys = []
-        # store an index of numbers for tagging the time of defined contexts; 
-        # this is used to be able to discern the order of context as added
-        self._timeIndex = 0
+        # parallel lists, one entry per defined context, oldest first
+        # id() of each object; the None site has a key of None
+        self._keys = []
+        # weak references to each object, or None for the None site
+        self._objs = []
+        # offsets; None if the object is a context, not a location
+        self._offsets = []
+        # the most specific class name of each object
+        self._classes = []
         # pass a reference to the object that contains this
         self.containedById = containedById
-        # cache for performance
-        self._lastID = -1 # cannot be None
-        self._lastOffset = None
 
     def __len__(self):
         '''Return the total number of references.
@@ -240,7 +249,16 @@ class Sites(object):
         >>> len(aContexts) 
         1
         '''
-        return len(self._definedContexts)
+        return len(self._keys)
+
+    def __getstate__(self):
+        # needed to pickle with protocols that do not support __slots__
+        return (self.containedById, self._keys, self._objs,
+                self._offsets, self._classes)
+
+    def __setstate__(self, state):
+        (self.containedById, self._keys, self._objs,
+            self._offsets, self._classes) = state
 
     def __deepcopy__(self, memo=None):
         '''
@@ -274,31 +292,16 @@ class Sites(object):
         # may be a performance hog.
 
         new = self.__class__()
-        locations = [] #self._locationKeys[:]
-        #environLocal.printDebug(['Sites.__deepcopy__', 'self._definedContexts.keys()', self._definedContexts.keys()])
-        for idKey in self._definedContexts:
-            singleContextDict = self._definedContexts[idKey]
-            if singleContextDict['isDead']:
+        # not copying the offset in deepcopying means that
+        # the old site becomes a context, not a site
+        # this is still experimental
+        for i, objRef in enumerate(self._objs):
+            if type(objRef) is weakref.ref and objRef() is None:
                 continue # do not copy dead references
-            post = {}
-            post['obj'] = singleContextDict['obj'] # already a weak ref
-
-            # not copying the offset in deepcopying means that 
-            # the old site becomes a context, not a site
-            # this is still experimental
-            # post['offset'] = None
-
-            post['offset'] = singleContextDict['offset']
-            if post['offset'] is not None:
-                locations.append(idKey) # if offset not None, a location
-
-            post['time'] = singleContextDict['time'] # assume still valid
-            post['class'] = singleContextDict['class']
-            post['isDead'] = False
-            new._definedContexts[idKey] = post
-
-        new._locationKeys = locations
-        new._timeIndex = self._timeIndex # keep for coherency
+            new._keys.append(self._keys[i])
+            new._objs.append(objRef) # already a weak ref
+            new._offsets.append(self._offsets[i])
+            new._classes.append(self._classes[i])
         return new
 
     #---------------------------------------------------------------------------
@@ -318,33 +321,20 @@ class Sites(object):
         >>> aSites.add(bObj)
         >>> common.isWeakref(aSites.get()[0]) # unwrapping happens 
         False
-        >>> common.isWeakref(aSites._definedContexts[id(aObj)]['obj'])
+        >>> common.isWeakref(aSites._objs[0])
         True
         >>> aSites.unwrapWeakref()
-        >>> common.isWeakref(aSites._definedContexts[id(aObj)]['obj'])
+        >>> common.isWeakref(aSites._objs[0])
         False
-        >>> common.isWeakref(aSites._definedContexts[id(bObj)]['obj'])
+        >>> common.isWeakref(aSites._objs[1])
         False
         '''
         if purgeLocations is True:
             # might not be needed if you know they are all alive.
             self.purgeLocations(rescanIsDead=True)
-
-        #environLocal.printDebug(['self', self, 'self._definedContexts.keys()', self._definedContexts.keys()])
-        for idKey in self._definedContexts:
-            if WEAKREF_ACTIVE:
-            #if common.isWeakref(self._definedContexts[idKey]['obj']):
-                target = self._definedContexts[idKey]['obj']
-                if target is None:
-                    continue
-                if common.isWeakref(target):
-                    #environLocal.printDebug(['unwrapping:', self._definedContexts[idKey]['obj']])
-                    target = common.unwrapWeakref(target)
-                    self._definedContexts[idKey]['obj'] = target
-                    # we may need to unwrap the weakrefs in this Stream
-                    # if it is not stored elsewhere
-#                     if target is not None:
-#                         self._definedContexts[idKey]['obj'].unwrapWeakref()
+        if WEAKREF_ACTIVE:
+            self._objs = [common.unwrapWeakref(objRef)
+                          for objRef in self._objs]
 
     def wrapWeakref(self):
         '''
@@ -360,18 +350,13 @@ class Sites(object):
         >>> aSites.add(bObj)
         >>> aSites.unwrapWeakref()
         >>> aSites.wrapWeakref()
-        >>> common.isWeakref(aSites._definedContexts[id(aObj)]['obj'])
+        >>> common.isWeakref(aSites._objs[0])
         True
-        >>> common.isWeakref(aSites._definedContexts[id(bObj)]['obj'])
+        >>> common.isWeakref(aSites._objs[1])
         True
         '''
-        for idKey in self._definedContexts:
-            if self._definedContexts[idKey]['obj'] is None:
-                continue # always skip None
-            if not common.isWeakref(self._definedContexts[idKey]['obj']):
-                #environLocal.printDebug(['wrapping:', self._definedContexts[idKey]['obj']])
-                post = common.wrapWeakref(self._definedContexts[idKey]['obj'])
-                self._definedContexts[idKey]['obj'] = post
+        # None and existing weakrefs are returned unaltered
+        self._objs = [common.wrapWeakref(objRef) for objRef in self._objs]
 
     #---------------------------------------------------------------------------
     # general
@@ -380,10 +365,10 @@ class Sites(object):
         '''
         Clear all stored data.
         '''
-        self._definedContexts = {} 
-        self._locationKeys = []
-        self._lastID = -1 # cannot be None
-        self._lastOffset = None
+        self._keys = []
+        self._objs = []
+        self._offsets = []
+        self._classes = []
 
     def _prepareObject(self, obj):
         '''
@@ -394,13 +379,61 @@ class Sites(object):
         if obj is None: # leave None alone
             return obj
         elif WEAKREF_ACTIVE:
-            return common.wrapWeakref(obj)
+            try:
+                return weakref.ref(obj)
+            except TypeError: # already a weakref, or cannot be weakly referenced
+                return obj
         # a normal reference, return unaltered
         else:
             return obj
 
-    def add(self, obj, offset=None, 
-            timeValue=None, idKey=None, classString=None):
+    def _indexById(self, idKey):
+        '''
+        Return the position of `idKey` in the stored lists, or -1 if
+        it is not defined.
+
+        >>> class Mock(base.Music21Object):
+        ...     pass
+        >>> aObj = Mock()
+        >>> aSites = base.Sites()
+        >>> aSites.add(None, 0.0)
+        >>> aSites.add(aObj, 2.0)
+        >>> aSites._indexById(id(aObj))
+        1
+        >>> aSites._indexById(None)
+        0
+        >>> aSites._indexById(1)
+        -1
+        '''
+        # NOTE: this is a performance critical method
+        keys = self._keys
+        # most objects are in just one Stream besides the None site, and
+        # the most recently added site is the one most often asked for
+        if keys and keys[-1] == idKey:
+            return len(keys) - 1
+        try:
+            return keys.index(idKey)
+        except ValueError:
+            return -1
+
+    def _removeByIndex(self, i):
+        '''
+        Remove the entry at position `i` from all stored lists.
+        '''
+        del self._keys[i]
+        del self._objs[i]
+        del self._offsets[i]
+        del self._classes[i]
+
+    def _isDeadByIndex(self, i):
+        '''
+        Return True if the object at position `i` was
+        weakly referenced and no longer exists.
+        '''
+        objRef = self._objs[i]
+        return type(objRef) is weakref.ref and objRef() is None
+
+    def add(self, obj, offset=None, idKey=None, classString=None):
         '''
         Add a reference to the `Sites` collection for this
         object. 
@@ -425,10 +458,8 @@ class Sites(object):
         is the highest available time in the obj (used for
         ``streamObj.append(el)``)
 
-        The `timeValue` argument is used to store the time
-        (in seconds after Jan 1, 1970) when this object was 
-        added to locations. If set to `None`, then the current
-        time is used.
+        Adding an object that is already stored updates its
+        entry and makes it the most recently added.
         
         `idKey` stores the id() of the obj.  If `None`, then
         id(obj) is used.
@@ -436,8 +467,20 @@ class Sites(object):
         `classString` stores the class of obj.  If `None` then
         `obj.classes[0]` is used.
         
-        TODO: Tests.  Including updates.
-        
+        >>> class Mock(base.Music21Object):
+        ...     pass
+        >>> aObj = Mock()
+        >>> bObj = Mock()
+        >>> aSites = base.Sites()
+        >>> aSites.add(aObj, 10)
+        >>> aSites.add(bObj)
+        >>> aSites.add(aObj, 20)
+        >>> len(aSites)
+        2
+        >>> aSites.getOffsetBySite(aObj)
+        20
+        >>> aSites.get(sortByCreationTime=True) == [aObj, bObj]
+        True
         '''
         # NOTE: this is a performance critical method
 
@@ -446,42 +489,25 @@ class Sites(object):
         if idKey is None and obj is not None:
             idKey = id(obj)
 
-        updateNotAdd = False
-        if idKey in self._definedContexts:
-            updateNotAdd = True 
-
-        if offset is not None: # a location, not a context
-            if idKey not in self._locationKeys:                 
-                self._locationKeys.append(idKey)
-        #environLocal.printDebug(['adding obj', obj, idKey])
-        # weak refs were being passed in __deepcopy__ calling this method
-        # __deepcopy__ no longer call this method, so we can assume that
-        # we will not get weakrefs
-
         objRef = None
-
         if obj is not None:
             if classString is None:
                 classString = obj.classes[0] # get most current class
             objRef = self._prepareObject(obj)
 
-        if updateNotAdd is True:
-            singleContextDict = self._definedContexts[idKey]
-        else:
-            singleContextDict = {}
-
-        singleContextDict['obj'] = objRef # a weak ref
-        singleContextDict['offset'] = offset # offset can be None for contexts
-        singleContextDict['class'] = classString 
-        singleContextDict['isDead'] = False # store to access w/o unwrapping
-        # time is a numeric count, not a real time measure
-        if timeValue is None:
-            singleContextDict['time'] = self._timeIndex
-            self._timeIndex += 1 # increment for next usage
-        else:
-            singleContextDict['time'] = timeValue
-        if not updateNotAdd: # add new/missing information to dictionary
-            self._definedContexts[idKey] = singleContextDict
+        keys = self._keys
+        if keys and keys[-1] == idKey: # already most recent; update
+            self._objs[-1] = objRef
+            self._offsets[-1] = offset
+            self._classes[-1] = classString
+            return
+        i = self._indexById(idKey)
+        if i != -1:
+            self._removeByIndex(i)
+        keys.append(idKey)
+        self._objs.append(objRef) # a weak ref
+        self._offsets.append(offset) # offset can be None for contexts
+        self._classes.append(classString)
 
 
     def remove(self, site):
@@ -522,57 +548,39 @@ class Sites(object):
         2
 
         OMIT_FROM_DOCS
-        >>> len(aSites._locationKeys)
+        >>> len(aSites.getSiteIds())
         2
 
         '''
-        # must clear
-        self._lastID = -1 # cannot be None
-        self._lastOffset = None
-
         siteId = None
         if site is not None: 
             siteId = id(site)
-        try:
-            del self._definedContexts[siteId]
-            #environLocal.printDebug(['removed site w/o exception:', siteId, 'self._definedContexts.keys()', self._definedContexts.keys()])
-        except:    
+        i = self._indexById(siteId)
+        if i == -1:
             raise SitesException('an entry for this object (%s) is not stored in this Sites object' % site)
-        # also delete from location keys
-        if siteId in self._locationKeys:
-            self._locationKeys.pop(self._locationKeys.index(siteId))
-
-        #environLocal.printDebug(['removed site:', 'self._definedContexts.getSites()', self.getSites()])
+        self._removeByIndex(i)
         
     def removeById(self, idKey):
         '''
         Remove a site entry by id key, 
         which is id() of the object. 
         '''
-        # must clear if removing
-        if idKey == self._lastID:
-            self._lastID = -1 # cannot be None
-            self._lastOffset = None
         if idKey is None:
             raise SitesException('trying to remove None idKey is not allowed')
-
-        #environLocal.printDebug(['removeById', idKey, 'self._definedContexts.keys()', self._definedContexts.keys()])
-        del self._definedContexts[idKey]
-        if idKey in self._locationKeys:
-            self._locationKeys.pop(self._locationKeys.index(idKey))
+        i = self._indexById(idKey)
+        if i == -1:
+            raise SitesException('an entry for this id (%s) is not stored in this Sites object' % idKey)
+        self._removeByIndex(i)
 
     def getById(self, id): # id is okay here @ReservedAssignment
         '''
         Return the object specified by an id.
         Used for testing and debugging. 
         '''
-        singleContextDict = self._definedContexts[id]
-        # need to check if these is weakref
-        #if common.isWeakref(dict['obj']):
-        if WEAKREF_ACTIVE:
-            return common.unwrapWeakref(singleContextDict['obj'])
-        else:
-            return singleContextDict['obj']
+        i = self._indexById(id)
+        if i == -1:
+            raise SitesException('an entry for this id (%s) is not stored in this Sites object' % id)
+        return common.unwrapWeakref(self._objs[i])
 
 
     def _keysByTime(self, newFirst=True):
@@ -590,24 +598,20 @@ class Sites(object):
         >>> aSites.add(cObj, 345)
         >>> aSites.add(aObj)
         >>> aSites.add(bObj)
-        >>> k = aSites._keysByTime()
-        >>> aSites._definedContexts[k[0]]['time'] > aSites._definedContexts[k[1]]['time'] > aSites._definedContexts[k[2]]['time']
+        >>> aSites._keysByTime() == [id(bObj), id(aObj), id(cObj)]
         True
         '''
-        post = []
-        for key in self._definedContexts:
-            post.append((self._definedContexts[key]['time'], key))
-        post.sort()
+        # entries are stored in the order added
         if newFirst:
-            post.reverse()
-        return [k for unused_time, k in post]
+            return self._keys[::-1]
+        return self._keys[:]
 
 
     def get(self, locationsTrail=False, sortByCreationTime=False,
             priorityTarget=None, excludeNone=False):
         '''
-        Get references; unwrap from weakrefs; order, based 
-        on dictionary keys, is from most recently added to least recently added.
+        Get references; unwrap from weakrefs; order is from
+        least recently added to most recently added.
 
         The `locationsTrail` option forces locations to come after all other defined contexts.
 
@@ -633,50 +637,30 @@ class Sites(object):
         >>> aSites.get(sortByCreationTime=True) == [bObj, aObj, cObj]
         True
         '''
+        indices = range(len(self._keys))
         if sortByCreationTime in [True, 1]:
-            keyRepository = self._keysByTime(newFirst=True)
-        # reverse creation time puts oldest elements first
-        elif sortByCreationTime in [-1, 'reverse']:
-            keyRepository = self._keysByTime(newFirst=False)
-        else: # None, or False
-            keyRepository = self._definedContexts
-
-        post = [] 
-        #purgeKeys = []
+            indices.reverse()
+        # reverse creation time puts oldest elements first, as stored
         
         # get partitioned list of all, w/ locations last if necessary
         if locationsTrail:
-            keys = []
-            keysLocations = [] # but possibly sorted
-            for key in keyRepository:
-                if key not in self._locationKeys: # skip these
-                    keys.append(key) # others first
-                else:
-                    keysLocations.append(key)
-            keys += keysLocations # now locations are at end
-        else:
-            keys = keyRepository
+            offsets = self._offsets
+            indices = ([i for i in indices if offsets[i] is None] +
+                       [i for i in indices if offsets[i] is not None])
             
-        # get each dict from all defined contexts
-        for key in keys:
-            singleContextDict = self._definedContexts[key]
+        post = []
+        for i in indices:
+            objRef = self._objs[i]
             # check for None object; default location, not a weakref, keep
-            if singleContextDict['obj'] is None:
+            if objRef is None:
                 if not excludeNone:
-                    post.append(singleContextDict['obj'])
-            elif WEAKREF_ACTIVE:
-                obj = common.unwrapWeakref(singleContextDict['obj'])
-                if obj is None: # dead ref
-                    singleContextDict['isDead'] = True
-                else:
+                    post.append(None)
+            elif type(objRef) is weakref.ref:
+                obj = objRef()
+                if obj is not None: # skip dead refs
                     post.append(obj)
             else:
-                post.append(singleContextDict['obj'])
-
-        # remove dead references
-#         if autoPurge:
-#             for key in purgeKeys:
-#                 self.removeById(key)
+                post.append(objRef)
 
         if priorityTarget is not None:
             if priorityTarget in post:
@@ -700,37 +684,31 @@ class Sites(object):
         >>> aSites = music21.Sites()
         >>> aSites.add(aObj, 234)
         >>> aSites.add(bObj, 3000)
-        >>> len(aSites._locationKeys) == 2
+        >>> len(aSites.getSiteIds()) == 2
         True
         >>> len(aSites.getSites()) == 2
         True
         '''
-#         if idExclude is None:
-#             idExclude = [] # else, assume a list
-        # use pre-collected keys
         post = []
-        for idKey in self._locationKeys:
+        keys = self._keys
+        objs = self._objs
+        for i, offset in enumerate(self._offsets):
+            if offset is None: # a context
+                continue
+            idKey = keys[i]
             if idExclude is not None:
                 if idKey in idExclude:
                     continue
-            try:
-                objRef = self._definedContexts[idKey]['obj']
-            except KeyError:
-                raise SitesException('no such site: %s' % idKey)
-            # skip dead references
-            if self._definedContexts[idKey]['isDead']:
-                continue
             if idKey is None:
                 if not excludeNone: 
                     post.append(None) # keep None as site
-            elif not WEAKREF_ACTIVE: # leave None alone
-                post.append(objRef)
-            else:
-                obj = common.unwrapWeakref(objRef)
-                if obj is None:
-                    self._definedContexts[idKey]['isDead'] = True
+                continue
+            objRef = objs[i]
+            if type(objRef) is weakref.ref:
+                objRef = objRef()
+                if objRef is None: # skip dead references
                     continue
-                post.append(obj)
+            post.append(objRef)
         return post
     
 
@@ -760,54 +738,38 @@ class Sites(object):
         if not isinstance(className, str):
             className = common.classToClassStr(className)
 
-        for idKey in self._locationKeys:
-            if self._definedContexts[idKey]['isDead']:
+        for i, classStr in enumerate(self._classes):
+            if classStr != className or self._offsets[i] is None:
                 continue 
-            classStr = self._definedContexts[idKey]['class']
-            if classStr == className:
-                objRef = self._definedContexts[idKey]['obj']
-                if not WEAKREF_ACTIVE: # leave None alone
-                    obj = objRef
-                else:
-                    obj = common.unwrapWeakref(objRef)
-                found.append(obj)
+            obj = common.unwrapWeakref(self._objs[i])
+            if obj is None: # dead
+                continue
+            found.append(obj)
         return found
-#             
-#        found = []
-#        for idKey in self._locationKeys:
-#            objRef = self._definedContexts[idKey]['obj']
-#            if objRef is None:
-#                continue
-#            if not WEAKREF_ACTIVE: # leave None alone
-#                obj = objRef
-#            else:
-#                obj = common.unwrapWeakref(objRef)
-#            match = False
-#            if common.isStr(className):
-#                if hasattr(obj, 'classes'):
-#                    if className in obj.classes:
-#                        match = True
-#                elif type(obj).__name__.lower() == className.lower():
-#                    match = True
-#            elif isinstance(obj, className):
-#                match = True
-#            if match:
-#                found.append(obj)
-#        return found
 
 
+    def _hasLiveSiteOfClass(self, className):
+        '''
+        Return True if a location of the class named
+        `className` is stored and still exists.
+        '''
+        # a quick check avoids unwrapping in the usual case
+        if className not in self._classes:
+            return False
+        for i, classStr in enumerate(self._classes):
+            if classStr != className or self._offsets[i] is None:
+                continue
+            if not self._isDeadByIndex(i):
+                return True
+        return False
+
     def hasSpannerSite(self):
         '''
         Return True if this object is found in 
         any Spanner. This is determined by looking for 
         a SpannerStorage Stream class as a Site.
         '''
-        for idKey in self._locationKeys:
-            if self._definedContexts[idKey]['isDead']:
-                continue 
-            if self._definedContexts[idKey]['class'] == 'SpannerStorage':
-                return True
-        return False
+        return self._hasLiveSiteOfClass('SpannerStorage')
 
     def hasVariantSite(self):
         '''
@@ -815,21 +777,15 @@ class Sites(object):
         any Variant. This is determined by looking for 
         a VariantStorage Stream class as a Site.
         '''
-        for idKey in self._locationKeys:
-            if self._definedContexts[idKey]['isDead']:
-                continue 
-            if self._definedContexts[idKey]['class'] == 'VariantStorage':
-                return True
-        return False
+        return self._hasLiveSiteOfClass('VariantStorage')
 
     def getSiteCount(self):
         '''
         Return the number of non-dead sites, including None. 
-        This does not unwrap weakrefs for performance. 
         '''
         count = 0
-        for idKey in self._locationKeys:
-            if self._definedContexts[idKey]['isDead']:
+        for i, offset in enumerate(self._offsets):
+            if offset is None or self._isDeadByIndex(i):
                 continue 
             count += 1
         return count
@@ -853,9 +809,7 @@ class Sites(object):
         >>> aLocations.isSite(bSite)
         False
         '''
-        if id(obj) in self._locationKeys:
-            return True
-        return False
+        return self.hasSiteId(id(obj))
 
     def hasSiteId(self, siteId):
         '''
@@ -876,9 +830,13 @@ class Sites(object):
         >>> dc.hasSiteId(id(bSite))
         False
         '''
-        if siteId in self._locationKeys:
-            return True
-        return False
+        keys = self._keys
+        if keys and keys[-1] == siteId: # see _indexById()
+            return self._offsets[-1] is not None
+        try:
+            return self._offsets[keys.index(siteId)] is not None
+        except ValueError:
+            return False
 
     def getSiteIds(self):
         '''
@@ -895,18 +853,16 @@ class Sites(object):
         >>> dc.getSiteIds() == [id(aSite)]
         True
         '''
-        # may want to convert to tuple to avoid user editing?
-        return self._locationKeys
+        offsets = self._offsets
+        return [idKey for i, idKey in enumerate(self._keys)
+                if offsets[i] is not None]
 
     def purgeLocations(self, rescanIsDead=False):
         '''
         Clean all locations that refer to objects that no longer exist.
 
-        The `removeOrphanedSites` option removes sites that 
-        may have been the result of deepcopy: the element 
-        has the site, but the site does not have
-        the element. This results b/c Sites are 
-        shallow-copied, and then elements are re-added. 
+        The `rescanIsDead` option is retained for compatibility;
+        weak references are always checked.
 
         >>> import music21
         >>> class Mock(music21.Music21Object): 
@@ -925,34 +881,31 @@ class Sites(object):
         >>> len(aLocations)
         1
         '''
-        # first, check if any sites are dead, and cache the results
-        if rescanIsDead:
-            for idKey in self._locationKeys:
-                if idKey is None: 
-                    continue
-                if self._definedContexts[idKey]['isDead']:
-                    continue # already marked
-                if WEAKREF_ACTIVE:
-                    obj = common.unwrapWeakref(
-                        self._definedContexts[idKey]['obj'])
-                else:
-                    obj = self._definedContexts[idKey]['obj']
-                if obj is None: # if None, it no longer exists
-                    self._definedContexts[idKey]['isDead'] = True
-        # use previously set isDead entry, so as not to
-        # unwrap all references
-        remove = []
-        for idKey in self._locationKeys:
-            if idKey is None: 
+        # iterate backwards so that removal does not shift what is left
+        for i in range(len(self._keys) - 1, -1, -1):
+            if self._offsets[i] is None or self._keys[i] is None:
                 continue
-            if self._definedContexts[idKey]['isDead']:
-                remove.append(idKey)
-        for idKey in remove:
-            # this call changes the ._locationKeys list, and thus must be 
-            # out side _locationKeys loop
-            self.removeById(idKey)
+            if self._isDeadByIndex(i):
+                self._removeByIndex(i)
         
 
+    def _getOffsetByIndex(self, i):
+        '''
+        Return the offset stored at position `i`, resolving offsets
+        given as attribute names of the site.
+        '''
+        value = self._offsets[i]
+        # stored string are assummed to be attributes of the stored object
+        if isinstance(value, str):
+            if value not in ['highestTime', 'lowestOffset', 'highestOffset']:
+                raise SitesException('attempted to set a bound offset with a string attribute that is not supported: %s' % value)
+            obj = common.unwrapWeakref(self._objs[i])
+            # offset value is an attribute string
+            # canot cache these values as may change outside of definedcontexts
+            return getattr(obj, value)
+        # if value is not a string, it is a numerical offset
+        return value
+
     def getOffsetBySiteId(self, idKey, strictDeadCheck = False):
         '''
         Main method for getting an offset from a location key.
@@ -978,11 +931,11 @@ class Sites(object):
         
         >>> idBSite = id(bSite)
         >>> del(bSite)
-        >>> aLocations._definedContexts[idBSite]['obj']
+        >>> aLocations._objs[2]
         <weakref at 0x...; dead>
-        >>> aLocations._definedContexts[idBSite]['obj'] is None
+        >>> aLocations._objs[2] is None
         False     
-        >>> common.unwrapWeakref(aLocations._definedContexts[idBSite]['obj']) is None
+        >>> common.unwrapWeakref(aLocations._objs[2]) is None
         True
         
         >>> aLocations.getOffsetBySiteId(idBSite, strictDeadCheck = False) # default
@@ -993,45 +946,24 @@ class Sites(object):
         >>> aLocations.getOffsetBySiteId(idBSite, strictDeadCheck = True)
         Traceback (most recent call last):
         SitesException: Could not find the object with id ... in the Site marked with idKey ... (was there, now site is dead). 
-           object <music21.base.Sites object at 0x...>, definedContexts: {...}
+           object <music21.base.Sites object at 0x...>, siteIds: [...]
            containedById = ...
         
         
         '''
         # NOTE: this is a core method called very frequently
-#        if idKey == self._lastID:
-#            return self._lastOffset
-        try:
-            value = self._definedContexts[idKey]['offset']
-            if WEAKREF_ACTIVE and strictDeadCheck is True and self._definedContexts[idKey]['obj'] is not None:
-                obj = common.unwrapWeakref(self._definedContexts[idKey]['obj'])
-                if obj is None:
-                    #if self._definedContexts[idKey]['isDead'] is True: # not good enough
-                    errorMsg = "Could not find the object with id %s in the Site marked with idKey %s (was there, now site is dead). " % (id(self), idKey)
-                    errorMsg += "\n   object %r, definedContexts: %r" % (self, self._definedContexts)
-                    errorMsg += "\n   containedById = %r" % (self.containedById)
-                    raise SitesException(errorMsg)
-                
-        except KeyError:
+        i = self._indexById(idKey)
+        if i == -1:
             errorMsg = "Could not find the object with id %s in the Site marked with idKey %s. " % (id(self), idKey)
-            errorMsg += "\n   object %r, definedContexts: %r" % (self, self._definedContexts)
+            errorMsg += "\n   object %r, siteIds: %r" % (self, self._keys)
             errorMsg += "\n   containedById = %d" % (self.containedById)
             raise SitesException(errorMsg)
-        # stored string are assummed to be attributes of the stored object
-        if isinstance(value, str):
-            if value not in ['highestTime', 'lowestOffset', 'highestOffset']:
-                raise SitesException('attempted to set a bound offset with a string attribute that is not supported: %s' % value)
-            if WEAKREF_ACTIVE:
-                obj = common.unwrapWeakref(self._definedContexts[idKey]['obj'])
-            else:
-                obj = self._definedContexts[idKey]['obj']
-            # offset value is an attribute string
-            # canot cache these values as may change outside of definedcontexts
-            return getattr(obj, value)
-        # if value is not a string, it is a numerical offset
-        self._lastID = idKey
-        self._lastOffset = value
-        return value
+        if strictDeadCheck is True and self._isDeadByIndex(i):
+            errorMsg = "Could not find the object with id %s in the Site marked with idKey %s (was there, now site is dead). " % (id(self), idKey)
+            errorMsg += "\n   object %r, siteIds: %r" % (self, self._keys)
+            errorMsg += "\n   containedById = %r" % (self.containedById)
+            raise SitesException(errorMsg)
+        return self._getOffsetByIndex(i)
 
 
     def getOffsets(self):
@@ -1054,8 +986,8 @@ class Sites(object):
         >>> aLocations.getOffsets()
         [0, 234]
         '''
-        # here, already having location keys may be an advantage
-        return [self.getOffsetBySiteId(x) for x in self._locationKeys] 
+        return [self._getOffsetByIndex(i)
+                for i, offset in enumerate(self._offsets) if offset is not None]
 
 
     def getOffsetByObjectMatch(self, obj):
@@ -1083,22 +1015,14 @@ class Sites(object):
         >>> aLocations.getOffsetByObjectMatch(bSite)
         121.5
         '''
-        for idKey in self._definedContexts:
-            singleContextDict = self._definedContexts[idKey]
-            if singleContextDict['isDead']: # cal alway skip
-                continue
+        for i, objRef in enumerate(self._objs):
             # must unwrap references before comparison
-            #if common.isWeakref(dict['obj']):
-            if WEAKREF_ACTIVE:
-                compareObj = common.unwrapWeakref(singleContextDict['obj'])
-            else:
-                compareObj = singleContextDict['obj']
-            if compareObj is None: # mark isDead for later removal
-                singleContextDict['isDead'] = True
+            compareObj = common.unwrapWeakref(objRef)
+            if compareObj is None: # the None site, or dead
                 continue
-            if id(compareObj) == id(obj):
+            if compareObj is obj:
                 #environLocal.printDebug(['found object as site', obj, id(obj), 'idKey', idKey])
-                return self.getOffsetBySiteId(idKey) #dict['offset']
+                return self._getOffsetByIndex(i)
         raise SitesException('an entry for this object (%s) is not stored in Sites' % obj)
 
     def getOffsetBySite(self, site):
@@ -1125,13 +1049,19 @@ class Sites(object):
         siteId = None
         if site is not None:
             siteId = id(site)
-        try:
-            # will raise a key error if not found
-            return self.getOffsetBySiteId(siteId) 
-            #post = self._definedContexts[siteId]['offset']
-        except SitesException: # the site id is not valid
-            #environLocal.printDebug(['getOffsetBySite: trying to get an offset by a site failed; self:', self, 'site:', site, 'defined contexts:', self._definedContexts])
-            raise # re-raise Exception
+        # _indexById() inlined; the most recent site is checked first
+        keys = self._keys
+        if keys and keys[-1] == siteId:
+            i = len(keys) - 1
+        else:
+            try:
+                i = keys.index(siteId)
+            except ValueError: # the site id is not valid; raises
+                return self.getOffsetBySiteId(siteId)
+        value = self._offsets[i]
+        if value.__class__ is float: # the common case
+            return value
+        return self._getOffsetByIndex(i)
 
 
     def setOffsetBySite(self, site, value):
@@ -1161,13 +1091,10 @@ class Sites(object):
         siteId = None
         if site is not None:
             siteId = id(site)
-        # will raise an index error if the siteId does not exist
-        try:
-            self._definedContexts[siteId]['offset'] = value
-            self._lastID = siteId
-            self._lastOffset = value
-        except KeyError:
+        i = self._indexById(siteId)
+        if i == -1:
             raise SitesException('an entry for this object (%s) is not stored in Sites' % site)
+        self._offsets[i] = value
             
 
     def setOffsetBySiteId(self, siteId, value):
@@ -1177,21 +1104,17 @@ class Sites(object):
 
         The `siteId` parameter can be None.
         '''
-        try:
-            self._definedContexts[siteId]['offset'] = value
-            self._lastID = siteId
-            self._lastOffset = value
-        except KeyError:
+        i = self._indexById(siteId)
+        if i == -1:
             raise SitesException('an entry for this object (%s) is not stored in Sites' % siteId)
+        self._offsets[i] = value
 
 
     def getSiteByOffset(self, offset):
         '''For a given offset return the site that fits it
 
         More than one Site may have the same offset; 
-        this at one point returned the last site added by sorting time,
-        but now we use a dict, so there's no guarantee that the 
-        one you want will be there -- need orderedDicts!
+        the site added first is returned.
 
         >>> import music21
         >>> class Mock(music21.Music21Object): 
@@ -1205,23 +1128,12 @@ class Sites(object):
         >>> aSite == aLocations.getSiteByOffset(23)
         True
         '''
-
-        match = None
-        for siteId in self._definedContexts:
+        for i, value in enumerate(self._offsets):
             # might need to use almost equals here
-            if self._definedContexts[siteId]['offset'] == offset:
-                if self._definedContexts[siteId]['isDead']:
-                    return None
-                match = self._definedContexts[siteId]['obj']
-                break
-        if WEAKREF_ACTIVE:
-            if match is None: # this is a dead erfs
-                return match
-            elif not common.isWeakref(match):
-                raise SitesException('site on coordinates is not a weak ref: %s' % match)
-            return common.unwrapWeakref(match)
-        else:
-            return match
+            if value == offset:
+                # returns None if this is a dead ref
+                return common.unwrapWeakref(self._objs[i])
+        return None
 
 
     #---------------------------------------------------------------------------
@@ -1667,9 +1579,10 @@ class Music21Object(object):
                     newValue = copy.deepcopy(part, memo)
                     setattr(new, name, newValue)
             # use sites own __deepcopy__, but set contained by id
-            elif name == 'sites':
+            # (some classes, such as Pitch, store sites lazily as _sites)
+            elif name == 'sites' or (name == '_sites' and part is not None):
                 newValue = copy.deepcopy(part, memo)
-                #environLocal.printDebug(['copied definedContexts:', newValue._locationKeys])
+                #environLocal.printDebug(['copied definedContexts:', newValue.getSiteIds()])
                 newValue.containedById = id(new)
                 setattr(new, name, newValue)
             else: # use copy.deepcopy, will call __deepcopy__ if available
@@ -2933,10 +2846,12 @@ class Music21Object(object):
         # the first case here would match
         #environLocal.printDebug(['Music21Object._getOffset', 'self.id', self.id, 'id(self)', id(self), self.__class__])
 
+        # unwrap the activeSite weakref only once
+        activeSite = self.activeSite
         activeSiteId = None
-        if self.activeSite is not None:
-            activeSiteId = id(self.activeSite)
-            self._activeSiteId = id(self.activeSite)
+        if activeSite is not None:
+            activeSiteId = id(activeSite)
+            self._activeSiteId = activeSiteId
         elif self._activeSiteId is not None:
             activeSiteId = self._activeSiteId
         
@@ -2944,7 +2859,7 @@ class Music21Object(object):
             self.sites.hasSiteId(activeSiteId)):
             return self.sites.getOffsetBySiteId(activeSiteId)
             #return self.sites.coordinates[activeSiteId]['offset']
-        elif self.activeSite is None: # assume we want self
+        elif activeSite is None: # assume we want self
             return self.sites.getOffsetBySite(None)
         else:
             # try to look for it in all objects
@@ -2952,11 +2867,10 @@ class Music21Object(object):
             #environLocal.printDebug(['activeSite', self.activeSite, 'self.sites.hasSiteId(activeSiteId)', self.sites.hasSiteId(activeSiteId)])
             #environLocal.printDebug(['self.hasSite(self.activeSite)', self.hasSite(self.activeSite)])
 
-            offset = self.sites.getOffsetByObjectMatch(
-                    self.activeSite)
+            offset = self.sites.getOffsetByObjectMatch(activeSite)
             return offset
 
-            #environLocal.printDebug(['self.sites', self.sites._definedContexts])
+            #environLocal.printDebug(['self.sites', self.sites.getSiteIds()])
         raise Exception('request within %s for offset cannot be made with activeSite of %s (id: %s)' % (self.__class__, self.activeSite, activeSiteId))            
 
     def _setOffset(self, value):
@@ -2984,6 +2898,11 @@ class Music21Object(object):
         # do not have to unwrap a weakref of self.activeSite to get the id()
         # of activeSite
         self.sites.setOffsetBySiteId(self._activeSiteId, offset) 
+        # the sort order and offset index of the activeSite depend on
+        # the offsets of its elements
+        activeSite = self.activeSite
+        if activeSite is not None and hasattr(activeSite, '_elementsChanged'):
+            activeSite._elementsChanged(updateIsFlat=False)
 
     
     offset = property(_getOffset, _setOffset, 
@@ -3263,6 +3182,7 @@ class Music21Object(object):
             fp = environLocal.getTempFile(ext)
 
         if fileFormat in ['text', 'textline', 'musicxml', 'musicxml.png', 'vexflow', 'vexflow.html']:        
+            dataStr = None
             if fileFormat == 'text':
                 dataStr = self._reprText()
             elif fileFormat == 'textline':
@@ -3271,14 +3191,20 @@ class Music21Object(object):
             # musicxml, musicxml.png, etc.
             elif fileFormat.startswith('musicxml'):
                 from music21.musicxml import m21ToString
-                dataStr = m21ToString.fromMusic21Object(self)
+                # written measure by measure, without building the string
+                f = open(fp, 'w')
+                try:
+                    m21ToString.writeMusic21Object(self, f)
+                finally:
+                    f.close()
             elif fileFormat.startswith('vexflow'):
                 import music21.vexflow
                 dataStr = music21.vexflow.fromObject(self, mode='html')
 
-            f = open(fp, 'w')
-            f.write(dataStr)
-            f.close()
+            if dataStr is not None:
+                f = open(fp, 'w')
+                f.write(dataStr)
+                f.close()
             
             if fileFormat == 'musicxml.png':
                 # HACK
@@ -5112,14 +5038,14 @@ class Test(unittest.TestCase):
         # if offset is None, it is a context, and has no offset
         dc.add(s, None)
         self.assertEqual(len(dc), 1)
-        self.assertEqual(len(dc._locationKeys), 0)
+        self.assertEqual(len(dc.getSiteIds()), 0)
         self.assertEqual(dc.getSites(), [])
 
         dc = Sites()
         # if we have an offset, we get a location
         dc.add(s, 30)
         self.assertEqual(len(dc), 1)
-        self.assertEqual(len(dc._locationKeys), 1)
+        self.assertEqual(len(dc.getSiteIds()), 1)
         self.assertEqual(dc.getSites(), [s])
         self.assertEqual(dc.getOffsets(), [30])
         self.assertEqual(dc.getOffsetBySite(s), 30)
@@ -5131,7 +5057,7 @@ class Test(unittest.TestCase):
         # expression that take s as an argument
         dc.add(s, 30)
         self.assertEqual(len(dc), 1)
-        self.assertEqual(len(dc._locationKeys), 1)
+        self.assertEqual(len(dc.getSiteIds()), 1)
         self.assertEqual(dc.getSites(), [s])
         self.assertEqual(dc.getOffsets(), [30])
         self.assertEqual(dc.getOffsetBySite(s), 30)
@@ -5150,7 +5076,7 @@ class Test(unittest.TestCase):
         # expression that take s as an argument
         dc.add(s, 'highestTime')
         self.assertEqual(len(dc), 1)
-        self.assertEqual(len(dc._locationKeys), 1)
+        self.assertEqual(len(dc.getSiteIds()), 1)
         self.assertEqual(dc.getSites(), [s])
         self.assertEqual(dc.getOffsetBySite(s), 20.0)
         self.assertEqual(dc.getOffsets(), [20.0])
@@ -5276,6 +5202,20 @@ class Test(unittest.TestCase):
         self.assertEqual(n2.sites.containedById, id(n2))
 
 
+    def testSitesPickle(self):
+        import pickle
+        sites = Sites(containedById=20)
+        sites.add(None, 0.0)
+        sites.setOffsetBySite(None, 3.0)
+        # __slots__ requires __getstate__ for protocols below 2
+        for protocol in (0, 2):
+            post = pickle.loads(pickle.dumps(sites, protocol=protocol))
+            self.assertEqual(post.containedById, 20)
+            self.assertEqual(len(post), 1)
+            self.assertEqual(post.getOffsets(), [3.0])
+            self.assertEqual(post.getSites(), [None])
+
+
 
     def testGetContextByClassA(self):
         from music21 import stream, note, tempo
@@ -15,6 +15,7 @@ as well as other methods, functions, and objects related to chords.
 '''
 
 import copy
+import functools
 import unittest
 
 from music21 import beam
@@ -40,6 +41,45 @@ class ChordException(exceptions21.Music21Exception):
     pass
 
 
+def _cacheDerived(method, usesRoot=False):
+    '''
+    Decorator for Chord methods without arguments whose results depend only 
+    on the pitches of the Chord: the result is stored until the pitches, or 
+    the Pitch objects themselves, change. Lists are copied when returned, so 
+    that changing them does not change the stored value.
+
+    If `usesRoot` is True, the result also depends on the root, bass, and 
+    inversion the Chord keeps (which may have been set), and is only used 
+    while they are the same.
+    '''
+    name = method.__name__
+    @functools.wraps(method)
+    def cachedMethod(self):
+        self._checkDerivedCache()
+        try:
+            value, context = self._derivedCache[name]
+            if usesRoot and (context[0] is not self._root 
+                             or context[1] is not self._bass
+                             or context[2] != self._inversion):
+                raise KeyError(name)
+        except KeyError:
+            value = method(self)
+            # finding the value may have found the root, bass, or inversion
+            context = (self._root, self._bass, self._inversion)
+            self._derivedCache[name] = (value, context)
+        if isinstance(value, list):
+            return list(value)
+        return value
+    return cachedMethod
+
+def _cacheDerivedFromRoot(method):
+    '''
+    Decorator for Chord methods that depend on the pitches and on the root, 
+    bass, and inversion of the Chord; see _cacheDerived().
+    '''
+    return _cacheDerived(method, usesRoot=True)
+
+
 #-------------------------------------------------------------------------------
 
 
@@ -148,6 +188,8 @@ class Chord(note.NotRest):
     _bass = None
     _root = None
     _inversion = None
+    _derivedCache = {} # never changed; replaced in _checkDerivedCache()
+    _pitchesState = None
     isChord = True
     isNote = False
     isRest = False
@@ -182,6 +224,10 @@ class Chord(note.NotRest):
         self._notes = []
         self._chordTablesAddress = None
         self._chordTablesAddressNeedsUpdating = True # only update when needed
+        # values derived from the pitches, such as the root found; see 
+        # _checkDerivedCache()
+        self._derivedCache = {}
+        self._pitchesState = None
         # here, pitch and duration data is extracted from notes
         # if provided
 
@@ -275,6 +321,8 @@ class Chord(note.NotRest):
         # that looks only to _volume to see if it is not None; with a       
         # Chord, _volume will always be None
         new = note.NotRest.__deepcopy__(self, memo=memo)
+        new._derivedCache = {}
+        new._pitchesState = None
         # after copying, if a Volume exists, it is linked to the old object
         # look at _volume so as not to create object if not already there
         for d in new._notes:
@@ -397,7 +445,7 @@ class Chord(note.NotRest):
 
         Inversion is either 0 (for symmetrical) or -1/1
 
-        NOTE: time consuming, and only should be run when necessary.
+        The address is looked up in a table of all sets of pitch classes.
 
         ::
 
@@ -443,62 +491,16 @@ class Chord(note.NotRest):
             (3, 1, 0)
 
         '''
-        pcSet = self.orderedPitchClasses
+        pcSet = [component.pitch.pitchClass for component in self._notes]
         if len(pcSet) == 0:
             raise ChordException(
                 'cannot access chord tables address for Chord with %s pitches' % len(pcSet))
 
         #environLocal.printDebug(['calling seekChordTablesAddress:', pcSet])
 
-        card = len(pcSet)
-        if card == 1: # its a singleton: return
-            return (1, 1, 0)
-        elif card == 11: # its the only 11 note pcset
-            return (11, 1, 0)
-        elif card == 12: # its the aggregate
-            return (12, 1, 0)
-        # go through each rotation of pcSet
-        candidates = []
-        for rot in range(0, card):
-            testSet = pcSet[rot:] + pcSet[0:rot]
-            # transpose to lead with zero
-            testSet = [(x - testSet[0]) % 12 for x in testSet]
-            # create inversion; first take difference from 12 mod 12
-            testSetInvert = [(12 - x) % 12 for x in testSet]
-            testSetInvert.reverse() # reverse order (first steps now last)
-            # transpose all steps (were last) to zero, mod 12
-            testSetInvert = [(x + (12 - testSetInvert[0])) % 12
-                            for x in testSetInvert]
-            candidates.append([testSet, testSetInvert])
-
-        # compare sets to those in table
-        match = False
-        for indexCandidate in range(len(chordTables.FORTE[card])):
-            dataLine = chordTables.FORTE[card][indexCandidate]
-            if dataLine == None: continue # spacer lines
-            inversionsAvailable = chordTables.forteIndexToInversionsAvailable(
-                                  card, indexCandidate)
-
-            for candidate, candidateInversion in candidates:
-                #environLocal.printDebug([candidate])
-                # need to only match form
-                if dataLine[0] == tuple(candidate): # must compare to tuple
-                    if 0 in inversionsAvailable:
-                        index, inversion = indexCandidate, 0
-                    else:
-                        index, inversion = indexCandidate, 1
-                    match = True
-                    break
-                elif dataLine[0] == tuple(candidateInversion):
-                    if 0 in inversionsAvailable:
-                        index, inversion = indexCandidate, 0
-                    else:
-                        index, inversion = indexCandidate, -1
-                    match = True
-                    break
-        if not match:
-            raise ChordException('cannot find a chord table address for %s' % pcSet)
-        return (card, index, inversion)
+        # the addresses of all pitch class sets are precomputed; 
+        # duplicate pitch classes and their order do not matter
+        return chordTables.pitchClassesToAddress(pcSet)
 
     ### PRIVATE METHODS ###
     
@@ -525,6 +527,7 @@ class Chord(note.NotRest):
         msg.append('>')
         return ''.join(msg)
 
+    @_cacheDerived
     def _findBass(self):
         '''
         Returns the lowest note in the chord.
@@ -580,7 +583,51 @@ class Chord(note.NotRest):
         if not inPlace:
             return returnObj
 
+    def _checkDerivedCache(self):
+        '''
+        Clear the values derived from the pitches of this Chord if the 
+        pitches, or the Pitch objects themselves, have changed since the 
+        values were stored. 
+        
+        The root, bass, and inversion kept by root(), bass(), and 
+        inversion() are not cleared; they are only found again when the 
+        pitches are replaced.
+
+        >>> c = chord.Chord(['C4', 'E4', 'G4'])
+        >>> c.findRoot()
+        <music21.pitch.Pitch C4>
+        >>> c.isMajorTriad()
+        True
+        >>> c.pitches[1].accidental = pitch.Accidental('flat')
+        >>> c.isMajorTriad()
+        False
+        >>> c.commonName
+        'minor triad'
+        >>> c.pitches[2].name = 'A'
+        >>> c.findRoot()
+        <music21.pitch.Pitch A4>
+        >>> c.commonName
+        'diminished triad'
+
+        Values that depend on the root are found again when it is set:
+
+        >>> c = chord.Chord(['C4', 'E4', 'G4'])
+        >>> c.isMajorTriad()
+        True
+        >>> c.root('E4')
+        >>> c.isMajorTriad()
+        False
+        '''
+        state = tuple((id(component.pitch), component.pitch._getState()) 
+                      for component in self._notes)
+        if state == self._pitchesState:
+            return
+        self._derivedCache = {}
+        self._pitchesState = state
+        self._chordTablesAddressNeedsUpdating = True
+
     def _updateChordTablesAddress(self):
+        self._checkDerivedCache()
         if self._chordTablesAddressNeedsUpdating:
             self._chordTablesAddress = self.seekChordTablesAddress()
         self._chordTablesAddressNeedsUpdating = False
@@ -1016,6 +1063,7 @@ class Chord(note.NotRest):
         else:
             return True
 
+    @_cacheDerived
     def findRoot(self):
         ''' 
         Looks for the root usually by finding the note with the most 3rds above 
@@ -1864,6 +1912,7 @@ class Chord(note.NotRest):
                 return False
         return True
 
+    @_cacheDerivedFromRoot
     def isConsonant(self):
         '''
         returns True if the chord is
@@ -2402,6 +2451,7 @@ class Chord(note.NotRest):
 
         return True
 
+    @_cacheDerivedFromRoot
     def isMajorTriad(self):
         '''
         Returns True if chord is a Major Triad, that is, if it contains only notes that are
@@ -3332,6 +3382,7 @@ class Chord(note.NotRest):
         return property(**locals())
 
     @property
+    @_cacheDerived
     def commonName(self):
         '''
         Return the most common name associated with this Chord as a string.
@@ -3682,6 +3733,7 @@ class Chord(note.NotRest):
         return self._formatVectorString(self.normalForm)
 
     @property
+    @_cacheDerived
     def orderedPitchClasses(self):
         '''
         Return an list of pitch class integers, ordered form lowest to highest.
@@ -3738,6 +3790,7 @@ class Chord(note.NotRest):
         return len(self.orderedPitchClasses)
         
     @property
+    @_cacheDerived
     def pitchClasses(self):
         '''
         Return a list of all pitch classes in the chord as integers.
@@ -3868,12 +3921,10 @@ class Chord(note.NotRest):
                 >>> c.root()
                 <music21.pitch.Pitch A#4>
 
-            TODO: presently, whenever pitches are accessed, it sets
-            the _chordTablesAddressNeedsUpdating value to True
-            this is b/c the pitches list can be accessed and appended to.
-            A better way to do this needs to be found.
+            Values derived from the pitches, such as the chord tables 
+            address, are found again when the Pitch objects are changed; 
+            see _checkDerivedCache().
             '''
-            self._chordTablesAddressNeedsUpdating = True
             pitches = tuple(component.pitch for component in self._notes)
             return pitches
         def fset(self, value):
@@ -5110,6 +5161,32 @@ class Test(unittest.TestCase):
         self.assertEqual(s.highestOffset, 2.0)
         self.assertEqual(str(s.pitches), '[<music21.pitch.Pitch D2>, <music21.pitch.Pitch E-1>, <music21.pitch.Pitch B-6>]')
 
+    def testDerivedCacheA(self):
+        import copy
+        c1 = Chord(['c4', 'e4', 'g4'])
+        self.assertEqual(c1.pitchClasses, [0, 4, 7])
+        self.assertEqual(c1.forteClass, '3-11B')
+        # returned lists are copies
+        c1.pitchClasses.append(11)
+        self.assertEqual(c1.pitchClasses, [0, 4, 7])
+
+        c2 = copy.deepcopy(c1)
+        c2.pitches[1].octave = 5
+        c2.pitches[0].step = 'D'
+        self.assertEqual(c2.pitchClasses, [2, 4, 7])
+        self.assertEqual(c2.orderedPitchClasses, [2, 4, 7])
+        self.assertEqual(c2.forteClass, '3-7A')
+        self.assertEqual(c2.findRoot().nameWithOctave, 'E5')
+        # the original is unchanged
+        self.assertEqual(c1.pitchClasses, [0, 4, 7])
+        self.assertEqual(c1.findRoot().nameWithOctave, 'C4')
+
+        # replacing the pitches 
+        c1.pitches = ['a3', 'c4', 'e4']
+        self.assertEqual(c1.isConsonant(), True)
+        self.assertEqual(c1.commonName, 'minor triad')
+        self.assertEqual(c1.root().nameWithOctave, 'A3')
+
 
 #-------------------------------------------------------------------------------
 
@@ -2689,6 +2689,57 @@ def addressToCommonNames(address):
     else:
         return None
 
+# a list with the TN address of each set of pitch classes, indexed by 
+# the sum of 2 ** pitchClass over the set; created on first use
+_pitchClassSetAddresses = None
+
+def _getPitchClassSetAddresses():
+    '''Create the list of addresses of all pitch class sets from the 
+    transpositions of the normal forms in SCDICT.
+
+    >>> addresses = chordTables._getPitchClassSetAddresses()
+    >>> len(addresses)
+    4096
+    >>> addresses[0] is None
+    True
+    >>> addresses[2 ** 0 + 2 ** 4 + 2 ** 7]
+    (3, 11, -1)
+    '''
+    addresses = [None] * 4096
+    for card in range(1, 13):
+        for (index, inversion), data in SCDICT[card].items():
+            normalForm = data[0]
+            for transposition in range(12):
+                pitchClassBits = 0
+                for pc in normalForm:
+                    pitchClassBits |= 1 << ((pc + transposition) % 12)
+                addresses[pitchClassBits] = (card, index, inversion)
+    return addresses
+
+def pitchClassesToAddress(pitchClasses):
+    '''Given a collection of pitch classes, return the TN address of 
+    their set class, or None if there are no pitch classes. 
+    
+    The address is found in a table of all 4096 sets of pitch classes, 
+    created on first use.
+
+    >>> chordTables.pitchClassesToAddress([0, 4, 7])
+    (3, 11, -1)
+    >>> chordTables.pitchClassesToAddress([7, 10, 2, 2])
+    (3, 11, 1)
+    >>> chordTables.pitchClassesToAddress([0, 1, 3, 4, 6, 8, 10])
+    (7, 34, 0)
+    >>> chordTables.pitchClassesToAddress([]) is None
+    True
+    '''
+    global _pitchClassSetAddresses # pylint: disable=global-statement
+    if _pitchClassSetAddresses is None:
+        _pitchClassSetAddresses = _getPitchClassSetAddresses()
+    pitchClassBits = 0
+    for pc in pitchClasses:
+        pitchClassBits |= 1 << (pc % 12)
+    return _pitchClassSetAddresses[pitchClassBits]
+
 def addressToForteName(address, classification='tn'):
     '''Given an address, return the set-class name as a string.
 
@@ -2761,6 +2812,17 @@ class Test(unittest.TestCase):
             # must subtract one b/c all groups contain a zero set to pad
             # index values
             self.assertEqual(len(FORTE[setSize])-1, setCount)
+
+    def testPitchClassesToAddress(self):
+        for pitchClassBits in range(1, 4096):
+            pitchClasses = [pc for pc in range(12) if pitchClassBits & (1 << pc)]
+            address = pitchClassesToAddress(pitchClasses)
+            self.assertEqual(address[0], len(pitchClasses))
+            # the pitch classes are a transposition of the normal form
+            normalForm = addressToNormalForm(address)
+            transpositions = [sorted((pc + t) % 12 for pc in normalForm) 
+                              for t in range(12)]
+            self.assertEqual(pitchClasses in transpositions, True)
         
 
 
@@ -12,7 +12,9 @@
 This module was an attempt to speed up getElementsByClass searches
 for :class:`~music21.stream.Stream` objects by caching each of the classes in
 the Stream, but in the end it offered no significant speed improvements, so
-it is not used.
+it is not used. Streams instead keep a cached index of the positions of
+their elements by class name, built on first use; see
+:meth:`~music21.stream.Stream.getElementsByClass`.
 '''
 
 
@@ -1922,6 +1922,120 @@ class SingletonCounter(object):
 
 
 
+#-------------------------------------------------------------------------------
+class SlottedObject(object):
+    '''
+    A base class for objects that use __slots__ to save memory but that
+    still need to be pickled (and deep-copied) with any protocol.
+    Subclasses define their own __slots__; subclasses that do not define
+    __slots__ get a __dict__, which is also stored.
+
+    >>> class Mock(common.SlottedObject):
+    ...     __slots__ = ('a', 'b')
+    >>> m = Mock()
+    >>> m.a = 3
+    >>> m.__getstate__()
+    {'a': 3}
+    >>> n = Mock()
+    >>> n.__setstate__(m.__getstate__())
+    >>> n.a
+    3
+    >>> hasattr(n, 'b')
+    False
+    '''
+    __slots__ = ()
+
+    def __getstate__(self):
+        # needed to pickle with protocols that do not support __slots__
+        if hasattr(self, '__dict__'):
+            state = self.__dict__.copy()
+        else:
+            state = {}
+        for cls in self.__class__.mro():
+            for name in cls.__dict__.get('__slots__', ()):
+                if name == '__weakref__':
+                    continue
+                if hasattr(self, name): # slots may be unset
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+#-------------------------------------------------------------------------------
+class LRUCache(object):
+    '''
+    A cache of at most `maxSize` values stored by key. When the cache is
+    full, the least recently used values are discarded: half of them
+    at once, so that discarding is rare.
+
+    The number of hits and misses of get() are counted, for profiling.
+
+    >>> c = common.LRUCache(maxSize=4)
+    >>> for i in range(4):
+    ...     c[i] = str(i)
+    >>> c.get(0)
+    '0'
+    >>> c.get(10) is None
+    True
+    >>> c.hits, c.misses
+    (1, 1)
+    >>> c[4] = '4'
+    >>> len(c)
+    3
+    >>> sorted(c.keys()) # 1 and 2 were least recently used
+    [0, 3, 4]
+    >>> c.clear()
+    >>> len(c), c.hits, c.misses
+    (0, 0, 0)
+    '''
+    def __init__(self, maxSize=1024):
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+        # key: [value, time of last use]
+        self._data = {}
+        self._clock = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def keys(self):
+        return self._data.keys()
+
+    def get(self, key, default=None):
+        try:
+            entry = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._clock += 1
+        entry[1] = self._clock
+        return entry[0]
+
+    def __setitem__(self, key, value):
+        if len(self._data) >= self.maxSize and key not in self._data:
+            entries = sorted(self._data.items(), key=lambda x: x[1][1])
+            for oldKey, unused in entries[:max(1, len(entries) // 2)]:
+                del self._data[oldKey]
+        self._clock += 1
+        self._data[key] = [value, self._clock]
+
+    def clear(self):
+        '''Remove all values and reset the hit and miss counts.
+        '''
+        self._data = {}
+        self._clock = 0
+        self.hits = 0
+        self.misses = 0
+
+
 #-------------------------------------------------------------------------------
 class Iterator(object):
     '''A simple Iterator object used to handle iteration of Streams and other 
@@ -29,7 +29,7 @@ their own parsers (such as humdrum, musicxml, etc.)
 
 The second and subsequent times that a file is loaded it will likely be much
 faster since we store a parsed version of each file as a "pickle" object in
-the temp folder on the disk.
+a :class:`~music21.converter.ParseCache` on the disk.
 
 
 
@@ -43,17 +43,27 @@ the temp folder on the disk.
 import unittest
 
 import copy
+import hashlib
+import multiprocessing
 import os
 import re
+import tempfile
 import urllib
 import zipfile
 
+try:
+    import cPickle as pickleMod # much faster...
+except ImportError:
+    # in case we're on Jython, etc.
+    import pickle as pickleMod
+
 # import StringIO # this module is not supported in python3
 # use io.StringIO  in python 3, avail in 2.6, not 2.5
 
 from music21 import exceptions21
 from music21 import common
 from music21 import humdrum
+from music21 import spanner
 from music21 import stream
 from music21 import tinyNotation
 
@@ -75,9 +85,18 @@ from music21.noteworthy import binaryTranslate as noteworthyBinary # @Unresolved
 from music21.noteworthy import translate as noteworthyTranslate
 
 from music21 import environment
+from music21._version import __version__
 _MOD = 'converter.py'
 environLocal = environment.Environment(_MOD)
 
+# if True, MusicXML files are read with ElementTree's iterparse and 
+# translated measure by measure (see ConverterMusicXML)
+MUSICXML_ITERPARSE = False
+
+# if True, MIDI files are decoded into lightweight event tuples 
+# before creating music21 objects (see ConverterMidi)
+MIDI_EVENT_TUPLES = False
+
 
 
 
@@ -86,9 +105,12 @@ environLocal = environment.Environment(_MOD)
 class ArchiveManagerException(exceptions21.Music21Exception):
     pass
 
-class PickleFilterException(exceptions21.Music21Exception):
+class ParseCacheException(exceptions21.Music21Exception):
     pass
 
+# deprecated: use ParseCacheException
+PickleFilterException = ParseCacheException
+
 class ConverterException(exceptions21.Music21Exception):
     pass
 
@@ -191,61 +213,257 @@ class ArchiveManager(object):
 
 
 #-------------------------------------------------------------------------------
+class ParseCache(object):
+    '''
+    A cache on disk of parsed files, stored as pickles. 
+
+    Cached parses are found by a key made from a hash of the contents
+    of the source file, the music21 version, and the options used to
+    parse it (see :meth:`~music21.converter.ParseCache.getKey`), so a
+    cached parse is never used after the file or music21 has changed,
+    and copies of the same file share a single cached parse.
+
+    The directory and the maximum size (in bytes) of all cached parses 
+    default to the `directoryParseCache` and `parseCacheMaxSize` (in 
+    megabytes) preferences of the :class:`~music21.environment.Environment`.
+    When the maximum size is exceeded, the least recently used parses 
+    are removed.
+
+    >>> pc = converter.ParseCache(directory=environLocal.getRootTempDir())
+    >>> from music21.musicxml import testPrimitive
+    >>> fp = environLocal.getTempFile('.xml')
+    >>> f = open(fp, 'w')
+    >>> f.write(testPrimitive.pitches01a)
+    >>> f.close()
+    >>> key = pc.getKey(fp, format='musicxml')
+    >>> len(key)
+    32
+    >>> key == pc.getKey(fp, format='musicxml', reader='iterparse')
+    False
+    >>> pc.load(key) is None
+    True
+    >>> pc.store(key, [1, 2, 3])
+    >>> pc.load(key)
+    [1, 2, 3]
+    >>> pc.getStatistics()
+    {'hits': 1, 'writes': 1, 'misses': 1, 'evictions': 0}
+    >>> pc.remove(key)
+    >>> import os
+    >>> os.remove(fp)
+    '''
+    def __init__(self, directory=None, maxSize=None):
+        self.directory = directory
+        self.maxSize = maxSize
+        self.resetStatistics()
+
+    def getDirectory(self):
+        '''
+        Return the directory in which parses are cached, or None if 
+        there is no such directory and nothing can be cached.
+        '''
+        if self.directory is not None:
+            return self.directory
+        return environLocal.getParseCacheDir()
+
+    def getMaxSize(self):
+        '''
+        Return the maximum size, in bytes, of all cached parses, or 
+        None if the size is not bounded.
+        '''
+        if self.maxSize is not None:
+            return self.maxSize
+        maxSize = environLocal['parseCacheMaxSize']
+        if maxSize is None:
+            return None
+        return int(maxSize) * 1024 * 1024
+
+    def getKey(self, fp, **keywords):
+        '''
+        Return a key for the file at `fp` parsed with the options 
+        given as keywords: an md5 of the contents of the file, the music21 
+        version, and the options.
+        '''
+        m = hashlib.md5()
+        f = open(fp, 'rb')
+        try:
+            while True:
+                data = f.read(65536)
+                if not data:
+                    break
+                m.update(data)
+        finally:
+            f.close()
+        m.update(__version__)
+        m.update(repr(sorted(keywords.items())))
+        return m.hexdigest()
+
+    def _getCacheFp(self, key, directory=None):
+        if directory is None:
+            directory = self.getDirectory()
+            if directory is None:
+                return None
+        return os.path.join(directory, 'm21-' + key + '.p')
+
+    def _getEntries(self, directory):
+        '''
+        Return a list of (mtime, size, fp) of all cached parses in directory.
+        '''
+        post = []
+        for fn in os.listdir(directory):
+            if not (fn.startswith('m21-') and fn.endswith('.p')):
+                continue
+            fp = os.path.join(directory, fn)
+            try:
+                st = os.stat(fp)
+            except OSError: # removed by another process
+                continue
+            post.append((st.st_mtime, st.st_size, fp))
+        return post
+
+    def load(self, key):
+        '''
+        Return the object cached under `key`, or None if there is none
+        or if it cannot be unpickled, in which case it is removed.
+        '''
+        fpCache = self._getCacheFp(key)
+        if fpCache is None or not os.path.exists(fpCache):
+            self.misses += 1
+            return None
+        try:
+            f = open(fpCache, 'rb')
+            try:
+                obj = pickleMod.load(f)
+            finally:
+                f.close()
+        except Exception: # pylint: disable=broad-except
+            environLocal.printDebug(['cached parse (%s) is damaged; it will be removed' % fpCache])
+            self.remove(key)
+            self.misses += 1
+            return None
+        self.hits += 1
+        try: # mark as recently used
+            os.utime(fpCache, None)
+        except OSError:
+            pass
+        return obj
+
+    def store(self, key, obj):
+        '''
+        Pickle `obj` under `key`, then remove the least recently
+        used parses if the cache has grown beyond its maximum size.
+        '''
+        directory = self.getDirectory()
+        if directory is None:
+            return
+        fpCache = self._getCacheFp(key, directory)
+        # write to a temporary file first, so that other processes 
+        # never load a partially written pickle
+        fd, fpTemp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        f = os.fdopen(fd, 'wb')
+        try:
+            # a negative protocol value will get the highest protocol
+            pickleMod.dump(obj, f, protocol=-1)
+        finally:
+            f.close()
+        if os.path.exists(fpCache): # cannot rename over a file on win
+            os.remove(fpCache)
+        os.rename(fpTemp, fpCache)
+        self.writes += 1
+        self.evict()
+
+    def remove(self, key):
+        '''
+        Remove the parse cached under `key`, if any.
+        '''
+        fpCache = self._getCacheFp(key)
+        if fpCache is not None and os.path.exists(fpCache):
+            os.remove(fpCache)
+
+    def evict(self):
+        '''
+        Remove the least recently used parses until the size of all 
+        cached parses is no more than the maximum size.
+        '''
+        directory = self.getDirectory()
+        maxSize = self.getMaxSize()
+        if directory is None or maxSize is None:
+            return
+        entries = self._getEntries(directory)
+        totalSize = sum([size for unused_mtime, size, unused_fp in entries])
+        entries.sort()
+        for unused_mtime, size, fp in entries:
+            if totalSize <= maxSize:
+                break
+            try:
+                os.remove(fp)
+            except OSError: # removed by another process
+                pass
+            totalSize -= size
+            self.evictions += 1
+
+    def clear(self):
+        '''
+        Remove all cached parses.
+        '''
+        directory = self.getDirectory()
+        if directory is None:
+            return
+        for unused_mtime, unused_size, fp in self._getEntries(directory):
+            os.remove(fp)
+
+    def getStatistics(self):
+        '''
+        Return a dictionary of the number of hits, misses, writes, and 
+        evictions since this ParseCache was created or its statistics reset.
+        '''
+        return {'hits': self.hits, 'misses': self.misses, 
+                'writes': self.writes, 'evictions': self.evictions}
+
+    def resetStatistics(self):
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+
+# the ParseCache used by all Converters
+parseCache = ParseCache()
+
+
 class PickleFilter(object):
-    '''Before opening a file path, this class can check if there is an up 
-    to date version pickled and stored in the scratch directory. 
+    '''
+    This class exists for backwards compatibility; use 
+    :class:`~music21.converter.ParseCache` instead. 
 
-    If the user has not specified a scratch directory, a pickle path will 
-    not be created. 
+    Checks whether there is a cached parse of a file path in the 
+    ParseCache used by all Converters.
     '''
     def __init__(self, fp, forceSource=False):
-        '''Provide a file path to check if there is pickled version.
-
-        If forceSource is True, pickled files, if available, will not be
-        returned.
-        '''
+        import warnings
+        warnings.warn('converter.PickleFilter is deprecated: use converter.ParseCache', 
+            DeprecationWarning)
         self.fp = fp
         self.forceSource = forceSource
-        #environLocal.printDebug(['creating pickle filter'])
-
-    def _getPickleFp(self, directory):
-        if directory == None:
-            raise ValueError
-        return os.path.join(directory, 'm21-' + common.getMd5(self.fp) + '.p')
 
     def status(self):
-        '''Given a file path specified with __init__, look for an up to date pickled version of this file path. If it exists, return its fp, other wise return the original file path.
-
-        Return arguments are file path to load, boolean whether to write a pickle, and the file path of the pickle.
         '''
-        fpScratch = environLocal.getRootTempDir()
+        Return the file path to load, whether a parse should be cached, 
+        and the file path of the cached parse (or None), as before.
+        '''
         m21Format = common.findFormatFile(self.fp)
-
         if m21Format == 'pickle': # do not pickle a pickle
             if self.forceSource:
                 raise PickleFilterException('cannot access source file when only given a file path to a pickled file.')
-            writePickle = False # cannot write pickle if no scratch dir
-            fpLoad = self.fp
-            fpPickle = None                    
-        elif fpScratch == None or self.forceSource:
-            writePickle = False # cannot write pickle if no scratch dir
-            fpLoad = self.fp
-            fpPickle = None
-        else: # see which is more up to doate
-            fpPickle = self._getPickleFp(fpScratch)
-            if not os.path.exists(fpPickle):
-                writePickle = True # if pickled file does not exist
-                fpLoad = self.fp
-            else:
-                post = common.sortFilesRecent([self.fp, fpPickle])
-                if post[0] == fpPickle: # pickle is most recent
-                    writePickle = False
-                    fpLoad = fpPickle
-                elif post[0] == self.fp: # file is most recent
-                    writePickle = True
-                    fpLoad = self.fp
-        return fpLoad, writePickle, fpPickle
-
+            return self.fp, False, None
+        if self.forceSource:
+            return self.fp, False, None
+        fpPickle = parseCache._getCacheFp(parseCache.getKey(self.fp, 
+            format=m21Format))
+        if fpPickle is None: # no directory to cache parses in
+            return self.fp, False, None
+        if os.path.exists(fpPickle):
+            return fpPickle, False, fpPickle
+        return self.fp, True, fpPickle
 
 
 #-------------------------------------------------------------------------------
@@ -395,12 +613,31 @@ class ConverterNoteworthyBinary(object):
 #-------------------------------------------------------------------------------
 class ConverterMusicXML(object):
     '''Converter for MusicXML
+
+    If `useIterparse` is True (by default, the value of the module-level
+    `MUSICXML_ITERPARSE`), the file is read with ElementTree's iterparse 
+    rather than SAX, and each measure is translated into music21 and 
+    discarded as soon as it has been read, so the mxObjects for the 
+    whole document are never held in memory at once.  No pickle of 
+    the mxObjects is read or written in this mode.
+
+    >>> from music21.musicxml import testPrimitive
+    >>> c = converter.ConverterMusicXML(False, useIterparse=True)
+    >>> c.parseData(testPrimitive.pitches01a)
+    >>> len(c.stream.parts[0].getElementsByClass('Measure'))
+    26
     '''
 
-    def __init__(self, forceSource):
+    def __init__(self, forceSource, useIterparse=None):
         self._mxScore = None # store the musicxml object representation
         self._stream = stream.Score()
         self.forceSource = forceSource
+        if useIterparse is None:
+            useIterparse = MUSICXML_ITERPARSE
+        self.useIterparse = useIterparse
+        # when parts have already been translated by iterparse 
+        self._m21PartIdDictionary = None
+        self._spannerBundle = None
 
     #---------------------------------------------------------------------------
     def partIdToNameDict(self):
@@ -413,7 +650,10 @@ class ConverterMusicXML(object):
         #t = common.Timer()
         #t.start()
         from music21.musicxml import fromMxObjects
-        fromMxObjects.mxScoreToScore(self._mxScore, inputM21 = self._stream)
+        fromMxObjects.mxScoreToScore(self._mxScore, 
+                            spannerBundle=self._spannerBundle,
+                            inputM21=self._stream,
+                            m21PartIdDictionary=self._m21PartIdDictionary)
         #self._stream._setMX(self._mxScore)
         #t.stop()
         #environLocal.printDebug(['music21 object creation time:', t])
@@ -424,11 +664,28 @@ class ConverterMusicXML(object):
     stream = property(_getStream)
 
 
+    def _iterparseParts(self, fileLike, isFile=True):
+        '''
+        Translate all parts into the stream with iterparse, leaving 
+        in self._mxScore the mxScore without its measures.
+        '''
+        from music21.musicxml import fromMxObjects
+        c = musicxmlHandler.Document()
+        self._spannerBundle = spanner.SpannerBundle()
+        self._m21PartIdDictionary = fromMxObjects.mxIterparseToParts(c, 
+                            fileLike, isFile=isFile, 
+                            spannerBundle=self._spannerBundle, 
+                            inputM21=self._stream)
+        return c
+
     #---------------------------------------------------------------------------
     def parseData(self, xmlString, number=None):
         '''Open MusicXML data from a string.'''
-        c = musicxmlHandler.Document()
-        c.read(xmlString)
+        if self.useIterparse:
+            c = self._iterparseParts(xmlString, isFile=False)
+        else:
+            c = musicxmlHandler.Document()
+            c.read(xmlString)
         self._mxScore = c.score #  the mxScore object from the musicxml Document
         if len(self._mxScore) == 0:
             #print xmlString
@@ -436,62 +693,45 @@ class ConverterMusicXML(object):
         self.load()
 
     def parseFile(self, fp, number=None):
-        '''Open from a file path; check to see if there is a pickled
-        version available and up to date; if so, open that, otherwise
-        open source.
+        '''Open from a file path; check to see if a parse of this file
+        is available in the :class:`~music21.converter.ParseCache`; if so, 
+        open that, otherwise open source and store it in the cache.
         '''
-        # return fp to load, if pickle needs to be written, fp pickle
-        # this should be able to work on a .mxl file, as all we are doing
-        # here is seeing which is more recent
-
-        pfObj = PickleFilter(fp, self.forceSource)
-        # fpDst here is the file path to load, which may or may not be
-        # a pickled file 
-        fpDst, writePickle, fpPickle = pfObj.status() # get status
-
-        formatSrc = common.findFormatFile(fp)
-        # here we determine if we have pickled file or a musicxml file
-        m21Format = common.findFormatFile(fpDst)
-        pickleError = False
-
         c = musicxmlHandler.Document()
-        if m21Format == 'pickle':
-            environLocal.printDebug(['opening pickled file', fpDst])
-            try:
-                c.openPickle(fpDst)
-            except (ImportError, EOFError):
-                msg = 'pickled file (%s) is damaged; a new file will be created.' % fpDst
-                pickleError = True
-                writePickle = True
-                if formatSrc == 'musicxml':
-                    #environLocal.printDebug([msg], environLocal)
-                    fpDst = fp # set to orignal file path
-                else:
-                    raise ConverterException(msg)
-            # check if this pickle is up to date
-            if (hasattr(c.score, 'm21Version') and 
-                c.score.m21Version >= musicxmlHandler.musicxmlMod.VERSION_MINIMUM):
-                pass
-                #environLocal.printDebug(['pickled file version is compatible', c.score.m21Version])
+        formatSrc = common.findFormatFile(fp)
+        if formatSrc == 'pickle':
+            if self.forceSource:
+                raise ConverterException('cannot access source file when only given a file path to a pickled file.')
+            environLocal.printDebug(['opening pickled file', fp])
+            c.openPickle(fp)
+        else:
+            cacheKey = None
+            mxScore = None
+            # with iterparse there is no complete mxScore to cache
+            if not self.forceSource and not self.useIterparse:
+                cacheKey = parseCache.getKey(fp, format='musicxml')
+                mxScore = parseCache.load(cacheKey)
+            if mxScore is not None:
+                environLocal.printDebug(['opening cached parse of', fp])
+                c.score = mxScore
             else:
-                try:
-                    environLocal.printDebug(['pickled file version is not compatible', c.score.m21Version])
-                except (AttributeError, TypeError):
-                    # some old pickles have no versions
-                    pass
-                pickleError = True
-                writePickle = True
-                fpDst = fp # set to orignal file path
-
-        if m21Format == 'musicxml' or (formatSrc == 'musicxml' and pickleError):
-            environLocal.printDebug(['opening musicxml file:', fpDst])
-
-            # here, we can see if this is a mxl or similar archive
-            arch = ArchiveManager(fpDst)
-            if arch.isArchive():
-                c.read(arch.getData())
-            else: # its a file path or a raw musicxml string
-                c.open(fpDst)
+                environLocal.printDebug(['opening musicxml file:', fp])
+                # here, we can see if this is a mxl or similar archive
+                arch = ArchiveManager(fp)
+                if self.useIterparse:
+                    if arch.isArchive():
+                        c = self._iterparseParts(arch.getData(), isFile=False)
+                    else:
+                        c = self._iterparseParts(fp, isFile=True)
+                elif arch.isArchive():
+                    c.read(arch.getData())
+                else: # its a file path or a raw musicxml string
+                    c.open(fp)
+                # only cache if we have parts defined; this is done before
+                # a title is set from the file name, as copies of this 
+                # file with other names share the cached parse
+                if cacheKey is not None and len(c.score) > 0:
+                    parseCache.store(cacheKey, c.score)
 
         # get mxScore object from .score attribute
         self._mxScore = c.score
@@ -509,13 +749,6 @@ class ConverterMusicXML(object):
                 # set as movement title
                 self._mxScore.set('movementTitle', fn)
 
-        # only write pickle if we have parts defined
-        if writePickle:
-            if fpPickle == None: # if original file cannot be found
-                raise ConverterException('attempting to write pickle but no file path is given')
-            environLocal.printDebug(['writing pickled file', fpPickle])
-            c.writePickle(fpPickle)
-
         self.load()
 
 
@@ -525,11 +758,27 @@ class ConverterMusicXML(object):
 class ConverterMidi(object):
     '''
     Simple class wrapper for parsing MIDI.
+
+    If `useEventTuples` is True (by default, the value of the module-level
+    `MIDI_EVENT_TUPLES`), the MIDI data is decoded straight into 
+    lightweight event tuples, and music21 objects are only created once 
+    notes have been paired and gathered into chords; no MidiTrack or 
+    MidiEvent objects are created. The resulting Score is the same.
+
+    >>> import os
+    >>> fp = os.path.join(common.getSourceFilePath(), 'midi', 'testPrimitive',  'test05.mid')
+    >>> c = converter.ConverterMidi(useEventTuples=True)
+    >>> c.parseFile(fp)
+    >>> len(c.stream.flat.getElementsByClass('Chord'))
+    4
     '''
 
-    def __init__(self):
+    def __init__(self, useEventTuples=None):
         # always create a score instance
         self._stream = stream.Score()
+        if useEventTuples is None:
+            useEventTuples = MIDI_EVENT_TUPLES
+        self.useEventTuples = useEventTuples
 
     def parseData(self, strData, number=None):
         '''
@@ -538,7 +787,8 @@ class ConverterMidi(object):
         Calls midi.translate.midiStringToStream.
         '''
         from music21.midi import translate as midiTranslate
-        midiTranslate.midiStringToStream(strData, self._stream)
+        midiTranslate.midiStringToStream(strData, self._stream, 
+                                         useEventTuples=self.useEventTuples)
 
     def parseFile(self, fp, number=None):
         '''
@@ -547,7 +797,8 @@ class ConverterMidi(object):
         Calls midi.translate.midiFilePathToStream.
         '''
         from music21.midi import translate as midiTranslate
-        midiTranslate.midiFilePathToStream(fp, self._stream)
+        midiTranslate.midiFilePathToStream(fp, self._stream, 
+                                           useEventTuples=self.useEventTuples)
 
     def _getStream(self):
         return self._stream
@@ -1102,6 +1353,95 @@ def parse(value, *args, **keywords):
         return parseData(value, number=number, format=m21Format)
 
 
+def _parseManyWorker(job):
+    '''
+    Parse one item of parseMany() in a worker process, returning 
+    (index, pickled Stream or None, error message or None).
+    '''
+    index, value, keywords, useCorpus = job
+    try:
+        if useCorpus:
+            from music21 import corpus
+            streamObj = corpus.parse(value, **keywords)
+        else:
+            streamObj = parse(value, **keywords)
+        from music21 import freezeThaw
+        # the Stream is discarded here, so no copy is needed 
+        data = freezeThaw.StreamFreezer(streamObj, 
+                                        fastButUnsafe=True).writeStr()
+    except Exception as e: # report all errors to the caller
+        return index, None, '%s: %s' % (e.__class__.__name__, e)
+    return index, data, None
+
+def _parseManyIterator(values, processes, ordered, keywords, useCorpus):
+    jobs = [(i, v, keywords, useCorpus) for i, v in enumerate(values)]
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    processes = min(processes, len(jobs))
+    if processes <= 1: # parse here, without pickling 
+        for i, value, unused, unused in jobs:
+            try:
+                if useCorpus:
+                    from music21 import corpus
+                    streamObj = corpus.parse(value, **keywords)
+                else:
+                    streamObj = parse(value, **keywords)
+            except Exception as e:
+                yield value, None, '%s: %s' % (e.__class__.__name__, e)
+            else:
+                yield value, streamObj, None
+        return
+
+    pool = multiprocessing.Pool(processes=processes)
+    try:
+        if ordered:
+            results = pool.imap(_parseManyWorker, jobs)
+        else:
+            results = pool.imap_unordered(_parseManyWorker, jobs)
+        for i, data, error in results:
+            streamObj = None
+            if data is not None:
+                try:
+                    streamObj = thawStr(data)
+                except Exception as e:
+                    error = '%s: %s' % (e.__class__.__name__, e)
+            yield values[i], streamObj, error
+        pool.close()
+    finally:
+        # also reached if the caller stops iterating early
+        pool.terminate()
+        pool.join()
+
+def parseMany(values, processes=None, ordered=True, **keywords):
+    '''
+    Parse many file paths, URLs, or data strings, each as 
+    :func:`~music21.converter.parse` would, across a pool of 
+    `processes` worker processes (by default, one per CPU).  Parsed
+    Streams are returned to this process with the pickling of 
+    :func:`~music21.converter.freezeStr`.  Any keywords are passed
+    to parse().
+
+    This is a generator of (value, Stream, error) tuples.  If a value 
+    cannot be parsed, the Stream is None and error is a string 
+    describing the exception; the other values are still parsed.
+    If `ordered` is True, results come in the order of `values`; 
+    otherwise each comes as soon as it is ready.
+
+    With `processes` of 1 everything is parsed in this process.
+
+    >>> data = ['tinyNotation: 4/4 c4 d e f', 'tinyNotation: 3/4 g2.', 'tinyNotation: 2/4 x']
+    >>> for value, s, error in converter.parseMany(data, processes=2):
+    ...     if error is None:
+    ...         print(len(s.flat.notes))
+    ...     else:
+    ...         print(error)
+    4
+    1
+    TinyNotationException: could not get pitch information from x
+    '''
+    values = list(values)
+    return _parseManyIterator(values, processes, ordered, keywords, False)
+
 
 def freeze(streamObj, fmt=None, fp=None):
     '''Given a StreamObject and a file path, serialize and store the Stream to a file.
@@ -1281,6 +1621,95 @@ class Test(unittest.TestCase):
                 j = copy.deepcopy(obj)
 
 
+    def testParseManyUnordered(self):
+        from music21 import corpus
+        workNames = ['bach/bwv66.6', 'bach/bwv1.6', 'notAWork', 'luca/gloria']
+        results = list(parseMany([corpus.getWork(w) for w in workNames[:2]] + 
+                                 ['tinyNotation: 4/4 c4 d e f'], 
+                                 processes=2, ordered=False))
+        self.assertEqual(len(results), 3)
+        self.assertEqual(sorted(len(s.flat.notes) for v, s, e in results), 
+                         [4, 165, 498])
+
+        results = list(corpus.parseMany(workNames, processes=3, ordered=False))
+        self.assertEqual(sorted(r[0] for r in results), sorted(workNames))
+        for workName, s, error in results:
+            if workName == 'notAWork':
+                self.assertEqual(s, None)
+                self.assertTrue(error.startswith('CorpusException'))
+            else:
+                self.assertEqual(error, None)
+                self.assertTrue(s.corpusFilepath.startswith(workName))
+
+    def testParseCache(self):
+        import shutil
+        from music21.musicxml import testPrimitive
+        global parseCache # pylint: disable=global-statement
+        directory = tempfile.mkdtemp(dir=environLocal.getRootTempDir())
+        fpA = os.path.join(directory, 'a.xml')
+        fpB = os.path.join(directory, 'b.xml')
+        # without a title, the file name is used as a title
+        data = testPrimitive.pitches01a.replace(
+            '<movement-title>Pitches and accidentals</movement-title>', '')
+        for fp in [fpA, fpB]:
+            f = open(fp, 'w')
+            f.write(data)
+            f.close()
+        oldParseCache = parseCache
+        parseCache = ParseCache(directory=directory)
+        try:
+            s = parseFile(fpA)
+            self.assertEqual(parseCache.getStatistics(), 
+                {'hits': 0, 'misses': 1, 'writes': 1, 'evictions': 0})
+            # a copy of the same file is found in the cache, but gets its
+            # own file name as a title
+            sCopy = parseFile(fpB)
+            self.assertEqual(parseCache.hits, 1)
+            self.assertEqual(s.metadata.movementName, 'a.xml')
+            self.assertEqual(sCopy.metadata.movementName, 'b.xml')
+            self.assertEqual(len(sCopy.flat.notes), len(s.flat.notes))
+            # forcing the source does not use the cache
+            parseFile(fpA, forceSource=True)
+            self.assertEqual(parseCache.hits + parseCache.misses, 2)
+
+            # a changed file is not found in the cache
+            f = open(fpB, 'w')
+            f.write(data.replace('<step>C</step>', '<step>D</step>'))
+            f.close()
+            parseFile(fpB)
+            self.assertEqual(parseCache.misses, 2)
+            self.assertEqual(len(parseCache._getEntries(directory)), 2)
+
+            # with room for only one parse, the least recently used is removed
+            keyA = parseCache.getKey(fpA, format='musicxml')
+            self.assertNotEqual(parseCache.load(keyA), None)
+            parseCache.maxSize = max([size for unused_mtime, size, fp in 
+                                      parseCache._getEntries(directory)])
+            parseCache.evict()
+            self.assertEqual(parseCache.evictions, 1)
+            self.assertNotEqual(parseCache.load(keyA), None)
+
+            # a damaged parse is removed
+            f = open(parseCache._getCacheFp(keyA), 'wb')
+            f.write('damaged')
+            f.close()
+            self.assertEqual(parseCache.load(keyA), None)
+            self.assertEqual(parseCache._getEntries(directory), [])
+        finally:
+            parseCache = oldParseCache
+            shutil.rmtree(directory)
+
+    def testPickleFilterDeprecated(self):
+        import warnings
+        from music21 import corpus
+        fp = corpus.getWorkList('bwv66.6')[0]
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            pf = PickleFilter(fp, forceSource=True)
+        self.assertEqual(caught[0].category, DeprecationWarning)
+        self.assertEqual(pf.status(), (fp, False, None))
+        self.assertTrue(PickleFilterException is ParseCacheException)
+
     def testConversionMX(self):
         from music21.musicxml import testPrimitive
         from music21 import dynamics
@@ -1820,7 +2249,7 @@ class Test(unittest.TestCase):
 
 #-------------------------------------------------------------------------------
 # define presented order in documentation
-_DOC_ORDER = [parse, parseFile, parseData, parseURL, freeze, thaw, freezeStr, thawStr, Converter, ConverterMusicXML, ConverterHumdrum]
+_DOC_ORDER = [parse, parseFile, parseData, parseURL, parseMany, freeze, thaw, freezeStr, thawStr, Converter, ConverterMusicXML, ParseCache, ConverterHumdrum]
 
 
 if __name__ == "__main__":
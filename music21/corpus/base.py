@@ -887,6 +887,30 @@ def parse(workName, movementNumber=None, number=None,
     _addCorpusFilepath(streamObj, fp)
     return streamObj
 
+def parseMany(workNames, processes=None, ordered=True, **keywords):
+    '''
+    Parse many works from the corpus, each as :func:`~music21.corpus.parse` 
+    would, across a pool of `processes` worker processes (by default,
+    one per CPU).  Keywords (such as `movementNumber` or `forceSource`) 
+    are passed to parse().
+
+    This is a generator of (workName, Stream, error) tuples; see 
+    :func:`~music21.converter.parseMany` for the treatment of errors 
+    and of `ordered`.
+
+    >>> for workName, s, error in corpus.parseMany(['bwv66.6', 'bwv1.6', 'notAWork'], 
+    ...         processes=2):
+    ...     if error is None:
+    ...         print("%s %s" % (workName, s.corpusFilepath))
+    ...     else:
+    ...         print("%s %s" % (workName, error))
+    bwv66.6 bach/bwv66.6.mxl
+    bwv1.6 bach/bwv1.6.mxl
+    notAWork CorpusException: Could not find a work that met this criterion: notAWork
+    '''
+    return converter._parseManyIterator(list(workNames), processes, ordered,
+                                        keywords, True)
+
 def _addCorpusFilepath(streamObj, filepath):   
     # metadata attribute added to store the file path, for use later in identifying the score
     #if streamObj.metadata == None:
@@ -1360,7 +1384,7 @@ class Test(unittest.TestCase):
 
 #-------------------------------------------------------------------------------
 # define presented order in documentation
-_DOC_ORDER = [parse, getWork]
+_DOC_ORDER = [parse, parseMany, getWork]
 
 
 if __name__ == "__main__":
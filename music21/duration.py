@@ -94,6 +94,11 @@ ordinalTypeFromNum = ["duplex-maxima", "maxima", "longa", "breve", "whole",
 
 defaultTupletNumerators = [3, 5, 7, 11, 13]
 
+# bounded caches of conversions from quarterLength; see conversionCacheInfo()
+_dottedMatchCache = common.LRUCache(maxSize=1024)
+_quarterLengthToTupletCache = common.LRUCache(maxSize=1024)
+_quarterLengthToDurationsCache = common.LRUCache(maxSize=1024)
+
 
 def unitSpec(durationObjectOrObjects):
     '''
@@ -262,6 +267,12 @@ def dottedMatch(qLen, maxDots=4):
     (False, False)
 
     '''
+    key = (qLen, maxDots)
+    post = _dottedMatchCache.get(key)
+    if post is not None:
+        return post
+
+    post = (False, False)
     for dots in range(0, maxDots + 1):
         ## assume qLen has n dots, so find its non-dotted length
         preDottedLength = (qLen + 0.0) / common.dotMultiplier(dots)
@@ -270,8 +281,10 @@ def dottedMatch(qLen, maxDots=4):
         except DurationException:
             continue
         if match is True:
-            return (dots, durType)
-    return (False, False)
+            post = (dots, durType)
+            break
+    _dottedMatchCache[key] = post
+    return post
 
 
 def quarterLengthToTuplet(qLen, maxToReturn=4):
@@ -303,6 +316,15 @@ def quarterLengthToTuplet(qLen, maxToReturn=4):
     >>> c.tupletMultiplier()
     0.6666...
     '''
+    key = (qLen, maxToReturn)
+    post = _quarterLengthToTupletCache.get(key)
+    if post is None:
+        post = _quarterLengthToTuplet(qLen, maxToReturn)
+        _quarterLengthToTupletCache[key] = post
+    # return copies: Tuplets are changed once attached to Durations
+    return [copy.deepcopy(t) for t in post]
+
+def _quarterLengthToTuplet(qLen, maxToReturn):
     post = []
     # type, qLen pairs
     durationToType = []
@@ -431,7 +453,22 @@ def quarterLengthToDurations(qLen, link=True):
     >>> duration.quarterLengthToDurations(0.0)
     [<music21.duration.ZeroDuration>]
 
+    Results are cached (see :func:`~music21.duration.conversionCacheInfo`);
+    each call returns new DurationUnits.
+
+    >>> a = duration.quarterLengthToDurations(1.5)
+    >>> b = duration.quarterLengthToDurations(1.5)
+    >>> a == b, a[0] is b[0]
+    (True, False)
     '''
+    key = (qLen, link)
+    post = _quarterLengthToDurationsCache.get(key)
+    if post is None:
+        post = _quarterLengthToDurations(qLen, link)
+        _quarterLengthToDurationsCache[key] = post
+    return [du.unfrozenCopy() for du in post]
+
+def _quarterLengthToDurations(qLen, link):
     post = []
     
     if qLen < 0:
@@ -496,6 +533,34 @@ def quarterLengthToDurations(qLen, link=True):
             du.unlink()
     return post
 
+def conversionCacheInfo():
+    '''
+    Return a dictionary with the number of hits, the number of misses, 
+    the size, and the maximum size of each cache of quarterLength conversions.
+    Use clearConversionCaches() to reset them.
+
+    >>> duration.clearConversionCaches()
+    >>> for i in range(3):
+    ...     unused = duration.quarterLengthToDurations(2.75)
+    >>> duration.conversionCacheInfo()['quarterLengthToDurations']
+    (2, 2, 2, 1024)
+    '''
+    return {'dottedMatch': _cacheInfo(_dottedMatchCache), 
+        'quarterLengthToTuplet': _cacheInfo(_quarterLengthToTupletCache),
+        'quarterLengthToDurations': _cacheInfo(_quarterLengthToDurationsCache),
+        }
+
+def _cacheInfo(cache):
+    return (cache.hits, cache.misses, len(cache), cache.maxSize)
+
+def clearConversionCaches():
+    '''
+    Remove all cached quarterLength conversions and reset their counts.
+    '''
+    _dottedMatchCache.clear()
+    _quarterLengthToTupletCache.clear()
+    _quarterLengthToDurationsCache.clear()
+
         
 def partitionQuarterLength(qLen, qLenDiv=4):
     '''
@@ -779,7 +844,7 @@ def updateTupletType(durationList):
 class TupletException(exceptions21.Music21Exception):
     pass
 
-class Tuplet(object):
+class Tuplet(common.SlottedObject):
     '''
     A tuplet object is a representation of a musical tuplet (like a
     triplet).  It expresses a ratio that 
@@ -863,10 +928,14 @@ class Tuplet(object):
 
     '''
 
-    frozen = False
+    __slots__ = ('frozen', 'tupletId', 'nestedLevel', 'numberNotesActual',
+                 'durationActual', 'numberNotesNormal', 'durationNormal',
+                 'type', 'bracket', 'placement', 'tupletActualShow',
+                 'tupletNormalShow')
 
     def __init__(self, *arguments, **keywords):
         #environLocal.printDebug(['creating Tuplet instance'])
+        self.frozen = False
 
         # necessary for some complex tuplets, interrupted, for instance
 
@@ -1167,7 +1236,7 @@ class Tuplet(object):
 
 
 #-------------------------------------------------------------------------------
-class DurationCommon(object):
+class DurationCommon(common.SlottedObject):
     '''A base class for both Duration and DurationUnit objects.
     '''
     #def __init__(self):
@@ -1175,11 +1244,16 @@ class DurationCommon(object):
     #def __init__(self):
         # this parameter permits linking type, dots, and tuplets to qLen
 
+    # subclasses define __slots__: there are many Durations in a score
+    __slots__ = ()
+
     # this functionality is on Music21Object; added here for comparisons
     def _getClasses(self):
-        if self._classes is None:
-            self._classes = [x.__name__ for x in self.__class__.mro()] 
-        return self._classes
+        # stored on the class, as instances may not have a __dict__
+        cls = self.__class__
+        if cls.__dict__.get('_classes') is None:
+            cls._classes = [x.__name__ for x in cls.mro()] 
+        return cls._classes
 
     classes = property(_getClasses, doc='''Returns a list containing the names (strings, not objects) of classes that this 
         object belongs to -- starting with the object's class name and going up the mro()
@@ -1234,11 +1308,26 @@ class DurationUnit(DurationCommon):
         * 'unexpressible' type for anything that cannot 
           be expressed as a single notation unit, and thus 
           needs a full Duration object (such as 2.5 quarterLengths.)
+
+    DurationUnits may be frozen, in which case they become immutable and
+    can be shared by many Durations; see :func:`~music21.duration.sharedDurationUnit`.
+    A frozen DurationUnit is not copied by deepcopy.
+
+    >>> du = duration.DurationUnit('half')
+    >>> du.frozen = True
+    >>> du.type = 'whole'
+    Traceback (most recent call last):
+    DurationException: A frozen DurationUnit (shared by many Durations) is immutable
+    >>> copy.deepcopy(du) is du
+    True
     '''
+    __slots__ = ('frozen', '_link', '_type', '_dots', '_tuplets', '_qtrLength',
+                 '_typeNeedsUpdating', '_quarterLengthNeedsUpdating')
   
     def __init__(self, prototype='quarter'):
         #DurationCommon.__init__(self)
 
+        self.frozen = False
         self._link = True # default is True
 
         self._type = ""
@@ -1308,10 +1397,56 @@ class DurationUnit(DurationCommon):
         '''
         return not self.__eq__(other)
 
+    def __deepcopy__(self, memo=None):
+        # frozen DurationUnits are shared: a copy would waste memory
+        if self.frozen:
+            return self
+        return self.unfrozenCopy(memo)
+
+    def unfrozenCopy(self, memo=None):
+        '''
+        Return a deep copy of this DurationUnit that is not frozen, 
+        and thus can be changed.
+
+        >>> du = duration.sharedDurationUnit('eighth')
+        >>> du2 = du.unfrozenCopy()
+        >>> du2.frozen
+        False
+        >>> du2.dots = 1
+        >>> du2, du
+        (<music21.duration.DurationUnit 0.75>, <music21.duration.DurationUnit 0.5>)
+        '''
+        # slots are copied directly, as this is called for each 
+        # DurationUnit returned by quarterLengthToDurations()
+        new = self.__class__.__new__(self.__class__)
+        new.frozen = False
+        new._link = self._link
+        new._type = self._type
+        new._dots = list(self._dots)
+        if self._tuplets:
+            new._tuplets = copy.deepcopy(self._tuplets, memo)
+        else:
+            new._tuplets = ()
+        new._typeNeedsUpdating = self._typeNeedsUpdating
+        if self.frozen and self._link:
+            # as in a new DurationUnit, quarterLength is derived when needed
+            new._qtrLength = 0.0
+            new._quarterLengthNeedsUpdating = True
+        else:
+            new._qtrLength = self._qtrLength
+            new._quarterLengthNeedsUpdating = self._quarterLengthNeedsUpdating
+        if hasattr(self, '__dict__'): # subclasses without __slots__
+            new.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        return new
+
     def link(self):
+        if self.frozen and not self._link:
+            raise DurationException("A frozen DurationUnit (shared by many Durations) is immutable")
         self._link = True
 
     def unlink(self):
+        if self.frozen and self._link:
+            raise DurationException("A frozen DurationUnit (shared by many Durations) is immutable")
         self._link = False
 
     def _isLinked(self):
@@ -1394,6 +1529,8 @@ class DurationUnit(DurationCommon):
             raise DurationException('amountToScale must be greater than zero')
 
         if inPlace:
+            if self.frozen:
+                raise DurationException("A frozen DurationUnit (shared by many Durations) is immutable")
             post = self
         else:
             post = DurationUnit()
@@ -1457,6 +1594,8 @@ class DurationUnit(DurationCommon):
         if not common.isNum(value):
             raise DurationException(
             "not a valid quarter length (%s)" % value)
+        if self.frozen:
+            raise DurationException("A frozen DurationUnit (shared by many Durations) is immutable")
         if isinstance(value, int):
             value = float(value)
             
@@ -1528,6 +1667,8 @@ class DurationUnit(DurationCommon):
         # validate
         if value not in typeToDuration:
             raise DurationException("no such type exists: %s" % value)
+        if self.frozen:
+            raise DurationException("A frozen DurationUnit (shared by many Durations) is immutable")
         if value != self._type: # only update if different
             # link status will be checked in quarterLengthNeeds updating
             self._quarterLengthNeedsUpdating = True
@@ -1619,6 +1760,8 @@ class DurationUnit(DurationCommon):
         1.75
 
         '''
+        if self.frozen:
+            raise DurationException("A frozen DurationUnit (shared by many Durations) is immutable")
         if value != self._dots[0]:
             self._quarterLengthNeedsUpdating = True
         if common.isNum(value):
@@ -1652,6 +1795,8 @@ class DurationUnit(DurationCommon):
         '''
         Sets the number of dots in a dot group
         '''
+        if self.frozen:
+            raise DurationException("A frozen DurationUnit (shared by many Durations) is immutable")
         self._quarterLengthNeedsUpdating = True
         if common.isListLike(listValue):
             if not isinstance(listValue, list):
@@ -1676,6 +1821,8 @@ class DurationUnit(DurationCommon):
         if not isinstance(value, tuple):
             raise DurationException(
             "value submitted (%s) is not a tuple of tuplets" % value)
+        if self.frozen:
+            raise DurationException("A frozen DurationUnit (shared by many Durations) is immutable")
         if self._tuplets != value:
             self._quarterLengthNeedsUpdating = True
         # note that in some cases this methods seems to be called more 
@@ -1690,6 +1837,8 @@ class DurationUnit(DurationCommon):
     tuplets = property(_getTuplets, _setTuplets)
 
     def appendTuplet(self, newTuplet):
+        if self.frozen:
+            raise DurationException("A frozen DurationUnit (shared by many Durations) is immutable")
         newTuplet.frozen = True
         self._tuplets = self._tuplets + (newTuplet,)
         self._quarterLengthNeedsUpdating = True
@@ -1791,6 +1940,8 @@ class ZeroDuration(DurationUnit):
     '''
     Represents any Music21 element that does not last any length of time.
     '''
+    __slots__ = ()
+
     isGrace = False
 
     def __init__(self):
@@ -1810,6 +1961,54 @@ class ZeroDuration(DurationUnit):
         return '<music21.duration.ZeroDuration>'
 
 
+# when True, Durations set from a quarterLength, and Durations read
+# from MusicXML, use frozen DurationUnits shared by all Durations of 
+# the same type and dots; this saves memory in large scores
+SHARE_DURATION_UNITS = False
+
+_sharedDurationUnits = {}
+
+def sharedDurationUnit(durType, dots=0):
+    '''
+    Return a frozen DurationUnit of the given type and number of dots. 
+    The same object is returned for each call with the same values.
+
+    >>> du = duration.sharedDurationUnit('eighth', 1)
+    >>> du
+    <music21.duration.DurationUnit 0.75>
+    >>> du.frozen
+    True
+    >>> du is duration.sharedDurationUnit('eighth', 1)
+    True
+    >>> du.dots = 2
+    Traceback (most recent call last):
+    DurationException: A frozen DurationUnit (shared by many Durations) is immutable
+
+    A Duration replaces its frozen components with unfrozen copies before
+    changing them.
+
+    >>> d = duration.Duration(components=[du])
+    >>> d.dots = 2
+    >>> d.components[0] is du
+    False
+    >>> d.quarterLength, du.quarterLength
+    (0.875, 0.75)
+    '''
+    key = (durType, dots)
+    try:
+        return _sharedDurationUnits[key]
+    except KeyError:
+        pass
+    # types read from MusicXML may be unicode
+    du = DurationUnit(str(durType))
+    du.dots = dots
+    # resolve all lazily updated values before freezing
+    du.updateQuarterLength()
+    du.frozen = True
+    _sharedDurationUnits[key] = du
+    return du
+
+
 #-------------------------------------------------------------------------------
 class DurationException(exceptions21.Music21Exception):
     pass
@@ -1881,6 +2080,9 @@ class Duration(DurationCommon):
     
     '''
 
+    __slots__ = ('_qtrLength', '_components', '_componentsNeedUpdating',
+                 '_quarterLengthNeedsUpdating', '_cachedIsLinked', 'linkage')
+
     isGrace = False
 
     def __init__(self, *arguments, **keywords):
@@ -2004,6 +2206,7 @@ class Duration(DurationCommon):
         normal representation in quarterLength units.
         '''
         if len(self._components) >= 1:
+            self._thawComponents()
             for c in self._components: # these are Duration objects
                 c.unlink()
             self._cachedIsLinked = False
@@ -2081,6 +2284,16 @@ class Duration(DurationCommon):
 
     components = property(_getComponents, _setComponents)
 
+    def _thawComponents(self):
+        '''
+        Replace any frozen (shared) DurationUnits in components with 
+        unfrozen copies; must be called before changing components in place.
+        '''
+        components = self.components
+        for i in range(len(components)):
+            if components[i].frozen:
+                components[i] = components[i].unfrozenCopy()
+
     #---------------------------------------------------------------------------
     def _isComplex(self):
         if len(self.components) > 1:
@@ -2205,6 +2418,7 @@ class Duration(DurationCommon):
         # keep components, simply unlink; quarter lengths stored will
         # not be included in this elements quater length
         else: 
+            self._thawComponents()
             for c in self._components:
                 c.unlink()
         # reach ahead and set cached is linked: no need to check components
@@ -2218,10 +2432,16 @@ class Duration(DurationCommon):
         self._quarterLengthNeedsUpdating = False
         if self.isLinked:
             try:
-                self.components = quarterLengthToDurations(self.quarterLength)
+                components = quarterLengthToDurations(self.quarterLength)
             except DurationException:
                 print ("problem updating components of note with quarterLength %s, chokes quarterLengthToDurations\n" % self.quarterLength)
                 raise
+            if SHARE_DURATION_UNITS:
+                for i in range(len(components)):
+                    du = components[i]
+                    if du.tuplets == () and du.isLinked and du.type in typeToDuration:
+                        components[i] = sharedDurationUnit(du.type, du.dots)
+            self.components = components
         self._componentsNeedUpdating = False
 
     def _getType(self):
@@ -2255,6 +2475,7 @@ class Duration(DurationCommon):
 
         if len(self.components) == 1:
             # change the existing DurationUnit to the this type
+            self._thawComponents()
             self.components[0].type = value
             self._quarterLengthNeedsUpdating = True
         elif self.isComplex: # more than one component
@@ -2279,6 +2500,7 @@ class Duration(DurationCommon):
 
         if len(self.components) == 1:
             # change the existing DurationUnit to the this type
+            self._thawComponents()
             self.components[0].unlink()
             self.components[0].type = value
             #self._quarterLengthNeedsUpdating = True
@@ -2325,6 +2547,7 @@ class Duration(DurationCommon):
             raise DurationException('only numeric dot values can be used with this method.')
 
         if len(self.components) == 1:
+            self._thawComponents()
             self.components[0].dots = value
             self._quarterLengthNeedsUpdating = True
         elif len(self.components) > 1:
@@ -2360,6 +2583,7 @@ class Duration(DurationCommon):
             raise DurationException('only list-like dotGroups values can be used with this method.')
 
         if len(self.components) == 1:
+            self._thawComponents()
             self.components[0].dotGroups = value
             self._quarterLengthNeedsUpdating = True
         elif len(self.components) > 1:
@@ -2458,6 +2682,7 @@ class Duration(DurationCommon):
         elif len(self.components) == 1:
             for thisTuplet in tupletTuple:
                 thisTuplet.frozen = True
+            self._thawComponents()
             self.components[0].tuplets = tupletTuple
             self._quarterLengthNeedsUpdating = True
         else: # there must be 1 or more components
@@ -2621,11 +2846,15 @@ class Duration(DurationCommon):
             for c in dur.components:
                 cNew = copy.deepcopy(c) # must copy as otherwise will unlink
                 if not link:
+                    if cNew.frozen:
+                        cNew = cNew.unfrozenCopy()
                     cNew.unlink()
                 self.components.append(cNew)
         else: # its a number that may produce more than one component
             for c in Duration(dur).components:
                 if not link:
+                    if c.frozen:
+                        c = c.unfrozenCopy()
                     c.unlink()
                 self.components.append(c)
         if link:
@@ -2738,10 +2967,10 @@ class Duration(DurationCommon):
             post = copy.deepcopy(self)
 
         if retainComponents:
+            post._thawComponents()
             for d in post.components:
                 d.augmentOrDiminish(amountToScale, inPlace=True)
-            self._typeNeedsUpdating = True
-            self._quarterLengthNeedsUpdating = True
+            post._quarterLengthNeedsUpdating = True
         else:
             post.quarterLength = post.quarterLength * amountToScale
 
@@ -3526,6 +3755,64 @@ class Test(unittest.TestCase):
 #         self.assertEqual(d.quarterLength, 20.0) 
 #         self.assertEqual(d.isLinked, False) # note set
 
+    def testSharedDurationUnits(self):
+        import pickle
+        global SHARE_DURATION_UNITS
+        SHARE_DURATION_UNITS = True
+        try:
+            d1 = Duration(1.5)
+            d2 = Duration(1.5)
+            d3 = Duration(1/3.)
+            # components are created when first needed
+            for d in [d1, d2, d3]:
+                unused = d.components
+        finally:
+            SHARE_DURATION_UNITS = False
+        self.assertEqual(d1.components[0] is d2.components[0], True)
+        self.assertEqual(d1.components[0].frozen, True)
+        # units with tuplets are never shared
+        self.assertEqual(d3.components[0].frozen, False)
+        # copies share frozen units
+        d4 = copy.deepcopy(d1)
+        self.assertEqual(d4.components[0] is d1.components[0], True)
+        # changing a Duration does not change others sharing its units
+        d2.type = 'half'
+        d4.unlink()
+        self.assertEqual(d2.quarterLength, 3.0)
+        self.assertEqual(d1.quarterLength, 1.5)
+        self.assertEqual(d1.isLinked, True)
+        self.assertEqual(d1.components[0].frozen, True)
+        self.assertEqual(d2.components[0].frozen, False)
+        # slotted objects can be pickled with any protocol
+        for protocol in [0, 2]:
+            d5 = pickle.loads(pickle.dumps(d1, protocol))
+            self.assertEqual(d5.quarterLength, 1.5)
+            self.assertEqual(d5.dots, 1)
+            d6 = pickle.loads(pickle.dumps(d3, protocol))
+            self.assertEqual(d6.tuplets[0].numberNotesActual, 3)
+            self.assertEqual(d6.tuplets[0].frozen, True)
+
+    def testConversionCaches(self):
+        clearConversionCaches()
+        a = quarterLengthToDurations(1/3.)
+        b = quarterLengthToDurations(1/3.)
+        # cached results are copied, including their Tuplets
+        self.assertEqual(a[0].tuplets[0] is b[0].tuplets[0], False)
+        a[0].tuplets[0].type = 'start'
+        self.assertEqual(b[0].tuplets[0].type, None)
+        self.assertEqual(quarterLengthToDurations(1/3.)[0].tuplets[0].type, None)
+        self.assertEqual(conversionCacheInfo()['quarterLengthToDurations'][:2],
+                        (2, 1))
+        # unlinked results are cached separately
+        c = quarterLengthToDurations(1/3., link=False)
+        self.assertEqual(c[0].isLinked, False)
+        self.assertEqual(quarterLengthToDurations(1/3.)[0].isLinked, True)
+        # caches are bounded
+        for i in range(1, 2000):
+            unused = dottedMatch(i / 64.)
+        self.assertEqual(len(_dottedMatchCache) <= 1024, True)
+        clearConversionCaches()
+
     def xtestStrangeMeasure(self):
         from music21 import corpus
         j1 = corpus.parse('trecento/PMFC_06-Jacopo-03a')
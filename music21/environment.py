@@ -208,6 +208,10 @@ class _EnvironmentCore(object):
         '''Load defaults. All keys are derived from these defaults.
         '''
         self._ref['directoryScratch'] = None # path to a directory for temporary files
+        # path to a directory for cached parses; default is in directoryScratch
+        self._ref['directoryParseCache'] = None 
+        # maximum size, in megabytes, of all cached parses on disk
+        self._ref['parseCacheMaxSize'] = 512 
         self._ref['lilypondPath'] = None # path to lilypond
         self._ref['lilypondVersion'] = None # version of lilypond
         self._ref['lilypondFormat'] = 'pdf' 
@@ -485,6 +489,20 @@ class _EnvironmentCore(object):
         else:
             return self._ref['directoryScratch']
 
+    def getParseCacheDir(self):
+        if self._ref['directoryParseCache'] is None:
+            dstDir = os.path.join(self.getRootTempDir(), 'parseCache')
+            if not os.path.exists(dstDir):
+                try:
+                    os.mkdir(dstDir)
+                except OSError: # cannot make the directory
+                    return None
+            return dstDir
+        elif not os.path.exists(self._ref['directoryParseCache']):    
+            raise EnvironmentException('user-specified parse cache directory (%s) does not exist; remove preference file or reset Environment' % self._ref['directoryParseCache'])
+        else:
+            return self._ref['directoryParseCache']
+
     def getTempFile(self, suffix=''):
         '''
         gets a temporary file with a suffix that will work for a bit.
@@ -651,7 +669,7 @@ class Environment(object):
         
         >>> a = environment.Environment()
         >>> a.getRefKeys()
-        ['lilypondBackend', 'pdfPath', 'lilypondVersion', 'graphicsPath', 'warnings', 'showFormat', 'localCorpusSettings', 'musescoreDirectPNGPath', 'vectorPath', 'writeFormat', 'lilypondPath', 'directoryScratch', 'lilypondFormat', 'debug', 'musicxmlPath', 'autoDownload', 'midiPath']
+        ['lilypondBackend', 'pdfPath', 'musescoreDirectPNGPath', 'lilypondVersion', 'graphicsPath', 'warnings', 'showFormat', 'localCorpusSettings', 'parseCacheMaxSize', 'vectorPath', 'writeFormat', 'lilypondPath', 'directoryScratch', 'lilypondFormat', 'debug', 'musicxmlPath', 'directoryParseCache', 'autoDownload', 'midiPath']
         '''
         return _environStorage['instance'].getRefKeys()
 
@@ -704,7 +722,7 @@ class Environment(object):
         
         >>> e = environment.Environment()
         >>> e.keys()
-        ['lilypondBackend', 'pdfPath', 'lilypondVersion', 'graphicsPath', 'warnings', 'showFormat', 'localCorpusSettings', 'musescoreDirectPNGPath', 'vectorPath', 'writeFormat', 'lilypondPath', 'directoryScratch', 'lilypondFormat', 'debug', 'musicxmlPath', 'autoDownload', 'midiPath', 'localCorpusPath']
+        ['lilypondBackend', 'pdfPath', 'musescoreDirectPNGPath', 'lilypondVersion', 'graphicsPath', 'warnings', 'showFormat', 'localCorpusSettings', 'parseCacheMaxSize', 'vectorPath', 'writeFormat', 'lilypondPath', 'directoryScratch', 'lilypondFormat', 'debug', 'musicxmlPath', 'directoryParseCache', 'autoDownload', 'midiPath', 'localCorpusPath']
 
         '''
         return _environStorage['instance'].keys()
@@ -752,6 +770,15 @@ class Environment(object):
         '''
         return _environStorage['instance'].getRootTempDir()
 
+    def getParseCacheDir(self):
+        '''Return the directory in which parsed files are cached (see 
+        :class:`~music21.converter.ParseCache`). This is either the 
+        user-set `directoryParseCache` preference or a 'parseCache' 
+        directory within the directory given by getRootTempDir(); None 
+        is returned if the latter cannot be created.
+        '''
+        return _environStorage['instance'].getParseCacheDir()
+
     def getTempFile(self, suffix=''):
         '''Return a file path to a temporary file with the specified suffix (file extension). 
         '''
@@ -838,7 +865,7 @@ class UserSettings(object):
     Second, view the available settings keys.
 
     >>> us.keys()
-    ['lilypondBackend', 'pdfPath', 'lilypondVersion', 'graphicsPath', 'warnings', 'showFormat', 'localCorpusSettings', 'musescoreDirectPNGPath', 'vectorPath', 'writeFormat', 'lilypondPath', 'directoryScratch', 'lilypondFormat', 'debug', 'musicxmlPath', 'autoDownload', 'midiPath', 'localCorpusPath']
+    ['lilypondBackend', 'pdfPath', 'musescoreDirectPNGPath', 'lilypondVersion', 'graphicsPath', 'warnings', 'showFormat', 'localCorpusSettings', 'parseCacheMaxSize', 'vectorPath', 'writeFormat', 'lilypondPath', 'directoryScratch', 'lilypondFormat', 'debug', 'musicxmlPath', 'directoryParseCache', 'autoDownload', 'midiPath', 'localCorpusPath']
 
     Third, after finding the desired setting, supply the 
     new value as a Python dictionary key value pair. Setting 
@@ -991,7 +1018,7 @@ def set(key, value): # okay to override set here: @ReservedAssignment
 
     
     >>> environment.keys()
-    ['lilypondBackend', 'pdfPath', 'lilypondVersion', 'graphicsPath', 'warnings', 'showFormat', 'localCorpusSettings', 'musescoreDirectPNGPath', 'vectorPath', 'writeFormat', 'lilypondPath', 'directoryScratch', 'lilypondFormat', 'debug', 'musicxmlPath', 'autoDownload', 'midiPath', 'localCorpusPath']
+    ['lilypondBackend', 'pdfPath', 'musescoreDirectPNGPath', 'lilypondVersion', 'graphicsPath', 'warnings', 'showFormat', 'localCorpusSettings', 'parseCacheMaxSize', 'vectorPath', 'writeFormat', 'lilypondPath', 'directoryScratch', 'lilypondFormat', 'debug', 'musicxmlPath', 'directoryParseCache', 'autoDownload', 'midiPath', 'localCorpusPath']
     >>> environment.set('wer', 'asdf')
     Traceback (most recent call last):
     EnvironmentException: no preference: wer
@@ -1009,7 +1036,7 @@ def get(key):
 
     
     >>> environment.keys()
-    ['lilypondBackend', 'pdfPath', 'lilypondVersion', 'graphicsPath', 'warnings', 'showFormat', 'localCorpusSettings', 'musescoreDirectPNGPath', 'vectorPath', 'writeFormat', 'lilypondPath', 'directoryScratch', 'lilypondFormat', 'debug', 'musicxmlPath', 'autoDownload', 'midiPath', 'localCorpusPath']
+    ['lilypondBackend', 'pdfPath', 'musescoreDirectPNGPath', 'lilypondVersion', 'graphicsPath', 'warnings', 'showFormat', 'localCorpusSettings', 'parseCacheMaxSize', 'vectorPath', 'writeFormat', 'lilypondPath', 'directoryScratch', 'lilypondFormat', 'debug', 'musicxmlPath', 'directoryParseCache', 'autoDownload', 'midiPath', 'localCorpusPath']
     >>> #_DOCS_SHOW environment.get('musicxmlPath')
     '/Applications/Finale Reader.app'
     '''
@@ -1065,12 +1092,13 @@ class Test(unittest.TestCase):
 <settings>
   <preference name="lilypondBackend" value="ps"/>
   <preference name="pdfPath" value="/Applications/Preview.app"/>
+  <preference name="musescoreDirectPNGPath" value="/Applications/MuseScore.app/Contents/MacOS/mscore"/>
   <preference name="lilypondVersion"/>
   <preference name="graphicsPath" value="/Applications/Preview.app"/>
   <preference name="warnings" value="1"/>
   <preference name="showFormat" value="musicxml"/>
   <localCorpusSettings/>
-  <preference name="musescoreDirectPNGPath" value="/Applications/MuseScore.app/Contents/MacOS/mscore"/>
+  <preference name="parseCacheMaxSize" value="512"/>
   <preference name="vectorPath" value="/Applications/Preview.app"/>
   <preference name="writeFormat" value="musicxml"/>
   <preference name="lilypondPath" value="/Applications/Lilypond.app/Contents/Resources/bin/lilypond"/>
@@ -1078,6 +1106,7 @@ class Test(unittest.TestCase):
   <preference name="lilypondFormat" value="pdf"/>
   <preference name="debug" value="0"/>
   <preference name="musicxmlPath" value="/Applications/Finale Notepad 2012.app"/>
+  <preference name="directoryParseCache"/>
   <preference name="autoDownload" value="ask"/>
   <preference name="midiPath" value="/Applications/QuickTime Player.app"/>
 </settings>
@@ -1091,6 +1120,7 @@ class Test(unittest.TestCase):
 <settings>
   <preference name="lilypondBackend" value="ps"/>
   <preference name="pdfPath" value="/Applications/Preview.app"/>
+  <preference name="musescoreDirectPNGPath" value="/Applications/MuseScore.app/Contents/MacOS/mscore"/>
   <preference name="lilypondVersion"/>
   <preference name="graphicsPath" value="/Applications/Preview.app"/>
   <preference name="warnings" value="1"/>
@@ -1100,7 +1130,7 @@ class Test(unittest.TestCase):
     <localCorpusPath>b</localCorpusPath>
     <localCorpusPath>c</localCorpusPath>
   </localCorpusSettings>
-  <preference name="musescoreDirectPNGPath" value="/Applications/MuseScore.app/Contents/MacOS/mscore"/>
+  <preference name="parseCacheMaxSize" value="512"/>
   <preference name="vectorPath" value="/Applications/Preview.app"/>
   <preference name="writeFormat" value="musicxml"/>
   <preference name="lilypondPath" value="/Applications/Lilypond.app/Contents/Resources/bin/lilypond"/>
@@ -1108,6 +1138,7 @@ class Test(unittest.TestCase):
   <preference name="lilypondFormat" value="pdf"/>
   <preference name="debug" value="0"/>
   <preference name="musicxmlPath" value="/Applications/Finale Notepad 2012.app"/>
+  <preference name="directoryParseCache"/>
   <preference name="autoDownload" value="ask"/>
   <preference name="midiPath" value="/Applications/QuickTime Player.app"/>
 </settings>
@@ -1134,6 +1165,7 @@ class Test(unittest.TestCase):
 <settings>
   <preference name="lilypondBackend" value="ps"/>
   <preference name="pdfPath" value="/Applications/Preview.app"/>
+  <preference name="musescoreDirectPNGPath" value="/Applications/MuseScore.app/Contents/MacOS/mscore"/>
   <preference name="lilypondVersion"/>
   <preference name="graphicsPath" value="/Applications/Preview.app"/>
   <preference name="warnings" value="1"/>
@@ -1143,7 +1175,7 @@ class Test(unittest.TestCase):
     <localCorpusPath>y</localCorpusPath>
     <localCorpusPath>z</localCorpusPath>
   </localCorpusSettings>
-  <preference name="musescoreDirectPNGPath" value="/Applications/MuseScore.app/Contents/MacOS/mscore"/>
+  <preference name="parseCacheMaxSize" value="512"/>
   <preference name="vectorPath" value="/Applications/Preview.app"/>
   <preference name="writeFormat" value="musicxml"/>
   <preference name="lilypondPath" value="/Applications/Lilypond.app/Contents/Resources/bin/lilypond"/>
@@ -1151,6 +1183,7 @@ class Test(unittest.TestCase):
   <preference name="lilypondFormat" value="pdf"/>
   <preference name="debug" value="0"/>
   <preference name="musicxmlPath" value="/Applications/Finale Notepad 2012.app"/>
+  <preference name="directoryParseCache"/>
   <preference name="autoDownload" value="ask"/>
   <preference name="midiPath" value="w"/>
 </settings>
@@ -701,7 +701,7 @@ class StreamThawer(StreamFreezeThawBase):
                 e._stream._elementsChanged()
                 e._cache = {}
                 #for el in e._stream.flat:
-                #    print el, el.offset, el.sites._definedContexts
+                #    print el, el.offset, el.sites.getSiteIds()
             elif e.isSpanner:
                 subSF = StreamThawer()
                 subSF.teardownSerializationScaffold(e.spannedElements)
@@ -902,7 +902,7 @@ class JSONFreezeThawBase(object):
                                   'yearError', 'monthError', 'dayError', 'hourError', 'minuteError', 'secondError'],
         'music21.metadata.DateSingle': ['_relevance',  '_dataError', '_data'],
         'music21.metadata.Metadata': ['_date', '_imprint', '_copyright', '_workIds', '_urls', '_contributors'],
-        'music21.metadata.MetadataBundle': ['storage', 'name'],
+        'music21.metadata.MetadataBundle': ['storage', 'name', '_index', 'fingerprints'],
         'music21.metadata.RichMetadata': ['keySignatureFirst', 'timeSignatureFirst', 'pitchHighest', 'pitchLowest', 'noteCount', 'quarterLength', '__INHERIT__'],
         'music21.metadata.Text': ['_data', '_language'],
         'music21.meter.TimeSignature': ['ratioString'],
@@ -1042,6 +1042,9 @@ class JSONFreezer(JSONFreezeThawBase):
         # these names will be rejected in final accumulation
         classNames = []
         for bundle in inspect.classify_class_attrs(obj.__class__):
+            # __slots__ members are instance data, even if defined on the class
+            if inspect.ismemberdescriptor(bundle.object):
+                continue
             if (bundle.name.startswith('_') and not 
                 bundle.name.startswith('__')):
                 classNames.append(bundle.name)
@@ -1646,14 +1649,14 @@ class Test(unittest.TestCase):
         n2 = c[1]
         sf = freezeThaw.StreamFreezer(c, fastButUnsafe=True)
         sf.setupSerializationScaffold()
-        for dummy in n1.sites._definedContexts:
+        for dummy in n1.sites.getSiteIds():
             pass
             #print idKey
-            #print n1.sites._definedContexts[idKey]['obj']
-        for dummy in n2.sites._definedContexts:
+            #print n1.sites.getById(idKey)
+        for dummy in n2.sites.getSiteIds():
             pass
             #print idKey
-            #print n2.sites._definedContexts[idKey]['obj']
+            #print n2.sites.getById(idKey)
 
         dummy_data = pickleMod.dumps(c, protocol=-1)
         
@@ -39,11 +39,17 @@ The following example creates a :class:`~music21.stream.Stream` object, adds a
 
 import unittest
 import datetime
+import hashlib
 import multiprocessing
 import os
 import pickle
 import re
 
+try:
+    import sqlite3
+except ImportError: # not available on all platforms
+    sqlite3 = None
+
 from music21 import base
 from music21 import common
 from music21 import exceptions21
@@ -51,6 +57,7 @@ from music21 import freezeThaw
 from music21 import text
 
 from music21 import environment
+from music21._version import __version__
 _MOD = "metadata.py"
 environLocal = environment.Environment(_MOD)
 
@@ -59,6 +66,37 @@ environLocal = environment.Environment(_MOD)
 class MetadataException(exceptions21.Music21Exception):
     pass
 
+
+def getFileFingerprint(filePath):
+    '''
+    Return a list of the size, the modification time, and an md5 of the 
+    contents of the file at `filePath`; these are used by a 
+    :class:`~music21.metadata.MetadataBundle` to find files that have 
+    changed since their metadata were stored.
+
+    ::
+
+        >>> fp = metadata.getFileFingerprint(corpus.getWork('bach/bwv66.6'))
+        >>> len(fp)
+        3
+        >>> fp[2]
+        '...'
+
+    '''
+    m = hashlib.md5()
+    f = open(filePath, 'rb')
+    try:
+        while True:
+            data = f.read(65536)
+            if not data:
+                break
+            m.update(data)
+    finally:
+        f.close()
+    st = os.stat(filePath)
+    return [st.st_size, st.st_mtime, m.hexdigest()]
+
+
 #-------------------------------------------------------------------------------
 # utility dictionaries and conversion functions; used by objects defined in this
 # module
@@ -1608,6 +1646,29 @@ class Metadata(base.Music21Object):
                 elif query == v: 
                     return True, f
         return False, None
+
+    def _getSearchTokens(self):
+        '''
+        Return a list of (field, token) pairs for the lower-case, 
+        whitespace-delimited tokens of all search attributes with string 
+        values; these are the entries of the index of a 
+        :class:`~music21.metadata.MetadataBundle`.
+
+        ::
+
+            >>> md = metadata.Metadata(title='Third Symphony')
+            >>> sorted(md._getSearchTokens())
+            [('date', 'none'), ('title', 'symphony'), ('title', 'third')]
+
+        '''
+        post = []
+        for field in self._searchAttributes:
+            value = getattr(self, field)
+            if not common.isStr(value):
+                continue # only strings are matched by plain queries
+            for token in set(value.lower().split()):
+                post.append((field, token))
+        return post
             
     def setWorkId(self, idStr, value):
         '''
@@ -2059,7 +2120,11 @@ class MetadataBundle(object):
         'storage': 'A dictionary containing the Metadata objects that have '
             'been parsed.  Keys are strings',
         'name': 'The name of the type of MetadataBundle being made, can be '
-            '"default", "corpus", or "virtual".  Possibly also "local".'
+            '"default", "corpus", or "virtual".  Possibly also "local".',
+        'fingerprints': 'A dictionary of the file paths of parsed files to '
+            'a list of their size, modification time, md5, the version of '
+            'music21 that parsed them, and the keys of the Metadata found '
+            'in them.',
         }
     
     ### INITIALIZER ###
@@ -2074,22 +2139,145 @@ class MetadataBundle(object):
         # this will need to be refreshed after loading json data
         # keys are the same for self.storage
         self._accessPaths = {}
+        # keys are file extensions of access paths, values are sets of keys
+        self._accessPathExtensions = {}
+        # an inverted index of the string values of all search attributes:
+        # keys are fields, values are dictionaries of lower-case 
+        # whitespace-delimited tokens to lists of keys; empty if not yet built
+        self._index = {}
+        # keys are file paths of parsed files, values are lists of the 
+        # size, modification time, md5 of contents (see getFileFingerprint),
+        # the music21 version that parsed the file, and a list of the keys 
+        # of the Metadata found in the file
+        self.fingerprints = {}
 
     ### PRIVATE METHODS ###
 
-    def _getFilePath(self):
+    def _getFilePath(self, extension='.json'):
         if self.name in ['virtual', 'core']:
             filePath = os.path.join(common.getMetadataCacheFilePath(), 
-                self.name + '.json')
+                self.name + extension)
         elif self.name == 'local':
             # write in temporary dir
             filePath = os.path.join(environLocal.getRootTempDir(), 
-                self.name + '.json')
+                self.name + extension)
         else:
             raise MetadataException('unknown metadata name passed: %s' % 
                 self.name)
         return filePath
 
+    def _getIndexFields(self, field):
+        '''
+        Return a list of the indexed fields that a search of `field` 
+        looks in, as in :meth:`~music21.metadata.Metadata.search`, or None
+        if `field` names an attribute that is not indexed.
+
+        ::
+
+            >>> mb = metadata.MetadataBundle()
+            >>> mb._getIndexFields('compose')
+            ['composer']
+
+        ::
+
+            >>> mb._getIndexFields('composers') is None
+            True
+
+        ::
+
+            >>> mb._getIndexFields('popularTitle') is None
+            True
+
+        ::
+
+            >>> mb._getIndexFields('frank') is None
+            True
+
+        '''
+        searchAttributes = RichMetadata()._searchAttributes
+        if field is None:
+            return searchAttributes
+        elif field in searchAttributes:
+            return [field]
+        # as in Metadata.search(), an attribute named `field`, including 
+        # the work ids found by Metadata.__getattr__(), is searched first
+        elif (hasattr(RichMetadata, field) or 
+            field in workIdAbbreviationDict or 
+            field in workIdAbbreviationDict.values()):
+            return None
+        for f in searchAttributes:
+            if field.lower() in f.lower():
+                return [f]
+        # no indexed field: Metadata may still have such an attribute
+        return None
+
+    def _getIndexCandidates(self, query, fields):
+        '''
+        Return a set of the keys of all Metadata whose `fields` may contain
+        the plain string `query`: each whitespace-delimited word of the query
+        must be found within a token of the same field.
+        '''
+        if isinstance(self.storage, MetadataDatabase):
+            return self.storage.getIndexCandidates(query, fields)
+        words = query.lower().split()
+        candidates = set()
+        for field in fields:
+            fieldIndex = self._index.get(field, {})
+            fieldCandidates = None
+            for word in words:
+                wordCandidates = set()
+                for token, keys in fieldIndex.iteritems():
+                    if word in token:
+                        wordCandidates.update(keys)
+                if fieldCandidates is None:
+                    fieldCandidates = wordCandidates
+                else:
+                    fieldCandidates &= wordCandidates
+                if not fieldCandidates:
+                    break
+            candidates.update(fieldCandidates)
+        return candidates
+
+    def _setFingerprint(self, filePath, fingerprint):
+        '''
+        Set, or remove if `fingerprint` is None, the fingerprint of a file.
+        '''
+        if fingerprint is None:
+            self.fingerprints.pop(filePath, None)
+        else:
+            self.fingerprints[filePath] = fingerprint
+        if isinstance(self.storage, MetadataDatabase):
+            self.storage.setFingerprint(filePath, fingerprint)
+
+    def _getChangedPaths(self, pathList):
+        '''
+        Return a list of the paths in `pathList` that have not been parsed
+        before, that have been changed since, or that were parsed by 
+        another version of music21, which may extract other metadata. Files
+        that have a new modification time but the same contents are not 
+        changed.
+        '''
+        post = []
+        for filePath in pathList:
+            fingerprint = self.fingerprints.get(filePath)
+            if (fingerprint is None or len(fingerprint) != 5 or 
+                fingerprint[3] != __version__ or 
+                not os.path.exists(filePath)):
+                post.append(filePath)
+                continue
+            size, mtime, md5, version, keys = fingerprint
+            st = os.stat(filePath)
+            if st.st_size == size and st.st_mtime == mtime:
+                continue
+            if st.st_size == size:
+                newFingerprint = getFileFingerprint(filePath)
+                if newFingerprint[2] == md5:
+                    self._setFingerprint(filePath, 
+                        newFingerprint + [version, keys])
+                    continue
+            post.append(filePath)
+        return post
+
     ### PUBLIC METHODS ###
 
     def addFromPaths(self, pathList, printDebugAfter=0, useCorpus=False):
@@ -2128,19 +2316,77 @@ class MetadataBundle(object):
                 useCorpus=useCorpus,
                 )
             jobs.append(job)
-        #results, filePathErrors = JobProcessor.process_serial(jobs)
-        #results, filePathErrors = JobProcessor.process_parallel(jobs)
+        # each finished job is yielded; JobProcessor.process_serial(jobs)
+        # yields them in the same way without subprocesses
         currentIteration = 0
-        for results, errors in JobProcessor.process_parallel(jobs):
+        for job in JobProcessor.process_parallel(jobs):
             currentIteration += 1
+            results = job.getResults()
+            errors = job.getErrors()
             accumulatedResults.extend(results)
             accumulatedErrors.extend(errors)
+            keys = [corpusPath for corpusPath, unused_md in results]
+            # remove Metadata no longer found in a file parsed before
+            if job.filePath in self.fingerprints:
+                for key in self.fingerprints[job.filePath][-1]:
+                    if key not in keys and key in self.storage:
+                        del self.storage[key]
             for corpusPath, richMetadata in results:
                 self.storage[corpusPath] = richMetadata
+            if job.fingerprint is not None and not errors:
+                self._setFingerprint(job.filePath, 
+                    job.fingerprint + [__version__, keys])
+            else: # parse again next time
+                self._setFingerprint(job.filePath, None)
+            self._index = {}
             if (currentIteration % 50) == 0:
                 self.write()
         return accumulatedErrors
 
+    def updateFromPaths(self, pathList, useCorpus=False):
+        '''
+        Update this MetadataBundle so that it stores the metadata of the 
+        files in `pathList`: as 
+        :meth:`~music21.metadata.MetadataBundle.addFromPaths`, but only 
+        files that are new or have changed since they were last parsed are
+        parsed, and Metadata of files parsed before that are no longer in 
+        `pathList` are removed.
+
+        Returns a list of file paths with errors.
+
+        ::
+
+            >>> mb = metadata.MetadataBundle()
+            >>> mb.updateFromPaths(corpus.getWorkList('bwv66.6'))
+            []
+            >>> len(mb.storage), len(mb.fingerprints)
+            (1, 1)
+
+        ::
+
+            >>> mb.updateFromPaths(corpus.getWorkList('bwv66.6'))
+            []
+            >>> mb.updateFromPaths([])
+            []
+            >>> len(mb.storage), len(mb.fingerprints)
+            (0, 0)
+
+        '''
+        pathSet = set(pathList)
+        for filePath in self.fingerprints.keys():
+            if filePath not in pathSet:
+                for key in self.fingerprints[filePath][-1]:
+                    if key in self.storage:
+                        del self.storage[key]
+                self._setFingerprint(filePath, None)
+                self._index = {}
+        changedPaths = self._getChangedPaths(pathList)
+        environLocal.printDebug(['MetadataBundle: updating', 
+            len(changedPaths), 'of', len(pathList), 'files'])
+        if not changedPaths:
+            return []
+        return self.addFromPaths(changedPaths, useCorpus=useCorpus)
+
     @staticmethod
     def corpusPathToKey(filePath, number=None):
         '''Given a file path or corpus path, return the meta-data path
@@ -2183,12 +2429,27 @@ class MetadataBundle(object):
         Load self from the file path suggested by the name 
         of this MetadataBundle.
         
-        If filePath is None (typical), run self._getFilePath().
+        If filePath is None (typical), run self._getFilePath(). If
+        an SQLite database (a .db file) written by 
+        :meth:`~music21.metadata.MetadataBundle.openDatabase` is found,
+        and it was modified more recently than the JSON file (or there 
+        is no JSON file), the database is used instead; no Metadata are 
+        loaded from it until they are needed. Otherwise the JSON file is 
+        read, so that rebuilding the JSON file with 
+        :func:`~music21.metadata.cacheMetadata` supersedes an older database.
         '''
         t = common.Timer()
         t.start()
         if filePath is None:
             filePath = self._getFilePath()
+            dbFilePath = self._getFilePath('.db')
+            if sqlite3 is not None and os.path.exists(dbFilePath):
+                if (not os.path.exists(filePath) or 
+                    os.path.getmtime(dbFilePath) > os.path.getmtime(filePath)):
+                    filePath = dbFilePath
+        if filePath.endswith('.db') and os.path.exists(filePath):
+            self.openDatabase(filePath)
+            return
         if not os.path.exists(filePath):
             environLocal.warn('no metadata found for: %s; try building cache with corpus.cacheMetadata("%s")' % (self.name, self.name))
             return
@@ -2210,6 +2471,10 @@ class MetadataBundle(object):
 
         Return pairs of file paths and work numbers, or None
 
+        Queries that are plain strings are first looked up in an inverted
+        index (see :meth:`~music21.metadata.MetadataBundle.updateIndex`), 
+        and only the Metadata found there are searched.
+
         ::
 
             >>> mb = metadata.MetadataBundle()
@@ -2236,13 +2501,41 @@ class MetadataBundle(object):
             1   
 
         '''
+        if (not self._index and self.storage and 
+            not isinstance(self.storage, MetadataDatabase)):
+            self.updateIndex()
+        # plain queries are answered from the index; regular expressions,
+        # and fields that are not indexed, need all Metadata to be searched
+        candidates = None
+        if not hasattr(query, 'search'):
+            query = str(query)
+            if query.strip() and not any(
+                character in query for character in '*.|+?{}'):
+                fields = self._getIndexFields(field)
+                if fields is not None:
+                    candidates = self._getIndexCandidates(query, fields)
+        if candidates is None:
+            candidates = self.storage.keys()
+
+        if extList is not None:
+            # xml extensions also match mxl and mx files 
+            allowedKeys = set()
+            for pathExtension, keys in self._accessPathExtensions.iteritems():
+                for ext in extList:
+                    if (pathExtension.endswith(ext) or (ext.endswith('xml') and
+                        (pathExtension.endswith('mxl') or 
+                        pathExtension.endswith('mx')))):
+                        allowedKeys.update(keys)
+                        break
+        else: # keys in metadata cache, but no longer in filesystem are skipped
+            allowedKeys = self._accessPaths
+
         post = []
-        for key in self.storage:
+        found = set()
+        for key in sorted(candidates):
+            if key not in allowedKeys:
+                continue
             md = self.storage[key]
-#            if md.title is not None and 'Renmin' in md.title: # test -- china/chinese/etc.
-#                print key
-#                print "\n"
-#                print self.storage[key]
             match, unused_fieldPost = md.search(query, field)
             if match:
                 # returns a pair of file path, work number
@@ -2250,23 +2543,35 @@ class MetadataBundle(object):
                     number = int(md.number)
                 else:
                     number = md.number
-                try:
-                    result = (self._accessPaths[key], number)
-                    include = False
-                    if extList != None:
-                        for ext in extList:
-                            if result[0].endswith(ext) or\
-                                (ext.endswith('xml') and (result[0].endswith('mxl') or result[0].endswith('mx'))):
-                                include = True
-                                break
-                    else:
-                        include = True
-                    if include and result not in post:
-                        post.append(result)  
-                except KeyError:
-                    pass # in metadata cache, but no longer in filesystem
+                result = (self._accessPaths[key], number)
+                if result not in found:
+                    found.add(result)
+                    post.append(result)  
         return post
 
+    def updateIndex(self):
+        '''
+        Build the inverted index used by 
+        :meth:`~music21.metadata.MetadataBundle.search` from the string 
+        values of the search attributes of all stored Metadata. This is 
+        done when the MetadataBundle is written, and the index is stored 
+        with it.
+
+        ::
+
+            >>> mb = metadata.MetadataBundle()
+            >>> mb.storage['a'] = metadata.Metadata(title='Third Symphony')
+            >>> mb.updateIndex()
+            >>> mb._index['title']
+            {'symphony': ['a'], 'third': ['a']}
+
+        '''
+        index = {}
+        for key, md in self.storage.iteritems():
+            for field, token in md._getSearchTokens():
+                index.setdefault(field, {}).setdefault(token, []).append(key)
+        self._index = index
+
     def updateAccessPaths(self, pathList):
         r'''
 
@@ -2342,6 +2647,7 @@ class MetadataBundle(object):
         '''
         # always clear first
         self._accessPaths = {}
+        self._accessPathExtensions = {}
         # create a copy to manipulate
         keyOptions = self.storage.keys()
         for filePath in pathList:
@@ -2352,34 +2658,297 @@ class MetadataBundle(object):
             # a version of the path that may not have a work number
             cpStub = '_'.join(cp.split('_')[:-1]) # get all but last underscore
             match = False
-            try:
-                # MSC: Don't remove this following line: it seems to be important for some reason...
-                md = self.storage[cp] # @UnusedVariable
+            # a membership test, as getting Metadata from a 
+            # MetadataDatabase would thaw them
+            if cp in self.storage:
                 self._accessPaths[cp] = filePath
                 match = True
-            except KeyError:
-                pass
             if not match:
                 # see if there is work id alternative
                 for candidate in keyOptions:
                     if candidate.startswith(cpStub):
                         self._accessPaths[candidate] = filePath
+        for key, filePath in self._accessPaths.iteritems():
+            unused_root, ext = os.path.splitext(filePath)
+            self._accessPathExtensions.setdefault(ext, set()).add(key)
         #environLocal.printDebug(['metadata grouping time:', t, 'md bundles found:', len(post)])
         #return post
 
     def write(self):
         '''
         Write the JSON storage of all Metadata or 
-        RichMetadata contained in this object. 
+        RichMetadata contained in this object. If this MetadataBundle
+        is stored in a database, changes to it are committed instead.
 
         TODO: Test!
         '''
-        filePath = self._getFilePath()
+        if isinstance(self.storage, MetadataDatabase):
+            self.storage.commit()
+            return
+        return self.exportJSON()
+
+    def exportJSON(self, filePath=None):
+        '''
+        Write the JSON storage of all Metadata or RichMetadata contained
+        in this object to `filePath`, or to the file path suggested by the
+        name of this MetadataBundle. 
+        '''
+        if filePath is None:
+            filePath = self._getFilePath()
         environLocal.warn(['MetadataBundle: writing:', filePath])
-        
-        jsf = freezeThaw.JSONFreezer(self)
+        if isinstance(self.storage, MetadataDatabase):
+            bundle = MetadataBundle(self.name)
+            bundle.storage = dict(self.storage.iteritems())
+            bundle.fingerprints = self.fingerprints
+        else:
+            bundle = self
+        bundle.updateIndex()
+        jsf = freezeThaw.JSONFreezer(bundle)
         return jsf.jsonWrite(filePath)
 
+    def openDatabase(self, filePath=None):
+        '''
+        Store this MetadataBundle in an SQLite database at `filePath`, or
+        at the file path suggested by the name of this MetadataBundle 
+        (with a .db extension), creating the database if necessary. 
+        Metadata already in `storage` are added to the database, and 
+        `storage` becomes a :class:`~music21.metadata.MetadataDatabase`.
+
+        Metadata added afterwards (as by 
+        :meth:`~music21.metadata.MetadataBundle.addFromPaths`) are written
+        to the database, and committed by 
+        :meth:`~music21.metadata.MetadataBundle.write`.
+
+        ::
+
+            >>> import os
+            >>> fp = environLocal.getTempFile('.db')
+            >>> os.remove(fp)
+            >>> mb = metadata.MetadataBundle()
+            >>> mb.storage['bwv66_6'] = metadata.Metadata(title='Bach Chorale')
+            >>> mb.openDatabase(fp)
+            >>> mb.storage
+            <music21.metadata.MetadataDatabase 1 items>
+            >>> mb.write()
+
+        ::
+
+            >>> mb = metadata.MetadataBundle()
+            >>> mb.read(fp)
+            >>> mb.storage['bwv66_6'].title
+            'Bach Chorale'
+            >>> mb.storage.close()
+            >>> os.remove(fp)
+
+        '''
+        if filePath is None:
+            filePath = self._getFilePath('.db')
+        database = MetadataDatabase(filePath)
+        if not isinstance(self.storage, MetadataDatabase):
+            for key, md in self.storage.iteritems():
+                database[key] = md
+            for path, fingerprint in self.fingerprints.iteritems():
+                database.setFingerprint(path, fingerprint)
+            database.commit()
+        self.storage = database
+        self.fingerprints = database.getFingerprints()
+        self._index = {}
+
+
+#-------------------------------------------------------------------------------
+
+
+class MetadataDatabase(object):
+    '''
+    A dictionary-like storage of Metadata or RichMetadata objects, 
+    keyed by strings, in an SQLite database, for use as the `storage` of a
+    :class:`~music21.metadata.MetadataBundle` 
+    (see :meth:`~music21.metadata.MetadataBundle.openDatabase`).
+
+    Metadata are stored as JSON (as written by 
+    :class:`~music21.freezeThaw.JSONFreezer`), and are only thawed when 
+    they are first accessed. The tokens of their search attributes are
+    stored with them, so that a search only thaws the Metadata 
+    that may match it.
+
+    Changes are only made permanent by calling commit().
+
+    ::
+
+        >>> mdb = metadata.MetadataDatabase(':memory:')
+        >>> mdb['a'] = metadata.Metadata(title='Third Symphony')
+        >>> mdb['b'] = metadata.RichMetadata(title='Fourth Symphony')
+        >>> len(mdb)
+        2
+        >>> 'a' in mdb
+        True
+        >>> sorted(mdb.getIndexCandidates('symph', ['title']))
+        [u'a', u'b']
+        >>> sorted(mdb.getIndexCandidates('third sym', ['title']))
+        [u'a']
+
+    ::
+
+        >>> mdb['b'] = metadata.Metadata(title='Fifth Symphony')
+        >>> sorted(mdb.getIndexCandidates('fourth', ['title']))
+        []
+        >>> del mdb['a']
+        >>> mdb.keys()
+        [u'b']
+        >>> mdb.close()
+
+    '''
+    def __init__(self, filePath):
+        if sqlite3 is None:
+            raise MetadataException('sqlite3 is not available')
+        self.filePath = filePath
+        self._connection = sqlite3.connect(filePath)
+        self._connection.executescript('''
+            CREATE TABLE IF NOT EXISTS metadata (
+                key TEXT PRIMARY KEY, class TEXT, data TEXT);
+            CREATE TABLE IF NOT EXISTS tokens (
+                id INTEGER PRIMARY KEY, field TEXT, token TEXT, 
+                UNIQUE (field, token));
+            CREATE TABLE IF NOT EXISTS postings (tokenId INTEGER, key TEXT);
+            CREATE INDEX IF NOT EXISTS postingsTokenId ON postings (tokenId);
+            CREATE INDEX IF NOT EXISTS postingsKey ON postings (key);
+            ''')
+        # files parsed before the version was stored are all parsed again
+        columns = [row[1] for row in 
+            self._connection.execute('PRAGMA table_info(files)')]
+        if columns and 'version' not in columns:
+            self._connection.execute('DROP TABLE files')
+        self._connection.execute('''
+            CREATE TABLE IF NOT EXISTS files (
+                filePath TEXT PRIMARY KEY, size INTEGER, mtime REAL, 
+                md5 TEXT, version TEXT, keys TEXT)''')
+        # thawed Metadata, by key
+        self._cache = {}
+
+    def __repr__(self):
+        return '<music21.metadata.MetadataDatabase %s items>' % len(self)
+
+    def __len__(self):
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM metadata').fetchone()[0]
+
+    def __contains__(self, key):
+        if key in self._cache:
+            return True
+        return self._connection.execute(
+            'SELECT 1 FROM metadata WHERE key = ?', (key,)).fetchone() is not None
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __getitem__(self, key):
+        if key in self._cache:
+            return self._cache[key]
+        row = self._connection.execute(
+            'SELECT class, data FROM metadata WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        className, data = row
+        md = freezeThaw.JSONThawer().music21ObjectFromString(className)
+        freezeThaw.JSONThawer(md).json = data
+        self._cache[key] = md
+        return md
+
+    def __setitem__(self, key, md):
+        jsf = freezeThaw.JSONFreezer(md)
+        execute = self._connection.execute
+        execute('INSERT OR REPLACE INTO metadata VALUES (?, ?, ?)', 
+            (key, jsf.className, jsf.json))
+        execute('DELETE FROM postings WHERE key = ?', (key,))
+        for field, token in md._getSearchTokens():
+            execute('INSERT OR IGNORE INTO tokens (field, token) VALUES (?, ?)',
+                (field, token))
+            execute('INSERT INTO postings SELECT id, ? FROM tokens '
+                'WHERE field = ? AND token = ?', (key, field, token))
+        self._cache[key] = md
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._connection.execute('DELETE FROM metadata WHERE key = ?', (key,))
+        self._connection.execute('DELETE FROM postings WHERE key = ?', (key,))
+        self._cache.pop(key, None)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return [row[0] for row in 
+            self._connection.execute('SELECT key FROM metadata')]
+
+    def iteritems(self):
+        for key in self.keys():
+            yield key, self[key]
+
+    def getIndexCandidates(self, query, fields):
+        '''
+        Return a set of the keys of all Metadata whose `fields` may contain
+        the plain string `query`, as 
+        :meth:`~music21.metadata.MetadataBundle.search` does with its index.
+        '''
+        words = query.lower().split()
+        candidates = set()
+        for field in fields:
+            fieldCandidates = None
+            for word in words:
+                pattern = '%' + word.replace('\\', '\\\\').replace(
+                    '%', '\\%').replace('_', '\\_') + '%'
+                rows = self._connection.execute(
+                    'SELECT DISTINCT postings.key FROM tokens JOIN postings '
+                    'ON postings.tokenId = tokens.id WHERE tokens.field = ? '
+                    "AND tokens.token LIKE ? ESCAPE '\\'", (field, pattern))
+                wordCandidates = set(row[0] for row in rows)
+                if fieldCandidates is None:
+                    fieldCandidates = wordCandidates
+                else:
+                    fieldCandidates &= wordCandidates
+                if not fieldCandidates:
+                    break
+            candidates.update(fieldCandidates)
+        return candidates
+
+    def getFingerprints(self):
+        '''
+        Return a dictionary of all file fingerprints, as stored in
+        :attr:`~music21.metadata.MetadataBundle.fingerprints`.
+        '''
+        post = {}
+        for filePath, size, mtime, md5, version, keys in self._connection.execute(
+            'SELECT filePath, size, mtime, md5, version, keys FROM files'):
+            keys = keys.split('\n') if keys else []
+            post[filePath] = [size, mtime, md5, version, keys]
+        return post
+
+    def setFingerprint(self, filePath, fingerprint):
+        '''
+        Set, or remove if `fingerprint` is None, the fingerprint of a file.
+        '''
+        if fingerprint is None:
+            self._connection.execute('DELETE FROM files WHERE filePath = ?', 
+                (filePath,))
+        else:
+            size, mtime, md5 = fingerprint[:3]
+            # fingerprints stored by older versions of music21 have no version
+            version = fingerprint[3] if len(fingerprint) == 5 else None
+            keys = fingerprint[-1]
+            self._connection.execute(
+                'INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)', 
+                (filePath, size, mtime, md5, version, '\n'.join(keys)))
+
+    def commit(self):
+        self._connection.commit()
+
+    def close(self):
+        self._connection.close()
+
 
 #-------------------------------------------------------------------------------
 
@@ -2388,9 +2957,18 @@ class MetadataCacheException(exceptions21.Music21Exception):
     pass
 
 
-def cacheMetadata(domains=('local', 'core', 'virtual')): 
+def cacheMetadata(domains=('local', 'core', 'virtual'), useDatabase=False): 
     '''
     The core cache is all locally-stored corpus files. 
+
+    If `useDatabase` is True, metadata are stored in an SQLite database 
+    (see :meth:`~music21.metadata.MetadataBundle.openDatabase`), which is
+    updated as each file is processed, rather than in a JSON file. 
+    Otherwise the JSON file is always written, even if metadata were read 
+    from a database, so that it is the newer file, read from then on.
+
+    Only files that are new, that have changed, or that were parsed by 
+    another version of music21 are parsed; after an upgrade, all files are.
     '''
     from music21 import corpus, metadata
 
@@ -2418,16 +2996,25 @@ def cacheMetadata(domains=('local', 'core', 'virtual')):
         if domain not in domainGetPathsProcedures:
             raise MetadataCacheException('invalid domain provided: {0}'.format(
                 domain))
+        # only files that are new or changed since the last caching are parsed
+        if (os.path.exists(metadataBundle._getFilePath('.db')) or 
+            os.path.exists(metadataBundle._getFilePath())):
+            metadataBundle.read()
+        if useDatabase and not isinstance(metadataBundle.storage, 
+            MetadataDatabase):
+            metadataBundle.openDatabase()
         paths = domainGetPathsProcedures[domain]()
         environLocal.warn(
             'metadata cache: starting processing of paths: {0}'.format(
                 len(paths)))
         #metadataBundle.addFromPaths(paths[-3:])
         # returns any paths that failed to load
-        failingFilePaths += metadataBundle.addFromPaths(
-            paths, printDebugAfter=1) 
+        failingFilePaths += metadataBundle.updateFromPaths(paths)
         #print metadataBundle.storage
         metadataBundle.write() # will use a default file path based on domain
+        if not useDatabase and isinstance(metadataBundle.storage, 
+            MetadataDatabase):
+            metadataBundle.exportJSON()
         environLocal.warn(
             'cache: writing time: {0} md items: {1}'.format(
                 timer, len(metadataBundle.storage)))
@@ -2518,6 +3105,8 @@ class MetadataCachingJob(object):
 
     def __init__(self, filePath, jobNumber=0, useCorpus=True):
         self.filePath = filePath
+        # set when called, if filePath is a file
+        self.fingerprint = None
         self.filePathErrors = []
         self.jobNumber = int(jobNumber)
         self.results = []
@@ -2528,6 +3117,9 @@ class MetadataCachingJob(object):
     def __call__(self):
         import gc
         self.results = []
+        if os.path.isfile(self.filePath):
+            # before parsing, so that changes made while parsing are found
+            self.fingerprint = getFileFingerprint(self.filePath)
         parsedObject = self._parseFilePath()
         if parsedObject is not None:
             if 'Opus' in parsedObject.classes:
@@ -2633,11 +3225,14 @@ class JobProcessor(object):
 
     @staticmethod
     def process_parallel(jobs, processCount=None):
+        '''
+        Run `jobs` in `processCount` worker processes, yielding each 
+        finished job, with its results and errors, as it completes.
+        '''
         processCount = processCount or multiprocessing.cpu_count() * 2
         assert 0 < processCount
         remainingJobs = len(jobs)
-        results = []
-        filePathErrors = []
+        errorCount = 0
         job_queue = multiprocessing.JoinableQueue()
         result_queue = multiprocessing.Queue()
         workers = [WorkerProcess(job_queue, result_queue) 
@@ -2649,16 +3244,15 @@ class JobProcessor(object):
                 job_queue.put(pickle.dumps(job, protocol=0))
             for i in xrange(len(jobs)):
                 job = pickle.loads(result_queue.get())
-                results = job.getResults()
-                errors = job.getErrors()
+                errorCount += len(job.getErrors())
                 remainingJobs -= 1
                 JobProcessor.report(
                     len(jobs),
                     remainingJobs,
                     job.filePath,
-                    len(filePathErrors),
+                    errorCount,
                     )
-                yield results, errors
+                yield job
         for worker in workers:
             job_queue.put(None)
         job_queue.join()
@@ -2667,25 +3261,27 @@ class JobProcessor(object):
         for worker in workers:
              worker.join()
         raise StopIteration
-        # return results, filePathErrors
 
     @staticmethod
     def process_serial(jobs):
+        '''
+        Run `jobs` one after another in this process, yielding each 
+        finished job, with its results and errors.
+        '''
         remainingJobs = len(jobs)
-        results = []
-        filePathErrors = []
-        for i, job in enumerate(jobs):
-            results, errors = job()
+        errorCount = 0
+        for job in jobs:
+            unused_results, errors = job()
+            errorCount += len(errors)
             remainingJobs -= 1
             JobProcessor.report(
                 len(jobs),
                 remainingJobs,
                 job.filePath,
-                len(filePathErrors),
+                errorCount,
                 )
-            yield results, errors
+            yield job
         raise StopIteration
-        #return results, filePathErrors 
 
     @staticmethod
     def report(totalJobs, remainingJobs, filePath, filePathErrorCount):
@@ -2753,6 +3349,173 @@ class Test(unittest.TestCase):
         md = fromMxObjects.mxScoreToMetadata(mxScore)
         self.assertEqual(md.composer, 'Gilles Binchois')
 
+    def testMetadataBundleSearchIndex(self):
+        mb = MetadataBundle()
+        mb.storage['c_a_a_xml'] = RichMetadata(title='Third Symphony', 
+            composer='Beethoven, Ludwig van')
+        mb.storage['c_a_b_krn'] = Metadata(title='Fourth Symphony', 
+            composer='Beethoven, Ludwig van')
+        mb.storage['c_a_c_mxl'] = Metadata(title='Symphony in C', 
+            composer='Bizet, Georges')
+        mb.storage['c_a_d_xml'] = Metadata(title='Third Symphony')
+        mb.updateAccessPaths(['/c/a/a.xml', '/c/a/b.krn', '/c/a/c.mxl'])
+
+        def paths(post):
+            return sorted(fp for fp, unused_number in post)
+
+        self.assertEqual(paths(mb.search('symphony')), 
+            ['/c/a/a.xml', '/c/a/b.krn', '/c/a/c.mxl'])
+        self.assertEqual(paths(mb.search('thoven, lud', 'compose')), 
+            ['/c/a/a.xml', '/c/a/b.krn'])
+        # all words must be found in the same field
+        self.assertEqual(mb.search('third georges'), [])
+        self.assertEqual(paths(mb.search('in c')), ['/c/a/c.mxl'])
+        self.assertEqual(paths(mb.search('ph.*in')), ['/c/a/c.mxl'])
+        self.assertEqual(paths(mb.search('symphony', extList=['.xml'])), 
+            ['/c/a/a.xml', '/c/a/c.mxl'])
+        self.assertEqual(paths(mb.search('symphony', extList=['.krn'])), 
+            ['/c/a/b.krn'])
+        # work ids are not indexed, and are searched in all Metadata
+        mb.storage['c_a_a_xml'].popularTitle = 'Eroica'
+        self.assertEqual(paths(mb.search('eroica', 'popularTitle')), 
+            ['/c/a/a.xml'])
+        mb.storage['c_a_c_mxl'].setWorkId('otp', 'Roma')
+        self.assertEqual(paths(mb.search('roma', 'otp')), ['/c/a/c.mxl'])
+
+        # metadata added to storage directly requires the index to be rebuilt
+        mb.storage['c_a_d_krn'] = Metadata(title='Fifth Symphony')
+        self.assertEqual(mb.search('fifth'), [])
+        mb.updateIndex()
+        mb.updateAccessPaths(['/c/a/a.xml', '/c/a/b.krn', '/c/a/c.mxl', 
+                              '/c/a/d.krn'])
+        self.assertEqual(paths(mb.search('fifth')), ['/c/a/d.krn'])
+
+    def testMetadataDatabase(self):
+        # classes must be from music21.metadata to be frozen
+        from music21 import metadata
+        mb = metadata.MetadataBundle()
+        mb.storage['c_a_a_xml'] = metadata.RichMetadata(title='Third Symphony', 
+            composer='Beethoven, Ludwig van')
+        mb.storage['c_a_c_mxl'] = metadata.Metadata(title='Symphony in C', 
+            composer='Bizet, Georges')
+        mb.openDatabase(':memory:')
+        # metadata added later are indexed as they are added
+        mb.storage['c_a_b_krn'] = metadata.Metadata(title='Fourth Symphony', 
+            composer='Beethoven, Ludwig van')
+        mb.updateAccessPaths(['/c/a/a.xml', '/c/a/b.krn', '/c/a/c.mxl'])
+        # nothing is thawed until it is needed
+        mb.storage._cache = {}
+
+        def paths(post):
+            return sorted(fp for fp, unused_number in post)
+
+        self.assertEqual(paths(mb.search('thoven, lud', 'compose')), 
+            ['/c/a/a.xml', '/c/a/b.krn'])
+        self.assertEqual(sorted(mb.storage._cache.keys()), 
+            ['c_a_a_xml', 'c_a_b_krn'])
+        self.assertEqual(mb.search('third georges'), [])
+        self.assertEqual(paths(mb.search('ph.*in')), ['/c/a/c.mxl'])
+        self.assertEqual(paths(mb.search('symphony', extList=['.xml'])), 
+            ['/c/a/a.xml', '/c/a/c.mxl'])
+        self.assertEqual(mb.storage['c_a_a_xml'].composer, 
+            'Beethoven, Ludwig van')
+        mb.storage.close()
+
+    def testMetadataBundleUpdateFromPaths(self):
+        import shutil
+        import tempfile
+        import time
+        from music21 import metadata
+        from music21.musicxml import testPrimitive
+        directory = tempfile.mkdtemp(dir=environLocal.getRootTempDir())
+
+        def writeFile(fn, title):
+            fp = os.path.join(directory, fn)
+            f = open(fp, 'w')
+            f.write(testPrimitive.pitches01a.replace(
+                'Pitches and accidentals', title))
+            f.close()
+            return fp
+
+        def titles(mb):
+            return sorted(mb.storage[key].title for key in mb.storage)
+
+        try:
+            fpA = writeFile('a.xml', 'Title A')
+            fpB = writeFile('b.xml', 'Title B')
+            mb = metadata.MetadataBundle()
+            self.assertEqual(mb.updateFromPaths([fpA, fpB]), [])
+            self.assertEqual(titles(mb), ['Title A', 'Title B'])
+            self.assertEqual(mb._getChangedPaths([fpA, fpB]), [])
+            mb.openDatabase(':memory:')
+            self.assertEqual(sorted(mb.fingerprints), sorted([fpA, fpB]))
+
+            # a file with a new modification time, but the same contents, 
+            # is not parsed again
+            mtime = time.time() + 10
+            os.utime(fpA, (mtime, mtime))
+            self.assertEqual(mb._getChangedPaths([fpA, fpB]), [])
+            self.assertEqual(mb.fingerprints[fpA][1], os.stat(fpA).st_mtime)
+            # changed and new files are parsed, removed files are dropped
+            writeFile('b.xml', 'Title B, revised')
+            fpC = writeFile('c.xml', 'Title C')
+            self.assertEqual(mb._getChangedPaths([fpB, fpC]), [fpB, fpC])
+            self.assertEqual(mb.updateFromPaths([fpB, fpC]), [])
+            self.assertEqual(titles(mb), ['Title B, revised', 'Title C'])
+            self.assertEqual(sorted(mb.storage.getFingerprints()), 
+                sorted([fpB, fpC]))
+            # files parsed by another version of music21 are parsed again
+            self.assertEqual(mb.storage.getFingerprints()[fpC][3], 
+                __version__)
+            fingerprint = mb.fingerprints[fpC]
+            mb._setFingerprint(fpC, fingerprint[:3] + ['0.0.1', 
+                fingerprint[4]])
+            self.assertEqual(mb._getChangedPaths([fpB, fpC]), [fpC])
+            self.assertEqual(mb.updateFromPaths([fpB, fpC]), [])
+            self.assertEqual(mb._getChangedPaths([fpB, fpC]), [])
+            mb.storage.close()
+        finally:
+            shutil.rmtree(directory)
+
+    def testMetadataBundleReadNewer(self):
+        import shutil
+        import tempfile
+        from music21 import metadata
+        directory = tempfile.mkdtemp(dir=environLocal.getRootTempDir())
+
+        def getFilePath(extension='.json'):
+            return os.path.join(directory, 'local' + extension)
+
+        def readBundle():
+            mb = metadata.MetadataBundle('local')
+            mb._getFilePath = getFilePath
+            mb.read()
+            return mb
+
+        try:
+            mb = metadata.MetadataBundle('local')
+            mb._getFilePath = getFilePath
+            mb.storage['c_a_a_xml'] = metadata.Metadata(title='Third Symphony')
+            mb.exportJSON()
+            mb.openDatabase()
+            mb.storage['c_a_b_xml'] = metadata.Metadata(title='Fourth Symphony')
+            mb.write()
+            mb.storage.close()
+            # the database is newer than the JSON file
+            os.utime(getFilePath(), (1000, 1000))
+            mb = readBundle()
+            self.assertTrue(isinstance(mb.storage, metadata.MetadataDatabase))
+            self.assertEqual(len(mb.storage), 2)
+            mb.storage.close()
+            # a rebuilt JSON file is read instead of an older database
+            os.utime(getFilePath('.db'), (1000, 1000))
+            os.utime(getFilePath(), (2000, 2000))
+            mb = readBundle()
+            self.assertFalse(isinstance(mb.storage, metadata.MetadataDatabase))
+            self.assertEqual(list(mb.storage.keys()), ['c_a_a_xml'])
+        finally:
+            shutil.rmtree(directory)
+
     def testJSONSerialization(self):
         from music21 import metadata
         import json
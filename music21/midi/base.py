@@ -190,6 +190,33 @@ def getVariableLengthNumber(midiStr):
             #environLocal.printDebug(['getVariableLengthNumber: depth read into string: %s' % i])
             return summation, midiStr[i:] 
 
+def _getVariableLengthNumberAt(data, position):
+    r'''
+    Like :func:`~music21.midi.base.getVariableLengthNumber`, but read from
+    a bytearray starting at the integer `position`, and return the value
+    and the position just after it instead of the remaining string.
+    Nothing is copied, so reading a whole track is linear in its length.
+
+    
+    >>> midi.base._getVariableLengthNumberAt(bytearray('A-u'), 1)
+    (45, 2)
+    >>> midi.base._getVariableLengthNumberAt(bytearray('x\xff\x7fy'), 1)
+    (16383, 3)
+
+    If no low-byte character is encoded, raises an IndexError
+
+    >>> midi.base._getVariableLengthNumberAt(bytearray('\xff\xff'), 0)
+    Traceback (most recent call last):
+    IndexError: bytearray index out of range
+    '''
+    summation = 0
+    while True:
+        x = data[position]
+        summation = (summation << 7) + (x & 0x7F)
+        position += 1
+        if not (x & 0x80):
+            return summation, position
+
 def getNumbersAsList(midiStr):
     '''
     Translate each char into a number, return in a list. 
@@ -242,18 +269,31 @@ def putVariableLengthNumber(x):
     MidiException: cannot putVariableLengthNumber() when number is negative: -1
     '''
     #environLocal.printDebug(['calling putVariableLengthNumber(x) with', x])
+    data = bytearray()
+    _putVariableLengthNumberTo(data, x)
+    return str(data)
+
+def _putVariableLengthNumberTo(data, x):
+    r'''
+    Append the number `x` as a variable length number to the bytearray `data`. 
+
+    >>> data = bytearray('MTrk')
+    >>> midi.base._putVariableLengthNumberTo(data, 1024)
+    >>> data
+    bytearray(b'MTrk\x88\x00')
+    '''
     # note: negative numbers will cause an infinite loop here
     if x < 0:
         raise MidiException('cannot putVariableLengthNumber() when number is negative: %s' % x)
-    lst = [ ] 
-    while True: 
-        y, x = x & 0x7F, x >> 7 
-        lst.append(chr(y + 0x80)) 
-        if x == 0: 
-            break 
-    lst.reverse() 
-    lst[-1] = chr(ord(lst[-1]) & 0x7f) 
-    return string.join(lst, "") 
+    # find the shift of the most significant group of seven bits
+    shift = 0
+    while x >> (shift + 7):
+        shift += 7
+    # all but the last byte have the high bit set
+    while shift:
+        data.append(((x >> shift) & 0x7F) | 0x80)
+        shift -= 7
+    data.append(x & 0x7F)
 
 def putNumbersAsList(numList):
     '''
@@ -377,6 +417,187 @@ metaEvents = Enumeration([("SEQUENCE_NUMBER", 0x00),
                           ("KEY_SIGNATURE", 0x59), 
                           ("SEQUENCER_SPECIFIC_META_EVENT", 0x7F)]) 
 
+#-------------------------------------------------------------------------------
+# decoding events from a bytearray, shared by MidiEvent.read() and 
+# MidiFile.readEventTuples()
+
+def _readChannelVoiceMessage(x, z, thirdByte):
+    '''
+    Decode a channel voice message from the status byte `x` and the two 
+    data bytes `z` and `thirdByte` (as integers). Return a tuple of 
+    the number of bytes the message takes (including the status byte), 
+    the type, the channel, and the first and second parameters 
+    (pitch and velocity for notes).
+
+    >>> midi.base._readChannelVoiceMessage(0x91, 60, 120)
+    (3, 'NOTE_ON', 2, 60, 120)
+    >>> midi.base._readChannelVoiceMessage(0xC2, 40, 0)
+    (2, 'PROGRAM_CHANGE', 3, 40, None)
+    '''
+    # x, y, and z define characteristics of the first two chars
+    # for x: The left nybble (4 bits) contains the actual command, and the right nibble contains the midi channel number on which the command will be executed.
+    y = x & 0xF0  # bitwise and to derive channel number
+    channel = (x & 0x0F) + 1  # this is same as y + 1
+    messageType = channelVoiceMessages.whatis(y) 
+    if (messageType == "PROGRAM_CHANGE" or 
+        messageType == "CHANNEL_KEY_PRESSURE"): 
+        # the data
+        return 2, messageType, channel, z, None
+    # for a note, the pitch and the velocity; 
+    # for a CONTROLLER_CHANGE, the controller id and the control value
+    return 3, messageType, channel, z, thirdByte
+
+
+def _readEventAt(data, position, runningStatus):
+    '''
+    Decode the MIDI event (without its delta time) that starts at the 
+    integer `position` of the bytearray `data`, which must have at least 
+    two bytes left. `runningStatus` is the last status byte read, as an 
+    integer, or None; it is used if the event begins with a data byte.
+
+    Return a tuple of the position just after the event, the status byte 
+    to use as the next running status, the type, the channel, and the 
+    first and second parameters of the event (as stored in
+    :class:`~music21.midi.base.MidiEvent` `_parameter1` and `_parameter2`).
+
+    Raises a MidiException for events that cannot be read.
+
+    >>> data = bytearray(midi.intsToHexString([0x91, 60, 120, 62, 100]))
+    >>> midi.base._readEventAt(data, 0, None)
+    (3, 145, 'NOTE_ON', 2, 60, 120)
+    >>> midi.base._readEventAt(data, 3, 145)
+    (5, 145, 'NOTE_ON', 2, 62, 100)
+
+    >>> data = bytearray(midi.intsToHexString([0xFF, 0x03, 3]) + 'Oboe')
+    >>> midi.base._readEventAt(data, 0, 145)
+    (6, 255, 'SEQUENCE_TRACK_NAME', None, 'Obo', None)
+    '''
+    # x, y, and z define characteristics of the first two chars
+    # for x: The left nybble (4 bits) contains the actual command, and the right nibble contains the midi channel number on which the command will be executed.
+    x = data[position]
+
+    # detect running status: if the status byte is less than 128, its 
+    # not a status byte, but a data byte
+    if x < 128:
+        # environLocal.printDebug(['MidiEvent.read(): found running status even data', 'self.lastStatusByte:', self.lastStatusByte])
+
+        if runningStatus is not None:
+            x = runningStatus
+        else: # provide a default
+            x = 0x90
+        # process as before, as if the running status byte stood 
+        # just before the data bytes
+        position -= 1
+        status = runningStatus
+    else:
+        status = x
+
+    y = x & 0xF0  # bitwise and to derive message type
+    z = data[position + 1] 
+
+    #environLocal.printDebug(['MidiEvent.read(): trying to parse a MIDI event, looking at first two chars:', 'repr(x)', repr(x), 'charToBinary(str[0])', charToBinary(str[0]), 'charToBinary(str[1])', charToBinary(str[1])])
+
+    if channelVoiceMessages.hasValue(y): 
+        size, messageType, channel, parameter1, parameter2 = _readChannelVoiceMessage(
+                                                x, z, data[position + 2])
+        return position + size, status, messageType, channel, parameter1, parameter2
+
+    elif y == 0xB0 and channelModeMessages.hasValue(z): 
+        messageType = channelModeMessages.whatis(z) 
+        parameter1 = None
+        if messageType == "LOCAL_CONTROL": 
+            parameter1 = (data[position + 2] == 0x7F) 
+        elif messageType == "MONO_MODE_ON": 
+            parameter1 = data[position + 2] 
+        else:
+            environLocal.printDebug(['unhandled message:', chr(data[position + 2])])
+        return position + 3, status, messageType, (x & 0x0F) + 1, parameter1, None
+
+    elif x == 0xF0 or x == 0xF7: 
+        messageType = {0xF0: "F0_SYSEX_EVENT", 
+                       0xF7: "F7_SYSEX_EVENT"}[x] 
+        length, position = _getVariableLengthNumberAt(data, position + 1) 
+        return (position + length, status, messageType, None, 
+                str(data[position:position + length]), None)
+
+    # SEQUENCE_TRACK_NAME and other MetaEvents are here
+    elif x == 0xFF: 
+        #environLocal.printDebug(['MidiEvent.read(): got a variable length meta event', charToBinary(str[0])])
+        if not metaEvents.hasValue(z): 
+            environLocal.printDebug(["unknown meta event: FF %02X" % z])
+            sys.stdout.flush() 
+            raise MidiException("Unknown midi event type: %r, %r" % (x, z))
+        messageType = metaEvents.whatis(z) 
+        length, position = _getVariableLengthNumberAt(data, position + 2) 
+        # return the position of the next event
+        return (position + length, status, messageType, None, 
+                str(data[position:position + length]), None)
+    else:
+        # an uncaught message
+        environLocal.printDebug(['got unknown midi event type', repr(x), 'charToBinary(midiStr[0])', charToBinary(chr(x)), 'charToBinary(midiStr[1])', charToBinary(chr(z))])
+
+        raise MidiException("Unknown midi event type")
+
+
+def _getTrackDataAt(data, position):
+    r'''
+    Return the length given in the header of the track chunk that begins, 
+    with `MTrk`, at the integer `position` of the bytearray `data`, and 
+    the event data of the track, as a new bytearray.
+    
+    Reading past the end of the returned data raises an IndexError, 
+    as reading past the end of a string would.
+
+    >>> data = bytearray('MTrk' + midi.putNumber(3, 4) + '\x00\xff\x2fMThd')
+    >>> midi.base._getTrackDataAt(data, 0)
+    (3, bytearray(b'\x00\xff/'))
+    '''
+    if not data[position:position + 4] == "MTrk":
+        raise MidiException('badly formed midi string: missing leading MTrk')
+    if len(data) < position + 8:
+        raise MidiException('badly formed midi string: missing track length')
+    # get the 4 chars after the MTrk encoding
+    length = struct.unpack_from('>L', data, position + 4)[0]
+    #environLocal.printDebug(['MidiTrack.read(): got chunk size', length])   
+    return length, data[position + 8:position + 8 + length]
+
+
+def _readTrackEventTuplesAt(data, position):
+    '''
+    Decode the track chunk that begins at the integer `position` of the
+    bytearray `data` into a list of event tuples, as described in 
+    :meth:`~music21.midi.base.MidiFile.readEventTuples`. 
+    Return the list and the position just after the track.
+
+    Events are read, and skipped, exactly as by 
+    :meth:`~music21.midi.base.MidiTrack.read`, but no 
+    MidiEvent or DeltaTime objects are created.
+    '''
+    length, trackData = _getTrackDataAt(data, position)
+    trackEnd = len(trackData)
+
+    events = []
+    tick = 0 # a running counter of ticks
+    runningStatus = None
+    trackPosition = 0
+    while trackPosition < trackEnd: 
+        dt, eventPosition = _getVariableLengthNumberAt(trackData, trackPosition)
+        if trackEnd - eventPosition < 2:
+            # a null event, which carries no data, ends the track
+            break
+        # some midi events may raise errors; simply skip for now, 
+        # without advancing the time
+        try:
+            (trackPosition, runningStatus, eventType, channel, parameter1, 
+                parameter2) = _readEventAt(trackData, eventPosition, runningStatus)
+        except MidiException:
+            trackPosition = eventPosition
+            continue
+        tick += dt
+        events.append((tick, eventType, channel, parameter1, parameter2))
+    return events, position + 8 + length
+
+
 #-------------------------------------------------------------------------------
 class MidiEvent(object): 
     '''
@@ -592,34 +813,10 @@ class MidiEvent(object):
         >>> me1.velocity
         120
         '''
-        # x, y, and z define characteristics of the first two chars
-        # for x: The left nybble (4 bits) contains the actual command, and the right nibble contains the midi channel number on which the command will be executed.
-        x = ord(midiStr[0]) # return the char number
-        y = x & 0xF0  # bitwise and to derive channel number
-        z = ord(midiStr[1])
-        thirdByte = midiStr[2] 
-
-        self.channel = (x & 0x0F) + 1  # this is same as y + 1
-        self.type = channelVoiceMessages.whatis(y) 
-        #environLocal.printDebug(['MidiEvent.read()', self.type])
-        if (self.type == "PROGRAM_CHANGE" or 
-            self.type == "CHANNEL_KEY_PRESSURE"): 
-            self.data = z 
-            return midiStr[2:] 
-        elif (self.type == "CONTROLLER_CHANGE"):
-            # for now, do nothing with this data
-            # for a note, str[2] is velocity; here, it is the control value
-            self.pitch = z # this is the controller id
-            self.velocity = ord(thirdByte) # this is the controller value
-            return midiStr[3:] 
-        else: 
-            self.pitch = z # the second byte
-            # read the third chart toi get velocity 
-            self.velocity = ord(thirdByte) 
-            # each MidiChannel object is accessed here
-            # using that channel, data for each event is added or 
-            # removed 
-            return midiStr[3:] 
+        data = bytearray(midiStr[:3])
+        (size, self.type, self.channel, self._parameter1, 
+            self._parameter2) = _readChannelVoiceMessage(data[0], data[1], data[2])
+        return midiStr[size:]
 
     def read(self, time, midiStr): 
         '''
@@ -643,134 +840,111 @@ class MidiEvent(object):
         >>> (159 & 0x0F) + 1 # getting the channel
         16
         '''
-        if len(midiStr) < 2:
-            # often what we have here are null events:
-            # the string is simply: 0x00
-            environLocal.printDebug(['MidiEvent.read(): got bad data string', 'time', time, 'str', repr(midiStr)])
-            return ''
-
-        # x, y, and z define characteristics of the first two chars
-        # for x: The left nybble (4 bits) contains the actual command, and the right nibble contains the midi channel number on which the command will be executed.
-        x = ord(midiStr[0]) # given a string representation, get decimal number
-
-        # detect running status: if the status byte is less than 128, its 
-        # not a status byte, but a data byte
-        if x < 128:
-            # environLocal.printDebug(['MidiEvent.read(): found running status even data', 'self.lastStatusByte:', self.lastStatusByte])
-
-            if self.lastStatusByte is not None:
-                rsb = self.lastStatusByte
-            else: # provide a default
-                rsb = chr(0x90)
-            #post = self._parseChannelVoiceMessage(str, runningStatusByte=rsb)
-            #return post
-            # add the running status byte to the front of the string 
-            # and process as before
-            midiStr = rsb + midiStr
-            x = ord(midiStr[0]) # given a string representation, get decimal number
-        else:
-            # store last status byte
-            self.lastStatusByte = midiStr[0]
+        return midiStr[self._readBytes(time, bytearray(midiStr), 0):]
 
-        y = x & 0xF0  # bitwise and to derive message type
-        z = ord(midiStr[1]) 
+    def _readBytes(self, time, data, position):
+        '''
+        Read this event from the bytearray `data`, starting at the integer
+        `position`, and return the position just after the event. 
+        The data is never sliced, so :meth:`~music21.midi.base.MidiTrack.read`
+        can walk a whole track with a single cursor.
 
-        #environLocal.printDebug(['MidiEvent.read(): trying to parse a MIDI event, looking at first two chars:', 'repr(x)', repr(x), 'charToBinary(str[0])', charToBinary(str[0]), 'charToBinary(str[1])', charToBinary(str[1])])
+        The `time` value is as in :meth:`~music21.midi.base.MidiEvent.read`.
 
-        if channelVoiceMessages.hasValue(y): 
-            return self._parseChannelVoiceMessage(midiStr)
+        >>> mt = midi.MidiTrack(1)
+        >>> me1 = midi.MidiEvent(mt)
+        >>> data = bytearray(midi.intsToHexString([0, 145, 60, 120, 62, 100]))
+        >>> me1._readBytes(0, data, 1)
+        4
+        >>> me1
+        <MidiEvent NOTE_ON, t=None, track=1, channel=2, pitch=60, velocity=120>
 
-        elif y == 0xB0 and channelModeMessages.hasValue(z): 
-            self.channel = (x & 0x0F) + 1 
-            self.type = channelModeMessages.whatis(z) 
-            if self.type == "LOCAL_CONTROL": 
-                self.data = (ord(midiStr[2]) == 0x7F) 
-            elif self.type == "MONO_MODE_ON": 
-                self.data = ord(midiStr[2]) 
-            else:
-                environLocal.printDebug(['unhandled message:', midiStr[2]])
-            return midiStr[3:]
-
-        elif x == 0xF0 or x == 0xF7: 
-            self.type = {0xF0: "F0_SYSEX_EVENT", 
-                         0xF7: "F7_SYSEX_EVENT"}[x] 
-            length, midiStr = getVariableLengthNumber(midiStr[1:]) 
-            self.data = midiStr[:length] 
-            return midiStr[length:]
-
-        # SEQUENCE_TRACK_NAME and other MetaEvents are here
-        elif x == 0xFF: 
-            #environLocal.printDebug(['MidiEvent.read(): got a variable length meta event', charToBinary(str[0])])
-            if not metaEvents.hasValue(z): 
-                environLocal.printDebug(["unknown meta event: FF %02X" % z])
-                sys.stdout.flush() 
-                raise MidiException("Unknown midi event type: %r, %r" % (x, z))
-            self.type = metaEvents.whatis(z) 
-            length, midiStr = getVariableLengthNumber(midiStr[2:]) 
-            self.data = midiStr[:length] 
-            # return remainder
-            return midiStr[length:] 
-        else:
-            # an uncaught message
-            environLocal.printDebug(['got unknown midi event type', repr(x), 'charToBinary(midiStr[0])', charToBinary(midiStr[0]), 'charToBinary(midiStr[1])', charToBinary(midiStr[1])])
+        A data byte where a status byte is expected uses the running status:
 
-            raise MidiException("Unknown midi event type")
-            #return everything but the first character
-            return midiStr[1:] # 
+        >>> me2 = midi.MidiEvent(mt)
+        >>> me2.lastStatusByte = me1.lastStatusByte
+        >>> me2._readBytes(0, data, 4)
+        6
+        >>> me2
+        <MidiEvent NOTE_ON, t=None, track=1, channel=2, pitch=62, velocity=100>
+        '''
+        if len(data) - position < 2:
+            # often what we have here are null events:
+            # the string is simply: 0x00
+            environLocal.printDebug(['MidiEvent.read(): got bad data string', 'time', time, 'str', repr(str(data[position:]))])
+            return len(data)
+
+        if self.lastStatusByte is not None:
+            runningStatus = ord(self.lastStatusByte)
+        else:
+            runningStatus = None
+        (position, status, self.type, self.channel, self._parameter1, 
+            self._parameter2) = _readEventAt(data, position, runningStatus)
+        if status is not None:
+            # store last status byte
+            self.lastStatusByte = chr(status)
+        return position
 
 
     def write(self): 
         '''
         Write out a midi track.
         '''
+        data = bytearray()
+        self._writeBytes(data)
+        return str(data)
+
+    def _writeBytes(self, data):
+        '''
+        Append the bytes of this event to the bytearray `data`.
+        '''
         sysex_event_dict = {"F0_SYSEX_EVENT": 0xF0, 
                             "F7_SYSEX_EVENT": 0xF7} 
         if channelVoiceMessages.hasattr(self.type): 
             #environLocal.printDebug(['writing channelVoiceMessages', self.type])
-            x = chr((self.channel - 1) + 
-                    getattr(channelVoiceMessages, self.type)) 
+            data.append((self.channel - 1) + 
+                        getattr(channelVoiceMessages, self.type)) 
             # for writing note-on/note-off
             if self.type not in ['PROGRAM_CHANGE', 
                 'CHANNEL_KEY_PRESSURE']:
-                # this results in a two-part string, like '\x00\x00'
+                # this results in two bytes, like '\x00\x00'
                 try:
-                    data = chr(self._parameter1) + chr(self._parameter2) 
+                    data.append(self._parameter1)
+                    data.append(self._parameter2)
                 except ValueError:
                     raise MidiException("Problem with representing either %d or %d" % (self._parameter1, self._parameter2))
             elif self.type in ['PROGRAM_CHANGE']:
                 #environLocal.printDebug(['trying to add program change data: %s' % self.data])
                 try:
-                    data = chr(self.data) 
+                    data.append(self.data) 
                 except TypeError:
                     raise MidiException("Got incorrect data for %s in .data: %s, cannot parse Program Change" % (self, self.data))
             else:  # all other messages
                 try:
-                    data = chr(self.data) 
+                    data.append(self.data) 
                 except TypeError:
                     raise MidiException("Got incorrect data for %s in .data: %s, cannot parse Miscellaneous Message" % (self, self.data))
-            return x + data 
 
         elif channelModeMessages.hasattr(self.type): 
-            x = getattr(channelModeMessages, self.type) 
-            x = (chr(0xB0 + (self.channel - 1)) + 
-                 chr(x) + 
-                 chr(self.data)) 
-            return x 
+            data.append(0xB0 + (self.channel - 1))
+            data.append(getattr(channelModeMessages, self.type))
+            data.append(self.data)
 
         elif sysex_event_dict.has_key(self.type): 
-            s = chr(sysex_event_dict[self.type]) 
-            s = s + putVariableLengthNumber(len(self.data)) 
-            return s + self.data 
+            data.append(sysex_event_dict[self.type])
+            _putVariableLengthNumberTo(data, len(self.data))
+            data.extend(self.data)
 
         elif metaEvents.hasattr(self.type):                 
-            s = chr(0xFF) + chr(getattr(metaEvents, self.type)) 
-            s = s + putVariableLengthNumber(len(self.data)) 
-            try: # TODO: need to handle unicode
-                return s + self.data 
-            except UnicodeDecodeError:
+            data.append(0xFF)
+            data.append(getattr(metaEvents, self.type))
+            _putVariableLengthNumberTo(data, len(self.data))
+            if isinstance(self.data, unicode): # TODO: need to handle unicode
                 #environLocal.printDebug(['cannot decode data', self.data])
-                return s + unicodedata.normalize('NFKD', 
-                           self.data).encode('ascii','ignore')
+                data.extend(unicodedata.normalize('NFKD', 
+                            self.data).encode('ascii','ignore'))
+            else:
+                data.extend(self.data)
         else: 
             raise MidiException("unknown midi event type: %s" % self.type)
 
@@ -912,10 +1086,21 @@ class DeltaTime(MidiEvent):
         self.time, newstr = getVariableLengthNumber(oldstr) 
         return self.time, newstr 
 
+    def _readBytes(self, data, position):
+        '''
+        Read the time from the bytearray `data` at the integer `position`; 
+        return the time and the position just after it.
+        '''
+        self.time, position = _getVariableLengthNumberAt(data, position) 
+        return self.time, position
+
     def write(self): 
         midiStr = putVariableLengthNumber(self.time) 
         return midiStr
 
+    def _writeBytes(self, data):
+        _putVariableLengthNumberTo(data, self.time)
+
 
 
 class MidiTrack(object): 
@@ -955,25 +1140,32 @@ class MidiTrack(object):
         Creates and stores :class:`~music21.midi.base.DeltaTime` 
         and :class:`~music21.midi.base.MidiEvent` objects. 
         '''
+        return midiStr[self._readBytes(bytearray(midiStr), 0):]
+
+    def _readBytes(self, data, position):
+        '''
+        Read a track from the bytearray `data`, beginning with `MTrk` at 
+        the integer `position`, and return the position just after the track.
+
+        The track is parsed with one integer cursor, so, unlike repeatedly 
+        slicing off the front of a string, the time taken is linear in 
+        the length of the track.
+        '''
         time = 0 # a running counter of ticks
 
-        if not midiStr[:4] == "MTrk":
-            raise MidiException('badly formed midi string: missing leading MTrk')
-        # get the 4 chars after the MTrk encoding
-        length, midiStr = getNumber(midiStr[4:], 4)      
-        #environLocal.printDebug(['MidiTrack.read(): got chunk size', length])   
+        # all event data is in the track data
+        length, trackData = _getTrackDataAt(data, position)
         self.length = length 
+        trackEnd = len(trackData)
 
-        # all event data is in the track str
-        trackStr = midiStr[:length] 
-        remainder = midiStr[length:] 
-
+        events = self.events
+        trackPosition = 0
         ePrevious = None
-        while trackStr: 
+        while trackPosition < trackEnd: 
             # shave off the time stamp from the event
             delta_t = DeltaTime(self) 
-            # return extracted time, as well as remaining string
-            dt, trackStrCandidate = delta_t.read(trackStr) 
+            # return extracted time, as well as position of the event
+            dt, positionCandidate = delta_t._readBytes(trackData, trackPosition) 
             # this is the offset that this event happens at, in ticks
             timeCandidate = time + dt 
     
@@ -983,40 +1175,51 @@ class MidiTrack(object):
                 e.lastStatusByte = ePrevious.lastStatusByte
             # some midi events may raise errors; simply skip for now
             try:
-                trackStrCandidate = e.read(timeCandidate, trackStrCandidate) 
+                positionCandidate = e._readBytes(timeCandidate, trackData, positionCandidate) 
             except MidiException:
-                # assume that trackStr, after delta extraction, is still correct
+                # assume that the position, after delta extraction, is still correct
                 #environLocal.printDebug(['forced to skip event; delta_t:', delta_t])
                 # set to result after taking delta time
-                trackStr = trackStrCandidate
+                trackPosition = positionCandidate
                 continue
             # only set after trying to read, which may raise exception
             time = timeCandidate
-            trackStr = trackStrCandidate # remainder string
+            trackPosition = positionCandidate
             # only append if we get this far
-            self.events.append(delta_t) 
-            self.events.append(e) 
+            events.append(delta_t) 
+            events.append(e) 
             ePrevious = e
 
-        return remainder # remainder string after extracting track data
-    
+        return position + 8 + length
+
     def write(self): 
         '''
         returns a string of midi-data from the `.events` in the object.
         '''
-        
-        # set time to the first event
-        # time = self.events[0].time 
-        # build str using MidiEvents 
-        midiStr = ""
+        data = bytearray()
+        self._writeBytes(data)
+        return str(data)
+
+    def _writeBytes(self, data):
+        '''
+        Append the track, beginning with `MTrk`, to the bytearray `data`.
+
+        Events are written into the one bytearray, so, unlike concatenating 
+        strings, the time taken is linear in the length of the track.
+        '''
+        start = len(data)
+        # the track length is filled in when all events are written
+        data.extend("MTrk\x00\x00\x00\x00")
         for e in self.events: 
             # this writes both delta time and message events
+            eventStart = len(data)
             try:
-                ew = e.write()
-                midiStr = midiStr + ew
+                e._writeBytes(data)
             except MidiException as me:
+                # remove anything written before the error
+                del data[eventStart:]
                 environLocal.warn("Conversion error for %s: %s; ignored." % (e, me))
-        return "MTrk" + putNumber(len(midiStr), 4) + midiStr
+        struct.pack_into('>L', data, start + 4, len(data) - start - 8)
     
     def __repr__(self): 
         r = "<MidiTrack %d -- %d events\n" % (self.index, len(self.events)) 
@@ -1131,23 +1334,36 @@ class MidiFile(object):
         data in `.ticksPerQuarterNote` and a list of
         `MidiTrack` objects in the attribute `.tracks`. 
         '''
-        if not midiStr[:4] == "MThd":
-            raise MidiException('badly formated midi string, got: %s' % midiStr[:20])
+        # we step through the data with an integer cursor, rather than
+        # chopping characters off the front of the string as we go
+        data = bytearray(midiStr)
+        numTracks = self._readHeader(data)
+        #environLocal.printDebug(['MidiFile.readstr(): got midi file format:', self.format, 'with specified number of tracks:', numTracks, 'ticksPerSecond:', self.ticksPerSecond, 'ticksPerQuarterNote:', self.ticksPerQuarterNote])
 
-        # we step through the str src, chopping off characters as we go
-        # and reassigning to str
-        length, midiStr = getNumber(midiStr[4:], 4) 
+        position = 14
+        for i in range(numTracks): 
+            trk = MidiTrack(i) # sets the MidiTrack index parameters
+            position = trk._readBytes(data, position) # returns the start of the next track
+            self.tracks.append(trk) 
+
+    def _readHeader(self, data):
+        '''
+        Read the header chunk at the start of the bytearray `data` into
+        `.format` and `.ticksPerQuarterNote` (or `.ticksPerSecond`); 
+        return the number of tracks. The first track starts at position 14.
+        '''
+        if not data[:4] == "MThd":
+            raise MidiException('badly formated midi string, got: %s' % str(data[:20]))
+        if len(data) < 14:
+            raise MidiException('badly formated midi string')
+        length, midiFormatType, numTracks, division = struct.unpack_from('>LHHH', data, 4)
         if not length == 6:
             raise MidiException('badly formated midi string')
 
-        midiFormatType, midiStr = getNumber(midiStr, 2) 
         self.format = midiFormatType
         if not midiFormatType in [0, 1]:
             raise MidiException('cannot handle midi file format: %s' % format)
 
-        numTracks, midiStr = getNumber(midiStr, 2) 
-        division, midiStr = getNumber(midiStr, 2) 
-
         # very few midi files seem to define ticksPerSecond
         if division & 0x8000: 
             framesPerSecond = -((division >> 8) | -128) 
@@ -1160,12 +1376,40 @@ class MidiFile(object):
         else: 
             self.ticksPerQuarterNote = division & 0x7FFF 
 
-        #environLocal.printDebug(['MidiFile.readstr(): got midi file format:', self.format, 'with specified number of tracks:', numTracks, 'ticksPerSecond:', self.ticksPerSecond, 'ticksPerQuarterNote:', self.ticksPerQuarterNote])
+        return numTracks
 
-        for i in range(numTracks): 
-            trk = MidiTrack(i) # sets the MidiTrack index parameters
-            midiStr = trk.read(midiStr) # pass all the remaining string, reassing
-            self.tracks.append(trk) 
+    def readEventTuples(self, midiStr):
+        '''
+        Read MIDI data as a string straight into lightweight tuples, 
+        without creating :class:`~music21.midi.base.MidiTrack`, 
+        :class:`~music21.midi.base.MidiEvent` or 
+        :class:`~music21.midi.base.DeltaTime` objects. 
+        
+        As with `readstr()`, `.ticksPerQuarterNote` is set from the data, 
+        but `.tracks` is left unchanged. Return a list with, for each track,
+        a list of (tick, type, channel, parameter1, parameter2) tuples, where
+        tick is the absolute time of the event and parameter1 and parameter2
+        are the pitch and velocity of notes, or the `data` of other events.
+
+        >>> import os
+        >>> fp = os.path.join(common.getSourceFilePath(), 'midi', 'testPrimitive',  'test05.mid')
+        >>> mf = midi.MidiFile()
+        >>> tracks = mf.readEventTuples(open(fp, 'rb').read())
+        >>> len(tracks)
+        1
+        >>> tracks[0][:2]
+        [(0, 'SEQUENCE_TRACK_NAME', None, '', None), (0, 'NOTE_ON', 1, 36, 90)]
+        >>> mf.ticksPerQuarterNote
+        1024
+        '''
+        data = bytearray(midiStr)
+        numTracks = self._readHeader(data)
+        position = 14
+        tracks = []
+        for unused_i in range(numTracks): 
+            events, position = _readTrackEventTuplesAt(data, position)
+            tracks.append(events)
+        return tracks
     
     def write(self): 
         '''
@@ -1184,12 +1428,13 @@ class MidiFile(object):
         # Don't handle ticksPerSecond yet, too confusing 
         if (division & 0x8000) != 0:
             raise MidiException('Cannot write midi string unless self.ticksPerQuarterNote is a multiple of 1024')
-        midiStr = "MThd" + putNumber(6, 4) + putNumber(self.format, 2) 
-        midiStr = midiStr + putNumber(len(self.tracks), 2) 
-        midiStr = midiStr + putNumber(division, 2) 
+        data = bytearray("MThd")
+        data.extend(struct.pack('>LHHH', 6, self.format, len(self.tracks), 
+                                division))
+        # all tracks are written into one bytearray
         for trk in self.tracks: 
-            midiStr = midiStr + trk.write() 
-        return midiStr 
+            trk._writeBytes(data)
+        return str(data)
 
 
 
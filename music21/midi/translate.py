@@ -18,6 +18,7 @@ notes takes place in the :meth:`~music21.stream.Stream.quantize` method not here
 import unittest
 import math
 import copy
+import heapq
 
 from music21.midi import base as midiModule
 from music21 import defaults
@@ -968,39 +969,42 @@ def tempoToMidiEvents(tempoIndication, includeDeltaTime=True):
 # Streams
 
 
-def _getPacket(trackId, offset, midiEvent, obj, lastInstrument=None):
+def _getPacket(trackId, offset, midiEvent, obj, lastInstrument=None, seq=0):
     '''
-    Pack a dictionary of parameters for each event. 
+    Pack a tuple of parameters for each event. 
     Packets are used for sorting and configuring all note events. 
-    Includes offset, any cent shift, the midi event, and the source object.
+
+    A packet is a tuple of (offset, sortOrder, seq, trackId, midiEvent, 
+    duration, centShift, lastInstrument). The first three values order 
+    packets by time, then by the sort order of the MIDI event, and 
+    finally by the order in which the packets were created, so that 
+    sorted lists of packets can be sorted and merged as plain tuples.
 
     Offset and duration values stored here are MIDI ticks, not quarter lengths.
 
-    TODO: Test
+    >>> me = midi.MidiEvent(None, type='NOTE_OFF')
+    >>> n = note.Note('C4', quarterLength=2)
+    >>> p = midi.translate._getPacket(1, 1024, me, n, seq=3)
+    >>> p[:4], p[5:]
+    ((1024, -20, 3, 1), (0, None, None))
+    >>> me = midi.MidiEvent(None, type='NOTE_ON')
+    >>> midi.translate._getPacket(1, 0, me, n)[5]
+    2048
     '''
-    post = {}
-    post['trackId'] = trackId
-    post['offset'] = offset # offset values are in midi ticks
-
     # update sort order here, as type may have been set after creation
     midiEvent.updateSortOrder()
-    post['midiEvent'] = midiEvent
-    post['obj'] = obj # keep a reference to the source object
-    post['centShift'] = midiEvent.centShift
-    # allocate channel later
-    #post['channel'] = None
     if midiEvent.type != 'NOTE_OFF' and obj is not None:
         # store duration so as to calculate when the 
         # channel/pitch bend can be freed
-        post['duration'] = durationToMidi(obj.duration)
+        duration = durationToMidi(obj.duration)
     # note offs will have the same object ref, and seem like the have a 
     # duration when they do not
     else: 
-        post['duration'] = 0
-
-    # store last m21 instrument object, as needed to reset program changes
-    post['lastInstrument'] = lastInstrument
-    return post
+        duration = 0
+    # offset values are in midi ticks; store last m21 instrument object, 
+    # as needed to reset program changes
+    return (offset, midiEvent.sortOrder, seq, trackId, midiEvent, 
+            duration, midiEvent.centShift, lastInstrument)
 
 def _streamToPackets(s, trackId=1):
     '''
@@ -1011,7 +1015,7 @@ def _streamToPackets(s, trackId=1):
     if necessary, have been added. 
 
     In converting from a Stream to MIDI, this is called first, 
-    resulting in a collection of packets by offset. 
+    resulting in a list of packets sorted by offset. 
     Then, packets to events is called.
     '''
     # store all events by offset by offset without delta times
@@ -1053,33 +1057,25 @@ def _streamToPackets(s, trackId=1):
         # for each event, we create a packet representation
         # all events: delta/note-on/delta/note-off
         # strip delta times
-        packets = []
-        for i in range(len(sub)):
+        offset = offsetToMidi(obj.getOffsetBySite(s))
+        for midiEvent in sub:
             # store offset, midi event, object
             # add channel and pitch change also
-            midiEvent = sub[i]
             if midiEvent.type != 'NOTE_OFF':
                 # use offset
-                p = _getPacket(trackId, 
-                            offsetToMidi(obj.getOffsetBySite(s)), 
-                            midiEvent, obj=obj, lastInstrument=lastInstrument)
-                packets.append(p)
+                p = _getPacket(trackId, offset, midiEvent, obj=obj, 
+                    lastInstrument=lastInstrument, seq=len(packetsByOffset))
             # if its a note_off, use the duration to shift offset
             # midi events have already been created; 
             else: 
                 p = _getPacket(trackId, 
-                    offsetToMidi(obj.getOffsetBySite(s)) + durationToMidi(obj.duration), 
-                    midiEvent, obj=obj, lastInstrument=lastInstrument)
-                packets.append(p)
-        packetsByOffset += packets
+                    offset + durationToMidi(obj.duration), midiEvent, obj=obj, 
+                    lastInstrument=lastInstrument, seq=len(packetsByOffset))
+            packetsByOffset.append(p)
 
     # sorting is useful here, as we need these to be in order to assign last
-    # instrument
-    packetsByOffset.sort(
-        cmp=lambda x,y: cmp(x['offset'], y['offset']) or
-                        cmp(x['midiEvent'].sortOrder, y['midiEvent'].sortOrder)
-        )
-    # return packets and stream, as this flat stream should be retained
+    # instrument; packets sort by offset, then sort order, then creation
+    packetsByOffset.sort()
     return packetsByOffset
 
 
@@ -1099,10 +1095,13 @@ def _processPackets(packets, channelForInstrument=None, channelsDyanmic=None,
     Insert pitch bend messages as well, 
     one for start of event, one for end of event.
 
-    `packets` is a list of packets.
+    `packets` is a list of packets, grouped by track and 
+    sorted within each track, as returned by :func:`_streamToPackets`.
     `channelForInstrument` should be a dictionary.
     `channelsDynamic` should be a list.
     `initChannelForTrack` should be a dictionary.
+
+    Returns a dictionary of sorted packet lists, where keys are track ids.
     '''
     if channelForInstrument is None:
         channelForInstrument = {}
@@ -1112,85 +1111,82 @@ def _processPackets(packets, channelForInstrument=None, channelsDyanmic=None,
         initChannelForTrack = {}
     
     #allChannels = range(1, 10) + range(11, 17) # all but 10
-    uniqueChannelEvents = {} # dict of (start, stop, usedChannel) : channel
-    post = []
-    usedTracks = []
+    channelSpans = set() # set of (start, stop, usedChannel)
+    # spans that carry a cent shift; only these can exclude a channel 
+    # for an event without a cent shift
+    shiftedSpans = set() 
+    # for each track, a list of sorted packet lists: the source packets, 
+    # and the pitch bends and program changes added to them; each of 
+    # these lists stays sorted, and they are merged at completion
+    streams = {}
+    # count of packets added, used to retain the order of addition
+    # between packets that share offset and sort order
+    seq = 0
 
     for p in packets:
-        #environLocal.printDebug(['_processPackets', p['midiEvent'].track, p['trackId']])
         # must use trackId, as .track on MidiEvent is not yet set
-        if p['trackId'] not in usedTracks:
-            usedTracks.append(p['trackId'])
+        (offset, sortOrder, unused, trackId, midiEvent, duration, 
+            centShift, lastInstrument) = p
+        if trackId not in streams:
+            streams[trackId] = [[], [], [], []]
+        processed, bendEnds, programChanges, bendStarts = streams[trackId]
 
         # only need note_ons, as stored correspondingEvent attr can be used
         # to get noteOff
-        if p['midiEvent'].type not in ['NOTE_ON']:
+        if midiEvent.type != 'NOTE_ON':
             # set all not note-off messages to init channel
-            if p['midiEvent'].type not in ['NOTE_OFF']:
-                p['midiEvent'].channel = p['initChannel']
-            post.append(p) # add the non note_on packet first
+            if midiEvent.type != 'NOTE_OFF':
+                midiEvent.channel = initChannelForTrack[trackId]
+            # add the non note_on packet first
+            processed.append((offset, sortOrder, seq) + p[3:])
+            seq += 1
             # if this is a note off, and has a cent shift, need to 
             # rest the pitch bend back to 0 cents
-            if p['midiEvent'].type in ['NOTE_OFF']:
-                #environLocal.printDebug(['got note-off', p['midiEvent']])
-                # cent shift is set for note on and note off
-                if p['centShift'] is not None:
-                    # do not set channel, as already set
-                    me = midiModule.MidiEvent(p['midiEvent'].track, 
-                        type="PITCH_BEND", channel=p['midiEvent'].channel)
-                    # note off stores note on's pitch; do not invert, simply
-                    # set to zero
-                    me.setPitchBend(0) 
-                    pBendEnd = _getPacket(trackId=p['trackId'], 
-                        offset=p['offset'], midiEvent=me, 
-                        obj=None, lastInstrument=None)
-                    post.append(pBendEnd)
-                    #environLocal.printDebug(['adding pitch bend', pBendEnd])
+            # cent shift is set for note on and note off
+            if midiEvent.type == 'NOTE_OFF' and centShift is not None:
+                # do not set channel, as already set
+                me = midiModule.MidiEvent(midiEvent.track, 
+                    type="PITCH_BEND", channel=midiEvent.channel)
+                # note off stores note on's pitch; do not invert, simply
+                # set to zero
+                me.setPitchBend(0) 
+                bendEnds.append(_getPacket(trackId=trackId, 
+                    offset=offset, midiEvent=me, 
+                    obj=None, lastInstrument=None, seq=seq))
+                seq += 1
             continue # store and continue
 
         # set default channel for all packets
-        p['midiEvent'].channel = p['initChannel']
+        midiEvent.channel = initChannelForTrack[trackId]
 
         # find a free channel       
         # if necessary, add pitch change at start of Note, 
         # cancel pitch change at end
-        o = p['offset']
-        oEnd = p['offset']+p['duration']
-
-        channelExclude = [] # channels that cannot be used
-        centShift = p['centShift'] # may be None
+        o = offset
+        oEnd = offset + duration
 
-        #environLocal.printDebug(['\n\noffset', o, 'oEnd', oEnd, 'centShift', centShift])
+        channelExclude = set() # channels that cannot be used
 
         # iterate through all past events/channels, and find all
-        # that are active and have a pitch bend
-        for key in uniqueChannelEvents:
+        # that are active and have a pitch bend; or, if this event 
+        # has a shift, all that are active, as we can exclude
+        # the channel already used without a shift
+        if centShift is None:
+            pastSpans = shiftedSpans
+        else:
+            pastSpans = channelSpans
+        for key in pastSpans:
             start, stop, usedChannel = key
             # if offset (start time) is in this range of a found event
             # or if any start or stop is within this span
-            #if o >= start and o < stop: # found an offset that is used
-
             if ( (start >= o and start < oEnd) or
                  (stop > o and stop < oEnd) or
                  (start <= o and stop > o) or
                  (start < oEnd and stop > oEnd)
                 ) : 
-                # if there is a cent shift active in the already used channel
-                #environLocal.printDebug(['matchedOffset overlap'])
-                centShiftList = uniqueChannelEvents[key]
-                if len(centShiftList) > 0:
-                    # only add if unique
-                    if usedChannel not in channelExclude:
-                        channelExclude.append(usedChannel)
-                # or if this event has shift, then we can exclude
-                # the channel already used without a shift
-                elif centShift is not None:
-                    if usedChannel not in channelExclude:
-                        channelExclude.append(usedChannel)
-                            # cannot break early w/o sorting
+                channelExclude.add(usedChannel)
 
         # if no channels are excluded, get a new channel
-        #environLocal.printDebug(['post process channelExclude', channelExclude])
         if len(channelExclude) > 0: # only change if necessary
             ch = None       
             # iterate in order over all channels: lower will be added first
@@ -1200,101 +1196,71 @@ def _processPackets(packets, channelForInstrument=None, channelsDyanmic=None,
                     break
             if ch is None:
                 raise TranslateException('no unused channels available for microtone/instrument assignment')
-            p['midiEvent'].channel = ch
+            midiEvent.channel = ch
             # change channel of note off; this is used above to turn off pbend
-            p['midiEvent'].correspondingEvent.channel = ch
-            #environLocal.printDebug(['set channel of correspondingEvent:', 
-                                #p['midiEvent'].correspondingEvent])
+            midiEvent.correspondingEvent.channel = ch
 
             # TODO: must add program change, as we are now in a new 
             # channel; regardless of if we have a pitch bend (we may
             # move channels for a different reason  
-            if p['lastInstrument'] is not None:
-                meList = instrumentToMidiEvents(inputM21=p['lastInstrument'], 
+            if lastInstrument is not None:
+                meList = instrumentToMidiEvents(inputM21=lastInstrument, 
                     includeDeltaTime=False, 
-                    midiTrack=p['midiEvent'].track, channel=ch)
-                pgmChangePacket = _getPacket(trackId=p['trackId'], 
+                    midiTrack=midiEvent.track, channel=ch)
+                programChanges.append(_getPacket(trackId=trackId, 
                     offset=o, midiEvent=meList[0], # keep offset here
-                    obj=None, lastInstrument=None)
-                post.append(pgmChangePacket)
+                    obj=None, lastInstrument=None, seq=seq))
+                seq += 1
 
         else: # use the existing channel
-            ch = p['midiEvent'].channel
+            ch = midiEvent.channel
             # always set corresponding event to the same channel
-            p['midiEvent'].correspondingEvent.channel = ch
-
-        #environLocal.printDebug(['assigning channel', ch, 'channelsDynamic', channelsDyanmic, "p['initChannel']", p['initChannel']])
+            midiEvent.correspondingEvent.channel = ch
 
         if centShift is not None:
             # add pitch bend
-            me = midiModule.MidiEvent(p['midiEvent'].track, 
+            me = midiModule.MidiEvent(midiEvent.track, 
                                     type="PITCH_BEND", channel=ch)
             me.setPitchBend(centShift)
-            pBendStart = _getPacket(trackId=p['trackId'], 
+            bendStarts.append(_getPacket(trackId=trackId, 
                 offset=o, midiEvent=me, # keep offset here
-                obj=None, lastInstrument=None)
-            post.append(pBendStart)
-            #environLocal.printDebug(['adding pitch bend', me])
+                obj=None, lastInstrument=None, seq=seq))
+            seq += 1
             # removal of pitch bend will happen above with note off
 
         # key includes channel, so that durations can span once in each channel
-        key = (p['offset'], p['offset']+p['duration'], ch)
-        if key not in uniqueChannelEvents:
-            # need to count multiple instances of events on the same
-            # span and in the same channel (fine if all have the same pitchbend
-            uniqueChannelEvents[key] = [] 
-        # always add the cent shift if it is not None
+        key = (o, oEnd, ch)
+        channelSpans.add(key)
+        # always note the span if there is a cent shift
         if centShift is not None:
-            uniqueChannelEvents[key].append(centShift)
-        post.append(p) # add packet/ done after ch change or bend addition
-        #environLocal.printDebug(['uniqueChannelEvents', uniqueChannelEvents])
-
-    # this is called once at completion
-    #environLocal.printDebug(['uniqueChannelEvents', uniqueChannelEvents])
-
-    # after processing, collect all channels used
-    foundChannels = []
-    for start, stop, usedChannel in uniqueChannelEvents.keys(): # a list
-        if usedChannel not in foundChannels:
-            foundChannels.append(usedChannel)
-#         for ch in chList:
-#             if ch not in foundChannels:
-#                 foundChannels.append(ch)
-    #environLocal.printDebug(['foundChannels', foundChannels])
-    #environLocal.printDebug(['usedTracks', usedTracks])
+            shiftedSpans.add(key)
+        # add packet/ done after ch change or bend addition
+        processed.append((offset, sortOrder, seq) + p[3:])
+        seq += 1
 
     # post processing of entire packet collection
-    # for all used channels, create a zero pitch bend at time zero
-    #for ch in foundChannels:
     # for each track, places a pitch bend in its initChannel
-    for trackId in usedTracks:
+    post = {}
+    for trackId, trackStreams in streams.items():
         ch = initChannelForTrack[trackId]
         # use None for track; will get updated later
         me = midiModule.MidiEvent(track=trackId, type="PITCH_BEND", channel=ch)
         me.setPitchBend(0) 
-        pBendEnd = _getPacket(trackId=trackId, 
-            offset=0, midiEvent=me, obj=None, lastInstrument=None)
-        post.append(pBendEnd)
-        #environLocal.printDebug(['adding pitch bend for found channels', me])
-    # this sort is necessary
-    post.sort(
-        cmp=lambda x,y: cmp(x['offset'], y['offset']) or
-                        cmp(x['midiEvent'].sortOrder, y['midiEvent'].sortOrder)
-        )
+        trackStreams.append([_getPacket(trackId=trackId, 
+            offset=0, midiEvent=me, obj=None, lastInstrument=None, seq=seq)])
+        seq += 1
+        # each stream is sorted, so merging retains the order of 
+        # offset, sort order, and order of addition
+        post[trackId] = list(heapq.merge(*trackStreams))
 
     # TODO: for each track, add an additional silent event to make sure
     # entire duration gets played
-
-    # diagnostic display
-    #for p in post: environLocal.printDebug(['proceessed packet', p])
-
-    #post = packets
     return post
 
 
 def _packetsToEvents(midiTrack, packetsSrc, trackIdFilter=None):
     '''
-    Given a list of packets, sort all packets and add proper 
+    Given a list of sorted packets, add proper 
     delta times. Optionally filters packets by track Id. 
 
     At this stage MIDI event objects have been created. 
@@ -1307,33 +1273,21 @@ def _packetsToEvents(midiTrack, packetsSrc, trackIdFilter=None):
     a matching track id. this can be used to filter out events 
     associated with a track. 
     '''
-    #environLocal.printDebug(['_packetsToEvents', 'got packets:', len(packetsSrc)])
-    # add delta times
-    # first, collect only the packets for this track id
-    packets = []
-    if trackIdFilter is not None:
-        for p in packetsSrc:
-            if p['trackId'] == trackIdFilter:
-                packets.append(p)
-    else:
-        packets = packetsSrc
-
     events = []
     lastOffset = 0
-    for p in packets:
-        me = p['midiEvent']
+    for p in packetsSrc:
+        offset, unused, unused, trackId, me = p[:5]
+        if trackIdFilter is not None and trackId != trackIdFilter:
+            continue
         if me.time is None:
             me.time = 0
-        t = p['offset'] - lastOffset
+        t = offset - lastOffset
         if t < 0:
             raise TranslateException('got a negative delta time')
         # set the channel from the midi event
-        dt = midiModule.DeltaTime(midiTrack, time=t, channel=me.channel)
-        #environLocal.printDebug(['packetsByOffset', p])
-        events.append(dt)
+        events.append(midiModule.DeltaTime(midiTrack, time=t, channel=me.channel))
         events.append(me)
-        lastOffset = p['offset']
-    #environLocal.printDebug(['_packetsToEvents', 'total events:', len(events)])
+        lastOffset = offset
     return events
 
 
@@ -1590,6 +1544,152 @@ def midiTrackToStream(mt, ticksPerQuarter=None, quantizePost=True,
         s.makeRests(inPlace=True, fillGaps=True)
     return s
 
+
+def midiEventTuplesToStream(events, ticksPerQuarter=None, quantizePost=True,
+    inputM21=None):
+    '''
+    Like :func:`~music21.midi.translate.midiTrackToStream`, but translate 
+    a track given as a list of (tick, type, channel, parameter1, parameter2) 
+    event tuples, as returned by 
+    :meth:`~music21.midi.base.MidiFile.readEventTuples`. 
+    
+    Note-ons are paired with their note-offs through a dictionary of 
+    sounding notes keyed by channel and pitch, and notes are gathered into 
+    chords in a single pass over the notes, which are already sorted by onset. 
+    Music21 objects are only created once the notes are known. The result
+    is the same as that of midiTrackToStream.
+
+    >>> import os
+    >>> fp = os.path.join(common.getSourceFilePath(), 'midi', 'testPrimitive',  'test05.mid')
+    >>> mf = midi.MidiFile()
+    >>> tracks = mf.readEventTuples(open(fp, 'rb').read())
+    >>> s = midi.translate.midiEventTuplesToStream(tracks[0])
+    >>> s
+    <music21.stream.Stream ...>
+    >>> len(s.notesAndRests)
+    11
+    '''
+    if inputM21 == None:
+        from music21 import stream
+        s = stream.Stream()
+    else:
+        s = inputM21
+    if ticksPerQuarter == None:
+        ticksPerQuarter = defaults.ticksPerQuarter
+
+    from music21 import chord
+    from music21 import note
+    from music21 import pitch
+    from music21 import volume
+
+    # each note is a list of [tick on, tick off, pitch, velocity]; 
+    # as in midiTrackToStream, a note-on is ended by the next note 
+    # event of the same pitch on the same channel, which is not reused
+    notes = [] 
+    sounding = {} # (channel, pitch): the note waiting for its end
+    metaEvents = [] # store pairs of abs time, m21 object
+    for t, eventType, channel, parameter1, parameter2 in events:
+        if eventType == 'NOTE_ON' or eventType == 'NOTE_OFF':
+            key = (channel, parameter1)
+            n = sounding.pop(key, None)
+            if n is not None:
+                n[1] = t
+            elif eventType == 'NOTE_ON' and parameter2 != 0:
+                n = [t, None, parameter1, parameter2]
+                notes.append(n)
+                sounding[key] = n
+        elif eventType in ('TIME_SIGNATURE', 'KEY_SIGNATURE', 'SET_TEMPO',
+                           'PROGRAM_CHANGE'):
+            # these are rare; translate them through a MidiEvent
+            e = midiModule.MidiEvent(None, type=eventType, time=t, 
+                                     channel=channel)
+            e.data = parameter1
+            if eventType == 'TIME_SIGNATURE':
+                metaEvents.append([t, midiEventsToTimeSignature(e)])
+            elif eventType == 'KEY_SIGNATURE':
+                metaEvents.append([t, midiEventsToKeySignature(e)])
+            elif eventType == 'SET_TEMPO':
+                metaEvents.append([t, midiEventsToTempo(e)])
+            else:
+                metaEvents.append([t, midiEventsToInstrument(e)])
+    # notes that never end are dropped
+    notes = [n for n in notes if n[1] is not None]
+
+    # first create meta events
+    for t, obj in metaEvents:
+        s.insert(t / float(ticksPerQuarter), obj)
+
+    # gather notes that start, and end, within a small time window into 
+    # chords; a note starting with others but ending elsewhere 
+    # requires voices
+    chunkTolerance = ticksPerQuarter / 16
+    gathered = set() 
+    voicesRequired = False
+    for i in range(len(notes)):
+        if i in gathered:
+            continue
+        t, tOff, unused_pitch, unused_velocity = notes[i]
+        chordNotes = None
+        for j in range(i + 1, len(notes)):
+            tSub, tOffSub, unused_pitchSub, unused_velocitySub = notes[j]
+            if abs(tSub - t) > chunkTolerance: 
+                # no more matches; the notes are sorted by onset
+                break
+            if abs(tOffSub - tOff) > chunkTolerance:
+                voicesRequired = True
+                continue
+            if chordNotes is None: # start a new one
+                chordNotes = [notes[i]]
+                gathered.add(i)
+            chordNotes.append(notes[j])
+            gathered.add(j)
+
+        if chordNotes is not None:
+            pitches = []
+            volumes = []
+            for unused_t, unused_tOff, midiPitch, velocity in chordNotes:
+                p = pitch.Pitch()
+                p.midi = midiPitch
+                pitches.append(p)
+                v = volume.Volume(velocity=velocity)
+                v.velocityIsRelative = False # velocity is absolute coming from MIDI
+                volumes.append(v)
+            c = chord.Chord()
+            c.pitches = pitches
+            c.volume = volumes
+            # as in midiEventsToChord: from the last start to the first end
+            ticks = chordNotes[0][1] - chordNotes[-1][0]
+            if ticks != 0:
+                midiToDuration(ticks, ticksPerQuarter, c.duration)
+            else:
+                c.quarterLength = 1
+            c.midiTickStart = t
+            s._insertCore(t / float(ticksPerQuarter), c)
+        else:
+            n = note.Note()
+            n.pitch.midi = notes[i][2]
+            n.volume.velocity = notes[i][3]
+            n.volume.velocityIsRelative = False # not relative coming from MIDI
+            if (tOff - t) != 0:
+                midiToDuration(tOff - t, ticksPerQuarter, n.duration)
+            else:
+                n.quarterLength = 1.0
+            n.midiTickStart = t
+            s._insertCore(t / float(ticksPerQuarter), n)
+
+    s._elementsChanged()
+    # quantize to nearest 16th
+    if quantizePost:    
+        s.quantize([8, 3], processOffsets=True, processDurations=True, inPlace=True)
+
+    if voicesRequired:
+        # this procedure will make the appropriate rests
+        s.makeVoices(inPlace=True, fillGaps=True)
+    else:
+        # always need to fill gaps, as rests are not found in any other way
+        s.makeRests(inPlace=True, fillGaps=True)
+    return s
+
     
 def _prepareStreamForMidi(s):
     '''
@@ -1722,40 +1822,37 @@ def streamHierarchyToMidiTracks(inputM21, acceptableChannelList = None):
     #environLocal.printDebug(['channelForInstrument', channelForInstrument, 'channelsDyanmic', channelsDyanmic, 'allChannels', allChannels, 'allUniqueInstruments', allUniqueInstruments])
 
     initChannelForTrack = {}
-    # update packets with first channel
+    # set the first channel of each track
     for key, bundle in packetStorage.items():
         initChannelForTrack[key] = None # key is channel id
         bundle['initChannel'] = None # set for bundle too
-        for p in bundle['rawPackets']:
-            # get instrument
-            instObj = bundle['initInstrument']
-            if instObj is None:
-                try:
-                    initCh = channelForInstrument[None]
-                except KeyError:
-                    initCh = 0  # CUTHBERT ADD -- Not sure if this works...
-            else: # use midi program
-                initCh = channelForInstrument[instObj.midiProgram]
-            p['initChannel'] = initCh
-            # only set for bundle once
-            if bundle['initChannel'] is None:
-                bundle['initChannel'] = initCh
-                initChannelForTrack[key] = initCh
+        if len(bundle['rawPackets']) == 0:
+            continue
+        # get instrument
+        instObj = bundle['initInstrument']
+        if instObj is None:
+            try:
+                initCh = channelForInstrument[None]
+            except KeyError:
+                initCh = 0  # CUTHBERT ADD -- Not sure if this works...
+        else: # use midi program
+            initCh = channelForInstrument[instObj.midiProgram]
+        bundle['initChannel'] = initCh
+        initChannelForTrack[key] = initCh
 
     # combine all packets for processing of channel allocation 
     netPackets = []
     for bundle in packetStorage.values():
         netPackets += bundle['rawPackets']
 
-    # process all channel assignments for all packets together
-    netPackets = _processPackets(netPackets, 
+    # process all channel assignments for all packets together; 
+    # returns sorted packets for each track id
+    packetsByTrack = _processPackets(netPackets, 
         channelForInstrument=channelForInstrument, 
         channelsDyanmic=channelsDyanmic, 
         initChannelForTrack=initChannelForTrack)
 
-    #environLocal.printDebug(['got netPackets:', len(netPackets), 'packetStorage keys (tracks)', packetStorage.keys()])
-    # build each track, sorting out the appropriate packets based on track
-    # ids
+    # build each track from the packets of its track id
     for trackId in packetStorage:   
         initChannel = packetStorage[trackId]['initChannel']
         instObj = packetStorage[trackId]['initInstrument']
@@ -1764,12 +1861,9 @@ def streamHierarchyToMidiTracks(inputM21, acceptableChannelList = None):
         # need to pass preferred channel here
         mt.events += _getStartEvents(mt, channel=initChannel, 
                                     instrumentObj=instObj) 
-        # note that netPackets is must be passed here, and then be filtered
-        # packets have been added to net packets
-        mt.events += _packetsToEvents(mt, netPackets, trackIdFilter=trackId)
+        mt.events += _packetsToEvents(mt, packetsByTrack.get(trackId, []))
         mt.events += getEndEvents(mt, channel=initChannel)
         mt.updateEvents()
-    # need to filter out packets only for the desired tracks
         midiTracks.append(mt)
 
     return midiTracks
@@ -1806,6 +1900,47 @@ def midiTracksToStreams(midiTracks, ticksPerQuarter=None, quantizePost=True,
             midiTrackToStream(mt, ticksPerQuarter, quantizePost, 
                               inputM21=conductorTrack)
     #environLocal.printDebug(['show() conductorTrack elements'])
+    _addConductorElements(s, conductorTrack)
+    return s
+
+
+def midiEventTuplesToStreams(tracks, ticksPerQuarter=None, quantizePost=True,
+    inputM21=None):
+    '''
+    Like :func:`~music21.midi.translate.midiTracksToStreams`, but for 
+    tracks given as lists of event tuples, as returned by 
+    :meth:`~music21.midi.base.MidiFile.readEventTuples`; each track 
+    is translated with :func:`~music21.midi.translate.midiEventTuplesToStream`. 
+    '''
+    from music21 import stream
+    if inputM21 == None:
+        s = stream.Score()
+    else:
+        s = inputM21
+    # store common elements such as time sig, key sig from conductor
+    conductorTrack = stream.Stream()
+    for events in tracks:
+        # not all tracks have notes defined; only creates parts for those
+        # that do
+        for unused_t, eventType, unused_channel, unused_pitch, velocity in events:
+            if eventType == 'NOTE_ON' and velocity != 0:
+                streamPart = stream.Part() 
+                midiEventTuplesToStream(events, ticksPerQuarter, quantizePost, 
+                                        inputM21=streamPart)
+                s.insert(0, streamPart)
+                break
+        else:
+            midiEventTuplesToStream(events, ticksPerQuarter, quantizePost, 
+                                    inputM21=conductorTrack)
+    _addConductorElements(s, conductorTrack)
+    return s
+
+
+def _addConductorElements(s, conductorTrack):
+    '''
+    Copy the time and key signatures found in the tracks without notes 
+    into each part of `s`, and the tempi into the first part.
+    '''
     # if we have time sig/key sig elements, add to each part
     
     # TODO: this would be faster if we iterated in the other order.
@@ -1826,7 +1961,6 @@ def midiTracksToStreams(midiTracks, ticksPerQuarter=None, quantizePost=True,
         # multiple references of the same
         eventCopy = copy.deepcopy(e)
         p.insert(e.getOffsetBySite(conductorTrack), eventCopy)
-    return s
 
 
 def streamToMidiFile(inputM21):
@@ -1867,7 +2001,7 @@ def streamToMidiFile(inputM21):
     return mf
 
 
-def midiFilePathToStream(filePath, inputM21=None):
+def midiFilePathToStream(filePath, inputM21=None, useEventTuples=False):
     '''
     Used by music21.converter:
     
@@ -1875,6 +2009,9 @@ def midiFilePathToStream(filePath, inputM21=None):
     
     return a :class:`~music21.stream.Score` object (or if inputM21 is passed in,
     use that object instead).
+
+    If `useEventTuples` is True, the data is translated from lightweight 
+    event tuples instead; see :func:`~music21.midi.translate.midiStringToStream`.
     
     >>> import os #_DOCS_HIDE
     >>> fp = os.path.join(common.getSourceFilePath(), 'midi', 'testPrimitive',  'test05.mid') #_DOCS_HIDE
@@ -1885,17 +2022,41 @@ def midiFilePathToStream(filePath, inputM21=None):
     '''
     mf = midiModule.MidiFile()
     mf.open(filePath)
+    if useEventTuples:
+        strData = mf.file.read()
+        mf.close()
+        return midiStringToStream(strData, inputM21, useEventTuples=True)
     mf.read()
     mf.close()
     return midiFileToStream(mf, inputM21)
 
-def midiStringToStream(strData, inputM21):
+def midiStringToStream(strData, inputM21=None, useEventTuples=False):
     '''
     Convert a string of binary midi data to a Music21 stream.Score object.
+
+    If `useEventTuples` is True, the data is decoded straight into 
+    lightweight event tuples with 
+    :meth:`~music21.midi.base.MidiFile.readEventTuples`, and translated 
+    with :func:`~music21.midi.translate.midiEventTuplesToStreams`, 
+    without creating MidiTrack, MidiEvent or DeltaTime objects. 
+    This is faster, especially for large files, and gives the same Score.
+
+    >>> import os
+    >>> fp = os.path.join(common.getSourceFilePath(), 'midi', 'testPrimitive',  'test05.mid')
+    >>> strData = open(fp, 'rb').read()
+    >>> s = midi.translate.midiStringToStream(strData, useEventTuples=True)
+    >>> len(s.flat.notesAndRests)
+    11
     '''
-    
     mf = midiModule.MidiFile()
     # do not need to call open or close on MidiFile instance
+    if useEventTuples:
+        tracks = mf.readEventTuples(strData)
+        if len(tracks) == 0:
+            from music21 import stream
+            raise stream.StreamException('no tracks are defined in this MIDI file.')
+        return midiEventTuplesToStreams(tracks, 
+                    ticksPerQuarter=mf.ticksPerQuarterNote, inputM21=inputM21)
     mf.readstr(strData)
     return midiFileToStream(mf, inputM21)
 
@@ -2620,7 +2781,78 @@ class Test(unittest.TestCase):
         s = converter.parse(fp)
         #s.show('t')
         self.assertEqual(len(s.flat.getElementsByClass('Chord')), 4)
-        
+
+    def testImportEventTuplesA(self):
+        # the event tuple import gives the same score as the MidiEvent import
+        import os
+        from music21 import corpus
+
+        dirLib = os.path.join(common.getSourceFilePath(), 'midi', 'testPrimitive')
+        dataList = []
+        for fn in ['test05.mid', 'test06.mid', 'test13.mid', 'test14.mid']:
+            dataList.append(open(os.path.join(dirLib, fn), 'rb').read())
+        # a score with time and key signatures, a tempo and instruments
+        s = corpus.parse('bach/bwv66.6')
+        dataList.append(streamToMidiFile(s).writestr())
+
+        for strData in dataList:
+            sSrc = midiStringToStream(strData)
+            sDst = midiStringToStream(strData, useEventTuples=True)
+            self.assertEqual(len(sSrc.parts), len(sDst.parts))
+            for pSrc, pDst in zip(sSrc.parts, sDst.parts):
+                self.assertEqual(len(pSrc.voices), len(pDst.voices))
+                post = []
+                for p in [pSrc, pDst]:
+                    post.append([(e.classes[0], e.offset, e.duration.quarterLength, 
+                                  repr(e.pitches) if 'NotRest' in e.classes else repr(e)) 
+                                  for e in p.recurse() if not e.isStream])
+                self.assertEqual(post[0], post[1])
+        self.assertEqual(len(sDst.flat.getElementsByClass('TimeSignature')), 4)
+
+    def testProcessPacketsA(self):
+        # packets are returned sorted for each track, with pitch bends 
+        # and program changes for microtones on a new channel
+        from music21 import stream, note, instrument
+
+        s = stream.Score()
+        for pitchNames in [['C4', 'D~4', 'E4'], ['G3', 'A`3', 'B3']]:
+            p = stream.Part()
+            p.insert(0, instrument.Violin())
+            for i, pn in enumerate(pitchNames):
+                p.insert(i, note.Note(pn))
+            s.insert(0, p)
+        mts = streamHierarchyToMidiTracks(s)
+        self.assertEqual(len(mts), 2)
+        post = []
+        for mt in mts:
+            post.append([(e.type, e.channel) for e in mt.events if e.type in 
+                ['NOTE_ON', 'PITCH_BEND', 'PROGRAM_CHANGE']])
+            self.assertEqual([e.time for e in mt.events if e.type == 'DeltaTime' 
+                and e.time != 0], [1024, 1024, 1024])
+        # the first track is processed first, and keeps its channel
+        self.assertEqual(post[0], [('PROGRAM_CHANGE', 1), ('PITCH_BEND', 1), 
+            ('PROGRAM_CHANGE', 1), ('NOTE_ON', 1), ('PITCH_BEND', 1), 
+            ('NOTE_ON', 1), ('PITCH_BEND', 1), ('NOTE_ON', 1)])
+        # the microtone of the second track overlaps the first, and moves
+        self.assertEqual(post[1], [('PROGRAM_CHANGE', 1), ('PITCH_BEND', 1), 
+            ('PROGRAM_CHANGE', 1), ('NOTE_ON', 1), ('PITCH_BEND', 2), 
+            ('PROGRAM_CHANGE', 2), ('NOTE_ON', 2), ('PITCH_BEND', 2), 
+            ('NOTE_ON', 1)])
+
+        packets = _streamToPackets(s.parts[0].flat, trackId=1)
+        self.assertEqual([p[0] for p in packets], 
+            [0, 0, 1024, 1024, 2048, 2048, 3072])
+        packets += _streamToPackets(s.parts[1].flat, trackId=2)
+        post = _processPackets(packets, channelsDyanmic=[2, 3], 
+            initChannelForTrack={1: 1, 2: 1})
+        self.assertEqual(sorted(post.keys()), [1, 2])
+        self.assertEqual([(p[0], p[4].type, p[4].channel) for p in post[2]], 
+            [(0, 'PITCH_BEND', 1), (0, 'PROGRAM_CHANGE', 1), (0, 'NOTE_ON', 1), 
+            (1024, 'NOTE_OFF', 1), (1024, 'PITCH_BEND', 2), 
+            (1024, 'PROGRAM_CHANGE', 2), (1024, 'NOTE_ON', 2), 
+            (2048, 'NOTE_OFF', 2), (2048, 'PITCH_BEND', 2), 
+            (2048, 'NOTE_ON', 1), (3072, 'NOTE_OFF', 1)])
+
 
 #-------------------------------------------------------------------------------
 _DOC_ORDER = [streamToMidiFile, midiFileToStream]
@@ -14,7 +14,8 @@ Low-level conversion routines from MusicXML to music21.
 
 This module supposes that the musicxml document has already been parsed by xml.sax (by base.Document.read() )
 and is stored as a collection of mxObjects -- equivalent parsing methods could be created
-and fed into `mxScoreToScore` to make this work.
+and fed into `mxScoreToScore` to make this work.  `mxIterparseToParts` instead 
+translates each measure as soon as xmlHandler.Document.iterparse() has read it.
 '''
 import unittest
 import copy
@@ -653,9 +654,13 @@ def mxToDuration(mxNote, inputM21=None):
                 environLocal.printDebug(['mxToDuration', 'raw qLen', qLen, durationType, 'mxNote.duration:', mxNote.duration, 'last mxDivisions:', mxDivisions])
                 durRaw.quarterLength = 1.
         else: # a cooked version builds up from pieces
-            durUnit = duration.DurationUnit()
-            durUnit.type = durationType
-            durUnit.dots = len(mxDotList)
+            if duration.SHARE_DURATION_UNITS and tup is None:
+                durUnit = duration.sharedDurationUnit(durationType, 
+                                                      len(mxDotList))
+            else:
+                durUnit = duration.DurationUnit()
+                durUnit.type = durationType
+                durUnit.dots = len(mxDotList)
             if not tup == None:
                 durUnit.appendTuplet(tup)
             durCooked = duration.Duration(components=[durUnit])
@@ -2481,101 +2486,134 @@ def mxToMeasure(mxMeasure, spannerBundle=None, inputM21=None, lastMeasureInfo=No
 # Streams
 
 
-def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
+class PartTranslator(object):
     '''
-    Load a part into a new Stream or one provided by 
-    `inputM21` given an mxScore and a part name.
+    Translate the measures of a single part, one mxMeasure at a 
+    time, into a music21 Part; the Part is placed into the Score
+    (or other Stream) given as `inputM21` when :meth:`finish` is called.
+
+    This holds the state that must be carried from one measure to the 
+    next (the last time signature, transposition, measure number, 
+    the running offset) so that measures can be translated 
+    as soon as they are read and then discarded, as 
+    :func:`mxIterparseToParts` does.  :func:`mxToStreamPart` simply
+    feeds it all the measures of an already parsed mxPart.
 
     The `spannerBundle` reference, when passed in, 
     is used to accumulate Spanners. These are not inserted here.
 
-    Though it is incorrect MusicXML, PDFtoMusic creates 
-    empty measures when it should create full
-    measures of rests (possibly hidden).  This routine 
-    fixes that bug.  See http://musescore.org/en/node/15129
+    >>> from music21.musicxml import testPrimitive
+    >>> mxScore = musicxml.xmlHandler.Document()
+    >>> mxScore.read(testPrimitive.pitches01a)
+    >>> pt = musicxml.fromMxObjects.PartTranslator(mxScore.score, 'P1')
+    >>> for mxMeasure in mxScore.score.getPart('P1'):
+    ...     m = pt.addMeasure(mxMeasure)
+    >>> p = pt.finish()
+    >>> len(p.getElementsByClass('Measure'))
+    26
+    >>> p.activeSite is pt.score
+    True
     '''
-    #environLocal.printDebug(['calling Stream.mxToStreamPart'])
-    if inputM21 == None:
-        # need a Score to load parts into
-        s = stream.Score()
-    else:
-        s = inputM21
-
-    if spannerBundle == None:
-        spannerBundle = spanner.SpannerBundle()
+    def __init__(self, mxScore, partId, spannerBundle=None, inputM21=None):
+        if inputM21 == None:
+            # need a Score to load parts into
+            self.score = stream.Score()
+        else:
+            self.score = inputM21
+
+        if spannerBundle == None:
+            spannerBundle = spanner.SpannerBundle()
+        self.spannerBundle = spannerBundle
+        self.partId = partId
+
+        # in some cases there may be more than one instrument defined
+        # in each score part; this has not been tested
+        mxInstrument = mxScore.getScorePart(partId)
+
+        # create a new music21 instrument
+        instrumentObj = instrument.Instrument()
+        if mxInstrument is not None: # mxInstrument is a ScorePart
+            # need an mxScorePart here   
+            mxToInstrument(mxInstrument, instrumentObj)
+        # add part id as group
+        instrumentObj.groups.append(partId)
+        self.instrumentObj = instrumentObj
+
+        streamPart = stream.Part() # create a part instance for each part
+        # always assume at sounding, unless transposition is defined in attributes
+        streamPart.atSoundingPitch = True
+
+        # set part id to stream best name
+        if instrumentObj.bestName() is not None:
+            streamPart.id = instrumentObj.bestName()
+        streamPart._insertCore(0, instrumentObj) # add instrument at zero offset
+        self.streamPart = streamPart
+
+        self.staffReferenceList = []
+        # offset is in quarter note length
+        self.oMeasure = 0.0
+        self.lastTimeSignature = None
+        self.lastTransposition = None # may change at measure boundaries
+        self.lastMeasureWasShort = False  # keep track of whether the last measure was short...
+
+        self.lastMeasureNumber = 0
+        self.lastMeasureSuffix = None
+        # the highest number of staves declared in any measure's attributes
+        self.maxStaves = 1
+        self.measureCount = 0
+
+    def addMeasure(self, mxMeasure):
+        '''
+        Translate one mxMeasure and append it to the Part.
+        '''
+        streamPart = self.streamPart
+        if mxMeasure.attributesObj is not None:
+            if mxMeasure.attributesObj.staves is not None:
+                count = int(mxMeasure.attributesObj.staves)
+                if count > self.maxStaves:
+                    self.maxStaves = count
 
-    mxPart = mxScore.getPart(partId)
-    # in some cases there may be more than one instrument defined
-    # in each score part; this has not been tested
-    mxInstrument = mxScore.getScorePart(partId)
-
-    # create a new music21 instrument
-    instrumentObj = instrument.Instrument()
-    if mxInstrument is not None: # mxInstrument is a ScorePart
-        # need an mxScorePart here   
-        mxToInstrument(mxInstrument, instrumentObj)
-    # add part id as group
-    instrumentObj.groups.append(partId)
-
-    streamPart = stream.Part() # create a part instance for each part
-    # always assume at sounding, unless transposition is defined in attributes
-    streamPart.atSoundingPitch = True
-
-    # set part id to stream best name
-    if instrumentObj.bestName() is not None:
-        streamPart.id = instrumentObj.bestName()
-    streamPart._insertCore(0, instrumentObj) # add instrument at zero offset
-
-    staffReferenceList = []
-    # offset is in quarter note length
-    oMeasure = 0.0
-    lastTimeSignature = None
-    lastTransposition = None # may change at measure boundaries
-    lastMeasureWasShort = False  # keep track of whether the last measure was short...
-
-    lastMeasureNumber = 0
-    lastMeasureSuffix = None
-
-    for i, mxMeasure in enumerate(mxPart):
         # t here is transposition, if defined; otherwise it is None
         m, staffReference, t = mxToMeasure(mxMeasure,
-                               spannerBundle=spannerBundle,
-                               lastMeasureInfo=(lastMeasureNumber, lastMeasureSuffix))
+                               spannerBundle=self.spannerBundle,
+                               lastMeasureInfo=(self.lastMeasureNumber, self.lastMeasureSuffix))
         if t is not None:
-            if lastTransposition is None and i == 0: # if this is the first
+            if self.lastTransposition is None and self.measureCount == 0: # if this is the first
                 #environLocal.printDebug(['transposition', t])
-                instrumentObj.transposition = t
+                self.instrumentObj.transposition = t
             else: # if not the first measure, need to copy as well
                 # for now, copy Instrument, change transposition, 
                 # could insert in part, or in measure
-                newInst = copy.deepcopy(instrumentObj)
+                newInst = copy.deepcopy(self.instrumentObj)
                 newInst.transposition = t
-                streamPart._insertCore(oMeasure, newInst)
+                streamPart._insertCore(self.oMeasure, newInst)
             # if a transposition is defined in musicxml, we assume it is
             # at written pitch
             streamPart.atSoundingPitch = False
             # store last for comparison
-            lastTransposition = t
+            self.lastTransposition = t
+        self.measureCount += 1
 
         # there will be one for each measure
-        staffReferenceList.append(staffReference)
+        self.staffReferenceList.append(staffReference)
 
-        if m.number != lastMeasureNumber:
+        if m.number != self.lastMeasureNumber:
             # we do this check so that we do not compound suffixes, i.e.:
             # 23, 23.X1, 23.X1X2, 23.X1X2X3
             # and instead just do:
             # 23, 23.X1, 23.X2, etc.
-            lastMeasureNumber = m.number
-            lastMeasureSuffix = m.numberSuffix
+            self.lastMeasureNumber = m.number
+            self.lastMeasureSuffix = m.numberSuffix
 
         if m.timeSignature is not None:
-            lastTimeSignature = m.timeSignature
-        elif lastTimeSignature is None and m.timeSignature is None:
+            self.lastTimeSignature = m.timeSignature
+        elif self.lastTimeSignature is None and m.timeSignature is None:
             # if no time sigature is defined, need to get a default
             ts = meter.TimeSignature()
             ts.load('%s/%s' % (defaults.meterNumerator,
                                defaults.meterDenominatorBeatType))
-            lastTimeSignature = ts
+            self.lastTimeSignature = ts
+        lastTimeSignature = self.lastTimeSignature
         
         if m._fullMeasureRest is True:
             r1 = m.getElementsByClass('Rest')[0]
@@ -2586,7 +2624,7 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
         del(m._fullMeasureRest)
         
         # add measure to stream at current offset for this measure
-        streamPart._insertCore(oMeasure, m)
+        streamPart._insertCore(self.oMeasure, m)
 
         # note: we cannot assume that the time signature properly
         # describes the offsets w/n this bar. need to look at 
@@ -2612,7 +2650,7 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
             # for the first measure, this may be a pickup
             # must detect this when writing, as next measures offsets will be 
             # incorrect
-            if oMeasure == 0.0:
+            if self.oMeasure == 0.0:
                 # cannot get bar duration proportion if cannot get a ts
                 if m.barDurationProportion() < 1.0:
                     m.padAsAnacrusis()
@@ -2624,57 +2662,140 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
             ### no...let's not do this...
             else:
                 mOffsetShift = mHighestTime #lastTimeSignatureQuarterLength
-                if lastMeasureWasShort is True:
+                if self.lastMeasureWasShort is True:
                     if m.barDurationProportion() < 1.0:
                         m.padAsAnacrusis() # probably a pickup after a repeat or phrase boundary or something
-                        lastMeasureWasShort = False
+                        self.lastMeasureWasShort = False
                 else:
                     if mHighestTime < lastTimeSignatureQuarterLength:
-                        lastMeasureWasShort = True
+                        self.lastMeasureWasShort = True
                     else:
-                        lastMeasureWasShort = False
+                        self.lastMeasureWasShort = False
                         
-        oMeasure += mOffsetShift
+        self.oMeasure += mOffsetShift
+        return m
 
-    # if we have multiple staves defined, add more parts, and transfer elements
-    # note: this presently has to look at _idLastDeepCopyOf to get matches
-    # to find removed elements after copying; this is probably not the
-    # best way to do this. 
+    def finish(self, mxPart=None):
+        '''
+        Insert the completed Part (or one PartStaff per staff, 
+        if more than one staff was used) into the Score and return the Part.
+        '''
+        s = self.score
+        streamPart = self.streamPart
+        spannerBundle = self.spannerBundle
+        partId = self.partId
+        # if we have multiple staves defined, add more parts, and transfer elements
+        # note: this presently has to look at _idLastDeepCopyOf to get matches
+        # to find removed elements after copying; this is probably not the
+        # best way to do this. 
+
+        # for this part, if any elements are components in the spannerBundle,
+        # then then we need to update the spannerBundle after the part is copied
+
+        if self.maxStaves > 1:
+            separateOutPartStaffs(mxPart, streamPart, spannerBundle, s, self.staffReferenceList, partId)
+        else:
+            streamPart.addGroupForElements(partId) # set group for components 
+            streamPart.groups.append(partId) # set group for stream itself
+
+            # TODO: this does not work with voices; there, Spanners 
+            # will be copied into the Score 
+
+            # copy spanners that are complete into the part, as this is the 
+            # highest level container that needs them
+            rm = []
+            for sp in spannerBundle.getByCompleteStatus(True):
+                streamPart._insertCore(0, sp)
+                rm.append(sp)
+            # remove from original spanner bundle
+            for sp in rm:
+                spannerBundle.remove(sp)
+            # s is the score; adding the aprt to the score
+            streamPart._elementsChanged()
+            s._insertCore(0, streamPart)
+
+        s._elementsChanged()
+        # when adding parts to this Score
+        # this assumes all start at the same place
+        # even if there is only one part, it will be placed in a Stream
+        return streamPart
 
-    # for this part, if any elements are components in the spannerBundle,
-    # then then we need to update the spannerBundle after the part is copied
 
-    streamPartStaff = None
-    if mxPart.getStavesCount() > 1:
-        separateOutPartStaffs(mxPart, streamPart, spannerBundle, s, staffReferenceList, partId)
-    else:
-        streamPart.addGroupForElements(partId) # set group for components 
-        streamPart.groups.append(partId) # set group for stream itself
-
-        # TODO: this does not work with voices; there, Spanners 
-        # will be copied into the Score 
-
-        # copy spanners that are complete into the part, as this is the 
-        # highest level container that needs them
-        rm = []
-        for sp in spannerBundle.getByCompleteStatus(True):
-            streamPart._insertCore(0, sp)
-            rm.append(sp)
-        # remove from original spanner bundle
-        for sp in rm:
-            spannerBundle.remove(sp)
-        # s is the score; adding the aprt to the score
-        streamPart._elementsChanged()
-        s._insertCore(0, streamPart)
+def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
+    '''
+    Load a part into a new Stream or one provided by 
+    `inputM21` given an mxScore and a part name.
 
-    s._elementsChanged()
-    # when adding parts to this Score
-    # this assumes all start at the same place
-    # even if there is only one part, it will be placed in a Stream
-    if streamPartStaff is not None:
-        return streamPartStaff
+    The `spannerBundle` reference, when passed in, 
+    is used to accumulate Spanners. These are not inserted here.
+
+    Though it is incorrect MusicXML, PDFtoMusic creates 
+    empty measures when it should create full
+    measures of rests (possibly hidden).  This routine 
+    fixes that bug.  See http://musescore.org/en/node/15129
+    '''
+    #environLocal.printDebug(['calling Stream.mxToStreamPart'])
+    mxPart = mxScore.getPart(partId)
+    translator = PartTranslator(mxScore, partId, spannerBundle=spannerBundle,
+                                inputM21=inputM21)
+    for mxMeasure in mxPart:
+        translator.addMeasure(mxMeasure)
+    return translator.finish(mxPart)
+
+
+def mxIterparseToParts(mxDocument, fileLike, isFile=True, 
+                       spannerBundle=None, inputM21=None):
+    '''
+    Read MusicXML from `fileLike` with 
+    :meth:`~music21.musicxml.xmlHandler.Document.iterparse` and translate
+    each measure as soon as it has been read, so that the complete
+    mxObject tree of the document never exists in memory.  Parts are 
+    inserted into `inputM21` (a new Score if not given).
+
+    Returns a dictionary of part ids to music21 Parts; pass it,
+    with `mxDocument.score` and the same `spannerBundle`, 
+    to :func:`mxScoreToScore` to add metadata, layout, 
+    part groups and spanners crossing parts.
+
+    >>> from music21.musicxml import testPrimitive
+    >>> mxDocument = musicxml.xmlHandler.Document()
+    >>> s = stream.Score()
+    >>> sb = spanner.SpannerBundle()
+    >>> partDict = musicxml.fromMxObjects.mxIterparseToParts(mxDocument, 
+    ...      testPrimitive.pitches01a, isFile=False,
+    ...      spannerBundle=sb, inputM21=s)
+    >>> partDict.keys()
+    [u'P1']
+    >>> len(mxDocument.score.getPart('P1'))  # measures are not retained
+    0
+    >>> s = musicxml.fromMxObjects.mxScoreToScore(mxDocument.score, 
+    ...      spannerBundle=sb, inputM21=s, m21PartIdDictionary=partDict)
+    >>> len(s.parts[0].getElementsByClass('Measure'))
+    26
+    '''
+    if inputM21 == None:
+        s = stream.Score()
     else:
-        return streamPart
+        s = inputM21
+    if spannerBundle == None:
+        spannerBundle = spanner.SpannerBundle()
+
+    m21PartIdDictionary = {}
+    translator = None
+    for mxPart, mxMeasure in mxDocument.iterparse(fileLike, isFile=isFile):
+        partId = mxPart.get('id')
+        try:
+            if translator is None:
+                translator = PartTranslator(mxDocument.score, partId,
+                        spannerBundle=spannerBundle, inputM21=s)
+            if mxMeasure is not None:
+                translator.addMeasure(mxMeasure)
+            else: # end of the part
+                m21PartIdDictionary[partId] = translator.finish(mxPart)
+                translator = None
+        except FromMxObjectsException as strerror:
+            raise FromMxObjectsException('cannot translate part %s: %s' % (partId, strerror))
+    return m21PartIdDictionary
 
 def separateOutPartStaffs(mxPart, streamPart, spannerBundle, s, staffReferenceList, partId):
     '''
@@ -2763,7 +2884,8 @@ def _getStaffExclude(staffReference, targetKey):
     return post
 
 
-def mxScoreToScore(mxScore, spannerBundle=None, inputM21=None):
+def mxScoreToScore(mxScore, spannerBundle=None, inputM21=None, 
+                   m21PartIdDictionary=None):
     '''
     Translate an mxScore into a music21 Score object 
     or puts it into the
@@ -2774,6 +2896,10 @@ def mxScoreToScore(mxScore, spannerBundle=None, inputM21=None):
 
     All spannerBundles accumulated at all lower levels 
     are inserted here.
+
+    If `m21PartIdDictionary` is given, the parts have already been
+    translated into `inputM21` (see :func:`mxIterparseToParts`) and 
+    only the score-level information is added here.
     '''
     # TODO: may not want to wait to this leve to insert spanners; may want to 
     # insert in lower positions if it makes sense
@@ -2784,10 +2910,13 @@ def mxScoreToScore(mxScore, spannerBundle=None, inputM21=None):
     if spannerBundle == None:
         spannerBundle = spanner.SpannerBundle()
 
-    mxPartIds = mxScore.getPartIdsFromPartListObj()
+    if m21PartIdDictionary is None:
+        mxPartIds = mxScore.getPartIdsFromPartListObj()
+        m21PartIdDictionary = {}
+    else:
+        mxPartIds = []
     #print mxPartIds
     #mxPartIdDictionary = mxScore.partIdToNameDict()
-    m21PartIdDictionary = {}
     # values are part names
     #partNameIds = mxPartIdDictionary.keys()
     #partNameIds.sort()
@@ -3324,6 +3453,34 @@ class Test(unittest.TestCase):
         return out
 
 
+    def testIterparseMatchesSax(self):
+        from music21 import converter, corpus
+        from music21.musicxml import testPrimitive
+
+        def summary(s):
+            post = []
+            for e in s.recurse():
+                post.append((e.classes[0], e.offset, e.duration.quarterLength, 
+                             tuple(e.groups), type(e.activeSite).__name__))
+            return post
+
+        for data in [testPrimitive.pianoStaff43a, 
+                     testPrimitive.spanners33a,
+                     testPrimitive.staffGroupsNested41d,
+                     corpus.getWork('bach/bwv66.6')]:
+            sax = converter.ConverterMusicXML(False, useIterparse=False)
+            iterparse = converter.ConverterMusicXML(False, useIterparse=True)
+            if data.startswith('<'):
+                sax.parseData(data)
+                iterparse.parseData(data)
+            else:
+                sax.parseFile(data)
+                iterparse.parseFile(data)
+            self.assertEqual(summary(sax.stream), summary(iterparse.stream))
+            self.assertEqual([str(p.id) for p in sax.stream.parts], 
+                             [str(p.id) for p in iterparse.stream.parts])
+        self.assertEqual(len(iterparse.stream.flat.notes), 165)
+
     def testBarRepeatConversion(self):
         from music21 import corpus
 
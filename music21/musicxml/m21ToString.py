@@ -34,6 +34,11 @@ with musicxml between the standard music21 objects and musicxml.toMxObjects
 import copy
 import unittest
 
+try:
+    import cStringIO as StringIO
+except ImportError:
+    import StringIO
+
 from music21 import exceptions21
 from music21 import note
 from music21 import stream
@@ -74,13 +79,50 @@ def fromStream(streamObject):
     return a complete musicxml string
     from a music21 Stream object
     '''
+    f = StringIO.StringIO()
+    writeStream(streamObject, f)
+    return f.getvalue()
+
+def writeMusic21Object(m21Object, fileLike):
+    '''
+    Write the musicxml for an arbitrary music21 object to `fileLike`, 
+    an open file or any other object with a write() method.  
+    The text written is the same as that returned by 
+    :func:`fromMusic21Object`, but Streams are written 
+    incrementally (see :func:`writeStream`).
+
+    >>> import StringIO
+    >>> s = converter.parse('tinyNotation: 3/4 C4 D E r2.').makeMeasures()
+    >>> f = StringIO.StringIO()
+    >>> musicxml.m21ToString.writeMusic21Object(s, f)
+    >>> print(f.getvalue()[:38])
+    <?xml version="1.0" encoding="utf-8"?>
+    >>> len(f.getvalue()) == len(musicxml.m21ToString.fromMusic21Object(s))
+    True
+    '''
+    classes = m21Object.classes
+    if 'Measure' in classes:
+        # a lone Measure is small; it is not worth writing incrementally
+        fileLike.write(fromMeasure(m21Object))
+    elif 'Stream' in classes:
+        writeStream(m21Object, fileLike)
+    else:
+        fileLike.write(fromMusic21Object(m21Object))
+
+def writeStream(streamObject, fileLike):
+    '''
+    Write a complete musicxml document for a music21 Stream to 
+    `fileLike`.  The header and part-list are written first; then each 
+    Measure is translated to an mxMeasure and written as it is 
+    reached, so neither an mxObject tree for the whole score nor 
+    an XML DOM is ever built.
+    '''
     # always make a deepcopy before processing musicxml
     # this should only be done once
     post = copy.deepcopy(streamObject)
     post.makeImmutable()
-    mxScore = toMxObjects.streamToMx(post)
-    del post
-    return mxScore.xmlStr()
+    mxScore = toMxObjects.streamToMx(post, measureIterators=True)
+    mxScore.writeXmlDocument(fileLike)
 
 def fromMeasure(m):
     '''Translate a music21 Measure into a 
@@ -297,6 +339,21 @@ class M21ToStringException(exceptions21.Music21Exception):
 class Test(unittest.TestCase):
     pass
 
+    def testWriteStreamMatchesMxObjects(self):
+        import re
+        from music21 import corpus
+        s = corpus.parse('schumann/opus41no1/movement2')
+        post = copy.deepcopy(s)
+        post.makeImmutable()
+        old = toMxObjects.streamToMx(post).xmlStr()
+        f = StringIO.StringIO()
+        writeMusic21Object(s, f)
+        new = f.getvalue()
+        # instrument ids are random
+        idMatch = re.compile(r'"[IP][0-9a-f]{32}"')
+        self.assertEqual(idMatch.sub('""', old), idMatch.sub('""', new))
+        self.assertEqual(new.count('<measure '), 332)
+
     def testVoices(self):
         from music21 import converter
         from music21.musicxml import testPrimitive
@@ -2065,6 +2065,21 @@ def streamPartToMx(part, instStream=None, meterStream=None,
 
     The `meterStream`, if given, provides a template of meters.
     '''
+    mxScorePart, mxPart, mxMeasureIterator = streamPartToMxIterator(part, 
+                        instStream=instStream, meterStream=meterStream,
+                        refStreamOrTimeRange=refStreamOrTimeRange, 
+                        spannerBundle=spannerBundle)
+    for mxMeasure in mxMeasureIterator:
+        mxPart.append(mxMeasure)
+    return mxScorePart, mxPart
+
+def streamPartToMxIterator(part, instStream=None, meterStream=None,
+                   refStreamOrTimeRange=None, spannerBundle=None):
+    '''
+    Prepare a Part for conversion as :func:`streamPartToMx` does, but
+    return an mxScorePart, an empty mxPart, and a generator
+    that translates one Measure to an mxMeasure each time it is advanced.
+    '''
     #environLocal.printDebug(['calling Stream.streamPartToMx', 'len(spannerBundle)', len(spannerBundle)])
     # note: meterStream may have TimeSignature objects from an unrelated
     # Stream.
@@ -2144,7 +2159,11 @@ def streamPartToMx(part, instStream=None, meterStream=None,
 
     # make sure that all instances of the same class have unique ids
     spannerBundle.setIdLocals()
+    mxMeasureIterator = _measureStreamToMxIterator(part, measureStream, 
+                                                   instStream, spannerBundle)
+    return mxScorePart, mxPart, mxMeasureIterator
 
+def _measureStreamToMxIterator(part, measureStream, instStream, spannerBundle):
     # for each measure, call measureToMx to get the musicxml representation
     for obj in measureStream:
         # get instrument for every measure position
@@ -2161,12 +2180,10 @@ def streamPartToMx(part, instStream=None, meterStream=None,
                     mxTranspose = intervalToMXTranspose(
                                     instSubObj.transposition)
                     #raise ToMxObjectsException('cannot get transposition for a part that is not at sounding pitch.')
-        mxPart.append(measureToMx(obj, spannerBundle=spannerBundle,
-                 mxTranspose=mxTranspose))
+        yield measureToMx(obj, spannerBundle=spannerBundle,
+                 mxTranspose=mxTranspose)
     # might to post processing after adding all measures to the Stream
     # TODO: need to find all MetricModulations and updateByContext
-    # mxScorePart contains mxInstrument
-    return mxScorePart, mxPart
 
 def emptyObjectToMx():
     '''
@@ -2188,13 +2205,19 @@ def emptyObjectToMx():
     return streamToMx(out)
 
 
-def streamToMx(s, spannerBundle=None):
+def streamToMx(s, spannerBundle=None, measureIterators=False):
     '''
     Create and return a musicxml Score object from a Stream or Score
 
     This is the most common entry point for
     conversion of a Stream to MusicXML.
 
+    If `measureIterators` is True, the component list of each mxPart
+    is a generator that translates each Measure only when it is 
+    reached, as in :meth:`~music21.xmlnode.XMLNode.writeXml`; the
+    returned mxScore can then be written only once.  Parts and the
+    part-list are always complete before any Measure is translated.
+
     
     >>> n1 = note.Note()
     >>> measure1 = stream.Measure()
@@ -2291,20 +2314,22 @@ def streamToMx(s, spannerBundle=None):
             # force this instrument into this part
             # meterStream is only used here if there are no measures
             # defined in this part
-            mxScorePart, mxPart = streamPartToMx(obj, instStream=instStream,
+            mxScorePart, mxPart, mxMeasureIterator = streamPartToMxIterator(
+                        obj, instStream=instStream,
                         meterStream=meterStream,
                         refStreamOrTimeRange=refStreamOrTimeRange,
                         spannerBundle=spannerBundle)
-            mxComponents.append([mxScorePart, mxPart, obj])
+            mxComponents.append([mxScorePart, mxPart, obj, mxMeasureIterator])
             #mxComponents.append(obj.streamPartToMx(inst, meterStream, refStreamOrTimeRange))
 
     else: # assume this is the only part
         #environLocal.printDebug('streamPartToMx: handling single-part Stream')
         # if no instrument is provided it will be obtained through s
         # when streamPartToMx is called
-        mxScorePart, mxPart = streamPartToMx(s, meterStream=meterStream,
+        mxScorePart, mxPart, mxMeasureIterator = streamPartToMxIterator(s, 
+                              meterStream=meterStream,
                               spannerBundle=spannerBundle)
-        mxComponents.append([mxScorePart, mxPart, s])
+        mxComponents.append([mxScorePart, mxPart, s, mxMeasureIterator])
         #environLocal.printDebug(['mxComponents', mxComponents])
 
     # create score and part list
@@ -2348,7 +2373,7 @@ def streamToMx(s, spannerBundle=None):
     # first, find which parts are start/end of partGroups
     partGroupIndexRef = {} # have id be key
     partGroupIndex = 1 # start by 1 by convetion
-    for mxScorePart, mxPart, p in mxComponents:
+    for mxScorePart, mxPart, p, unused in mxComponents:
         # check for first
         for sg in staffGroups:
             if sg.isFirst(p):
@@ -2375,7 +2400,12 @@ def streamToMx(s, spannerBundle=None):
                 mxPartList.append(mxPartGroup)
 
     # addition of parts must simply be in the same order as above
-    for mxScorePart, mxPart, p in mxComponents:
+    for mxScorePart, mxPart, p, mxMeasureIterator in mxComponents:
+        if measureIterators:
+            mxPart.componentList = mxMeasureIterator
+        else:
+            for mxMeasure in mxMeasureIterator:
+                mxPart.append(mxMeasure)
         mxScore.append(mxPart) # mxParts go on component list
 
     # set the mxPartList
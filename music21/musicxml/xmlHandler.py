@@ -46,6 +46,10 @@ except ImportError:
 
 import xml.sax
 import xml.dom.minidom # @UnusedImport
+try:
+    import xml.etree.cElementTree as ElementTree
+except ImportError:
+    import xml.etree.ElementTree as ElementTree
 
 from music21.base import VERSION
 from music21 import xmlnode
@@ -1053,6 +1057,82 @@ class Document(object):
             self.tagLib.statClear()
 
 
+    def iterparse(self, fileLike, isFile=True):
+        '''
+        Parse MusicXML from a file path (or, if `isFile` is False, a string)
+        incrementally with ElementTree's iterparse, feeding the same 
+        Handler used by the SAX parser.  This is a generator: as soon as 
+        a <measure> has been read, an (mxPart, mxMeasure) pair is yielded,
+        and when a <part> closes, (mxPart, None) is yielded.
+        
+        Yielded measures are removed from their mxPart, and the 
+        parsed elements are cleared, so that memory use does not grow 
+        with the length of the document; consumers must translate 
+        each measure as it arrives (see 
+        :func:`~music21.musicxml.fromMxObjects.mxIterparseToParts`).
+        `self.score` is set before the first measure is yielded and, 
+        once iteration is complete, holds everything but the measures.
+
+        >>> from music21.musicxml import testPrimitive
+        >>> d = musicxml.xmlHandler.Document()
+        >>> for mxPart, mxMeasure in d.iterparse(testPrimitive.pitches01a, isFile=False):
+        ...     if mxMeasure is None:
+        ...         print mxPart.get('id')
+        ...     elif mxMeasure.get('number') == '1':
+        ...         print len(mxMeasure)
+        4
+        P1
+        >>> d.score.getPartIdsFromPartListObj()
+        [u'P1']
+        '''
+        h = Handler(self.tagLib) 
+        if not isFile:
+            if isinstance(fileLike, unicode):
+                fileLike = fileLike.encode('utf-8')
+            fileLikeOpen = StringIO.StringIO(fileLike)
+        else:
+            fileLikeOpen = open(fileLike, 'rb')
+
+        characters = h.characters
+        startElement = h.startElement
+        endElement = h.endElement
+        elementStack = []
+        try:
+            for event, elem in ElementTree.iterparse(fileLikeOpen, 
+                                                     events=('start', 'end')):
+                if event == 'start':
+                    elementStack.append(elem)
+                    attrs = elem.attrib
+                    if attrs: # values are unicode, as from SAX
+                        attrs = dict((k, unicode(v)) for k, v in attrs.iteritems())
+                    startElement(elem.tag, attrs)
+                    if elem.tag == 'part':
+                        # part-list and header information is complete
+                        self.score = h.getContent()
+                    continue
+
+                # end event; text can only be relied upon here.  Only 
+                # elements without children take character data, and 
+                # the Handler ignores text between tags
+                elementStack.pop()
+                name = elem.tag
+                if elem.text is not None and len(elem) == 0:
+                    characters(elem.text)
+                endElement(name)
+                if name == 'measure':
+                    mxPart = h._mxObjs['part']
+                    mxMeasure = mxPart.componentList.pop()
+                    elem.clear()
+                    elementStack[-1].remove(elem)
+                    yield mxPart, mxMeasure
+                elif name == 'part':
+                    elem.clear()
+                    elementStack[-1].remove(elem)
+                    yield h._parts[-1], None
+        finally:
+            fileLikeOpen.close()
+        self.score = h.getContent()
+
     def read(self, xmlString, audit=False):
         '''Load MusicXML from a string, instead of from a file.
         '''
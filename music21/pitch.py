@@ -344,7 +344,7 @@ class MicrotoneException(exceptions21.Music21Exception):
     pass
 
 #-------------------------------------------------------------------------------
-class Microtone(object):
+class Microtone(common.SlottedObject):
     '''
     The Microtone object defines a pitch transformation above 
     or below a standard Pitch and its Accidental.
@@ -394,6 +394,9 @@ class Microtone(object):
     '''
     _jsonFreezer = True
 
+    # every Pitch has a Microtone
+    __slots__ = ('_centShift', '_harmonicShift')
+
     def __init__(self, centsOrString=0):
         self._centShift = 0
         self._harmonicShift = 1 # the first harmonic is the start
@@ -1111,8 +1114,9 @@ class Pitch(base.Music21Object):
     >>> pitch.Pitch("C#5") < pitch.Pitch("D-5")
     False
     '''
-    # define order to present names in documentation; use strings
-    _DOC_ORDER = ['name', 'nameWithOctave', 'step', 'pitchClass', 'octave', 'midi', 'german', 'french', 'spanish', 'italian','dutch']
+    # define order to present names in documentation; use strings
+    _DOC_ORDER = ['name', 'nameWithOctave', 'step', 'pitchClass', 'octave', 'midi', 'german', 'french', 'spanish', 'italian','dutch']
+
     # documentation for all attributes (not properties or methods)
     _DOC_ATTR = {
     }
@@ -1121,6 +1125,10 @@ class Pitch(base.Music21Object):
     _twelfth_root_of_two = TWELFTH_ROOT_OF_TWO
 
     def __init__(self, name=None, **keywords):
+        # most Pitches are never placed in a Stream: create Sites 
+        # only when first needed; see _getSites()
+        if 'sites' not in keywords:
+            keywords['sites'] = None
         base.Music21Object.__init__(self, **keywords)
 
         # this should not be set, as will be updated when needed
@@ -1186,6 +1194,61 @@ class Pitch(base.Music21Object):
             if 'ps' in keywords:
                 self.ps = keywords['ps']
 
+    def _getSites(self):
+        if self._sites is None:
+            self._sites = base.Sites(containedById=id(self))
+            self._sites.add(None, 0.0)
+        return self._sites
+
+    def _setSites(self, value):
+        self._sites = value
+
+    sites = property(_getSites, _setSites, doc='''
+        The :class:`~music21.base.Sites` object of this Pitch. 
+        As few Pitches are placed in Streams, Sites are only 
+        created when first used.
+
+        >>> p = pitch.Pitch('e4')
+        >>> p._sites is None
+        True
+        >>> p.sites.getSites()
+        [None]
+        >>> p._sites is None
+        False
+        ''')
+
+    def purgeOrphans(self, excludeStorageStreams=True):
+        # without Sites there can be no orphans; do not create Sites
+        if self._sites is None:
+            return
+        base.Music21Object.purgeOrphans(self, 
+            excludeStorageStreams=excludeStorageStreams)
+
+    def _getState(self):
+        '''
+        Return a tuple of the step, octave, accidental, and microtone 
+        of this Pitch that changes whenever the Pitch is changed, including 
+        by changing its Accidental or Microtone objects in place. A 
+        :class:`~music21.chord.Chord` compares these to know when values 
+        derived from its pitches must be found again.
+
+        >>> p = pitch.Pitch('c#4')
+        >>> state = p._getState()
+        >>> p.accidental.set('flat')
+        >>> p._getState() == state
+        False
+        >>> p.accidental.set('sharp')
+        >>> p._getState() == state
+        True
+        '''
+        if self._accidental is None:
+            alter = None
+        else:
+            alter = self._accidental._alter
+        microtone = self._microtone
+        return (self._step, self._octave, self.defaultOctave, alter, 
+                microtone._centShift, microtone._harmonicShift)
+
     def __repr__(self):
         return '<music21.pitch.Pitch %s>' % self.__str__()
 
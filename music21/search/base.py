@@ -151,6 +151,8 @@ def rhythmicSearch(thisStream, searchStream):
     searchLength = len(searchStream)
     if searchLength == 0:
         raise SearchException('the search Stream cannot be empty')
+    if 'numpy' not in m21Base._missingImport:
+        return _rhythmicSearchArray(thisStream, searchStream)
     streamLength = len(thisStream)
     foundEls = []
     for start in range(1 + streamLength - searchLength):
@@ -167,6 +169,26 @@ def rhythmicSearch(thisStream, searchStream):
             foundEls.append(start)
     return foundEls
 
+def _rhythmicSearchArray(thisStream, searchStream):
+    '''
+    the numpy version of rhythmicSearch: compares the quarterLengths of
+    every possible starting position at once, one search element at a time,
+    skipping the elements of the search Stream masked as wildcards.
+    '''
+    import numpy
+    searchLength = len(searchStream)
+    starts = 1 + len(thisStream) - searchLength
+    if starts <= 0:
+        return []
+    quarterLengths = translateStreamToArray(thisStream)['quarterLength']
+    searchQuarterLengths = translateStreamToArray(searchStream)['quarterLength']
+    wildcardMask = numpy.array(["WildcardDuration" in e.duration.classes for e in searchStream], 
+                               dtype=bool)
+    found = numpy.ones(starts, dtype=bool)
+    for j in numpy.flatnonzero(~wildcardMask):
+        found &= (quarterLengths[j:j + starts] == searchQuarterLengths[j])
+    return [int(i) for i in numpy.flatnonzero(found)]
+
 def approximateNoteSearch(thisStream, otherStreams):
     '''
     searches the list of otherStreams and returns an ordered list of matches
@@ -190,12 +212,10 @@ def approximateNoteSearch(thisStream, otherStreams):
     o2 0.083333...
     '''
     isJunk = None
-    n = thisStream.flat.notesAndRests
-    thisStreamStr = translateStreamToString(n)
+    thisStreamStr = _translateStreamForSearch(thisStream, 'all')
     sorterList = []
     for s in otherStreams:
-        sn = s.flat.notesAndRests
-        thatStreamStr = translateStreamToString(sn)
+        thatStreamStr = _translateStreamForSearch(s, 'all')
         ratio = difflib.SequenceMatcher(isJunk, thisStreamStr, thatStreamStr).ratio()
         s.matchProbability = ratio
         sorterList.append((ratio, s))
@@ -229,12 +249,10 @@ def approximateNoteSearchNoRhythm(thisStream, otherStreams):
     o2 0.1666666...
     '''
     isJunk = None
-    n = thisStream.flat.notesAndRests
-    thisStreamStr = translateStreamToStringNoRhythm(n)
+    thisStreamStr = _translateStreamForSearch(thisStream, 'noRhythm')
     sorterList = []
     for s in otherStreams:
-        sn = s.flat.notesAndRests
-        thatStreamStr = translateStreamToStringNoRhythm(sn)
+        thatStreamStr = _translateStreamForSearch(s, 'noRhythm')
         ratio = difflib.SequenceMatcher(isJunk, thisStreamStr, thatStreamStr).ratio()
         s.matchProbability = ratio
         sorterList.append((ratio, s))
@@ -267,12 +285,10 @@ def approximateNoteSearchOnlyRhythm(thisStream, otherStreams):
     o2 0.0
     '''
     isJunk = None
-    n = thisStream.flat.notesAndRests
-    thisStreamStr = translateStreamToStringOnlyRhythm(n)
+    thisStreamStr = _translateStreamForSearch(thisStream, 'onlyRhythm')
     sorterList = []
     for s in otherStreams:
-        sn = s.flat.notesAndRests
-        thatStreamStr = translateStreamToStringOnlyRhythm(sn)
+        thatStreamStr = _translateStreamForSearch(s, 'onlyRhythm')
         ratio = difflib.SequenceMatcher(isJunk, thisStreamStr, thatStreamStr).ratio()
         s.matchProbability = ratio
         sorterList.append((ratio, s))
@@ -307,16 +323,12 @@ def approximateNoteSearchWeighted(thisStream, otherStreams):
     o2 0.25
     '''
     isJunk = None
-    n = thisStream.flat.notesAndRests
-    thisStreamStrPitches = translateStreamToStringNoRhythm(n)
-    thisStreamStrDuration = translateStreamToStringOnlyRhythm(n)   
+    thisStreamStrPitches, thisStreamStrDuration = _translateStreamForSearch(thisStream, 'noRhythm', 'onlyRhythm')
 #    print "notes",thisStreamStrPitches
 #    print "rhythm",thisStreamStrDuration 
     sorterList = []
     for s in otherStreams:
-        sn = s.flat.notesAndRests
-        thatStreamStrPitches = translateStreamToStringNoRhythm(sn)
-        thatStreamStrDuration = translateStreamToStringOnlyRhythm(sn)
+        thatStreamStrPitches, thatStreamStrDuration = _translateStreamForSearch(s, 'noRhythm', 'onlyRhythm')
 #        print "notes2",thatStreamStrPitches
 #        print "rhythm2",thatStreamStrDuration 
         ratioPitches = difflib.SequenceMatcher(isJunk, thisStreamStrPitches, thatStreamStrPitches).ratio()
@@ -330,6 +342,148 @@ def approximateNoteSearchWeighted(thisStream, otherStreams):
 
 
 
+def _translateStreamForSearch(inputStream, *translations):
+    '''
+    translates the notesAndRests of inputStream.flat into a string for each of the
+    `translations` given: 'all' (as in translateStreamToString), 'noRhythm' 
+    (as translateStreamToStringNoRhythm) or 'onlyRhythm' (as
+    translateStreamToStringOnlyRhythm). If numpy is installed, the strings
+    are made from the translateStreamToArray of inputStream.flat,
+    with the elements that are not notes or rests masked out.
+    
+    Returns a single string if one translation is given, otherwise a list.
+
+    
+    >>> s = converter.parse("c4 d8 r16 FF8. a'8 b-2.", "3/4")
+    >>> sn = s.flat.notesAndRests
+    >>> search.base._translateStreamForSearch(s, 'all') == search.translateStreamToString(sn)
+    True
+    >>> search.base._translateStreamForSearch(s, 'noRhythm', 'onlyRhythm')
+    ['<>\\x7f)QF', 'PF<KF_']
+    '''
+    post = []
+    if 'numpy' in m21Base._missingImport:
+        translators = {'all': translateStreamToString, 
+                       'noRhythm': translateStreamToStringNoRhythm,
+                       'onlyRhythm': translateStreamToStringOnlyRhythm}
+        notesAndRests = inputStream.flat.notesAndRests
+        for t in translations:
+            post.append(translators[t](notesAndRests))
+    else:
+        includes = {'all': (True, True, True), 
+                    'noRhythm': (True, False, False),
+                    'onlyRhythm': (False, True, False)}
+        streamArray = translateStreamToArray(inputStream.flat)
+        streamArray = streamArray[streamArray['midi'] >= 0]
+        for t in translations:
+            includePitch, includeDuration, includeTie = includes[t]
+            post.append(translateArrayToString(streamArray, includePitch=includePitch, 
+                                               includeDuration=includeDuration, 
+                                               includeTie=includeTie))
+    if len(post) == 1:
+        return post[0]
+    return post
+
+def translateStreamToArray(inputStream):
+    '''
+    takes a stream and returns a numpy structured array with one record for 
+    each element, in order, with the fields 'midi', 'quarterLength', 'offset' and 'tie'.
+    
+    'midi' is the midi number that translateNoteToByte uses (127 for rests and
+    chords without pitches) or -1 for elements that are not notes, rests or chords. 
+    'tie' is 0 for no tie and 1, 2, or 3 for a 'start', 'continue', or 'stop' tie.
+    
+    Building the array takes one pass over the elements; searching functions
+    can then compare whole streams at once.  The array is built anew on
+    each call, so that it reflects pitches and durations changed in place.
+    
+    
+    >>> s = converter.parse("c4 d8~ d16 r16 FF2", "4/4")
+    >>> a = search.translateStreamToArray(s.flat)
+    >>> a['midi'].tolist()
+    [-1, 60, 62, 62, 127, 41]
+    >>> a['quarterLength'].tolist()
+    [0.0, 1.0, 0.5, 0.25, 0.25, 2.0]
+    >>> a['offset'].tolist()
+    [0.0, 0.0, 1.0, 1.5, 1.75, 2.0]
+    >>> a['tie'].tolist()
+    [0, 0, 1, 3, 0, 0]
+    
+    Requires numpy.
+    '''
+    if 'numpy' in m21Base._missingImport:
+        raise SearchException('could not find numpy, cannot translate a stream to an array')
+    import numpy
+    tieCodes = {'start': 1, 'continue': 2, 'stop': 3}
+    records = []
+    for e in inputStream:
+        if not hasattr(e, 'isChord'): # not a GeneralNote
+            midi = -1
+        elif e.isRest:
+            midi = 127
+        elif e.isChord:
+            if len(e.pitches) > 0:
+                midi = e.pitches[0].midi
+            else:
+                midi = 127
+        elif hasattr(e, 'pitch'):
+            midi = e.pitch.midi
+        else:
+            midi = 127
+        t = getattr(e, 'tie', None)
+        if t is None:
+            tieCode = 0
+        else:
+            tieCode = tieCodes.get(t.type, 0)
+        records.append((midi, e.duration.quarterLength, e.offset, tieCode))
+    streamArray = numpy.array(records, dtype=[('midi', numpy.int16),
+                                              ('quarterLength', numpy.float64),
+                                              ('offset', numpy.float64),
+                                              ('tie', numpy.int8)])
+    return streamArray
+
+def translateArrayToString(streamArray, includePitch=True, includeDuration=True, includeTie=True):
+    '''
+    takes an array from translateStreamToArray of a stream of notesAndRests 
+    and returns the same string that translateStreamToString (or, 
+    with includeDuration and includeTie False, translateStreamToStringNoRhythm; 
+    with includePitch and includeTie False, translateStreamToStringOnlyRhythm) 
+    would return for the stream.
+    
+    
+    >>> s = converter.parse("c4 d8 r16 FF8. a'8 b-2.", "3/4")
+    >>> sn = s.flat.notesAndRests
+    >>> a = search.translateStreamToArray(sn)
+    >>> print search.translateArrayToString(a)
+    <P>F<)KQFF_
+    >>> print search.translateArrayToString(a, includePitch=False, includeTie=False)
+    PF<KF_
+    '''
+    import numpy
+    numNotes = len(streamArray)
+    columns = numpy.zeros((numNotes, 3), dtype=numpy.uint8)
+    mask = numpy.zeros((numNotes, 3), dtype=bool)
+    if includePitch:
+        columns[:, 0] = streamArray['midi']
+        mask[:, 0] = True
+    if includeDuration:
+        quarterLengths = streamArray['quarterLength']
+        # same formula, and same errors, as translateDurationToBytes
+        if numNotes > 0 and quarterLengths.min() <= 0:
+            raise ValueError('cannot translate a quarterLength of %s to a byte' % quarterLengths.min())
+        durations = (numpy.log(quarterLengths * 256) / numpy.log(2) * 10).astype(numpy.int64)
+        durations[durations >= 127] = 127
+        durations[durations == 0] = 1
+        if numNotes > 0 and durations.min() < 0:
+            raise ValueError('cannot translate a quarterLength of %s to a byte' % quarterLengths.min())
+        columns[:, 1] = durations
+        mask[:, 1] = True
+    if includeTie:
+        tieBytes = numpy.array([0, ord('s'), ord('c'), ord('e')], dtype=numpy.uint8)
+        columns[:, 2] = tieBytes[streamArray['tie']]
+        mask[:, 2] = streamArray['tie'] > 0
+    return columns[mask].tostring()
+
 def translateStreamToString(inputStream):
     '''
     takes a stream of notesAndRests only and returns
@@ -675,6 +829,42 @@ class Test(unittest.TestCase):
                 i = copy.copy(obj)
                 j = copy.deepcopy(obj)
 
+    def testTranslateArrayToString(self):
+        if 'numpy' in m21Base._missingImport:
+            return
+        from music21 import corpus
+        s = corpus.parse('bach/bwv66.6')
+        for p in s.parts:
+            sn = p.flat.notesAndRests
+            a = translateStreamToArray(sn)
+            self.assertEqual(translateArrayToString(a), translateStreamToString(sn))
+            self.assertEqual(translateArrayToString(a, includeDuration=False, includeTie=False), 
+                             translateStreamToStringNoRhythm(sn))
+            self.assertEqual(translateArrayToString(a, includePitch=False, includeTie=False), 
+                             translateStreamToStringOnlyRhythm(sn))
+            self.assertEqual(a['offset'].tolist(), [n.offset for n in sn])
+
+    def testSearchAfterInPlaceChanges(self):
+        '''Searches reflect pitches and durations changed in place
+        '''
+        from music21 import converter
+        s = converter.parse("c4 d8 e16 FF a'4 b-", "4/4")
+        o = converter.parse("c4 d8 e16 FF a'4 b-", "4/4")
+        approximateNoteSearchNoRhythm(s, [o])
+        self.assertEqual(o.matchProbability, 1.0)
+        s.transpose(2, inPlace=True)
+        approximateNoteSearchNoRhythm(s, [o])
+        self.assertTrue(o.matchProbability < 1.0)
+        o.transpose(2, inPlace=True)
+        approximateNoteSearchNoRhythm(s, [o])
+        self.assertEqual(o.matchProbability, 1.0)
+
+        p = converter.parse("c4 d8 e8 f4 g4", "4/4").flat.notes
+        q = converter.parse("d8 e8 f2", "4/4").flat.notes
+        self.assertEqual(rhythmicSearch(p, q), [])
+        p[3].duration.quarterLength = 2
+        self.assertEqual(rhythmicSearch(p, q), [1])
+
     
 
 #-------------------------------------------------------------------------------
@@ -21,11 +21,21 @@ Speed notes:
    use pyLevenshtein if it is installed from http://code.google.com/p/pylevenshtein/ .
    You will need to compile it by running **sudo python setup.py install** on Mac or
    Unix (compilation is much more difficult on Windows; sorry). The ratios are very 
-   slightly different, but the speedup is between 10 and 100x!
+   slightly different, but the speedup is between 10 and 100x!  If pyLevenshtein
+   is not installed but numpy is, `scoreSimilarity` compares each segment against
+   all the others at once with a vectorized edit-distance kernel, which gives the
+   same ratios as pyLevenshtein.  It can also split the work across several
+   processes and skip pairs that cannot reach a `minimumRatio`.
+   
+   To find a melody in many scores without comparing it to every segment,
+   build an n-gram index of the segments with `indexNGrams` and search
+   it with `searchNGramIndex`.
 
 '''
+from music21 import base # for _missingImport testing.
 from music21 import converter
 from music21 import environment
+from music21 import exceptions21
 from music21.search import base as searchBase
 
 _MOD = 'search.segment.py'
@@ -34,6 +44,7 @@ import os
 import math
 import json
 import difflib
+import multiprocessing
 
 def translateMonophonicPartToSegments(inputStream, segmentLengths = 30, overlap = 12, algorithm = searchBase.translateStreamToStringNoRhythm): #translateStreamToString):
     '''
@@ -183,6 +194,145 @@ def loadScoreDict(fp):
         scoreDict = json.load(fh)
     return scoreDict
 
+def indexNGrams(scoreDict, n=4):
+    r'''
+    Creates an inverted index of the n-grams (substrings of length `n`) of 
+    all segments in a scoreDict from `indexScoreFilePaths` (or 
+    `indexScoreParts`), for finding segments that contain a query with
+    `searchNGramIndex`. Segments may have been made by any algorithm 
+    (such as translateStreamToString, translateStreamToStringNoRhythm, or 
+    translateDiatonicStreamToString) but queries must use the same one.
+
+    Returns a dictionary with the length of n-grams under 'n' and, under 
+    'nGrams', a dictionary of each n-gram to a list of [score name, part 
+    number, segment number] lists for the segments containing it.  The 
+    dictionary can be saved and loaded with `saveNGramIndex` and 
+    `loadNGramIndex`.
+    
+    >>> luca = corpus.parse('luca/gloria')
+    >>> scoreDict = {'gloria': search.segment.indexScoreParts(luca)}
+    >>> nGramIndex = search.segment.indexNGrams(scoreDict)
+    >>> nGramIndex['n']
+    4
+    >>> nGramIndex['nGrams']['HJHE']
+    [['gloria', 0, 0], ['gloria', 0, 9]]
+    '''
+    nGrams = {}
+    for scoreKey, scoreParts in scoreDict.iteritems():
+        for pNum, partDict in enumerate(scoreParts):
+            for segmentNumber, segment in enumerate(partDict['segmentList']):
+                location = [scoreKey, pNum, segmentNumber]
+                for nGram in set(segment[i:i + n] 
+                                 for i in range(len(segment) - n + 1)):
+                    if nGram in nGrams:
+                        nGrams[nGram].append(location)
+                    else:
+                        nGrams[nGram] = [location]
+    return {'n': n, 'nGrams': nGrams}
+
+def saveNGramIndex(nGramIndex, fp = None):
+    '''
+    save the n-gram index from indexNGrams as a .json file for quickly reloading
+
+    returns the filepath (assumes you'll probably be using a temporary file)
+    '''
+    return saveScoreDict(nGramIndex, fp)
+
+def loadNGramIndex(fp):
+    '''
+    load the n-gram index from fp
+    '''
+    return loadScoreDict(fp)
+
+def searchNGramIndex(query, nGramIndex, scoreDict, maxCandidates=50, 
+                     minimumRatio=0.0, algorithm=None, forceDifflib=False):
+    r'''
+    Find the segments of a scoreDict that are most similar to `query`, a 
+    string made by the same algorithm as the segments or a Stream of notes
+    to be translated with `algorithm` (default 
+    translateStreamToStringNoRhythm).
+    
+    Candidate segments are those that share n-grams with the query in
+    `nGramIndex`, made by `indexNGrams`; only the `maxCandidates` (or all, 
+    if None) sharing the most n-grams are compared to the query, as in
+    `scoreSimilarity`. Candidates sharing as many n-grams are taken in 
+    order of score name, part number, and segment number. A query shorter
+    than the n-grams of the index has no n-grams: then all segments are 
+    compared to it, regardless of `maxCandidates`.
+    
+    Returns a list of tuples of score name, part number, segment number,
+    measure number, and similarity (0 to 1) for candidates that have a 
+    similarity of at least `minimumRatio`, most similar first (and equally 
+    similar segments in the order of candidates).
+    
+    >>> luca = corpus.parse('luca/gloria')
+    >>> scoreDict = {'gloria': search.segment.indexScoreParts(luca)}
+    >>> nGramIndex = search.segment.indexNGrams(scoreDict)
+    >>> query = scoreDict['gloria'][1]['segmentList'][5][3:25]
+    >>> results = search.segment.searchNGramIndex(query, nGramIndex, scoreDict,
+    ...    forceDifflib=True)
+    >>> results[0]
+    ('gloria', 1, 5, 42, 0.846...)
+
+    A query can also be given as notes:
+    
+    >>> notes = luca.parts[0].flat.notes[0:12]
+    >>> results = search.segment.searchNGramIndex(notes, nGramIndex, scoreDict,
+    ...    maxCandidates=5, minimumRatio=0.5, forceDifflib=True)
+    >>> results[0]
+    ('gloria', 0, 0, 1, 0.571...)
+    >>> len(results)
+    1
+
+    A query shorter than the n-grams is compared to all segments:
+
+    >>> nGramIndex['n']
+    4
+    >>> results = search.segment.searchNGramIndex(query[:3], nGramIndex, 
+    ...    scoreDict, maxCandidates=1, forceDifflib=True)
+    >>> len(results) == sum([len(p['segmentList']) for p in scoreDict['gloria']])
+    True
+    '''
+    if not isinstance(query, basestring):
+        if algorithm is None:
+            algorithm = searchBase.translateStreamToStringNoRhythm
+        query = algorithm(query)
+    n = nGramIndex['n']
+    nGrams = nGramIndex['nGrams']
+    if len(query) < n:
+        # no n-grams to look up: compare the query to every segment
+        candidates = []
+        for scoreKey in sorted(scoreDict):
+            for pNum, partDict in enumerate(scoreDict[scoreKey]):
+                for segmentNumber in range(len(partDict['segmentList'])):
+                    candidates.append((scoreKey, pNum, segmentNumber))
+    else:
+        # count the n-grams each segment shares with the query
+        sharedCounts = {}
+        for nGram in set(query[i:i + n] for i in range(len(query) - n + 1)):
+            for scoreKey, pNum, segmentNumber in nGrams.get(nGram, ()):
+                location = (scoreKey, pNum, segmentNumber)
+                sharedCounts[location] = sharedCounts.get(location, 0) + 1
+        # break ties by location, so that the same candidates are chosen
+        # whatever the order of the dictionary
+        candidates = sorted(sharedCounts, 
+                            key=lambda loc: (-sharedCounts[loc], loc))
+        if maxCandidates is not None:
+            candidates = candidates[:maxCandidates]
+
+    results = []
+    dl = getDifflibOrPyLev(query, forceDifflib = forceDifflib)
+    for scoreKey, pNum, segmentNumber in candidates:
+        partDict = scoreDict[scoreKey][pNum]
+        dl.set_seq1(partDict['segmentList'][segmentNumber])
+        ratio = dl.ratio()
+        if ratio < minimumRatio:
+            continue
+        measureNumber = partDict['measureList'][segmentNumber]
+        results.append((scoreKey, pNum, segmentNumber, measureNumber, ratio))
+    results.sort(key=lambda r: -r[4])
+    return results
+
 def getDifflibOrPyLev(seq2 = None, junk=None, forceDifflib = False):
     '''
     returns either a difflib.SequenceMatcher or pyLevenshtein StringMatcher.StringMatcher
@@ -202,7 +352,164 @@ def getDifflibOrPyLev(seq2 = None, junk=None, forceDifflib = False):
     
     return smObject
 
-def scoreSimilarity(scoreDict, minimumLength=20, giveUpdates = False, includeReverse = False, forceDifflib = False):
+def lcsRatios(seq, otherSeqs, minimumRatio=None):
+    r'''
+    Compare the string `seq` against every string in the list `otherSeqs`
+    at once and return a list of similarity ratios, using numpy.  The ratio
+    is twice the length of the longest common subsequence divided by the
+    total length of the two strings, which is the ratio that pyLevenshtein
+    reports.
+    
+    ::
+
+        >>> search.segment.lcsRatios('ABCDEF', ['ABCDEF', 'ABXDEF', 'FEDCBA', ''])
+        [1.0, 0.833..., 0.166..., 0.0]
+        
+    If `minimumRatio` is given, a pair is abandoned as soon as it can no longer
+    reach that ratio, and its ratio is given as None.
+    
+    ::
+    
+        >>> search.segment.lcsRatios('ABCDEF', ['ABCDEF', 'ABXDEF', 'FEDCBA', ''], minimumRatio=0.5)
+        [1.0, 0.833..., None, None]
+    
+    Raises a SegmentException if numpy is not installed.
+    '''
+    if 'numpy' in base._missingImport:
+        raise SegmentException('could not find numpy, cannot compute vectorized ratios')
+    import numpy
+    ratios = [None] * len(otherSeqs)
+    if len(otherSeqs) == 0:
+        return ratios
+    seqLength = len(seq)
+    otherLengths = numpy.array([len(other) for other in otherSeqs], dtype=numpy.int32)
+    # pad with -1, which never matches a character
+    codes = numpy.empty((len(otherSeqs), max(otherLengths.max(), 1)), dtype=numpy.int32)
+    codes.fill(-1)
+    for i, other in enumerate(otherSeqs):
+        codes[i, :len(other)] = [ord(c) for c in other]
+    totals = seqLength + otherLengths
+    remaining = numpy.arange(len(otherSeqs))
+
+    # row i of the longest common subsequence table, one row per candidate.
+    # Since a match always at least equals the cell to its left, each row
+    # is the running maximum of the diagonal (on a match) or the cell above.
+    lcsRow = numpy.zeros((len(otherSeqs), codes.shape[1] + 1), dtype=numpy.int32)
+    for i, char in enumerate(seq):
+        diagonalOrAbove = numpy.where(codes == ord(char), lcsRow[:, :-1] + 1, lcsRow[:, 1:])
+        numpy.maximum.accumulate(diagonalOrAbove, axis=1, out=lcsRow[:, 1:])
+        if minimumRatio is not None:
+            # each remaining character can add at most one to the subsequence
+            bestPossible = lcsRow[:, -1] + (seqLength - i - 1)
+            keep = 2.0 * bestPossible >= minimumRatio * totals
+            if not keep.all():
+                remaining = remaining[keep]
+                if len(remaining) == 0:
+                    return ratios
+                codes = codes[keep]
+                lcsRow = lcsRow[keep]
+                totals = totals[keep]
+
+    for index, lcsLength, total in zip(remaining, lcsRow[:, -1], totals):
+        if total == 0:
+            ratio = 1.0
+        else:
+            ratio = 2.0 * lcsLength / total
+        if minimumRatio is not None and ratio < minimumRatio:
+            continue
+        ratios[index] = float(ratio)
+    return ratios
+
+def _useLcsRatios(forceDifflib=False):
+    '''
+    returns True if `scoreSimilarity` should use the numpy kernel in `lcsRatios`,
+    that is, if numpy is installed and pyLevenshtein is not.
+    '''
+    if forceDifflib is True or 'numpy' in base._missingImport:
+        return False
+    try:
+        import StringMatcher # @UnusedImport
+        return False
+    except ImportError:
+        return True
+
+def _scoreSimilarityForScore(scoreDict, scoreDictKeys, thisScoreNumber, minimumLength=20, 
+                             includeReverse=False, forceDifflib=False, minimumRatio=None):
+    '''
+    compare each segment of one score in `scoreDict` against the segments 
+    of all the scores after it and return the list of similarity tuples for
+    `scoreSimilarity`.
+    '''
+    similarityScores = []
+    thisScoreKey = scoreDictKeys[thisScoreNumber]
+    thisScore = scoreDict[thisScoreKey]
+
+    thatSegmentInfo = [] # (thatScoreKey, pNum2, thatSegmentNumber, thatMeasureNumber)
+    thatSegments = []
+    for thatScoreNumber in range(thisScoreNumber + 1, len(scoreDictKeys)):
+        thatScoreKey = scoreDictKeys[thatScoreNumber]
+        thatScore = scoreDict[thatScoreKey]
+        for pNum2 in range(len(thatScore)):
+            for thatSegmentNumber, thatSegment in enumerate(thatScore[pNum2]['segmentList']):
+                if len(thatSegment) < minimumLength:
+                    continue
+                thatMeasureNumber = thatScore[pNum2]['measureList'][thatSegmentNumber]
+                thatSegmentInfo.append((thatScoreKey, pNum2, thatSegmentNumber, thatMeasureNumber))
+                thatSegments.append(thatSegment)
+
+    useLcsRatios = _useLcsRatios(forceDifflib)
+    for pNum in range(len(thisScore)):
+        for segmentNumber, thisSegment in enumerate(thisScore[pNum]['segmentList']):
+            if len(thisSegment) < minimumLength:
+                continue
+            thisMeasureNumber = thisScore[pNum]['measureList'][segmentNumber]
+            if useLcsRatios is True:
+                ratios = lcsRatios(thisSegment, thatSegments, minimumRatio)
+            else:
+                ratios = []
+                dl = getDifflibOrPyLev(thisSegment, forceDifflib = forceDifflib)
+                for thatSegment in thatSegments:
+                    if minimumRatio is not None:
+                        # cheap upper bounds on the ratio before computing it
+                        totalLength = len(thisSegment) + len(thatSegment)
+                        if 2.0 * min(len(thisSegment), len(thatSegment)) < minimumRatio * totalLength:
+                            ratios.append(None)
+                            continue
+                        dl.set_seq1(thatSegment)
+                        if dl.quick_ratio() < minimumRatio:
+                            ratios.append(None)
+                            continue
+                    else:
+                        dl.set_seq1(thatSegment)
+                    ratio = dl.ratio()
+                    if minimumRatio is not None and ratio < minimumRatio:
+                        ratio = None
+                    ratios.append(ratio)
+
+            for info, ratio in zip(thatSegmentInfo, ratios):
+                if ratio is None:
+                    continue
+                thatScoreKey, pNum2, thatSegmentNumber, thatMeasureNumber = info
+                similarityTuple = (thisScoreKey, pNum, segmentNumber, thisMeasureNumber, thatScoreKey, pNum2, thatSegmentNumber, thatMeasureNumber, ratio)
+                similarityScores.append(similarityTuple)
+                if includeReverse is True:
+                    similarityTupleReversed = (thatScoreKey, pNum2, thatSegmentNumber, thatMeasureNumber, thisScoreKey, pNum, segmentNumber, thisMeasureNumber, ratio)
+                    similarityScores.append(similarityTupleReversed)
+    return similarityScores
+
+# arguments shared by the worker processes of scoreSimilarity
+_scoreSimilarityArguments = None
+
+def _scoreSimilarityWorkerInit(arguments):
+    global _scoreSimilarityArguments # pylint: disable=global-statement
+    _scoreSimilarityArguments = arguments
+
+def _scoreSimilarityWorker(thisScoreNumber):
+    scoreDict, scoreDictKeys, keywords = _scoreSimilarityArguments
+    return _scoreSimilarityForScore(scoreDict, scoreDictKeys, thisScoreNumber, **keywords)
+
+def scoreSimilarity(scoreDict, minimumLength=20, giveUpdates = False, includeReverse = False, 
+                    forceDifflib = False, minimumRatio = None, processes = 1):
     r'''Find the level of similarity between each pair of segments in a scoreDict.
     
     This takes twice as long as it should because it does not cache the pairwise similarity.
@@ -230,51 +537,64 @@ def scoreSimilarity(scoreDict, minimumLength=20, giveUpdates = False, includeRev
          (u'bwv197.5.mxl', 0, 2, 9, u'bwv197.10.mxl', 0, 0, 0, 0.377...),
          (u'bwv197.5.mxl', 0, 2, 9, u'bwv197.10.mxl', 0, 1, 5, 0.339...)]
 
+    If `minimumRatio` is given, only pairs at least that similar are returned,
+    and each pair is abandoned as soon as it is clear that it cannot reach it.
+    
+    If `processes` is greater than 1 (or None, for one process per CPU), the 
+    scores are split among that many worker processes; the results are the
+    same and in the same order as when running in a single process.
+    
+    ::
+    
+        >>> scoreDict = {'a': [{'segmentList': ['ABCDEFGH', 'HGFEDCBA'], 'measureList': [1, 3]}],
+        ...              'b': [{'segmentList': ['ABCDXFGH'], 'measureList': [5]}]}
+        >>> search.segment.scoreSimilarity(scoreDict, minimumLength=5, minimumRatio=0.5, forceDifflib=True)
+        [('a', 0, 0, 1, 'b', 0, 0, 5, 0.875)]
+        >>> search.segment.scoreSimilarity(scoreDict, minimumLength=5, minimumRatio=0.5, forceDifflib=True, processes=2)
+        [('a', 0, 0, 1, 'b', 0, 0, 5, 0.875)]
+
     Return tuple.
     '''
-    similarityScores = []
-    scoreIndex = 0
     totalScores = len(scoreDict)
     scoreDictKeys = scoreDict.keys()
-    for thisScoreNumber in range(totalScores):
-        thisScoreKey = scoreDictKeys[thisScoreNumber]
-        thisScore = scoreDict[thisScoreKey]
-        scoreIndex += 1 
-        if giveUpdates is True:
-            print "Comparing %s (%d/%d)" % (thisScoreKey, scoreIndex, totalScores)
-        for pNum in range(len(thisScore)):
-            for segmentNumber, thisSegment in enumerate(thisScore[pNum]['segmentList']):
-                if len(thisSegment) < minimumLength:
-                    continue
-                thisMeasureNumber = thisScore[pNum]['measureList'][segmentNumber]
-                dl = getDifflibOrPyLev(thisSegment, forceDifflib = forceDifflib)
-                #dl = difflib.SequenceMatcher(None, '', thisSegment)
-                for thatScoreNumber in range(scoreIndex, totalScores):
-                    thatScoreKey = scoreDictKeys[thatScoreNumber]
-                    thatScore = scoreDict[thatScoreKey]
-                    #print "scorekey ", thisScoreNumber, thatScoreNumber, thatScoreKey, thatScore
-
-                    for pNum2 in range(len(thatScore)):
-                        for thatSegmentNumber, thatSegment in enumerate(thatScore[pNum2]['segmentList']):
-                            if len(thatSegment) < minimumLength:
-                                continue
-                            #print thisScoreKey, pNum, thisSegment, segmentNumber, thisMeasureNumber
-
-                            dl.set_seq1(thatSegment)
-                            ratio = dl.ratio()
-                            #print ratio
-                            thatMeasureNumber = thatScore[pNum2]['measureList'][thatSegmentNumber]
-                            #print thatScoreKey, pNum2, thatSegment, thatSegmentNumber, thatMeasureNumber
-                            similarityTuple = (thisScoreKey, pNum, segmentNumber, thisMeasureNumber, thatScoreKey, pNum2, thatSegmentNumber, thatMeasureNumber, ratio)
-                            similarityScores.append(similarityTuple)
-                            if includeReverse is True:
-                                similarityTupleReversed = (thatScoreKey, pNum2, thatSegmentNumber, thatMeasureNumber, thisScoreKey, pNum, segmentNumber, thisMeasureNumber, ratio)
-                                similarityScores.append(similarityTupleReversed)
-
-    #import pprint
-    #pprint.pprint(similarityScores)
+    keywords = {'minimumLength': minimumLength, 
+                'includeReverse': includeReverse, 
+                'forceDifflib': forceDifflib, 
+                'minimumRatio': minimumRatio,
+                }
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    processes = min(processes, totalScores)
+
+    similarityScores = []
+    if processes <= 1:
+        for thisScoreNumber in range(totalScores):
+            if giveUpdates is True:
+                print "Comparing %s (%d/%d)" % (scoreDictKeys[thisScoreNumber], thisScoreNumber + 1, totalScores)
+            similarityScores.extend(_scoreSimilarityForScore(scoreDict, scoreDictKeys, 
+                                                             thisScoreNumber, **keywords))
+        return similarityScores
+
+    pool = multiprocessing.Pool(processes=processes, 
+                                initializer=_scoreSimilarityWorkerInit, 
+                                initargs=((scoreDict, scoreDictKeys, keywords),))
+    try:
+        # imap keeps the results in score order
+        results = pool.imap(_scoreSimilarityWorker, range(totalScores))
+        for thisScoreNumber, thisScoreResults in enumerate(results):
+            if giveUpdates is True:
+                print "Compared %s (%d/%d)" % (scoreDictKeys[thisScoreNumber], thisScoreNumber + 1, totalScores)
+            similarityScores.extend(thisScoreResults)
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
     return similarityScores
     
+#-------------------------------------------------------------------------------
+class SegmentException(exceptions21.Music21Exception):
+    pass
+
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = []
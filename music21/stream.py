@@ -20,6 +20,7 @@ and :class:`~music21.stream.Score` objects, are defined in
 this module. 
 '''
 
+import bisect
 import copy
 import unittest
 import sys
@@ -28,7 +29,6 @@ from music21 import base
 
 from music21 import bar
 from music21 import common
-#from music21 import classCache
 from music21 import clef
 from music21 import chord
 from music21 import defaults
@@ -50,12 +50,178 @@ from music21 import environment
 _MOD = "stream.py"
 environLocal = environment.Environment(_MOD)
 
+# offsets in getElementsByOffset are compared after common.cleanupFloat();
+# the offset index must not exclude elements that rounding might admit
+_OFFSET_INDEX_TOLERANCE = 0.001
+
+# changes to the elements of a Stream are queued for its cached flat 
+# representation; beyond this many, rebuilding the flat is cheaper
+_MAX_PENDING_FLAT_CHANGES = 100
+
 #-------------------------------------------------------------------------------
 
 class StreamException(exceptions21.Music21Exception):
     pass
 
 
+#-------------------------------------------------------------------------------
+def _isOffsetInSpan(offset, quarterLength, offsetStart, offsetEnd,
+    includeEndBoundary=True, mustFinishInSpan=False, mustBeginInSpan=True):
+    '''
+    Return True if an element at `offset` lasting `quarterLength` falls 
+    within the span from `offsetStart` to `offsetEnd`, as defined by 
+    the parameters of :meth:`~music21.stream.Stream.getElementsByOffset`.
+
+    >>> stream._isOffsetInSpan(2.0, 2.0, 1, 3)
+    True
+    >>> stream._isOffsetInSpan(2.0, 2.0, 1, 3, mustFinishInSpan=True)
+    False
+    >>> stream._isOffsetInSpan(0.0, 2.0, 1, 3)
+    False
+    >>> stream._isOffsetInSpan(0.0, 2.0, 1, 3, mustBeginInSpan=False)
+    True
+    '''
+    if not mustFinishInSpan:
+        eEnd = offset
+    else:
+        eEnd = offset + quarterLength
+    eEnd = common.cleanupFloat(eEnd)
+
+    if not mustBeginInSpan:
+        eStart = offset + quarterLength
+    else:
+        eStart = offset
+    eStart = common.cleanupFloat(eStart)
+
+    if includeEndBoundary is True and mustBeginInSpan is True and \
+        eStart >= offsetStart and eEnd <= offsetEnd:
+            return True
+    elif includeEndBoundary is True and mustBeginInSpan is False and \
+        eStart > offsetStart and eEnd <= offsetEnd:
+            return True
+    elif includeEndBoundary is False and mustBeginInSpan is True and \
+        eStart >= offsetStart and eEnd < offsetEnd:
+            return True
+    elif includeEndBoundary is False and mustBeginInSpan is False and \
+        eStart > offsetStart and eEnd < offsetEnd:
+            return True
+    return False
+
+
+#-------------------------------------------------------------------------------
+class StreamFilter(object):
+    '''
+    A filter applied by a :class:`~music21.stream.StreamIterator` to 
+    each element of its source Stream. Calling the filter with an element 
+    and the iterator returns True if the element is to be returned. 
+    A filter may raise StopIteration if no later element can match.
+
+    The `derivationStr` is used as the derivationMethod of Streams 
+    built from filtered iterators.
+    '''
+    derivationStr = 'streamFilter'
+
+    def __call__(self, e, iterator):
+        return True
+
+
+class ClassFilter(StreamFilter):
+    '''
+    Match elements that are of one or more of the classes or class names 
+    in `classFilterList`, as :meth:`~music21.stream.Stream.getElementsByClass`.
+
+    >>> cf = stream.ClassFilter('Note')
+    >>> cf(note.Note(), None)
+    True
+    >>> cf(note.Rest(), None)
+    False
+    '''
+    derivationStr = 'getElementsByClass'
+
+    def __init__(self, classFilterList):
+        if not isinstance(classFilterList, (list, tuple)):
+            classFilterList = (classFilterList,)
+        self.classFilterList = classFilterList
+
+    def __call__(self, e, iterator):
+        return e.isClassOrSubclass(self.classFilterList)
+
+
+class ClassNotFilter(ClassFilter):
+    '''
+    Match elements that are not of any of the classes or class names 
+    in `classFilterList`, as 
+    :meth:`~music21.stream.Stream.getElementsNotOfClass`.
+
+    >>> cf = stream.ClassNotFilter('Note')
+    >>> cf(note.Note(), None)
+    False
+    >>> cf(note.Rest(), None)
+    True
+    '''
+    derivationStr = 'getElementsNotOfClass'
+
+    def __call__(self, e, iterator):
+        return not e.isClassOrSubclass(self.classFilterList)
+
+
+class GroupFilter(StreamFilter):
+    '''
+    Match elements that are in one or more of the groups in 
+    `groupFilterList`, as :meth:`~music21.stream.Stream.getElementsByGroup`.
+
+    >>> n = note.Note()
+    >>> n.groups.append('trombone')
+    >>> stream.GroupFilter('trombone')(n, None)
+    True
+    >>> stream.GroupFilter(['tuba', 'violin'])(n, None)
+    False
+    '''
+    derivationStr = 'getElementsByGroup'
+
+    def __init__(self, groupFilterList):
+        if not hasattr(groupFilterList, "__iter__"):
+            groupFilterList = [groupFilterList]
+        self.groupFilterList = groupFilterList
+
+    def __call__(self, e, iterator):
+        if not hasattr(e, "groups"):
+            return False
+        for g in self.groupFilterList:
+            if g in e.groups:
+                return True
+        return False
+
+
+class OffsetFilter(StreamFilter):
+    '''
+    Match elements found at an offset or within an offset span of the 
+    iterated Stream, with the parameters of 
+    :meth:`~music21.stream.Stream.getElementsByOffset`. If the 
+    Stream is sorted, iteration stops after the end of the span.
+    '''
+    derivationStr = 'getElementsByOffset'
+
+    def __init__(self, offsetStart, offsetEnd=None, includeEndBoundary=True, 
+        mustFinishInSpan=False, mustBeginInSpan=True):
+        if offsetEnd is None:
+            offsetEnd = offsetStart
+        self.offsetStart = offsetStart
+        self.offsetEnd = offsetEnd
+        self.includeEndBoundary = includeEndBoundary
+        self.mustFinishInSpan = mustFinishInSpan
+        self.mustBeginInSpan = mustBeginInSpan
+
+    def __call__(self, e, iterator):
+        srcStream = iterator.srcStream
+        offset = e.getOffsetBySite(srcStream)
+        if srcStream.isSorted and offset > self.offsetEnd:
+            raise StopIteration
+        return _isOffsetInSpan(offset, e.duration.quarterLength,
+            self.offsetStart, self.offsetEnd, self.includeEndBoundary, 
+            self.mustFinishInSpan, self.mustBeginInSpan)
+
+
 #-------------------------------------------------------------------------------
 class StreamIterator(object):
     '''
@@ -65,6 +231,14 @@ class StreamIterator(object):
 
     Note that this iterator automatically sets the active site of 
     returned elements to the the source Stream. 
+
+    An iterator can also filter the elements it returns, without creating 
+    any intermediate Streams. The filtering methods, such as 
+    :meth:`~music21.stream.StreamIterator.getElementsByClass`, add a 
+    :class:`~music21.stream.StreamFilter` and return the iterator 
+    itself, so that they can be chained; 
+    :meth:`~music21.stream.StreamIterator.stream` creates a Stream 
+    from the matching elements only if one is needed.
     
     Sets:
     
@@ -73,6 +247,7 @@ class StreamIterator(object):
     * StreamIterator.streamLength -- the len() of srcStream
     * StreamIterator.srcStreamElements -- srcStream.elements
     * StreamIterator.cleanupOnStop -- should the StreamIterator delete the reference to srcStream and srcStreamElements before stopping? default True
+    * StreamIterator.filters -- a list of StreamFilter objects that elements must all match
     '''
     def __init__(self, srcStream):
         self.srcStream = srcStream
@@ -80,6 +255,7 @@ class StreamIterator(object):
         self.streamLength = len(self.srcStream)
         self.srcStreamElements = self.srcStream.elements
         self.cleanupOnStop = True
+        self.filters = []
 
     def __iter__(self):
         return self
@@ -87,23 +263,205 @@ class StreamIterator(object):
     def next(self):
         # calling .elements here will sort if autoSort = True
         # thus, this does not need to sort or check autoSort status
-        if self.index >= self.streamLength:
-            if self.cleanupOnStop is not False:
-                del self.srcStream
-                del self.srcStreamElements
-                self.srcStream = None
-                self.srcStreamElements = None
-            raise StopIteration
-        #environLocal.printDebug(['self.srcStream', self.srcStream, self.index, 'len(self.srcStream)', len(self.srcStream), 'len(self._endElements)', len(self.srcStream._endElements), 'len(self.srcStream._elements)', len(self.srcStream._elements), 'len(self.srcStream.elements)', len(self.srcStream.elements)])
+        while self.index < self.streamLength:
+            #environLocal.printDebug(['self.srcStream', self.srcStream, self.index, 'len(self.srcStream)', len(self.srcStream), 'len(self._endElements)', len(self.srcStream._endElements), 'len(self.srcStream._elements)', len(self.srcStream._elements), 'len(self.srcStream.elements)', len(self.srcStream.elements)])
+            try:
+                post = self.srcStreamElements[self.index]
+            except IndexError:
+                raise StreamException("Cannot get index %d from Stream %r, elements were %r" % (self.index, self.srcStream, self.srcStreamElements))
+            self.index += 1
+            if self.filters:
+                try:
+                    if not self._matchesFilters(post):
+                        continue
+                except StopIteration:
+                    self.index = self.streamLength
+                    break
+            # here, the activeSite of extracted element is being set to Stream
+            # that is the source of the iteration
+            post.activeSite = self.srcStream
+            return post
+
+        if self.cleanupOnStop is not False:
+            del self.srcStream
+            del self.srcStreamElements
+            self.srcStream = None
+            self.srcStreamElements = None
+        raise StopIteration
+
+    def _matchesFilters(self, e):
+        '''
+        Return True if the element matches all filters; may raise 
+        StopIteration.
+        '''
+        for f in self.filters:
+            if not f(e, self):
+                return False
+        return True
+
+    def _matchingIndices(self):
+        '''
+        Yield the index in srcStreamElements of each matching element, 
+        without changing the state of the iterator.
+        '''
         try:
-            post = self.srcStreamElements[self.index]
-        except IndexError:
-            raise StreamException("Cannot get index %d from Stream %r, elements were %r" % (self.index, self.srcStream, self.srcStreamElements))
-        # here, the activeSite of extracted element is being set to Stream
-        # that is the source of the iteration
-        post.activeSite = self.srcStream
-        self.index += 1
-        return post
+            for i, e in enumerate(self.srcStreamElements):
+                if self._matchesFilters(e):
+                    yield i
+        except StopIteration:
+            return
+
+    #---------------------------------------------------------------------------
+    # filtering; all return the iterator itself so that calls may be chained
+
+    def addFilter(self, newFilter):
+        '''
+        Add a :class:`~music21.stream.StreamFilter` (or any callable taking 
+        an element and this iterator) to the filters, and return this 
+        iterator.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note('C'), 4)
+        >>> s.append(note.Note('D'))
+        >>> [n.name for n in s.iter.addFilter(lambda e, it: e.name == 'D')]
+        ['D']
+        '''
+        self.filters.append(newFilter)
+        return self
+
+    def getElementsByClass(self, classFilterList):
+        '''
+        Return only elements that match one or more of the classes or 
+        class names in `classFilterList`.
+
+        >>> s = stream.Stream()
+        >>> s.append(clef.TrebleClef())
+        >>> s.repeatAppend(note.Note('E'), 2)
+        >>> s.append(note.Rest())
+        >>> [e for e in s.iter.getElementsByClass('Note')]
+        [<music21.note.Note E>, <music21.note.Note E>]
+        >>> [e for e in s.iter.getElementsByClass([note.Rest, 'Clef'])]
+        [<music21.clef.TrebleClef>, <music21.note.Rest rest>]
+        '''
+        return self.addFilter(ClassFilter(classFilterList))
+
+    def getElementsNotOfClass(self, classFilterList):
+        '''
+        Return only elements that match none of the classes or 
+        class names in `classFilterList`.
+
+        >>> s = stream.Stream()
+        >>> s.append(clef.TrebleClef())
+        >>> s.repeatAppend(note.Note('E'), 2)
+        >>> [e for e in s.iter.getElementsNotOfClass('Note')]
+        [<music21.clef.TrebleClef>]
+        '''
+        return self.addFilter(ClassNotFilter(classFilterList))
+
+    def getElementsByGroup(self, groupFilterList):
+        '''
+        Return only elements in one or more of the groups in 
+        `groupFilterList`.
+
+        >>> s = stream.Stream()
+        >>> n1 = note.Note('C')
+        >>> n1.groups.append('trombone')
+        >>> n2 = note.Note('D')
+        >>> s.append([n1, n2])
+        >>> [n.name for n in s.iter.getElementsByGroup('trombone')]
+        ['C']
+        '''
+        return self.addFilter(GroupFilter(groupFilterList))
+
+    def getElementsByOffset(self, offsetStart, offsetEnd=None,
+        includeEndBoundary=True, mustFinishInSpan=False, mustBeginInSpan=True):
+        '''
+        Return only elements found at an offset or within an offset span, 
+        as defined by :meth:`~music21.stream.Stream.getElementsByOffset`.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.HalfNote('C'), 4)
+        >>> s.insert(3, note.Rest())
+        >>> [e.offset for e in s.iter.getElementsByOffset(2, 4)]
+        [2.0, 3.0, 4.0]
+        >>> [e.offset for e in s.iter.getElementsByClass('Note').getElementsByOffset(2, 4)]
+        [2.0, 4.0]
+        >>> [e.offset for e in s.iter.getElementsByOffset(3, 
+        ...     mustBeginInSpan=False)]
+        [2.0, 3.0]
+        >>> [e.offset for e in s.getElementsByOffset(3, mustBeginInSpan=False)]
+        [2.0, 3.0]
+        '''
+        return self.addFilter(OffsetFilter(offsetStart, offsetEnd, 
+            includeEndBoundary, mustFinishInSpan, mustBeginInSpan))
+
+    #---------------------------------------------------------------------------
+    # results
+
+    def offsets(self):
+        '''
+        Return a generator of (offset, element) pairs for all matching 
+        elements, where offset is the offset in the source Stream. This 
+        does not set the activeSite of elements and does not advance 
+        the iterator.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note('C'), 2)
+        >>> s.append(note.Rest())
+        >>> list(s.iter.getElementsByClass('Note').offsets())
+        [(0.0, <music21.note.Note C>), (1.0, <music21.note.Note C>)]
+        '''
+        srcStream = self.srcStream
+        for i in self._matchingIndices():
+            e = self.srcStreamElements[i]
+            yield e.getOffsetBySite(srcStream), e
+
+    def stream(self, returnStreamSubClass=True):
+        '''
+        Return a new Stream containing all matching elements at their 
+        offsets in the source Stream. This does not advance the iterator.
+
+        If `returnStreamSubClass` is True, the new Stream is of the same 
+        class as the source Stream.
+
+        >>> s = stream.Part()
+        >>> s.repeatAppend(note.Note('C'), 4)
+        >>> s.append(note.Rest())
+        >>> sNew = s.iter.getElementsByClass('Note').getElementsByOffset(1, 3).stream()
+        >>> sNew
+        <music21.stream.Part ...>
+        >>> [(n.offset, n.name) for n in sNew]
+        [(1.0, 'C'), (2.0, 'C'), (3.0, 'C')]
+        >>> sNew.derivationMethod
+        'getElementsByClass.getElementsByOffset'
+        '''
+        srcStream = self.srcStream
+        if returnStreamSubClass:
+            try:
+                found = srcStream.__class__()
+            except TypeError:
+                found = Stream()
+        else:
+            found = Stream()
+        found.derivesFrom = srcStream
+        if len(self.filters) > 0:
+            found.derivationMethod = '.'.join([getattr(f, 'derivationStr', 
+                StreamFilter.derivationStr) for f in self.filters])
+        found.autoSort = srcStream.autoSort
+
+        # srcStreamElements is _elements followed by _endElements
+        elementCount = len(srcStream._elements)
+        for i in self._matchingIndices():
+            e = self.srcStreamElements[i]
+            if i < elementCount:
+                found._insertCore(e.getOffsetBySite(srcStream), e, 
+                    ignoreSort=True)
+            else:
+                found._storeAtEndCore(e)
+        # if the source was sorted, the resultant stream is sorted
+        found._elementsChanged(clearIsSorted=False)
+        found.isSorted = srcStream.isSorted
+        return found
 
     def __getitem__(self, key):
         '''
@@ -333,6 +691,28 @@ class Stream(base.Music21Object):
         '''
         return StreamIterator(self)
 
+    def _getIter(self):
+        return StreamIterator(self)
+
+    iter = property(_getIter, doc='''
+        Return a new :class:`~music21.stream.StreamIterator` over this 
+        Stream, on which filters can be chained. Unlike the Stream methods 
+        of the same name, the filters do not create a Stream for each 
+        call; a Stream is only created by calling 
+        :meth:`~music21.stream.StreamIterator.stream`.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note('G4'), 6)
+        >>> s.insert(2, note.Rest())
+        >>> for n in s.iter.getElementsByClass('Note').getElementsByOffset(2, 4):
+        ...     print n.offset, n.nameWithOctave
+        2.0 G4
+        3.0 G4
+        4.0 G4
+        >>> len(s.iter.getElementsNotOfClass('Rest').stream())
+        6
+        ''')
+
 
     def __getitem__(self, key):
         '''Get a Music21Object from the Stream using a variety of keys or indices. 
@@ -429,11 +809,20 @@ class Stream(base.Music21Object):
     # most will set isSorted to False
 
     def _elementsChanged(self, updateIsFlat=True, clearIsSorted=True, 
-        memo=None, keepIndex=False):
+        memo=None, keepIndex=False, flatChanges=None):
         '''
         This method is called any time the elements in the Stream are changed. 
 
         The various arguments permit optimizing the clearing of cached data in situations when completely dropping all cached data is excessive. 
+
+        If `flatChanges` is provided, it is a list of ('insert', element, 
+        offset) or ('remove', element, None) tuples describing the only 
+        changes made: non-Stream elements inserted at, or removed from, 
+        an offset relative to this Stream. A cached flat representation 
+        is then kept, and the changes are queued, to be patched into it 
+        when .flat is next read, rather than discarded; the changes, with 
+        offsets translated, are passed on to the Streams that contain 
+        this Stream.
     
         
         >>> a = stream.Stream()
@@ -443,25 +832,53 @@ class Stream(base.Music21Object):
         >>> a._elementsChanged()
         >>> a.isFlat
         False
+
+        >>> p = stream.Part()
+        >>> m = stream.Measure()
+        >>> m.repeatAppend(note.Note('C'), 4)
+        >>> p.append(m)
+        >>> pFlat = p.flat
+        >>> m.insert(2.5, note.Note('D'))
+        >>> p.flat is pFlat
+        True
+        >>> [(n.offset, n.name) for n in p.flat.notes]
+        [(0.0, 'C'), (1.0, 'C'), (2.0, 'C'), (2.5, 'D'), (3.0, 'C')]
         '''
         # experimental
         if not self._mutable:
             return 
 
         if memo is None:
-            memo = []
-        memo.append(id(self))
+            memo = set()
+        memo.add(id(self))
         # if this Stream is a flat representation of something, and its 
         # elements have changed, than we must clear the cache of that 
         # ancestor; we can do that by calling _elementsChanged on
         # flattenedRepresentationOf
         if self.flattenedRepresentationOf is not None:
-            self.flattenedRepresentationOf._elementsChanged(memo=memo)
-
-        # may not always need to clear cache of the active site, but may 
-        # be a good idea; may need to intead clear all sites            
-        if self.activeSite is not None:
-            self.activeSite._elementsChanged()
+            source = self.flattenedRepresentationOf
+            if flatChanges is not None and len(flatChanges) == 0:
+                # only the order of this flat representation has changed:
+                # the flat representations of the source and its 
+                # containers remain valid
+                source._elementsChanged(memo=memo, flatChanges=[])
+            else:
+                source._elementsChanged(memo=memo)
+
+        # as flat representations are cached, all Streams that contain
+        # this Stream, not just the activeSite, must be notified
+        activeSite = self.activeSite
+        sites = self.sites.getSites(excludeNone=True)
+        if activeSite is not None and activeSite not in sites:
+            sites.append(activeSite)
+        for site in sites:
+            if id(site) in memo or not getattr(site, 'isStream', False):
+                continue
+            siteFlatChanges = None
+            if flatChanges is not None:
+                siteFlatChanges = self._translateFlatChanges(flatChanges,
+                                  site)
+            site._elementsChanged(memo=memo, flatChanges=siteFlatChanges)
 
         # clear these attributes for setting later
         if clearIsSorted:
@@ -481,12 +898,139 @@ class Stream(base.Music21Object):
         # resetting the cache removes lowest and highest time storage
         # a slight performance optimization: not creating unless needed
         if len(self._cache) > 0:
+            flatCache = None
+            pendingFlatChanges = None
+            arraysCache = None
+            if flatChanges is not None:
+                flatCache = self._cache.get('flat', None)
+                pendingFlatChanges = self._cache.get('flatChanges', None)
+                if len(flatChanges) == 0:
+                    # no elements were added or removed anywhere below
+                    arraysCache = self._cache.get('arrays', None)
+                elif flatCache is not None:
+                    # applied by _getFlat(), so that a series of edits 
+                    # costs no more than a rebuild of the flat
+                    if pendingFlatChanges is None:
+                        pendingFlatChanges = []
+                    pendingFlatChanges.extend(flatChanges)
+                    if len(pendingFlatChanges) > _MAX_PENDING_FLAT_CHANGES:
+                        flatCache = None
             if keepIndex and 'index' in self._cache:
                 indexCache = self._cache['index']
             # alway clear cache when elements have changed
             self._cache = {} #common.DefaultHash()
             if keepIndex:
                 self._cache['index'] = indexCache
+            if flatCache is not None:
+                self._cache['flat'] = flatCache
+                if pendingFlatChanges:
+                    self._cache['flatChanges'] = pendingFlatChanges
+            if arraysCache is not None:
+                self._cache['arrays'] = arraysCache
+
+    def _translateFlatChanges(self, flatChanges, site):
+        '''
+        Given a list of flatChanges, as passed to _elementsChanged(), with 
+        offsets relative to this Stream, return the same changes with 
+        offsets relative to `site`, or None if this Stream is not in `site`.
+        '''
+        try:
+            shift = self.getOffsetBySite(site)
+        except base.SitesException:
+            return None
+        post = []
+        for action, e, offset in flatChanges:
+            if offset is not None:
+                offset = offset + shift
+            post.append((action, e, offset))
+        return post
+
+    def _applyFlatChanges(self, flatChanges):
+        '''
+        Patch this flat representation of another Stream with a list of 
+        flatChanges, as passed to _elementsChanged(). This does not 
+        notify the Stream this is a representation of, nor set the 
+        activeSite of inserted elements.
+
+        Returns True if the changes were applied. Elements that sort 
+        equally are ordered in a flat Stream by their position in the 
+        hierarchy, which is not known here; if an inserted element would 
+        sort equally with one already present, or with another inserted 
+        element, nothing is changed and False is returned, and the flat 
+        representation must be rebuilt.
+
+        >>> s = stream.Stream()
+        >>> n1 = note.Note('C')
+        >>> n2 = note.Note('D')
+        >>> s.append(n1)
+        >>> s._applyFlatChanges([('insert', n2, 3.0), ('remove', n1, None)])
+        True
+        >>> [(n.getOffsetBySite(s), n.name) for n in s]
+        [(3.0, 'D')]
+        >>> s._applyFlatChanges([('insert', note.Note('E'), 3.0)])
+        False
+        >>> [n.name for n in s]
+        ['D']
+
+        An element removed and inserted again is moved:
+
+        >>> s._applyFlatChanges([('remove', n2, None), ('insert', n2, 1.0)])
+        True
+        >>> [(n.getOffsetBySite(s), n.name) for n in s]
+        [(1.0, 'D')]
+        '''
+        # reduce the changes to the elements to remove from, and the 
+        # elements, in order, to insert into, this Stream
+        inserts = []
+        insertPositions = {}
+        removeIds = set()
+        for action, e, offset in flatChanges:
+            if action == 'insert':
+                insertPositions[id(e)] = len(inserts)
+                inserts.append((e, offset))
+            elif action == 'remove':
+                if id(e) in insertPositions:
+                    inserts[insertPositions.pop(id(e))] = None
+                else:
+                    removeIds.add(id(e))
+        inserts = [pair for pair in inserts if pair is not None]
+
+        if len(inserts) > 0:
+            insertKeys = set()
+            for e, offset in inserts:
+                key = (offset, e.priority, e.classSortOrder, e.isGrace)
+                if key in insertKeys:
+                    return False
+                insertKeys.add(key)
+            offsets, unused_positions, elements = self._getOffsetIndex()
+            for e, offset in inserts:
+                i = bisect.bisect_left(offsets, offset)
+                while i < len(offsets) and offsets[i] == offset:
+                    other = elements[i]
+                    if (id(other) not in removeIds and 
+                        (other.priority, other.classSortOrder, other.isGrace) 
+                        == (e.priority, e.classSortOrder, e.isGrace)):
+                        return False
+                    i += 1
+
+        if len(removeIds) > 0:
+            for storageName in ('_elements', '_endElements'):
+                kept = []
+                for e in getattr(self, storageName):
+                    if id(e) in removeIds:
+                        if e.sites.isSite(self):
+                            e.removeLocationBySite(self)
+                    else:
+                        kept.append(e)
+                setattr(self, storageName, kept)
+        for e, offset in inserts:
+            self._insertCore(offset, e, ignoreSort=True, 
+                setActiveSite=False)
+        # clear all caches, but do not call _elementsChanged(), as
+        # this would discard the flat representation itself
+        self.isSorted = False
+        self._cache = {}
+        return True
 
     def _getElements(self):
         '''
@@ -820,13 +1364,9 @@ class Stream(base.Music21Object):
         False
         '''
         #environLocal.printDebug(['calling hasElementOfClass()', className])
-        for e in self._elements:
-            if e.isClassOrSubclass([className]): 
-                return True
-        for e in self._endElements:
-            if e.isClassOrSubclass([className]): 
-                return True
-        return False
+        if common.isStr(className):
+            return className in self._getClassIndex()[0]
+        return len(self._getClassIndexPositions([className])) > 0
 
 
 
@@ -1079,6 +1619,8 @@ class Stream(base.Music21Object):
                             
                             elementOffset = e.getOffsetBySite(self)
                             e.setOffsetBySite(self, elementOffset-shiftDur)
+                        # offsets have changed, but not their order
+                        self._elementsChanged(clearIsSorted=False)
                 #if renumberMeasures is True and matchedEndElement is False:
                 #   pass # This should maybe just call a function renumberMeasures
         else:
@@ -1099,8 +1641,14 @@ class Stream(base.Music21Object):
             if match is not None:
                 if shiftOffsets is True: 
                     matchOffset = match.getOffsetBySite(self)
+                # flat representations can be patched unless a Stream 
+                # is removed or offsets will be shifted
+                flatChanges = None
+                if shiftOffsets is not True and not match.isStream:
+                    flatChanges = [('remove', match, None)]
                 # removing an object will never change the sort status
-                self._elementsChanged(clearIsSorted=False)
+                self._elementsChanged(clearIsSorted=False, 
+                    flatChanges=flatChanges)
                 match.removeLocationBySite(self)
                 
                 if shiftOffsets is True and matchedEndElement is False: #shift all elements after the deletion point
@@ -1111,6 +1659,7 @@ class Stream(base.Music21Object):
                             if elementOffset < matchOffset+shiftDur: #shift only elements after the deleted section
                                 continue 
                             e.setOffsetBySite(self, elementOffset-shiftDur)
+                        self._elementsChanged(clearIsSorted=False)
                 # if renumberMeasures is True and matchedEndElement is False and type(match):
                 #    pass #This should just call a function renumberMeasures
             
@@ -1518,10 +2067,11 @@ class Stream(base.Music21Object):
         # main insert procedure here
         storeSorted = self._insertCore(offset, element, 
                      ignoreSort=ignoreSort, setActiveSite=setActiveSite)
-        updateIsFlat = False
         if element.isStream:
-            updateIsFlat = True
-        self._elementsChanged(updateIsFlat=updateIsFlat) 
+            self._elementsChanged(updateIsFlat=True) 
+        else:
+            self._elementsChanged(updateIsFlat=False, 
+                flatChanges=[('insert', element, offset)])
         if ignoreSort is False:
             self.isSorted = storeSorted
 
@@ -1729,6 +2279,9 @@ class Stream(base.Music21Object):
             # back into a list for list processing if single
             others = [others]
         updateIsFlat = False
+        # if only non-Stream elements are added, flat representations
+        # can be patched
+        flatChanges = []
         for e in others:
             try:
                 if e.isStream: # any on that is a Stream req update
@@ -1742,6 +2295,11 @@ class Stream(base.Music21Object):
             # need to explicitly set the activeSite of the element
             e.activeSite = self 
             self._elements.append(e)  
+            if flatChanges is not None:
+                if updateIsFlat:
+                    flatChanges = None
+                else:
+                    flatChanges.append(('insert', e, highestTime))
 
             # TODO: may need to be replaced with a common almost equal
             if e.duration.quarterLength != 0: 
@@ -1751,7 +2309,8 @@ class Stream(base.Music21Object):
         # does not change sorted state
         storeSorted = self.isSorted    
         # we cannot keep the index cache here b/c we might 
-        self._elementsChanged(updateIsFlat=updateIsFlat)         
+        self._elementsChanged(updateIsFlat=updateIsFlat, 
+            flatChanges=flatChanges)         
         self.isSorted = storeSorted
         self._setHighestTime(highestTime) # call after to store in cache
 
@@ -2364,6 +2923,101 @@ class Stream(base.Music21Object):
                     e.groups.append(group)
 
 
+    def _getClassIndex(self):
+        '''
+        Return a cached pair of dictionaries, the first mapping each class 
+        name found in the :attr:`~music21.base.Music21Object.classes` of 
+        this Stream's elements, the second mapping each class of these 
+        elements, to the ascending positions of the matching elements in 
+        :attr:`~music21.stream.Stream.elements` 
+        (_elements followed by _endElements). 
+
+        The index is built on first use and is discarded with the rest of 
+        the cache by _elementsChanged(). 
+
+        >>> s = stream.Stream()
+        >>> s.append(note.Note())
+        >>> s.append(note.Rest())
+        >>> s.append(note.Note())
+        >>> s.storeAtEnd(bar.Barline())
+        >>> classNameIndex, classIndex = s._getClassIndex()
+        >>> classNameIndex['Note']
+        [0, 2]
+        >>> classNameIndex['GeneralNote']
+        [0, 1, 2]
+        >>> classNameIndex['Barline']
+        [3]
+        >>> classIndex[note.Rest]
+        [1]
+        '''
+        if 'classIndex' not in self._cache or self._cache['classIndex'] is None:
+            # positions are only meaningful after sorting
+            if not self.isSorted and self.autoSort:
+                self.sort() # will set isSorted to True
+            classNameIndex = {}
+            classIndex = {}
+            i = 0
+            for e in self._elements + self._endElements:
+                for className in e.classes:
+                    if className not in classNameIndex:
+                        classNameIndex[className] = [i]
+                    else:
+                        classNameIndex[className].append(i)
+                # the class is stored as well as the cached .classes, as 
+                # some routines reassign the __class__ of a Stream
+                eClass = e.__class__
+                if eClass not in classIndex:
+                    classIndex[eClass] = [i]
+                else:
+                    classIndex[eClass].append(i)
+                i += 1
+            self._cache['classIndex'] = (classNameIndex, classIndex)
+        return self._cache['classIndex']
+
+    def _getClassIndexPositions(self, classFilterList):
+        '''
+        Return a list of the ascending positions, in _elements followed 
+        by _endElements, of elements that match one or more of the classes 
+        or class names in `classFilterList`, as 
+        :meth:`~music21.base.Music21Object.isClassOrSubclass` would.
+
+        >>> s = stream.Stream()
+        >>> s.append(note.Note())
+        >>> s.append(note.Rest())
+        >>> s.append(clef.BassClef())
+        >>> s._getClassIndexPositions(['Rest', note.Note])
+        [0, 1]
+        >>> s._getClassIndexPositions([clef.Clef])
+        [2]
+        >>> s._getClassIndexPositions([clef.TrebleClef])
+        []
+        '''
+        classNameIndex, classIndex = self._getClassIndex()
+        found = []
+        for className in classFilterList:
+            if common.isStr(className):
+                if className in classNameIndex:
+                    found.append(classNameIndex[className])
+                continue
+            # a class object: there are only a few distinct classes in 
+            # a Stream, so test each with issubclass()
+            for eClass in classIndex:
+                try:
+                    if issubclass(eClass, className):
+                        found.append(classIndex[eClass])
+                # issubclass() arg 2 must be a class, type, or tuple
+                except TypeError:
+                    break
+        if len(found) == 0:
+            return []
+        elif len(found) == 1:
+            return found[0]
+        else: # an element may match more than one class
+            merged = set()
+            for positions in found:
+                merged.update(positions)
+            return sorted(merged)
+
     #---------------------------------------------------------------------------
     # getElementsByX(self): anything that returns a collection of Elements should return a Stream
 
@@ -2480,27 +3134,18 @@ class Stream(base.Music21Object):
         if returnList is False:
             found.isSorted = self.isSorted
 
-        # to use class cache, class must be provided as a string, 
-        # and there must be only one class
-#         if canUseClassCache:
-#             if self._cache['classCache'] is None:
-#                 self._cache['classCache'] = classCache.ClassCache()
-#                 self._cache['classCache'].load(self)
-#             found = self._cache['classCache'].getElementsByClass(found,
-#                                               classFilterList)
-#             return found
-
-        #found.show('t')
-        # need both _elements and _endElements
-        for e in self._elements:
-            #eClasses = e.classes # store once, as this is property call
-            if e.isClassOrSubclass(classFilterList):
+        # the class index gives, in order, the positions of matching 
+        # elements in _elements followed by _endElements
+        elementCount = len(self._elements)
+        for i in self._getClassIndexPositions(classFilterList):
+            if i < elementCount:
+                e = self._elements[i]
                 if returnList is False:
                     found._insertCore(e.getOffsetBySite(self), e, ignoreSort=True)
                 else:
                     found.append(e)  
-        for e in self._endElements:
-            if e.isClassOrSubclass(classFilterList):
+            else:
+                e = self._endElements[i - elementCount]
                 if returnList is False:
                     found._storeAtEndCore(e)
                 else:
@@ -2559,14 +3204,14 @@ class Stream(base.Music21Object):
             if not isinstance(classFilterList, tuple):
                 classFilterList = [classFilterList]
 
-        # appendedAlready fixes bug where if an element matches two 
-        # classes it was appendedTwice
         # need both _elements and _endElements
-        for e in self._elements:
-            if not e.isClassOrSubclass(classFilterList):
+        excluded = set(self._getClassIndexPositions(classFilterList))
+        elementCount = len(self._elements)
+        for i, e in enumerate(self._elements):
+            if i not in excluded:
                 found._insertCore(e.getOffsetBySite(self), e, ignoreSort=True)
-        for e in self._endElements:
-            if not e.isClassOrSubclass(classFilterList):
+        for i, e in enumerate(self._endElements):
+            if i + elementCount not in excluded:
                 found._storeAtEndCore(e)
 
         # if this stream was sorted, the resultant stream is sorted
@@ -2785,6 +3430,68 @@ class Stream(base.Music21Object):
 #        return max([g.priority for g in found])
 
 
+    def _getOffsetIndex(self):
+        '''
+        Return a cached offset index for this Stream: three parallel 
+        lists giving the offsets of all elements (including end elements) 
+        in ascending order, the position of each element in 
+        :attr:`~music21.stream.Stream.elements`, and the elements themselves. 
+
+        The index is built on first use and is discarded with the rest of 
+        the cache by _elementsChanged(), so that offset queries can 
+        bisect the offsets rather than examine every element.
+
+        >>> s = stream.Stream()
+        >>> s.insert(2, note.Note('D'))
+        >>> s.insert(0, note.Note('C'))
+        >>> offsets, positions, elements = s._getOffsetIndex()
+        >>> offsets
+        [0.0, 2.0]
+        >>> [e.name for e in elements]
+        ['C', 'D']
+        >>> s.insert(1, note.Note('E'))
+        >>> s._getOffsetIndex()[0]
+        [0.0, 1.0, 2.0]
+        '''
+        if 'offsetIndex' not in self._cache or self._cache['offsetIndex'] is None:
+            # calling .elements will sort if autoSort is True
+            streamElements = self.elements
+            entries = [(e.getOffsetBySite(self), i) for i, e in 
+                       enumerate(streamElements)]
+            # if the Stream is sorted, this is a single linear pass
+            entries.sort()
+            offsets = [o for o, unused in entries]
+            positions = [i for unused, i in entries]
+            elements = [streamElements[i] for i in positions]
+            self._cache['offsetIndex'] = (offsets, positions, elements)
+        return self._cache['offsetIndex']
+
+    def _candidatesBeforeIndex(self, iEnd, offset, offsets, elements, 
+        classList=None):
+        '''
+        Used by getElementAtOrBefore() and getElementBeforeOffset(): given 
+        a position in the offset index, return a list of (span, element) 
+        pairs for the elements matching `classList` at the nearest offset 
+        before that position. 
+        '''
+        candidates = []
+        nearestOffset = None
+        i = iEnd - 1
+        while i >= 0:
+            o = offsets[i]
+            if nearestOffset is not None and o != nearestOffset:
+                break
+            # elements at negative offsets are only found if they are
+            # exactly at offset
+            if o < 0 and o != offset:
+                break
+            e = elements[i]
+            if classList is None or e.isClassOrSubclass(classList):
+                nearestOffset = o
+                candidates.append((offset - o, e))
+            i -= 1
+        return candidates
+
     def getElementsByOffset(self, offsetStart, offsetEnd=None,
                     includeEndBoundary=True, mustFinishInSpan=False, 
                     mustBeginInSpan=True, classList=None ):
@@ -2903,13 +3610,25 @@ class Stream(base.Music21Object):
         found.derivesFrom = self
         found.derivationMethod = 'getElementsByOffset'
 
-        # need both _elements and _endElements
-        for e in self.elements:
+        # the offset index gives, in offset order, both _elements 
+        # and _endElements; only the elements whose offsets could 
+        # possibly match need to be examined
+        offsets, positions, elements = self._getOffsetIndex()
+        # offsets are compared after cleanupFloat(); allow for its rounding
+        tolerance = _OFFSET_INDEX_TOLERANCE
+        iEnd = bisect.bisect_right(offsets, offsetEnd + tolerance)
+        if mustBeginInSpan:
+            iStart = bisect.bisect_left(offsets, offsetStart - tolerance)
+        else: # elements that began before offsetStart may still sound
+            iStart = 0
+
+        matches = []
+        for i in range(iStart, iEnd):
+            e = elements[i]
             if classList is not None:
                 if not e.isClassOrSubclass(classList):
                     continue
-            match = False
-            offset = e.getOffsetBySite(self)
+            offset = offsets[i]
             # if sorted, optimize by breaking after exceeding offsetEnd
             if self.isSorted:
                 if offset > offsetEnd:
@@ -2918,53 +3637,15 @@ class Stream(base.Music21Object):
                 # it is not  a match
                 if offset < (offsetStart - e.duration.quarterLength):
                     continue
-            dur = e.duration
-            if not mustFinishInSpan:
-                eEnd = offset
-            else:
-                eEnd = offset + dur.quarterLength
-            eEnd = common.cleanupFloat(eEnd)
-    
-            if not mustBeginInSpan:
-                eStart = offset + dur.quarterLength
-            else:
-                eStart = offset
-            eStart = common.cleanupFloat(eStart)
-
-            match = False
-
-            # alternate version that uses common based comparison
-            # not yet seen as necessary (but incurring a performance hit so
-            # not yet used
+            if _isOffsetInSpan(offset, e.duration.quarterLength, 
+                offsetStart, offsetEnd, includeEndBoundary, 
+                mustFinishInSpan, mustBeginInSpan):
+                matches.append((positions[i], offset, e))
 
-#             if (includeEndBoundary is True and mustBeginInSpan is True and 
-#                 common.greaterThanOrEqual(eStart, offsetStart) and common.lessThanOrEqual(eEnd, offsetEnd)):
-#                     match = True
-#             elif (includeEndBoundary is True and mustBeginInSpan is False and
-#                 eStart > offsetStart and common.lessThanOrEqual(eEnd, offsetEnd)):
-#                     match = True
-#             elif (includeEndBoundary is False and mustBeginInSpan is True and 
-#                 common.greaterThanOrEqual(eStart, offsetStart) and eEnd < offsetEnd):
-#                     match = True
-#             elif (includeEndBoundary is False and mustBeginInSpan is False and
-#                 eStart > offsetStart and eEnd < offsetEnd):
-#                     match = True
-
-            if includeEndBoundary is True and mustBeginInSpan is True and \
-                eStart >= offsetStart and eEnd <= offsetEnd:
-                    match = True
-            elif includeEndBoundary is True and mustBeginInSpan is False and \
-                eStart > offsetStart and eEnd <= offsetEnd:
-                    match = True
-            elif includeEndBoundary is False and mustBeginInSpan is True and \
-                eStart >= offsetStart and eEnd < offsetEnd:
-                    match = True
-            elif includeEndBoundary is False and mustBeginInSpan is False and \
-                eStart > offsetStart and eEnd < offsetEnd:
-                    match = True
-
-            if match:
-                found._insertCore(offset, e)
+        # insert in the order of self.elements, as a linear search would
+        matches.sort()
+        for unused, offset, e in matches:
+            found._insertCore(offset, e)
 
         found._elementsChanged()
         return found
@@ -3056,27 +3737,11 @@ class Stream(base.Music21Object):
         # NOTE: this is a performance critical method
         # TODO: need to deal with more than on object the same
         # offset and span from the source
-        candidates = []
-        nearestTrailSpan = offset # start with max time
-
-        # need both _elements and _endElements
-        for e in self.elements:
-            #eClasses = e.classes # store once, as this is property call
-            if classList is not None:
-                if not e.isClassOrSubclass(classList):
-                    continue
-            span = offset - e.getOffsetBySite(self)
-            #environLocal.printDebug(['e span check', span, 'offset', offset, 'e.offset', e.offset, 'e.getOffsetBySite(self)', e.getOffsetBySite(self), 'e', e])
-            if span < 0: # the e is after this offset
-                continue
-            elif span == 0: # should be almos equlas
-                candidates.append((span, e))
-                nearestTrailSpan = span
-            else:
-                # do this comparison because may be out of order
-                if span <= nearestTrailSpan:
-                    candidates.append((span, e))
-                    nearestTrailSpan = span
+        offsets, unused, elements = self._getOffsetIndex()
+        # all elements at or before offset are found before iEnd
+        iEnd = bisect.bisect_right(offsets, offset)
+        candidates = self._candidatesBeforeIndex(iEnd, offset, 
+                     offsets, elements, classList)
         #environLocal.printDebug(['getElementAtOrBefore(), e candidates', candidates])
         if len(candidates) > 0:
             candidates.sort() # TODO: this sort has side effects
@@ -3135,24 +3800,11 @@ class Stream(base.Music21Object):
         (0.0, 'z')
         '''
         # NOTE: this is a performance critical method
-        candidates = []
-        nearestTrailSpan = offset # start with max time
-
-        # need both _elements and _endElements
-        for e in self.elements:
-            #eClasses = e.classes # store once, as this is property call
-            if classList is not None:
-                if not e.isClassOrSubclass(classList):
-                    continue
-            span = offset - e.getOffsetBySite(self)
-            #environLocal.printDebug(['e span check', span, 'offset', offset, 'e.offset', e.offset, 'e.getOffsetBySite(self)', e.getOffsetBySite(self), 'e', e])
-            # by forcing <= here, we are sure to get offsets not at zero
-            if span <= 0: # the e is after this offset
-                continue
-            else: # do this comparison because may be out of order
-                if span <= nearestTrailSpan:
-                    candidates.append((span, e))
-                    nearestTrailSpan = span
+        offsets, unused, elements = self._getOffsetIndex()
+        # by using bisect_left, we are sure to get offsets not at offset
+        iEnd = bisect.bisect_left(offsets, offset)
+        candidates = self._candidatesBeforeIndex(iEnd, offset, 
+                     offsets, elements, classList)
         #environLocal.printDebug(['getElementBeforeOffset(), e candidates', candidates])
         if len(candidates) > 0:
             candidates.sort() # TODO: this sort has side effects
@@ -6832,8 +7484,10 @@ class Stream(base.Music21Object):
                     cmp(x.classSortOrder, y.classSortOrder)
                 )
             # as sorting changes order, elements have changed; 
-            # need to clear cache, but flat status is the same
-            self._elementsChanged(updateIsFlat=False, clearIsSorted=False)
+            # need to clear cache, but flat status is the same, and the 
+            # flat representations of containers are unchanged
+            self._elementsChanged(updateIsFlat=False, clearIsSorted=False, 
+                flatChanges=[])
             self.isSorted = True
             #environLocal.printDebug(['_elements', self._elements])
 
@@ -6976,7 +7630,10 @@ class Stream(base.Music21Object):
         sNew._cache = {} #common.DefaultHash()
         sNew._elements = []
         sNew._endElements = []
-        sNew._elementsChanged()
+        # do not call _elementsChanged(): as a copy, sNew has the 
+        # activeSite of self, the cache of which need not be cleared
+        sNew.isSorted = False
+        sNew.isFlat = True
 
         for e in self._elements:
             #environLocal.printDebug(['_getFlatOrSemiFlat', 'processing e:', e])
@@ -7052,7 +7709,8 @@ class Stream(base.Music21Object):
         sNew._cache = {} #common.DefaultHash()
         sNew._elements = []
         sNew._endElements = []
-        sNew._elementsChanged() # clear caches
+        # as in _getFlatOrSemiFlat, do not call _elementsChanged()
+        sNew.isSorted = False
         for e in self._elements:
             # if this element is a Stream, recurse
             #if hasattr(e, "elements"): 
@@ -7063,13 +7721,17 @@ class Stream(base.Music21Object):
         for e in self._endElements:
             #sNew.storeAtEnd(e)
             sNew._storeAtEndCore(e)
-        sNew._elementsChanged()
         sNew.isFlat = True
         # here, we store the source stream from which this stream was derived
         sNew.flattenedRepresentationOf = sf.flattenedRepresentationOf
         return sNew
 
     def _getFlat(self):
+        if 'flatChanges' in self._cache:
+            # patch the cached flat with changes queued by _elementsChanged()
+            flatChanges = self._cache.pop('flatChanges')
+            if not self._cache['flat']._applyFlatChanges(flatChanges):
+                del self._cache['flat']
         if 'flat' not in self._cache or self._cache['flat'] is None:
             if 'semiFlat' in self._cache and self._cache['semiFlat'] is not None:
                 self._cache['flat'] = self._getFlatFromSemiFlat()
@@ -8536,6 +9198,8 @@ class Stream(base.Music21Object):
                         qlNew = bestMatch(ql, quarterLengthDivisors)
                         #qlNew = common.nearestMultiple(ql, quarterLengthMin)
                         e.duration.quarterLength = qlNew
+            if processOffsets:
+                useStream._elementsChanged()
 
         if inPlace is False:
             return returnStream
@@ -9213,6 +9877,153 @@ class Stream(base.Music21Object):
         return post
 
 
+    def toArrays(self):
+        '''
+        Return a numpy structured array with one record for each pitch of 
+        each Note and Chord found anywhere in this Stream, for analysis 
+        routines that work on whole scores at once rather than on one 
+        object at a time. The records have these fields:
+        
+        `offset` and `endTime`: the offset and end time of the note or chord,
+        relative to this Stream (as in .flat); 
+        `midi`, `ps` and `pitchClass`: those attributes of the pitch; 
+        `quarterLength`: the quarterLength of the note or chord;
+        `part`: the index of the Part it is in (as in .parts), or 0 if not in a Part;
+        `measure`: the number of the Measure it is in, or -1 if not in a Measure;
+        `tie`: 0 for no tie, and 1, 2 or 3 for a 'start', 'continue' or 'stop' tie;
+        `voice`: the index of the Voice within its Measure, or -1 if not in a Voice.
+        
+        Records are sorted by offset; records at the same offset are in part order. 
+        
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> a = s.toArrays()
+        >>> len(a) == len(s.flat.notes)
+        True
+        >>> a.dtype.names
+        ('offset', 'endTime', 'midi', 'ps', 'pitchClass', 'quarterLength', 'part', 'measure', 'tie', 'voice')
+        >>> a[:4]['midi'].tolist()
+        [73, 64, 57, 57]
+        >>> a[:4]['part'].tolist()
+        [0, 1, 2, 3]
+        >>> a[-1]['offset'], a[-1]['endTime'], a[-1]['measure']
+        (35.0, 36.0, 9)
+        
+        Chords give one record for each pitch:
+        
+        >>> s = stream.Stream()
+        >>> s.append(note.Note('F#4', quarterLength=2))
+        >>> s.append(chord.Chord(['C4', 'E4']))
+        >>> s.toArrays()[['offset', 'midi', 'pitchClass']].tolist()
+        [(0.0, 66, 6), (2.0, 60, 0), (2.0, 64, 4)]
+
+        The array is cached until the elements of this Stream, or of any 
+        Stream in it, change, or the pitch, duration or tie of one of its 
+        notes or chords is changed in place. It is read-only.
+        
+        >>> a = s.toArrays()
+        >>> a is s.toArrays()
+        True
+        >>> s.append(note.Note('G4'))
+        >>> len(s.toArrays())
+        4
+        >>> s.notes[0].pitch.name = 'G'
+        >>> s.notes[1].quarterLength = 3
+        >>> s.toArrays()[['midi', 'quarterLength']].tolist()
+        [(67, 2.0), (60, 3.0), (64, 3.0), (67, 1.0)]
+        
+        Requires numpy.
+        '''
+        if 'numpy' in base._missingImport:
+            raise StreamException('could not find numpy, cannot create arrays for this Stream')
+        arraysCache = self._cache.get('arrays', None)
+        if arraysCache is not None:
+            arrays, sources, state = arraysCache
+            if self._getArraysState(sources) == state:
+                return arrays
+        import numpy
+        records = []
+        sources = []
+        self._getArraysRecords(records, sources, 0.0, 0, -1, -1)
+        arrays = numpy.array(records, dtype=[('offset', numpy.float64),
+                                             ('endTime', numpy.float64),
+                                             ('midi', numpy.int16),
+                                             ('ps', numpy.float64),
+                                             ('pitchClass', numpy.int8),
+                                             ('quarterLength', numpy.float64),
+                                             ('part', numpy.int16),
+                                             ('measure', numpy.int32),
+                                             ('tie', numpy.int8),
+                                             ('voice', numpy.int16)])
+        # records were gathered part by part; a stable sort keeps part order
+        arrays = arrays[numpy.argsort(arrays['offset'], kind='mergesort')]
+        arrays.flags.writeable = False
+        self._cache['arrays'] = (arrays, sources, self._getArraysState(sources))
+        return arrays
+
+    def _getArraysState(self, sources):
+        '''
+        Return a tuple of the pitches, quarterLength and tie type of each 
+        Note and Chord in the list `sources`, as gathered by 
+        _getArraysRecords(), that changes whenever one of them is changed 
+        in place, as Pitch._getState() does for a Pitch. 
+        toArrays() compares these to know when its cached array is stale.
+        '''
+        post = []
+        for e in sources:
+            if getattr(e, 'isChord', False):
+                pitches = e.pitches
+            else:
+                pitches = (e.pitch,)
+            if e.tie is None:
+                tieType = None
+            else:
+                tieType = e.tie.type
+            post.append((e.duration.quarterLength, tieType, 
+                tuple((id(p), p._getState()) for p in pitches)))
+        return tuple(post)
+
+    def _getArraysRecords(self, records, sources, offsetShift, partIndex, 
+        measureNumber, voiceIndex):
+        '''
+        Append the records for toArrays() of the notes and chords in this
+        Stream and the Streams within it to the list `records`, and the 
+        notes and chords themselves to the list `sources`.
+        '''
+        tieCodes = {'start': 1, 'continue': 2, 'stop': 3}
+        partCount = 0
+        voiceCount = 0
+        for e in self.elements:
+            offset = offsetShift + e.getOffsetBySite(self)
+            if e.isStream:
+                eClasses = e.classes
+                if 'Part' in eClasses:
+                    e._getArraysRecords(records, sources, offset, partCount, measureNumber, voiceIndex)
+                    partCount += 1
+                elif 'Measure' in eClasses:
+                    e._getArraysRecords(records, sources, offset, partIndex, e.number, voiceIndex)
+                elif 'Voice' in eClasses:
+                    e._getArraysRecords(records, sources, offset, partIndex, measureNumber, voiceCount)
+                    voiceCount += 1
+                else:
+                    e._getArraysRecords(records, sources, offset, partIndex, measureNumber, voiceIndex)
+                continue
+            if getattr(e, 'isChord', False):
+                pitches = e.pitches
+            elif getattr(e, 'isNote', False):
+                pitches = (e.pitch,)
+            else:
+                continue
+            sources.append(e)
+            quarterLength = e.duration.quarterLength
+            if e.tie is None:
+                tieCode = 0
+            else:
+                tieCode = tieCodes.get(e.tie.type, 0)
+            for p in pitches:
+                records.append((offset, offset + quarterLength, p.midi, p.ps, 
+                                p.pitchClass, quarterLength, partIndex, 
+                                measureNumber, tieCode, voiceIndex))
+
     #---------------------------------------------------------------------------
     # interval routines
     
@@ -11110,8 +11921,8 @@ class Stream(base.Music21Object):
         {2.0} <music21.note.Note C>
         {3.0} <music21.note.Note D>
         {4.0} <music21.note.Note E>
-        {15.0} <music21.note.Note G>
         {5.0} <music21.note.Note F>
+        {15.0} <music21.note.Note G>
         
         >>> sGapsExpanded = s._removeOrExpandGaps([(0.0,5.0, []), (11.0,5.0, []), (14.0,1.0, [n])], isRemove = False)
         >>> sGapsExpanded.show('text')
@@ -11171,6 +11982,7 @@ class Stream(base.Music21Object):
                     
                     elementOffset = e.getOffsetBySite(returnObj)
                     e.setOffsetBySite(returnObj, elementOffset-shiftDur)
+                returnObj._elementsChanged()
         else:
             shiftDur = 0.0
             shiftsDict = {}
@@ -11205,6 +12017,7 @@ class Stream(base.Music21Object):
                     
                     elementOffset = e.getOffsetBySite(returnObj)
                     e.setOffsetBySite(returnObj, elementOffset+shiftDur)
+                returnObj._elementsChanged()
                     
         if inPlace is True:
             return
@@ -11378,7 +12191,7 @@ class Stream(base.Music21Object):
                     newPart.remove(e)
                     r = note.Rest()
                     r.hideObjectOnPrint = True
-                    r.duration.quarterLenght = nQuarterLength
+                    r.duration.quarterLength = nQuarterLength
                     newPart.insert(nOffset, r)
                 elif "Measure" in eclasses: #Recurse if measure
                     measureDuration = e.duration.quarterLength
@@ -11462,6 +12275,7 @@ class Stream(base.Music21Object):
                     for el in cV._stream:
                         oldOffset = el.getOffsetBySite(cV._stream)
                         el.setOffsetBySite(cV._stream, oldOffset+shiftOffset)
+                    cV._stream._elementsChanged()
                     cV.insert(0.0, r)
                     cV.replacementDuration = oldReplacementDuration
                     self.remove(cV)
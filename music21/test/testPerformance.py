@@ -28,6 +28,9 @@ environLocal = environment.Environment(_MOD)
 #-------------------------------------------------------------------------------
 class Test(unittest.TestCase):
 
+    _largeMidiString = None
+    _manyPartScore = None
+
     def runTest(self):
         pass
 
@@ -109,6 +112,29 @@ class Test(unittest.TestCase):
         '''
         junk = corpus.parse('beethoven/opus59no2/movement3', forceSource=True)
 
+    def runParseBeethovenIterparse(self):
+        '''Loading file with iterparse: beethoven/opus59no2/movement3
+        '''
+        self._parseIterparse('beethoven/opus59no2/movement3')
+
+    def runParseMozart(self):
+        '''Loading file: mozart/k458/movement1
+        '''
+        junk = corpus.parse('mozart/k458/movement1', forceSource=True)
+
+    def runParseMozartIterparse(self):
+        '''Loading file with iterparse: mozart/k458/movement1
+        '''
+        self._parseIterparse('mozart/k458/movement1')
+
+    def _parseIterparse(self, workName):
+        from music21 import converter
+        converter.MUSICXML_ITERPARSE = True
+        try:
+            junk = corpus.parse(workName, forceSource=True)
+        finally:
+            converter.MUSICXML_ITERPARSE = False
+
     def runMusicxmlOutPartsBeethoven(self):
         '''Loading file and rendering musicxml output for each part: beethoven/opus59no2/movement3
         '''
@@ -248,11 +274,99 @@ class Test(unittest.TestCase):
 
 
 
+    def runGetElementsByOffset(self):
+        '''Getting elements by offset from a flat Stream of 10000 notes
+        '''
+        from music21 import note, stream
+        s = stream.Stream()
+        for i in range(10000):
+            n = note.Note()
+            n.quarterLength = .5
+            s.append(n)
+        
+        for i in range(2000):
+            o = (i * 7) % 4000
+            post = s.getElementsByOffset(o, o + 2)
+            assert len(post) == 5
+            post = s.getElementAtOrBefore(o + .25)
+            assert post is not None
+            post = s.getElementBeforeOffset(o)
+
+    def runInsertAfterFlat(self):
+        '''Inserting 1500 notes into a Measure after reading its Part's .flat
+        '''
+        from music21 import note, stream
+        p = stream.Part()
+        m = stream.Measure()
+        p.append(m)
+        unused = p.flat
+        for i in range(1500):
+            m.insert(i, note.Note())
+        assert len(p.flat.notes) == 1500
+
+    def getMemoryParseBeethoven(self):
+        '''Memory (bytes) used by parsing: beethoven/opus59no2/movement3
+        '''
+        import gc
+        import sys
+        gc.collect()
+        before = sum([sys.getsizeof(x) for x in gc.get_objects()])
+        s = corpus.parse('beethoven/opus59no2/movement3', forceSource=True)
+        gc.collect()
+        after = sum([sys.getsizeof(x) for x in gc.get_objects()])
+        self.assertTrue(len(s.flat.notes) > 0) # keep the score alive
+        return after - before
+
     def runParseMonteverdiRNText(self):
         '''Loading file: beethoven/opus59no2/movement3
         '''
         unused = corpus.parse('monteverdi/madrigal.5.3.rntxt', forceSource=True)
 
+    def _getLargeMidiString(self):
+        '''Return the data of a four-track MIDI file of about 1.3 MB, made by 
+        repeating each part of a chorale 800 times; built once and cached.
+        '''
+        if self._largeMidiString is None:
+            from music21.midi import translate
+            mf = translate.streamToMidiFile(corpus.parse('bach/bwv66.6'))
+            for mt in mf.tracks:
+                # keep the end of track event at the end
+                mt.events = mt.events[:-2] * 800 + mt.events[-2:]
+            Test._largeMidiString = mf.writestr()
+        return self._largeMidiString
+
+    def runParseMidiLarge(self):
+        '''Reading a large multi-track MIDI file
+        '''
+        from music21 import midi
+        mf = midi.MidiFile()
+        mf.readstr(self._getLargeMidiString())
+
+    def _getManyPartScore(self):
+        '''Return a score of 40 parts, each of 400 random notes; 
+        built once and cached.
+        '''
+        if self._manyPartScore is None:
+            import random
+            from music21 import stream, note
+            random.seed(2)
+            s = stream.Score()
+            for unused_i in range(40):
+                p = stream.Part()
+                for unused_j in range(400):
+                    p.append(note.Note(random.randint(36, 84), 
+                        quarterLength=random.choice([0.5, 1, 1.5, 2])))
+                s.insert(0, p)
+            Test._manyPartScore = s
+        return self._manyPartScore
+
+    def runMidiOutManyParts(self):
+        '''Writing a score of many parts as MIDI
+        '''
+        from music21.midi import translate
+        mf = translate.streamToMidiFile(self._getManyPartScore())
+        unused = mf.writestr()
+
     #---------------------------------------------------------------------------
     def testTimingTolerance(self):
         '''Test the performance of methods defined above, comparing the resulting time to the time obtained in past runs. 
@@ -260,9 +374,57 @@ class Test(unittest.TestCase):
         This should not produce errors as such, but is used to provide reference
         if overall performance has changed.
         '''
+        # the data read by runParseMidiLarge is not part of its timing
+        self._getLargeMidiString()
+        self._getManyPartScore()
         # provide work and expected min/max in seconds
         for testMethod, best in [
 
+            (self.runMidiOutManyParts, 
+                {
+                 '2026.10.17': 7.27, 
+                }),
+
+            (self.runParseMidiLarge, 
+                {
+                 '2026.10.17': 3.08, 
+                }),
+
+            (self.runInsertAfterFlat, 
+                {
+                 '2026.10.17': 0.35, 
+                }),
+
+            (self.runGetElementsByOffset, 
+                {
+                 '2026.10.16': 6.15, 
+                }),
+
+            (self.runParseBeethoven, 
+                {
+                 '2026.10.16': 1.92, 
+                }),
+
+            (self.runParseBeethovenIterparse, 
+                {
+                 '2026.10.16': 1.86, 
+                }),
+
+            (self.runParseMozart, 
+                {
+                 '2026.10.16': 4.76, 
+                }),
+
+            (self.runParseMozartIterparse, 
+                {
+                 '2026.10.16': 4.47, 
+                }),
+
+            (self.runMusicxmlOutScoreBeethoven, 
+                {
+                 '2026.10.16': 8.01, 
+                }),
+
             (self.runGetElementsByPrevious, 
                 {
                  '2011.11.29': 4.69, 
@@ -389,6 +551,32 @@ class Test(unittest.TestCase):
             )
             #self.assertEqual(True, dur <= max) # performance test
 
+    def testMemoryTolerance(self):
+        '''Test the memory used by a large parsed score, with and without 
+        shared DurationUnits (duration.SHARE_DURATION_UNITS).
+        '''
+        from music21 import duration
+        for testMethod, best in [
+            (self.getMemoryParseBeethoven, 
+                {
+                 '2026.10.16': 25230448, 
+                 '2026.10.16 shared': 24854216, 
+                }),
+            ]:
+            for share in [False, True]:
+                duration.SHARE_DURATION_UNITS = share
+                try:
+                    size = testMethod()
+                finally:
+                    duration.SHARE_DURATION_UNITS = False
+                environLocal.printDebug(['\n\nmemory tolerance for:',     
+                    str(testMethod.__doc__.strip()), 
+                    '\nshared DurationUnits:', share,
+                    '\nthis run:', size, '\nbest runs:', 
+                    ['%s: %s' % (x, y) for x, y in sorted(best.items())], '\n'
+                    ]
+                )
+
 
 
 
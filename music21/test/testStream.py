@@ -5469,8 +5469,8 @@ class Test(unittest.TestCase):
         self.assertEqual(p1FlatNotes.derivationChain, [p1Flat, p1])
 
 
-        # we cannot do this, as each call to flat produces a new Stream
-        self.assertEqual(p1.flat.notesAndRests.derivesFrom is p1.flat, False)
+        # the flat Stream is cached, and sorting it does not discard it
+        self.assertEqual(p1.flat.notesAndRests.derivesFrom is p1.flat, True)
         # chained calls to .derives from can be used
         self.assertEqual(p1.flat.notesAndRests.derivesFrom.derivesFrom is p1, True)
         
@@ -7303,6 +7303,231 @@ class Test(unittest.TestCase):
         #s.show()
 
 
+    def testOffsetIndexA(self):
+        '''Offset queries use a cached index that must follow edits
+        '''
+        s = Stream()
+        for i in range(20):
+            n = note.Note()
+            n.quarterLength = 2
+            s.insert(i * 2, n)
+        r = note.Rest()
+        s.insert(7, r)
+        self.assertEqual(len(s.getElementsByOffset(6, 8)), 3)
+        self.assertEqual(len(s.getElementsByOffset(7, 7, 
+            mustBeginInSpan=False)), 2)
+        self.assertEqual(s.getElementAtOrBefore(7.5) is r, True)
+        self.assertEqual(s.getElementBeforeOffset(7) is r, False)
+        self.assertEqual(s.getElementAtOrBefore(7.5, ['Note']).offset, 6.0)
+
+        # moving an element through its offset updates the index
+        r.offset = 31
+        self.assertEqual(len(s.getElementsByOffset(6, 8)), 2)
+        self.assertEqual(s.getElementAtOrBefore(31.5) is r, True)
+        self.assertEqual(s.getElementBeforeOffset(32) is r, True)
+        # removing an element updates the index
+        s.remove(r)
+        self.assertEqual(s.getElementAtOrBefore(31.5).offset, 30.0)
+        self.assertEqual(len(s.getElementsByOffset(31, 31.5)), 0)
+        # elements at negative offsets are only found at their offset
+        s.insert(-2, note.Rest())
+        self.assertEqual(s.getElementAtOrBefore(-1), None)
+        self.assertEqual(s.getElementAtOrBefore(-2).isRest, True)
+
+
+    def testClassIndexA(self):
+        '''Class queries use a cached index that must follow edits
+        '''
+        s = Stream()
+        s.repeatAppend(note.Note(), 4)
+        s.repeatAppend(note.Rest(), 2)
+        s.storeAtEnd(bar.Barline('final'))
+        self.assertEqual(s.hasElementOfClass('Rest'), True)
+        self.assertEqual(s.hasElementOfClass(note.Rest), True)
+        self.assertEqual(s.hasElementOfClass('Chord'), False)
+        self.assertEqual(len(s.getElementsByClass('GeneralNote')), 6)
+        self.assertEqual(len(s.getElementsByClass(['Barline', 'Rest'])), 3)
+        self.assertEqual(len(s.getElementsNotOfClass(['Barline', 'Rest'])), 4)
+        self.assertEqual(len(s.notes), 4)
+
+        # a class that shares a name with a contained class does not match
+        class Rest(note.GeneralNote):
+            pass
+        self.assertEqual(len(s.getElementsByClass(Rest)), 0)
+        self.assertEqual(len(s.getElementsByClass('Rest')), 2)
+
+        s.insert(0, chord.Chord(['c4', 'e4']))
+        self.assertEqual(s.hasElementOfClass('Chord'), True)
+        self.assertEqual(len(s.notes), 5)
+        self.assertEqual(s.getElementsByClass('Chord')[0].offset, 0.0)
+        s.remove(s.getElementsByClass('Barline')[0])
+        self.assertEqual(s.hasElementOfClass('Barline'), False)
+
+    def testStreamIteratorFiltersA(self):
+        '''Filtered iterators match Stream methods without adding sites
+        '''
+        from music21 import corpus
+        s = corpus.parse('bwv66.6')
+        sFlat = s.flat
+        for classes, start, end in [('Note', 0, 8), (['Note', 'Rest'], 3, 3),
+            ('TimeSignature', 0, 0), ('KeySignature', 10, 20)]:
+            post = sFlat.getElementsByClass(classes).getElementsByOffset(
+                start, end)
+            sitesBefore = [len(e.sites) for e in post]
+            found = list(sFlat.iter.getElementsByClass(classes
+                ).getElementsByOffset(start, end))
+            self.assertEqual([id(e) for e in found], [id(e) for e in post])
+            self.assertEqual([len(e.sites) for e in found], sitesBefore)
+            self.assertEqual([o for o, e in sFlat.iter.getElementsByClass(
+                classes).getElementsByOffset(start, end).offsets()], 
+                [e.getOffsetBySite(post) for e in post])
+
+        post = sFlat.getElementsNotOfClass('Note')
+        found = sFlat.iter.getElementsNotOfClass('Note').stream()
+        self.assertEqual([id(e) for e in found], [id(e) for e in post])
+        self.assertEqual(found.derivesFrom is sFlat, True)
+
+    def testFlatCachePatchingA(self):
+        '''Cached flat Streams are patched, not discarded, by edits in Measures
+        '''
+        from music21 import corpus, dynamics, stream
+        s = corpus.parse('bwv66.6')
+        # iterators, unlike getElementsByClass(), leave the activeSite of
+        # Parts and Measures as their containing Stream
+        p = list(s.iter.getElementsByClass('Part'))[1]
+        sFlat = s.flat
+        pFlat = p.flat
+        self.assertEqual(len(sFlat.notes), 165)
+
+        def flatContents(flatStream):
+            return sorted([(e.getOffsetBySite(flatStream), id(e)) 
+                for e in flatStream])
+
+        for m in list(p.iter.getElementsByClass('Measure'))[2:5]:
+            n = note.Note('c#5')
+            n.quarterLength = .25
+            m.insert(.25, n)
+            # the activeSite remains the Measure
+            self.assertEqual(n.activeSite is m, True)
+            # changes are patched in when .flat is next read
+            self.assertEqual(n.getOffsetBySite(s.flat), 
+                m.getOffsetBySite(p) + .25)
+            self.assertEqual(s.flat is sFlat, True)
+            m.remove(m.notes[0])
+        highestTime = m.highestTime
+        d = dynamics.Dynamic('pp')
+        m.append(d)
+        self.assertEqual(d.getOffsetBySite(s.flat), 
+            m.getOffsetBySite(p) + highestTime)
+
+        self.assertEqual(s.flat is sFlat, True)
+        self.assertEqual(p.flat is pFlat, True)
+        self.assertEqual(flatContents(s.flat), 
+            flatContents(s._getFlatOrSemiFlat(retainContainers=False)))
+        self.assertEqual(flatContents(p.flat), 
+            flatContents(p._getFlatOrSemiFlat(retainContainers=False)))
+        self.assertEqual(len(s.flat.notes), 165)
+
+        # adding a Stream discards the cache
+        m.insert(0, Voice())
+        self.assertEqual(p.flat is pFlat, False)
+        self.assertEqual(s.flat is sFlat, False)
+
+        # so do more changes than are worth patching in
+        pFlat = p.flat
+        for i in range(stream._MAX_PENDING_FLAT_CHANGES + 1):
+            m.insert(.125 + i * .001, note.Note('c#5'))
+        self.assertEqual(p.flat is pFlat, False)
+
+    def testFlatCachePatchingB(self):
+        '''Patched flat Streams keep the order of a freshly built flat Stream
+        '''
+        import copy
+        def build():
+            s = Score()
+            for name in ['C', 'E']:
+                p = Part()
+                m = Measure()
+                m.repeatAppend(note.Note(name), 2)
+                p.append(m)
+                s.insert(0, p)
+            return s
+
+        s = build()
+        sFlat = s.flat
+        m = s.parts[0].getElementsByClass('Measure')[0]
+        # sorts equally with notes of both Parts: the flat is rebuilt
+        m.insert(0, note.Note('D'))
+        self.assertEqual(s.flat is sFlat, False)
+        self.assertEqual([(n.offset, n.name) for n in s.flat.notes],
+            [(0.0, 'C'), (0.0, 'D'), (0.0, 'E'), (1.0, 'C'), (1.0, 'E')])
+        self.assertEqual([(n.offset, n.name) for n in s.flat.notes],
+            [(n.offset, n.name) for n in copy.deepcopy(s).flat.notes])
+
+        # an element that sorts after all others is patched in
+        sFlat = s.flat
+        m.insert(1.5, note.Note('F'))
+        self.assertEqual(s.flat is sFlat, True)
+        self.assertEqual([(n.offset, n.name) for n in s.flat.notes],
+            [(n.offset, n.name) for n in copy.deepcopy(s).flat.notes])
+
+    def testToArraysA(self):
+        '''Stream.toArrays() gives one record per pitch with its context
+        '''
+        from music21 import base, tie
+        if 'numpy' in base._missingImport:
+            return
+        s = Score()
+        for partNumber in range(2):
+            p = Part()
+            m1 = Measure(number=1)
+            m1.append(note.Note('C4', quarterLength=4))
+            m1.notes[0].tie = tie.Tie('start')
+            m2 = Measure(number=2)
+            v1 = Voice()
+            v1.append(note.Note('C4', quarterLength=2))
+            v1.append(chord.Chord(['E4', 'G#4'], quarterLength=2))
+            v1.notes[0].tie = tie.Tie('stop')
+            v2 = Voice()
+            v2.append(note.Rest(quarterLength=1))
+            v2.append(note.Note('A3', quarterLength=3))
+            m2.insert(0, v1)
+            m2.insert(0, v2)
+            p.append([m1, m2])
+            s.insert(0, p)
+        a = s.toArrays()
+        self.assertEqual(len(a), 10)
+        self.assertEqual(a['offset'].tolist(), 
+            [0.0, 0.0, 4.0, 4.0, 5.0, 5.0, 6.0, 6.0, 6.0, 6.0])
+        self.assertEqual(a['part'].tolist(), [0, 1, 0, 1, 0, 1, 0, 0, 1, 1])
+        self.assertEqual(a['measure'].tolist(), [1, 1, 2, 2, 2, 2, 2, 2, 2, 2])
+        self.assertEqual(a['voice'].tolist(), [-1, -1, 0, 0, 1, 1, 0, 0, 0, 0])
+        self.assertEqual(a['tie'].tolist(), [1, 1, 3, 3, 0, 0, 0, 0, 0, 0])
+        self.assertEqual(a['pitchClass'].tolist(), [0, 0, 0, 0, 9, 9, 4, 8, 4, 8])
+        self.assertEqual(a['endTime'].tolist(), 
+            [4.0, 4.0, 6.0, 6.0, 8.0, 8.0, 8.0, 8.0, 8.0, 8.0])
+        
+        # cached until an element is added anywhere in the Score
+        self.assertEqual(s.toArrays() is a, True)
+        self.assertEqual(len(s.flat.notes), 8)
+        self.assertEqual(s.toArrays() is a, True)
+        v2.append(note.Note('B3'))
+        self.assertEqual(s.toArrays() is a, False)
+        self.assertEqual(len(s.toArrays()), 11)
+        self.assertEqual(s.parts[1].toArrays()['ps'].tolist(), 
+            [60.0, 60.0, 57.0, 64.0, 68.0, 59.0])
+        
+        # found again when a pitch, duration or tie is changed in place
+        a = s.toArrays()
+        v1.notes[1].pitches[0].octave = 5
+        self.assertEqual(s.toArrays() is a, False)
+        self.assertEqual(s.toArrays()['ps'].tolist()[8:10], [76.0, 68.0])
+        m1.notes[0].quarterLength = 3
+        self.assertEqual(s.toArrays()['endTime'].tolist()[:2], [4.0, 3.0])
+        m1.notes[0].tie.type = 'continue'
+        self.assertEqual(s.toArrays()['tie'].tolist()[:2], [1, 2])
+        self.assertEqual(s.toArrays() is s.toArrays(), True)
+
 
 #------------------------------------------------------------------------------
 
@@ -70,6 +70,30 @@ def fixed_writexml(self, writer, indent="", addindent="", newl=""):
 
 
 
+def _escapeData(data):
+    '''
+    Escape text or attribute data exactly as minidom does when writing.
+
+    >>> print(xmlnode._escapeData('a < b & "c"'))
+    a &lt; b &amp; &quot;c&quot;
+    '''
+    if data:
+        data = data.replace("&", "&amp;").replace("<", "&lt;"). \
+                    replace("\"", "&quot;").replace(">", "&gt;")
+    return data
+
+def _writeEncoded(writer, data):
+    '''
+    Write to a file-like object; unicode is encoded as utf-8, as
+    toprettyxml(encoding='utf-8') does.
+    '''
+    if isinstance(data, unicode):
+        data = data.encode('utf-8')
+    writer.write(data)
+
+# marks the end of child nodes in XMLNode.writeXml
+_NO_CHILD = object()
+
 #-------------------------------------------------------------------------------
 class XMLNodeException(exceptions21.Music21Exception):
     pass
@@ -550,6 +574,139 @@ class XMLNode(object):
         '''Shortcut method to provide quick xml out.'''
         return self.toxml(None, None, 1)
 
+    #---------------------------------------------------------------------------
+    # writing without a DOM
+
+    def _childNodes(self):
+        '''
+        Yield, in order, the children toxml() would create: a string 
+        for character data, a (tag, text) pair for a simple element 
+        (text is None for an element without content), or an XMLNode.
+        Components are only requested from _getComponents() as they 
+        are needed, so a component list may be a generator.
+        '''
+        if self.charData != None:
+            try:
+                yield str(self.charData)
+            except UnicodeEncodeError:                
+                yield self.charData
+
+        for component in self._getComponents():
+            if component == None: continue
+            elif isinstance(component, tuple): 
+                tag, content = component
+                if content == None: continue
+                if type(content) == bool and content == False: 
+                    continue 
+                if type(content) == bool and content == True:
+                    yield (tag, None)
+                else:
+                    try:
+                        entry = unicode(content, errors='replace')
+                    except TypeError:
+                        entry = u"%s" % content
+                    yield (tag, entry)
+            elif isinstance(component, XMLNode):
+                yield component
+            elif isinstance(component, list):
+                print(['cannot process component object', component])
+            else:
+                raise XMLNodeException(
+                    'cannot process component object: %s' % component)
+
+    def writeXml(self, writer, indent='', addIndent='  ', newline='\n'):
+        '''
+        Write this node and all its components to the file-like `writer`,
+        as the same pretty-printed text that xmlStr() creates, but 
+        without building a DOM: each component is written, and may be
+        discarded, as soon as it is reached.
+
+        >>> import StringIO
+        >>> from music21 import musicxml
+        >>> p = musicxml.Pitch()
+        >>> p.set('step', 'E')
+        >>> p.set('octave', 4)
+        >>> f = StringIO.StringIO()
+        >>> p.writeXml(f)
+        >>> print(f.getvalue())
+        <pitch>
+          <step>E</step>
+          <octave>4</octave>
+        </pitch>
+        <BLANKLINE>
+        '''
+        tag = self._tag
+        _writeEncoded(writer, indent + '<' + tag)
+        attributes = []
+        for name, value in self._getAttributes():
+            if value in [None, '']: continue
+            attributes.append((name, str(value)))
+        attributes.sort()
+        for name, value in attributes:
+            _writeEncoded(writer, ' %s="%s"' % (name, _escapeData(value)))
+
+        children = self._childNodes()
+        first = next(children, _NO_CHILD)
+        if first is _NO_CHILD:
+            _writeEncoded(writer, '/>' + newline)
+            return
+        second = next(children, _NO_CHILD)
+        if second is _NO_CHILD and isinstance(first, basestring):
+            # a single text node is written on the same line
+            _writeEncoded(writer, '>')
+            _writeEncoded(writer, _escapeData(first))
+            _writeEncoded(writer, '</%s>%s' % (tag, newline))
+            return
+
+        _writeEncoded(writer, '>' + newline)
+        childIndent = indent + addIndent
+        self._writeXmlChild(writer, first, childIndent, addIndent, newline)
+        if second is not _NO_CHILD:
+            self._writeXmlChild(writer, second, childIndent, addIndent, newline)
+            for child in children:
+                self._writeXmlChild(writer, child, childIndent, addIndent, newline)
+        _writeEncoded(writer, '%s</%s>%s' % (indent, tag, newline))
+
+    def _writeXmlChild(self, writer, child, indent, addIndent, newline):
+        if isinstance(child, XMLNode):
+            child.writeXml(writer, indent, addIndent, newline)
+        elif isinstance(child, tuple):
+            tag, entry = child
+            if entry is None:
+                _writeEncoded(writer, '%s<%s/>%s' % (indent, tag, newline))
+            else:
+                _writeEncoded(writer, '%s<%s>' % (indent, tag))
+                _writeEncoded(writer, _escapeData(entry))
+                _writeEncoded(writer, '</%s>%s' % (tag, newline))
+        else: # text among other children
+            _writeEncoded(writer, _escapeData(indent + child + newline))
+
+    def writeXmlDocument(self, writer):
+        '''
+        Write a complete XML document, with declaration and doctype, for
+        this node to the file-like `writer`.  The text is the same as 
+        that returned by xmlStr().
+
+        >>> import StringIO
+        >>> from music21 import musicxml
+        >>> p = musicxml.Pitch()
+        >>> p.set('step', 'E')
+        >>> f = StringIO.StringIO()
+        >>> p.writeXmlDocument(f)
+        >>> f.getvalue() == p.xmlStr()
+        True
+        '''
+        _writeEncoded(writer, '<?xml version="1.0" encoding="utf-8"?>\n')
+        if self._doctypeName != None:
+            _writeEncoded(writer, '<!DOCTYPE ' + self._doctypeName)
+            if self._doctypePublic:
+                _writeEncoded(writer, "\n  PUBLIC '%s'\n  '%s'" % (
+                              self._doctypePublic, self._doctypeSystem))
+            elif self._doctypeSystem:
+                _writeEncoded(writer, "\n  SYSTEM '%s'" % self._doctypeSystem)
+            _writeEncoded(writer, '>\n')
+        self.writeXml(writer, '', '  ', '\n')
+
 
 
 class XMLNodeList(XMLNode):